@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from accounts.models import User
+from accounts.services import AchievementService, BookCompletionService
+from todos.models import PlanSubscription
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '기존 사용자들의 성경책 완독 현황(UserBookCompletion)을 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', type=int, help='특정 사용자만 처리')
+        parser.add_argument(
+            '--grant-achievements',
+            action='store_true',
+            help='집계 후 책/구약·신약/성경 완독 업적도 확인'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS('성경책 완독 현황 백필을 시작합니다...'))
+
+        # 구독이 있는 사용자만 대상
+        user_ids = PlanSubscription.objects.values_list('user_id', flat=True).distinct()
+        users = User.objects.filter(id__in=user_ids).order_by('id')
+        if options.get('user_id'):
+            users = users.filter(id=options['user_id'])
+
+        total_users = users.count()
+        processed = 0
+        completed_books = 0
+
+        for user in users.iterator():
+            try:
+                BookCompletionService.refresh_books(user)
+                completed_books += len(BookCompletionService.get_completed_books(user))
+
+                if options['grant_achievements']:
+                    AchievementService.check_and_grant_achievements(user)
+
+                processed += 1
+                if processed % 100 == 0:
+                    self.stdout.write(f'진행 상황: {processed}/{total_users}')
+
+            except Exception as e:
+                self.stdout.write(
+                    self.style.ERROR(f'사용자 {user.nickname} 백필 실패: {str(e)}')
+                )
+                logger.error(f'완독 현황 백필 오류 - 사용자: {user.id}, 에러: {str(e)}')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'백필 완료! {processed}/{total_users} 사용자 처리됨 (완독 책 {completed_books}권)'
+            )
+        )
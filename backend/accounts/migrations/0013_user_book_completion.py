@@ -0,0 +1,32 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:54
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_user_token_version_alter_user_email_verified_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserBookCompletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('book', models.CharField(help_text='책 이름 (DailyBibleSchedule.book)', max_length=50)),
+                ('completed_schedules', models.PositiveIntegerField(default=0)),
+                ('total_schedules', models.PositiveIntegerField(default=0)),
+                ('is_completed', models.BooleanField(default=False)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='book_completions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'is_completed'], name='book_completion_user_idx')],
+                'unique_together': {('user', 'book')},
+            },
+        ),
+    ]
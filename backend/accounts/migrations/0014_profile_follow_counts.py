@@ -0,0 +1,52 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:59
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_follow_counts(apps, schema_editor):
+    """프로필이 없는 사용자는 프로필을 만들고, 기존 팔로우 관계로 카운터 채우기"""
+    User = apps.get_model('accounts', 'User')
+    UserProfile = apps.get_model('accounts', 'UserProfile')
+    Follow = apps.get_model('accounts', 'Follow')
+
+    # 나중에 get_or_create로 만들어지는 프로필은 카운터가 0이므로 미리 생성
+    missing = User.objects.filter(profile__isnull=True).values_list('id', flat=True)
+    UserProfile.objects.bulk_create(
+        [UserProfile(user_id=user_id) for user_id in missing.iterator()],
+        batch_size=1000
+    )
+
+    def count_of(field):
+        return Coalesce(Subquery(
+            Follow.objects.filter(**{field: OuterRef('user_id')}).order_by().values(field).annotate(
+                total=Count('id')
+            ).values('total')
+        ), 0)
+
+    UserProfile.objects.update(
+        followers_count=count_of('following_id'),
+        following_count=count_of('follower_id')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_user_book_completion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='followers_count',
+            field=models.PositiveIntegerField(default=0, help_text='팔로워 수'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='following_count',
+            field=models.PositiveIntegerField(default=0, help_text='팔로잉 수'),
+        ),
+        migrations.RunPython(backfill_follow_counts, migrations.RunPython.noop),
+    ]
@@ -135,13 +135,27 @@ class UserProfile(models.Model):
     longest_streak = models.IntegerField(default=0, help_text="최장 연속 일수")
     joined_date = models.DateTimeField(auto_now_add=True)
     is_public = models.BooleanField(default=True, help_text="프로필 공개 여부")
+    # Follow 생성/삭제 시 signals.py에서 갱신
+    followers_count = models.PositiveIntegerField(default=0, help_text="팔로워 수")
+    following_count = models.PositiveIntegerField(default=0, help_text="팔로잉 수")
     
     class Meta:
         ordering = ['-total_completed_days']
     
+    # F() UPDATE로만 갱신하는 카운터 (일반 저장에서 메모리의 오래된 값으로 덮어쓰지 않음)
+    COUNTER_FIELDS = ('followers_count', 'following_count')
+
     def __str__(self):
         return f"{self.user.nickname}'s Profile"
 
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
 
 class Follow(models.Model):
     """팔로우 관계"""
@@ -205,6 +219,30 @@ class UserAchievement(models.Model):
         return f"{self.user.nickname} - {self.get_achievement_type_display()}"
 
 
+class UserBookCompletion(models.Model):
+    """사용자별 성경책 완독 현황 (업적 판정용 집계)"""
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name='book_completions',
+        on_delete=models.CASCADE
+    )
+    book = models.CharField(max_length=50, help_text="책 이름 (DailyBibleSchedule.book)")
+    completed_schedules = models.PositiveIntegerField(default=0)
+    total_schedules = models.PositiveIntegerField(default=0)
+    is_completed = models.BooleanField(default=False)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['user', 'book']
+        indexes = [
+            models.Index(fields=['user', 'is_completed'], name='book_completion_user_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.nickname} - {self.book} ({self.completed_schedules}/{self.total_schedules})"
+
+
 class UserReadingSettings(models.Model):
     """사용자 읽기 설정"""
     THEME_CHOICES = [
@@ -15,12 +15,19 @@ from .serializers import (
     PublicUserSerializer
 )
 from .achievement_config import ACHIEVEMENT_METADATA
-from todos.models import UserBibleProgress, PlanSubscription, DailyBibleSchedule, UserPlanDisplaySettings
-from todos.utils import abbreviate_schedule, get_plan_color
+from todos.services.stats_recompute import mark_user_stats_dirty
+from todos.services.calendar_projection import build_profile_calendar
+from search.services import search as search_index
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 사용자 검색 페이지 크기
+USER_SEARCH_PAGE_SIZE = 20
+# 팔로워/팔로잉 목록 페이지 크기
+FOLLOW_PAGE_SIZE = 20
+FOLLOW_PAGE_MAX_SIZE = 100
+
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -64,11 +71,17 @@ def update_user_profile(request):
     # 수정 가능한 필드만 업데이트
     if 'bio' in request.data:
         profile.bio = request.data['bio']
+    visibility_changed = False
     if 'is_public' in request.data:
+        visibility_changed = profile.is_public != request.data['is_public']
         profile.is_public = request.data['is_public']
 
     profile.save()
 
+    # 공개 여부가 바뀌면 리더보드 포함 여부도 갱신 (재계산 태스크에서 처리)
+    if visibility_changed:
+        mark_user_stats_dirty(request.user.id)
+
     serializer = UserProfileSerializer(profile, context={'request': request})
     return StandardResponse.success(
         data={'profile': serializer.data},
@@ -103,79 +116,8 @@ def get_user_calendar(request, user_id):
     else:
         end_date = datetime(int(year), int(month) + 1, 1).date() - timedelta(days=1)
 
-    # 사용자의 활성 구독 가져오기
-    subscriptions = PlanSubscription.objects.filter(
-        user=user,
-        is_active=True
-    ).select_related('plan')
-
-    if not subscriptions.exists():
-        return StandardResponse.success(
-            data={'calendar': [], 'plans': []},
-            message='달력 데이터를 조회했습니다.'
-        )
-
-    # 구독 ID 목록
-    subscription_ids = list(subscriptions.values_list('id', flat=True))
-    plan_ids = list(subscriptions.values_list('plan_id', flat=True))
-
-    # 표시 설정 조회 (색상 정보)
-    display_settings = UserPlanDisplaySettings.objects.filter(
-        user=user,
-        subscription_id__in=subscription_ids
-    ).select_related('subscription')
-    color_map = {ds.subscription_id: ds.color for ds in display_settings}
-
-    # 해당 기간의 모든 스케줄을 한 번에 조회
-    schedules = DailyBibleSchedule.objects.filter(
-        plan_id__in=plan_ids,
-        date__range=[start_date, end_date]
-    ).select_related('plan').order_by('date')
-
-    # 진행 상황을 한 번에 조회 (N+1 쿼리 최적화)
-    progress_map = {
-        (p.subscription_id, p.schedule_id): p.is_completed
-        for p in UserBibleProgress.objects.filter(
-            subscription_id__in=subscription_ids,
-            schedule__date__range=[start_date, end_date]
-        ).select_related('schedule')
-    }
-
-    # 구독-플랜 매핑
-    subscription_map = {s.plan_id: s for s in subscriptions}
-
-    # 플랜 정보 구성
-    plans_info = []
-    for idx, sub in enumerate(subscriptions):
-        plans_info.append({
-            'id': sub.plan.id,
-            'name': sub.plan.name,
-            'color': color_map.get(sub.id, get_plan_color(idx))
-        })
-
-    calendar_data = []
-    for schedule in schedules:
-        subscription = subscription_map.get(schedule.plan_id)
-        if subscription:
-            idx = list(subscription_map.keys()).index(schedule.plan_id)
-            is_completed = progress_map.get((subscription.id, schedule.id), False)
-            calendar_data.append({
-                'date': schedule.date,
-                'is_completed': is_completed,
-                'book': schedule.book,
-                'start_chapter': schedule.start_chapter,
-                'end_chapter': schedule.end_chapter,
-                'chapters': f"{schedule.start_chapter}-{schedule.end_chapter}장",
-                'plan_id': subscription.plan.id,
-                'plan_name': subscription.plan.name,
-                'color': color_map.get(subscription.id, get_plan_color(idx)),
-                'schedule_id': schedule.id,
-                'schedule_text': abbreviate_schedule(
-                    schedule.book,
-                    schedule.start_chapter,
-                    schedule.end_chapter
-                )
-            })
+    # (사용자, 월)별 캐시된 캘린더 (진도/표시 설정/구독 변경 시 무효화)
+    calendar_data, plans_info = build_profile_calendar(user.id, start_date, end_date)
 
     return StandardResponse.success(
         data={'calendar': calendar_data, 'plans': plans_info},
@@ -250,11 +192,39 @@ def unfollow_user(request, user_id):
     )
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
-@handle_api_exception
-def get_followers(request, user_id):
-    """팔로워 목록 조회"""
+def _following_ids(request, user_ids):
+    """요청 사용자가 팔로우 중인 ID (현재 페이지 대상만 IN 쿼리 1개로 조회)"""
+    if not request.user.is_authenticated or not user_ids:
+        return set()
+    return set(
+        Follow.objects.filter(follower=request.user, following_id__in=user_ids)
+        .values_list('following_id', flat=True)
+    )
+
+
+def _parse_follow_page_params(request):
+    """cursor('생성시각_팔로우ID')와 limit 파싱"""
+    cursor = request.query_params.get('cursor')
+    limit = request.query_params.get('limit', FOLLOW_PAGE_SIZE)
+    try:
+        if cursor:
+            created_at, follow_id = cursor.rsplit('_', 1)
+            cursor = (datetime.fromisoformat(created_at), int(follow_id))
+        limit = min(max(int(limit), 1), FOLLOW_PAGE_MAX_SIZE)
+    except (TypeError, ValueError):
+        raise ValueError('cursor 또는 limit 형식이 올바르지 않습니다.')
+    return cursor or None, limit
+
+
+def _list_follows(request, user_id, owner_field, user_field, count_field, key, message):
+    """
+    팔로워/팔로잉 목록 (Follow.created_at 최신순 keyset 페이지네이션)
+
+    Args:
+        owner_field: 목록 주인을 가리키는 Follow 필드
+        user_field: 목록에 표시할 사용자 Follow 필드
+        count_field: 전체 수를 담은 UserProfile 카운터 필드
+    """
     user = get_object_or_404(User, id=user_id)
 
     # 프로필 공개 여부 확인
@@ -266,63 +236,59 @@ def get_followers(request, user_id):
             status_code=status.HTTP_403_FORBIDDEN
         )
 
-    followers = User.objects.filter(
-        following__following=user
-    ).select_related('profile').distinct()
+    try:
+        cursor, limit = _parse_follow_page_params(request)
+    except ValueError as e:
+        return StandardResponse.error(error=str(e), status_code=status.HTTP_400_BAD_REQUEST)
 
-    # N+1 방지: 현재 사용자의 팔로잉 목록 미리 조회
-    following_ids = set()
-    if request.user.is_authenticated:
-        following_ids = set(
-            Follow.objects.filter(follower=request.user)
-            .values_list('following_id', flat=True)
+    follows = Follow.objects.filter(**{owner_field: user}).select_related(f'{user_field}__profile')
+    if cursor:
+        created_at, follow_id = cursor
+        follows = follows.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=follow_id)
         )
+    follows = list(follows.order_by('-created_at', '-id')[:limit + 1])
+    has_more = len(follows) > limit
+    follows = follows[:limit]
 
+    users = [getattr(follow, user_field) for follow in follows]
     serializer = UserSearchSerializer(
-        followers, many=True,
-        context={'request': request, 'following_ids': following_ids}
+        users, many=True,
+        context={'request': request, 'following_ids': _following_ids(request, [u.id for u in users])}
     )
+    last = follows[-1] if has_more else None
     return StandardResponse.success(
-        data={'followers': serializer.data},
-        message='팔로워 목록을 조회했습니다.'
+        data={
+            key: serializer.data,
+            'total': getattr(profile, count_field),
+            'has_more': has_more,
+            'next_cursor': f'{last.created_at.isoformat()}_{last.id}' if last else None
+        },
+        message=message
     )
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 @handle_api_exception
-def get_following(request, user_id):
-    """팔로잉 목록 조회"""
-    user = get_object_or_404(User, id=user_id)
-
-    # 프로필 공개 여부 확인
-    profile, created = UserProfile.objects.get_or_create(user=user)
-    if not profile.is_public and request.user != user:
-        return StandardResponse.error(
-            error='비공개 프로필입니다.',
-            message='이 프로필은 비공개로 설정되어 있습니다.',
-            status_code=status.HTTP_403_FORBIDDEN
-        )
-
-    following = User.objects.filter(
-        followers__follower=user
-    ).select_related('profile').distinct()
+def get_followers(request, user_id):
+    """팔로워 목록 조회"""
+    return _list_follows(
+        request, user_id,
+        owner_field='following', user_field='follower', count_field='followers_count',
+        key='followers', message='팔로워 목록을 조회했습니다.'
+    )
 
-    # N+1 방지: 현재 사용자의 팔로잉 목록 미리 조회
-    following_ids = set()
-    if request.user.is_authenticated:
-        following_ids = set(
-            Follow.objects.filter(follower=request.user)
-            .values_list('following_id', flat=True)
-        )
 
-    serializer = UserSearchSerializer(
-        following, many=True,
-        context={'request': request, 'following_ids': following_ids}
-    )
-    return StandardResponse.success(
-        data={'following': serializer.data},
-        message='팔로잉 목록을 조회했습니다.'
+@api_view(['GET'])
+@permission_classes([AllowAny])
+@handle_api_exception
+def get_following(request, user_id):
+    """팔로잉 목록 조회"""
+    return _list_follows(
+        request, user_id,
+        owner_field='follower', user_field='following', count_field='following_count',
+        key='following', message='팔로잉 목록을 조회했습니다.'
     )
 
 
@@ -337,11 +303,9 @@ def get_friends(request):
         following__following=request.user
     ).select_related('profile').distinct()
 
-    # N+1 방지: 현재 사용자의 팔로잉 목록 미리 조회
-    following_ids = set(
-        Follow.objects.filter(follower=request.user)
-        .values_list('following_id', flat=True)
-    )
+    # 친구는 모두 내가 팔로우 중인 사용자
+    friends = list(friends)
+    following_ids = {friend.id for friend in friends}
 
     serializer = UserSearchSerializer(
         friends, many=True,
@@ -365,26 +329,27 @@ def search_users(request):
             status_code=status.HTTP_400_BAD_REQUEST
         )
 
-    users = User.objects.filter(
-        Q(nickname__icontains=query) | Q(username__icontains=query)
-    ).select_related('profile').exclude(
-        id=request.user.id if request.user.is_authenticated else None
-    )[:20]
-
-    # N+1 방지: 현재 사용자의 팔로잉 목록 미리 조회
-    following_ids = set()
-    if request.user.is_authenticated:
-        following_ids = set(
-            Follow.objects.filter(follower=request.user)
-            .values_list('following_id', flat=True)
-        )
+    try:
+        page = max(int(request.query_params.get('page', 1)), 1)
+    except ValueError:
+        page = 1
+
+    # n-gram 색인으로 후보를 찾아 일치 정도순 정렬
+    users, has_more = search_index(
+        'user', query,
+        queryset=User.objects.select_related('profile').exclude(
+            id=request.user.id if request.user.is_authenticated else None
+        ),
+        limit=USER_SEARCH_PAGE_SIZE,
+        offset=(page - 1) * USER_SEARCH_PAGE_SIZE
+    )
 
     serializer = UserSearchSerializer(
         users, many=True,
-        context={'request': request, 'following_ids': following_ids}
+        context={'request': request, 'following_ids': _following_ids(request, [user.id for user in users])}
     )
     return StandardResponse.success(
-        data={'users': serializer.data},
+        data={'users': serializer.data, 'page': page, 'has_more': has_more},
         message='검색 결과입니다.'
     )
 
@@ -101,10 +101,10 @@ class UserProfileSerializer(serializers.ModelSerializer):
         return serializer_class(obj.user, context=self.context).data
 
     def get_followers_count(self, obj):
-        return obj.user.followers.count()
+        return obj.followers_count
     
     def get_following_count(self, obj):
-        return obj.user.following.count()
+        return obj.following_count
     
     def get_is_following(self, obj):
         request = self.context.get('request')
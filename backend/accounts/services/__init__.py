@@ -1,3 +1,4 @@
 from .achievement_service import AchievementService
+from .book_completion_service import BookCompletionService
 
-__all__ = ['AchievementService']
+__all__ = ['AchievementService', 'BookCompletionService']
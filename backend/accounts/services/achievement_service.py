@@ -4,13 +4,12 @@
 - 프로필 통계 업데이트 (total_completed_days, current_streak, longest_streak)
 """
 
-from datetime import timedelta
-from django.utils import timezone
 from django.db.models import Count
 
 from accounts.models import UserAchievement, UserProfile
-from accounts.achievement_config import BIBLE_BOOKS, ALL_BIBLE_BOOKS
-from todos.models import UserBibleProgress, DailyBibleSchedule
+from accounts.services.book_completion_service import BookCompletionService
+from todos.models import UserBibleProgress
+from todos.services.streak import calculate_streaks
 
 
 class AchievementService:
@@ -41,22 +40,22 @@ class AchievementService:
                 if AchievementService._grant_achievement(user, achievement_type, days):
                     granted.append(achievement_type)
 
-        # 4. 책 완독 업적
-        book_completed = AchievementService._check_book_completion(user)
+        # 4. 책 완독 업적 (완독 현황 테이블 조회 한 번으로 책/구약·신약/전체 판정)
+        book_completed = BookCompletionService.get_completed_books(user)
         if book_completed:
             if AchievementService._grant_achievement(user, 'book_complete', len(book_completed),
                                                       details={'books': book_completed}):
                 granted.append('book_complete')
 
         # 5. 구약/신약 완독 업적
-        testament_completed = AchievementService._check_testament_completion(user)
+        testament_completed = BookCompletionService.get_completed_testaments(book_completed)
         if testament_completed:
             if AchievementService._grant_achievement(user, 'testament_complete', len(testament_completed),
                                                       details={'testaments': testament_completed}):
                 granted.append('testament_complete')
 
         # 6. 성경 완독 업적
-        if AchievementService._check_bible_completion(user):
+        if BookCompletionService.is_bible_completed(book_completed):
             if AchievementService._grant_achievement(user, 'bible_complete', 66):
                 granted.append('bible_complete')
 
@@ -81,143 +80,21 @@ class AchievementService:
         """프로필 통계 업데이트"""
         profile, _ = UserProfile.objects.get_or_create(user=user)
 
-        # 총 완료 일수 계산 (고유한 날짜 수)
-        profile.total_completed_days = UserBibleProgress.objects.filter(
-            subscription__user=user,
-            is_completed=True
-        ).values('schedule__date').distinct().count()
-
-        # 연속 일수 계산
-        profile.current_streak = AchievementService._calculate_current_streak(user)
-        longest = AchievementService._calculate_longest_streak(user)
-        profile.longest_streak = max(profile.longest_streak, longest)
+        # 완료 날짜를 한 번만 조회해 총 완료 일수와 연속 일수를 함께 계산
+        stats = AchievementService._calculate_streak_stats(user)
+        profile.total_completed_days = stats.total_days
+        profile.current_streak = stats.current_streak
+        profile.longest_streak = max(profile.longest_streak, stats.longest_streak)
 
         profile.save()
         return profile
 
     @staticmethod
-    def _calculate_current_streak(user):
-        """현재 연속 일수 계산"""
-        today = timezone.now().date()
-        streak = 0
-        current_date = today
-
-        # 최대 366일까지만 확인 (1년 + 1일)
-        max_days = 366
-        checked = 0
-
-        while checked < max_days:
-            completed = UserBibleProgress.objects.filter(
-                subscription__user=user,
-                is_completed=True,
-                schedule__date=current_date
-            ).exists()
-
-            if not completed:
-                # 오늘이면 어제부터 확인
-                if current_date == today:
-                    current_date -= timedelta(days=1)
-                    checked += 1
-                    continue
-                break
-
-            streak += 1
-            current_date -= timedelta(days=1)
-            checked += 1
-
-        return streak
-
-    @staticmethod
-    def _calculate_longest_streak(user):
-        """최장 연속 일수 계산"""
-        completed_dates = list(UserBibleProgress.objects.filter(
-            subscription__user=user,
-            is_completed=True
-        ).values_list('schedule__date', flat=True).distinct().order_by('schedule__date'))
-
-        if not completed_dates:
-            return 0
-
-        max_streak = current_streak = 1
-        for i in range(1, len(completed_dates)):
-            if (completed_dates[i] - completed_dates[i-1]).days == 1:
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 1
-
-        return max_streak
-
-    @staticmethod
-    def _check_book_completion(user):
-        """성경책별 완독 확인 - 완독한 책 목록 반환"""
-        from todos.models import PlanSubscription
-
-        # 사용자가 완료한 모든 스케줄의 책 목록
-        completed_books = UserBibleProgress.objects.filter(
+    def _calculate_streak_stats(user):
+        """완료한 스케줄 날짜 기준 연속 일수 통계 (단일 쿼리)"""
+        completed_dates = UserBibleProgress.objects.filter(
             subscription__user=user,
             is_completed=True
-        ).values_list('schedule__book', flat=True).distinct()
-
-        completed_books_set = set(completed_books)
-
-        # 사용자의 활성 구독 플랜 ID 목록 가져오기
-        active_plan_ids = PlanSubscription.objects.filter(
-            user=user,
-            is_active=True
-        ).values_list('plan_id', flat=True)
-
-        # 각 책에 대해 모든 장을 읽었는지 확인하기 어려우므로,
-        # 플랜의 해당 책 스케줄을 모두 완료했는지 확인
-        completed_full_books = []
-
-        for book in ALL_BIBLE_BOOKS:
-            if book in completed_books_set:
-                # 해당 책의 스케줄 중 완료한 것의 비율 확인
-                total_schedules = DailyBibleSchedule.objects.filter(
-                    book=book,
-                    plan_id__in=active_plan_ids
-                ).distinct().count()
-
-                if total_schedules > 0:
-                    completed_schedules = UserBibleProgress.objects.filter(
-                        subscription__user=user,
-                        subscription__is_active=True,
-                        is_completed=True,
-                        schedule__book=book
-                    ).distinct().count()
-
-                    # 해당 책의 모든 스케줄을 완료했으면 완독으로 인정
-                    if completed_schedules >= total_schedules:
-                        completed_full_books.append(book)
-
-        return completed_full_books
-
-    @staticmethod
-    def _check_testament_completion(user):
-        """구약/신약 완독 확인"""
-        completed_books = AchievementService._check_book_completion(user)
-        completed_books_set = set(completed_books)
-
-        result = []
-
-        # 구약 완독 확인
-        old_testament_set = set(BIBLE_BOOKS['old_testament'])
-        if old_testament_set.issubset(completed_books_set):
-            result.append('old_testament')
-
-        # 신약 완독 확인
-        new_testament_set = set(BIBLE_BOOKS['new_testament'])
-        if new_testament_set.issubset(completed_books_set):
-            result.append('new_testament')
-
-        return result
-
-    @staticmethod
-    def _check_bible_completion(user):
-        """성경 전체 완독 확인"""
-        completed_books = AchievementService._check_book_completion(user)
-        all_books_set = set(ALL_BIBLE_BOOKS)
-        completed_books_set = set(completed_books)
+        ).values_list('schedule__date', flat=True).distinct()
 
-        return all_books_set.issubset(completed_books_set)
+        return calculate_streaks(completed_dates)
@@ -0,0 +1,119 @@
+"""
+성경책 완독 현황 서비스
+- UserBookCompletion 집계 테이블 유지 (진도가 바뀐 책만 다시 집계)
+- 책/구약·신약/성경 전체 완독 여부를 테이블 조회 한 번으로 판정
+"""
+
+from django.db.models import Count
+from django.utils import timezone
+
+from accounts.models import UserBookCompletion
+from accounts.achievement_config import BIBLE_BOOKS, ALL_BIBLE_BOOKS
+from todos.models import UserBibleProgress, DailyBibleSchedule, PlanSubscription
+
+
+class BookCompletionService:
+    """책 완독 현황 집계 서비스"""
+
+    @staticmethod
+    def refresh_books(user, books=None):
+        """
+        지정한 책들의 완독 현황을 다시 집계해 저장 (books=None이면 전체)
+
+        활성 구독 플랜의 해당 책 스케줄을 모두 완료했으면 완독으로 인정한다.
+        책 수와 관계없이 집계 쿼리 2개 + 저장 쿼리로 처리한다.
+        """
+        books = [b for b in (books or ALL_BIBLE_BOOKS) if b in ALL_BIBLE_BOOKS]
+        if not books:
+            return []
+
+        active_plan_ids = PlanSubscription.objects.filter(
+            user=user,
+            is_active=True
+        ).values_list('plan_id', flat=True)
+
+        totals = dict(
+            DailyBibleSchedule.objects.filter(
+                plan_id__in=active_plan_ids,
+                book__in=books
+            ).values('book').annotate(cnt=Count('id')).values_list('book', 'cnt')
+        )
+        completed = dict(
+            UserBibleProgress.objects.filter(
+                subscription__user=user,
+                subscription__is_active=True,
+                is_completed=True,
+                schedule__book__in=books
+            ).values('schedule__book').annotate(cnt=Count('id')).values_list('schedule__book', 'cnt')
+        )
+
+        existing = {
+            row.book: row
+            for row in UserBookCompletion.objects.filter(user=user, book__in=books)
+        }
+        now = timezone.now()
+        to_create, to_update = [], []
+        for book in books:
+            total = totals.get(book, 0)
+            done = completed.get(book, 0)
+            is_completed = total > 0 and done >= total
+
+            row = existing.get(book)
+            if row is None:
+                if not total and not done:
+                    continue
+                to_create.append(UserBookCompletion(
+                    user=user,
+                    book=book,
+                    completed_schedules=done,
+                    total_schedules=total,
+                    is_completed=is_completed,
+                    completed_at=now if is_completed else None,
+                ))
+                continue
+
+            if (row.completed_schedules, row.total_schedules, row.is_completed) == (done, total, is_completed):
+                continue
+            if is_completed and not row.is_completed:
+                row.completed_at = now
+            elif not is_completed:
+                row.completed_at = None
+            row.completed_schedules = done
+            row.total_schedules = total
+            row.is_completed = is_completed
+            row.updated_at = now
+            to_update.append(row)
+
+        if to_create:
+            UserBookCompletion.objects.bulk_create(to_create, ignore_conflicts=True)
+        if to_update:
+            UserBookCompletion.objects.bulk_update(
+                to_update,
+                ['completed_schedules', 'total_schedules', 'is_completed', 'completed_at', 'updated_at']
+            )
+        return to_create + to_update
+
+    @staticmethod
+    def get_completed_books(user):
+        """완독한 책 목록 (성경 순서)"""
+        completed = set(
+            UserBookCompletion.objects.filter(
+                user=user,
+                is_completed=True
+            ).values_list('book', flat=True)
+        )
+        return [book for book in ALL_BIBLE_BOOKS if book in completed]
+
+    @staticmethod
+    def get_completed_testaments(completed_books):
+        """완독한 책 목록으로 구약/신약 완독 여부 판정"""
+        completed_set = set(completed_books)
+        return [
+            testament for testament in ('old_testament', 'new_testament')
+            if set(BIBLE_BOOKS[testament]).issubset(completed_set)
+        ]
+
+    @staticmethod
+    def is_bible_completed(completed_books):
+        """완독한 책 목록으로 성경 전체 완독 여부 판정"""
+        return set(ALL_BIBLE_BOOKS).issubset(set(completed_books))
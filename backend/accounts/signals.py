@@ -1,10 +1,11 @@
 """
 Signal handlers for accounts app
 """
-from django.db.models.signals import post_save
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.conf import settings
-from .models import User, UserProfile
+from .models import Follow, User, UserProfile
 from .services.achievement_service import AchievementService
 
 
@@ -34,5 +35,26 @@ def save_user_profile(sender, instance, **kwargs):
         instance.profile.save()
 
 
+def _adjust_follow_counts(follow, delta):
+    """팔로우 대상의 팔로워 수, 팔로우한 사용자의 팔로잉 수를 조건부 UPDATE로 갱신"""
+    for user_id, field in ((follow.following_id, 'followers_count'), (follow.follower_id, 'following_count')):
+        queryset = UserProfile.objects.filter(user_id=user_id)
+        if delta < 0:
+            queryset = queryset.filter(**{f'{field}__gt': 0})
+        queryset.update(**{field: F(field) + delta})
+
+
+@receiver(post_save, sender=Follow)
+def increment_follow_counts(sender, instance, created, **kwargs):
+    if created:
+        _adjust_follow_counts(instance, 1)
+
+
+@receiver(post_delete, sender=Follow)
+def decrement_follow_counts(sender, instance, **kwargs):
+    """언팔로우와 회원 탈퇴(CASCADE) 모두 반영"""
+    _adjust_follow_counts(instance, -1)
+
+
 # UserBibleProgress Signal은 todos 앱에서 정의
 # 순환 참조를 피하기 위해 todos/signals.py에서 AchievementService 호출
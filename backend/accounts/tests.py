@@ -1,3 +1,138 @@
+"""
+accounts 앱 테스트
+"""
+
+from datetime import date, timedelta
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import Follow, User, UserAchievement, UserBookCompletion, UserProfile
+from accounts.services import AchievementService, BookCompletionService
+from todos.models import BibleReadingPlan, DailyBibleSchedule, PlanSubscription, UserBibleProgress
+
+
+class BookCompletionServiceTest(TestCase):
+    """책 완독 현황 집계 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='reader', password='pw', nickname='reader')
+        plan = BibleReadingPlan.objects.create(name='플랜', created_by=self.user)
+        self.subscription = PlanSubscription.objects.create(
+            user=self.user, plan=plan, start_date=date(2025, 1, 1)
+        )
+        self.schedules = DailyBibleSchedule.objects.bulk_create([
+            DailyBibleSchedule(plan=plan, date=date(2025, 1, 1) + timedelta(days=i),
+                               book=book, start_chapter=1, end_chapter=1)
+            for i, book in enumerate(['요나', '요나', '미가'])
+        ])
+
+    def _complete(self, schedules):
+        UserBibleProgress.objects.bulk_create([
+            UserBibleProgress(subscription=self.subscription, schedule=s, is_completed=True)
+            for s in schedules
+        ])
+
+    def test_refresh_only_touched_books(self):
+        """진도가 바뀐 책만 집계하고 완독 여부를 저장"""
+        self._complete(self.schedules[:2])
+
+        BookCompletionService.refresh_books(self.user, ['요나'])
+
+        row = UserBookCompletion.objects.get(user=self.user, book='요나')
+        self.assertEqual((row.completed_schedules, row.total_schedules), (2, 2))
+        self.assertTrue(row.is_completed)
+        self.assertIsNotNone(row.completed_at)
+        self.assertFalse(UserBookCompletion.objects.filter(user=self.user, book='미가').exists())
+        self.assertEqual(BookCompletionService.get_completed_books(self.user), ['요나'])
+
+    def test_book_achievement_uses_completion_table(self):
+        """업적 판정은 완독 현황 테이블 조회로 처리"""
+        self._complete(self.schedules)
+        BookCompletionService.refresh_books(self.user)
+
+        granted = AchievementService.check_and_grant_achievements(self.user)
+
+        self.assertIn('book_complete', granted)
+        achievement = UserAchievement.objects.get(user=self.user, achievement_type='book_complete')
+        self.assertEqual(achievement.details['books'], ['요나', '미가'])
+
+
+class FollowListTest(TestCase):
+    """팔로우 카운터와 팔로워/팔로잉 목록 페이지네이션 테스트"""
+
+    def setUp(self):
+        self.star = User.objects.create_user(username='star', password='pw', nickname='star')
+        self.fans = [
+            User.objects.create_user(username=f'fan{i}', password='pw', nickname=f'fan{i}')
+            for i in range(5)
+        ]
+        self.client = APIClient()
+
+    def _follow(self, follower, following):
+        self.client.force_authenticate(follower)
+        return self.client.post('/api/v1/accounts/follow/', {'user_id': following.id}, format='json')
+
+    def test_counts_follow_unfollow_and_cascade(self):
+        for fan in self.fans:
+            self._follow(fan, self.star)
+        self.assertEqual(self._follow(self.fans[0], self.star).status_code, 400)
+
+        profile = UserProfile.objects.get(user=self.star)
+        self.assertEqual(profile.followers_count, 5)
+        self.assertEqual(UserProfile.objects.get(user=self.fans[0]).following_count, 1)
+
+        self.client.force_authenticate(self.fans[0])
+        self.client.delete(f'/api/v1/accounts/unfollow/{self.star.id}/')
+        self.fans[1].delete()
+        profile.refresh_from_db()
+        self.assertEqual(profile.followers_count, 3)
+
+        # 오래된 프로필 인스턴스를 저장해도 카운터를 덮어쓰지 않음
+        stale = UserProfile.objects.get(user=self.star)
+        self._follow(self.fans[0], self.star)
+        stale.bio = '안녕하세요'
+        stale.save()
+        stale.refresh_from_db()
+        self.assertEqual((stale.bio, stale.followers_count), ('안녕하세요', 4))
+
+        self.client.force_authenticate(self.star)
+        response = self.client.get(f'/api/v1/accounts/profile/{self.star.id}/')
+        self.assertEqual(response.data['data']['profile']['followers_count'], 4)
+
+    def test_followers_cursor_and_query_count(self):
+        for fan in self.fans:
+            self._follow(fan, self.star)
+        # 같은 시각에 생성된 팔로우도 ID로 순서를 구분
+        Follow.objects.filter(following=self.star).update(created_at=Follow.objects.first().created_at)
+        self._follow(self.star, self.fans[4])
+
+        self.client.force_authenticate(self.fans[4])
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f'/api/v1/accounts/followers/{self.star.id}/', {'limit': 2})
+        data = response.data['data']
+        self.assertEqual([user['username'] for user in data['followers']], ['fan4', 'fan3'])
+        self.assertEqual(data['total'], 5)
+        self.assertTrue(data['has_more'])
+        # 대상 사용자 + 프로필 + 팔로우 목록 + 현재 페이지 팔로우 여부 (목록 크기와 무관)
+        self.assertLessEqual(len(ctx.captured_queries), 5)
+
+        seen = [user['username'] for user in data['followers']]
+        while data['has_more']:
+            response = self.client.get(
+                f'/api/v1/accounts/followers/{self.star.id}/',
+                {'limit': 2, 'cursor': data['next_cursor']}
+            )
+            data = response.data['data']
+            seen += [user['username'] for user in data['followers']]
+        self.assertEqual(seen, ['fan4', 'fan3', 'fan2', 'fan1', 'fan0'])
+        self.assertIsNone(data['next_cursor'])
+
+        response = self.client.get(f'/api/v1/accounts/following/{self.star.id}/')
+        following = response.data['data']['following']
+        self.assertEqual([(user['username'], user['is_following']) for user in following], [('fan4', False)])
 
-# Create your tests here.
+        response = self.client.get(f'/api/v1/accounts/followers/{self.star.id}/', {'cursor': 'bad'})
+        self.assertEqual(response.status_code, 400)
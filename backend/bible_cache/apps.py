@@ -5,3 +5,6 @@ class BibleCacheConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'bible_cache'
     verbose_name = '성경 본문 캐시'
+
+    def ready(self):
+        import bible_cache.signals  # noqa: F401
@@ -0,0 +1,68 @@
+"""
+캐시된 성경 본문 정규화 명령어
+
+저장된 원본(HTML/JSON)을 다시 받아오지 않고 절 배열(verses)로 변환합니다.
+현재 형식(VERSE_FORMAT)보다 이전에 변환된 행만 처리하므로 여러 번 실행해도 안전합니다.
+
+사용법:
+    python manage.py normalize_bible_content
+    python manage.py normalize_bible_content GAE
+    python manage.py normalize_bible_content --force
+"""
+
+from django.core.management.base import BaseCommand
+
+from bible_cache.models import BibleContentCache
+from bible_cache.services import ChapterContentCache
+from bible_cache.services.verse_normalizer import VERSE_FORMAT, normalize_content
+
+
+class Command(BaseCommand):
+    help = '캐시된 성경 본문을 정규화된 절 배열로 변환합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('version', nargs='?', help='특정 번역본만 처리 (예: GAE)')
+        parser.add_argument('--force', action='store_true', help='이미 변환된 행도 다시 변환')
+        parser.add_argument('--batch-size', type=int, default=200, help='한 번에 저장할 행 수')
+
+    def handle(self, *args, **options):
+        queryset = BibleContentCache.objects.filter(fetch_success=True)
+        if options['version']:
+            queryset = queryset.filter(version=options['version'].upper())
+        if not options['force']:
+            queryset = queryset.filter(verse_format__lt=VERSE_FORMAT)
+
+        total = queryset.count()
+        self.stdout.write(f'정규화 대상: {total}개')
+
+        batch_size = options['batch_size']
+        processed = 0
+        failed = 0
+        batch = []
+
+        rows = queryset.only('id', 'cache_key', 'version', 'content', 'content_type')
+        for obj in rows.iterator(chunk_size=batch_size):
+            obj.verses = normalize_content(obj.version, obj.content, obj.content_type)
+            obj.verse_format = VERSE_FORMAT
+            if obj.verses is None:
+                failed += 1
+            batch.append(obj)
+
+            if len(batch) >= batch_size:
+                processed += self._flush(batch)
+                batch = []
+                self.stdout.write(f'진행 상황: {processed}/{total}')
+
+        if batch:
+            processed += self._flush(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f'정규화 완료! {processed}개 처리 (절을 찾지 못한 본문 {failed}개)')
+        )
+
+    @staticmethod
+    def _flush(batch):
+        # bulk_update는 시그널이 없으므로 상위 캐시 계층을 직접 무효화
+        BibleContentCache.objects.bulk_update(batch, ['verses', 'verse_format'])
+        ChapterContentCache.invalidate_many([obj.cache_key for obj in batch])
+        return len(batch)
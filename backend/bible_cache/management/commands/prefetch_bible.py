@@ -3,6 +3,8 @@
 
 성서공회/두라노 서버에서 성경 본문을 미리 가져와 캐시에 저장합니다.
 자연스러운 트래픽 패턴을 위해 랜덤 순서와 랜덤 딜레이를 적용합니다.
+여러 서버(번역본)는 동시에 요청하되, 서버별 동시 요청 수와 요청 간격을 제한합니다.
+저장이 끝난 항목은 체크포인트 파일에 기록하므로 중단 후 다시 실행하면 이어서 진행합니다.
 
 지원 버전:
     - 대한성서공회: GAE, HAN, SAE, SAENEW, COG, COGNEW, KNT
@@ -14,17 +16,19 @@
     python manage.py prefetch_bible --all
     python manage.py prefetch_bible GAE --book gen
     python manage.py prefetch_bible WOORI --min-delay 3 --max-delay 6
+    python manage.py prefetch_bible --all --concurrency 6 --per-host 2
+    python manage.py prefetch_bible GAE --checkpoint /tmp/gae.json --reset-checkpoint
 """
 
+import os
 import random
-import time
 import signal
-import sys
+import tempfile
 from django.core.management.base import BaseCommand, CommandError
 
 from bible_cache.models import BibleContentCache
-from bible_cache.services import BibleFetchService
-from bible_cache.services.bible_fetch_service import BibleFetchError, SUPPORTED_VERSIONS
+from bible_cache.services.bible_fetch_service import SUPPORTED_VERSIONS
+from bible_cache.services.prefetch_engine import PrefetchEngine
 
 
 # 성경 책 정보 (id, 이름, 장 수)
@@ -103,6 +107,8 @@ BIBLE_BOOKS = [
 BOOK_NAMES = {book[0]: book[1] for book in BIBLE_BOOKS}
 BOOK_CHAPTERS = {book[0]: book[2] for book in BIBLE_BOOKS}
 
+DEFAULT_CHECKPOINT = os.path.join(tempfile.gettempdir(), 'prefetch_bible.checkpoint.json')
+
 
 class Command(BaseCommand):
     help = '성경 본문을 미리 캐싱합니다 (랜덤 순서, 랜덤 딜레이)'
@@ -110,6 +116,7 @@ class Command(BaseCommand):
     def __init__(self):
         super().__init__()
         self.should_stop = False
+        self.engine = None
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -132,13 +139,42 @@ class Command(BaseCommand):
             '--min-delay',
             type=float,
             default=1.0,
-            help='최소 딜레이 (초, 기본값: 1.0)'
+            help='같은 서버 요청 간 최소 딜레이 (초, 기본값: 1.0)'
         )
         parser.add_argument(
             '--max-delay',
             type=float,
             default=4.0,
-            help='최대 딜레이 (초, 기본값: 4.0)'
+            help='같은 서버 요청 간 최대 딜레이 (초, 기본값: 4.0)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='전체 동시 요청 수 (기본값: 4)'
+        )
+        parser.add_argument(
+            '--per-host',
+            type=int,
+            default=1,
+            help='서버별 동시 요청 수 (기본값: 1)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=50,
+            help='한 번에 저장할 항목 수 (기본값: 50)'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            default=DEFAULT_CHECKPOINT,
+            help=f'체크포인트 파일 경로 (기본값: {DEFAULT_CHECKPOINT})'
+        )
+        parser.add_argument(
+            '--reset-checkpoint',
+            action='store_true',
+            help='기존 체크포인트를 무시하고 처음부터 실행'
         )
         parser.add_argument(
             '--skip-cached',
@@ -169,8 +205,20 @@ class Command(BaseCommand):
         skip_cached = not options['force']
         dry_run = options['dry_run']
 
-        # 대상 목록 생성
-        targets = self._build_target_list(versions, books)
+        self.engine = PrefetchEngine(
+            concurrency=options['concurrency'],
+            per_host=options['per_host'],
+            min_delay=min_delay,
+            max_delay=max_delay,
+            batch_size=options['batch_size'],
+            checkpoint_path=options['checkpoint'],
+            on_result=self._report
+        )
+        if options['reset_checkpoint']:
+            self.engine.checkpoint.clear()
+
+        # 대상 목록 생성 (이전 실행에서 저장까지 끝난 항목 제외)
+        targets = self.engine.pending(self._build_target_list(versions, books))
 
         # 이미 캐시된 항목 필터링
         if skip_cached:
@@ -178,13 +226,19 @@ class Command(BaseCommand):
 
         if not targets:
             self.stdout.write(self.style.SUCCESS('모든 항목이 이미 캐시되어 있습니다.'))
+            self.engine.checkpoint.clear()
             return
 
         # 랜덤 셔플
         random.shuffle(targets)
 
         self.stdout.write(f'총 {len(targets)}개 항목을 캐싱합니다.')
-        self.stdout.write(f'딜레이: {min_delay}~{max_delay}초 (랜덤)')
+        if self.engine.checkpoint.done:
+            self.stdout.write(f'체크포인트에서 이어서 진행 ({len(self.engine.checkpoint.done)}개 완료됨)')
+        self.stdout.write(
+            f'동시 요청: {options["concurrency"]}개 (서버별 {options["per_host"]}개), '
+            f'서버별 딜레이: {min_delay}~{max_delay}초 (랜덤)'
+        )
         self.stdout.write('Ctrl+C로 중단할 수 있습니다.\n')
 
         if dry_run:
@@ -192,12 +246,14 @@ class Command(BaseCommand):
             return
 
         # 캐싱 실행
-        self._execute_prefetch(targets, min_delay, max_delay)
+        self._execute_prefetch(targets)
 
     def _signal_handler(self, signum, frame):
         """Ctrl+C 핸들러"""
-        self.stdout.write('\n\n중단 요청됨. 현재 작업 완료 후 종료합니다...')
+        self.stdout.write('\n\n중단 요청됨. 진행 중인 요청 완료 후 저장하고 종료합니다...')
         self.should_stop = True
+        if self.engine is not None:
+            self.engine.stop()
 
     def _get_versions(self, options):
         """버전 목록 결정"""
@@ -237,13 +293,15 @@ class Command(BaseCommand):
         return targets
 
     def _filter_cached(self, targets):
-        """이미 캐시된 항목 필터링"""
-        filtered = []
-        for version, book, chapter in targets:
-            cached = BibleContentCache.get_cached_content(version, book, chapter)
-            if not cached or not cached.fetch_success:
-                filtered.append((version, book, chapter))
-        return filtered
+        """이미 캐시된 항목 필터링 (쿼리 1개)"""
+        cached_keys = set(BibleContentCache.objects.filter(
+            version__in={version for version, _, _ in targets},
+            fetch_success=True
+        ).values_list('cache_key', flat=True))
+        return [
+            target for target in targets
+            if BibleContentCache.generate_cache_key(*target) not in cached_keys
+        ]
 
     def _print_targets(self, targets):
         """대상 목록 출력 (dry-run)"""
@@ -254,56 +312,36 @@ class Command(BaseCommand):
         if len(targets) > 20:
             self.stdout.write(f'  ... 외 {len(targets) - 20}개')
 
-    def _execute_prefetch(self, targets, min_delay, max_delay):
-        """캐싱 실행"""
-        total = len(targets)
-        success = 0
-        failed = 0
-        skipped = 0
-
-        for i, (version, book, chapter) in enumerate(targets, 1):
-            if self.should_stop:
-                break
-
-            book_name = BOOK_NAMES.get(book, book)
-
-            try:
-                # fetch 시도
-                BibleFetchService.get_bible_content(
-                    version=version,
-                    book=book,
-                    chapter=chapter,
-                    force_refresh=True
-                )
-                success += 1
-                self.stdout.write(
-                    f'[{i}/{total}] {self.style.SUCCESS("OK")} '
-                    f'{version} {book_name} {chapter}장'
-                )
-
-            except BibleFetchError as e:
-                failed += 1
-                self.stdout.write(
-                    f'[{i}/{total}] {self.style.ERROR("FAIL")} '
-                    f'{version} {book_name} {chapter}장 - {e}'
-                )
+    def _report(self, progress, target, error):
+        """항목별 결과와 처리량/남은 시간 출력"""
+        version, book, chapter = target
+        book_name = BOOK_NAMES.get(book, book)
+        prefix = f'[{progress.processed}/{progress.total}]'
+        if error is None:
+            self.stdout.write(f'{prefix} {self.style.SUCCESS("OK")} {version} {book_name} {chapter}장')
+        else:
+            self.stdout.write(
+                f'{prefix} {self.style.ERROR("FAIL")} {version} {book_name} {chapter}장 - {error}'
+            )
 
-            except Exception as e:
-                failed += 1
-                self.stdout.write(
-                    f'[{i}/{total}] {self.style.ERROR("ERROR")} '
-                    f'{version} {book_name} {chapter}장 - {e}'
-                )
+        if progress.processed % 20 == 0 or progress.processed == progress.total:
+            eta = progress.eta
+            eta_text = f'{int(eta // 60)}분 {int(eta % 60)}초' if eta is not None else '-'
+            self.stdout.write(f'  처리량: {progress.rate * 60:.1f}장/분, 남은 시간: {eta_text}')
 
-            # 마지막이 아니면 랜덤 딜레이
-            if i < total and not self.should_stop:
-                delay = random.uniform(min_delay, max_delay)
-                time.sleep(delay)
+    def _execute_prefetch(self, targets):
+        """캐싱 실행"""
+        progress = self.engine.run(targets)
 
         # 결과 요약
         self.stdout.write('\n' + '=' * 50)
-        self.stdout.write(f'완료: {success}개 성공, {failed}개 실패')
+        self.stdout.write(
+            f'완료: {progress.success}개 성공, {progress.failed}개 실패 '
+            f'({progress.elapsed:.1f}초, {progress.rate * 60:.1f}장/분)'
+        )
         if self.should_stop:
-            remaining = total - i
-            self.stdout.write(f'중단됨: {remaining}개 남음')
+            remaining = progress.total - progress.processed
+            self.stdout.write(f'중단됨: {remaining}개 남음 (다시 실행하면 이어서 진행)')
+        elif progress.failed:
+            self.stdout.write(f'실패한 항목은 다시 실행하면 재시도합니다 (체크포인트: {self.engine.checkpoint.path})')
         self.stdout.write('=' * 50)
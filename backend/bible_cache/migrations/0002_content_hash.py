@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:03
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_content_hash(apps, schema_editor):
+    BibleContentCache = apps.get_model('bible_cache', 'BibleContentCache')
+    batch = []
+    for obj in BibleContentCache.objects.only('id', 'content').iterator(chunk_size=500):
+        obj.content_hash = hashlib.sha256((obj.content or '').encode('utf-8')).hexdigest()
+        batch.append(obj)
+        if len(batch) >= 500:
+            BibleContentCache.objects.bulk_update(batch, ['content_hash'])
+            batch = []
+    if batch:
+        BibleContentCache.objects.bulk_update(batch, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bible_cache', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='biblecontentcache',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', help_text='콘텐츠 SHA-256 해시 (ETag)', max_length=64),
+        ),
+        migrations.RunPython(backfill_content_hash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bible_cache', '0002_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='biblecontentcache',
+            name='verse_format',
+            field=models.PositiveSmallIntegerField(default=0, help_text='정규화에 사용한 형식 버전 (0 = 미변환)'),
+        ),
+        migrations.AddField(
+            model_name='biblecontentcache',
+            name='verses',
+            field=models.JSONField(blank=True, help_text='정규화된 절 배열 (파싱 실패 시 null)', null=True),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import hashlib
+
 from django.db import models
 
 
@@ -47,6 +49,23 @@ class BibleContentCache(models.Model):
         default='html',
         help_text="콘텐츠 타입"
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        help_text="콘텐츠 SHA-256 해시 (ETag)"
+    )
+
+    # 정규화된 절 배열 [{'verse': 1, 'text': '...', 'title': '...'}, ...]
+    verses = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="정규화된 절 배열 (파싱 실패 시 null)"
+    )
+    verse_format = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="정규화에 사용한 형식 버전 (0 = 미변환)"
+    )
 
     # 메타 정보
     source_url = models.URLField(
@@ -74,6 +93,22 @@ class BibleContentCache(models.Model):
     def __str__(self):
         return f"{self.version}:{self.book}:{self.chapter}"
 
+    def save(self, *args, **kwargs):
+        # 관리자 수정 등 모든 저장 경로에서 ETag용 해시를 본문과 맞춤
+        self.content_hash = self.compute_content_hash(self.content)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'content' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'content_hash'}
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def compute_content_hash(content: str) -> str:
+        return hashlib.sha256((content or '').encode('utf-8')).hexdigest()
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.content_hash}"'
+
     @classmethod
     def generate_cache_key(cls, version: str, book: str, chapter: int) -> str:
         """캐시 키 생성"""
@@ -97,7 +132,9 @@ class BibleContentCache(models.Model):
         content: str,
         content_type: str = 'html',
         source_url: str = '',
-        fetch_success: bool = True
+        fetch_success: bool = True,
+        verses=None,
+        verse_format: int = 0
     ):
         """캐시에 콘텐츠 저장 (upsert)"""
         cache_key = cls.generate_cache_key(version, book, chapter)
@@ -112,6 +149,8 @@ class BibleContentCache(models.Model):
                 'content_type': content_type,
                 'source_url': source_url,
                 'fetch_success': fetch_success,
+                'verses': verses,
+                'verse_format': verse_format,
             }
         )
         return obj, created
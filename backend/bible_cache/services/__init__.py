@@ -1,4 +1,5 @@
 from .bible_fetch_service import BibleFetchService
 from .api_bible_service import ApiBibleService, ApiBibleError
+from .content_cache import ChapterContentCache
 
-__all__ = ['BibleFetchService', 'ApiBibleService', 'ApiBibleError']
+__all__ = ['BibleFetchService', 'ApiBibleService', 'ApiBibleError', 'ChapterContentCache']
@@ -11,6 +11,8 @@ import json
 from typing import Optional, Tuple, Dict, List
 from django.conf import settings
 
+from bible_cache.services.upstream import UpstreamClient
+
 logger = logging.getLogger(__name__)
 
 # API.Bible 기본 URL
@@ -140,7 +142,12 @@ class ApiBibleService:
             return book in OLD_TESTAMENT_BOOKS or book in NEW_TESTAMENT_BOOKS
     
     @staticmethod
-    def fetch_chapter(version: str, book: str, chapter: int) -> Tuple[str, str, str]:
+    def fetch_chapter(
+        version: str,
+        book: str,
+        chapter: int,
+        session: Optional[requests.Session] = None
+    ) -> Tuple[str, str, str]:
         """
         API.Bible에서 성경 본문 가져오기
         
@@ -148,6 +155,7 @@ class ApiBibleService:
             version: 역본 코드 (HEB, GRK, KJV, WEB, ASV)
             book: 성경책 코드 (gen, mat 등)
             chapter: 장 번호
+            session: 별도 세션 (없으면 원본 서버 공용 세션)
             
         Returns:
             Tuple[content, content_type, source_url]
@@ -200,8 +208,9 @@ class ApiBibleService:
         }
         
         try:
-            response = requests.get(
+            response = UpstreamClient.get(
                 url,
+                session=session,
                 headers=headers,
                 params=params,
                 timeout=REQUEST_TIMEOUT
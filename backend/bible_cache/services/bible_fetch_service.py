@@ -10,6 +10,10 @@ from typing import Optional, Tuple
 from django.conf import settings
 
 from bible_cache.models import BibleContentCache
+from bible_cache.services.content_cache import ChapterContentCache
+from bible_cache.services.single_flight import chapter_fetch_flight
+from bible_cache.services.upstream import UpstreamClient
+from bible_cache.services.verse_normalizer import VERSE_FORMAT, normalize_content
 
 logger = logging.getLogger(__name__)
 
@@ -168,6 +172,23 @@ class BibleFetchService:
         Raises:
             BibleFetchError: 원본에서도 캐시에서도 가져오기 실패
         """
+        entry = BibleFetchService.get_bible_entry(version, book, chapter, force_refresh)
+        return entry['content'], entry['content_type'], entry['from_cache']
+
+    @staticmethod
+    def get_bible_entry(
+        version: str,
+        book: str,
+        chapter: int,
+        force_refresh: bool = False
+    ) -> dict:
+        """
+        get_bible_content와 같으나 HTTP 캐시 헤더용 메타데이터를 함께 반환
+
+        Returns:
+            dict: content, content_type, content_hash, verses, verse_format, updated_at,
+                  from_cache, stale(원본 fetch 실패로 이전 캐시를 사용한 경우 True)
+        """
         version = version.upper()
         book = book.lower()
 
@@ -175,32 +196,28 @@ class BibleFetchService:
         if version not in SUPPORTED_VERSIONS:
             raise BibleFetchError(f"지원하지 않는 번역본: {version}")
 
-        # 1. 캐시 확인 (force_refresh가 아닌 경우)
+        # 1. 캐시 확인 (LRU → Redis → DB, force_refresh면 상위 계층 무효화)
+        cache_key = BibleContentCache.generate_cache_key(version, book, chapter)
         if not force_refresh:
-            cached = BibleContentCache.get_cached_content(version, book, chapter)
-            if cached and cached.fetch_success:
+            entry = ChapterContentCache.get(version, book, chapter)
+            if entry is not None:
                 logger.debug(f"Cache hit: {version}:{book}:{chapter}")
-                return cached.content, cached.content_type, True
+                entry = BibleFetchService._ensure_normalized(version, book, chapter, entry)
+                return {**entry, 'from_cache': True, 'stale': False}
+        else:
+            ChapterContentCache.invalidate(cache_key)
 
-        # 2. 원본에서 fetch 시도
+        # 2. 원본에서 fetch 시도 (캐시 miss는 같은 장에 대해 한 번만 fetch하고 동시 요청은 결과 공유)
         try:
-            content, content_type, source_url = BibleFetchService._fetch_from_source(
-                version, book, chapter
-            )
-
-            # 캐시에 저장
-            BibleContentCache.save_to_cache(
-                version=version,
-                book=book,
-                chapter=chapter,
-                content=content,
-                content_type=content_type,
-                source_url=source_url,
-                fetch_success=True
-            )
-
-            logger.info(f"Fetched and cached: {version}:{book}:{chapter}")
-            return content, content_type, False
+            if force_refresh:
+                entry = BibleFetchService._fetch_and_store(version, book, chapter)
+            else:
+                entry = chapter_fetch_flight.do(
+                    cache_key,
+                    lambda: BibleFetchService._fetch_and_store(version, book, chapter),
+                    lambda: ChapterContentCache.peek(cache_key)
+                )
+            return {**entry, 'from_cache': False, 'stale': False}
 
         except Exception as e:
             logger.warning(f"원본 fetch 실패: {version}:{book}:{chapter} - {e}")
@@ -209,40 +226,95 @@ class BibleFetchService:
             cached = BibleContentCache.get_cached_content(version, book, chapter)
             if cached:
                 logger.info(f"Using stale cache: {version}:{book}:{chapter}")
-                return cached.content, cached.content_type, True
+                entry = ChapterContentCache.build_entry(cached)
+                if entry['verse_format'] < VERSE_FORMAT:
+                    # 실패 기록일 수 있으므로 상위 계층에 저장하지 않고 응답용으로만 변환
+                    entry['verses'] = normalize_content(version, cached.content, cached.content_type)
+                return {**entry, 'from_cache': True, 'stale': True}
 
             # 4. 캐시도 없으면 에러
             raise BibleFetchError(
                 f"성경 본문을 가져올 수 없습니다: {version}:{book}:{chapter}"
             )
 
+    @staticmethod
+    def _fetch_and_store(version: str, book: str, chapter: int) -> dict:
+        """원본 fetch 후 저장 (절 배열로 정규화, DB 저장 후 상위 계층 갱신)"""
+        content, content_type, source_url = BibleFetchService._fetch_from_source(
+            version, book, chapter
+        )
+        obj, _ = BibleContentCache.save_to_cache(
+            version=version,
+            book=book,
+            chapter=chapter,
+            content=content,
+            content_type=content_type,
+            source_url=source_url,
+            fetch_success=True,
+            verses=normalize_content(version, content, content_type),
+            verse_format=VERSE_FORMAT
+        )
+        ChapterContentCache.set(obj)
+
+        logger.info(f"Fetched and cached: {version}:{book}:{chapter}")
+        return ChapterContentCache.build_entry(obj)
+
+    @staticmethod
+    def _ensure_normalized(version: str, book: str, chapter: int, entry: dict) -> dict:
+        """
+        이전 형식(또는 미변환) 캐시 항목을 현재 형식으로 정규화
+
+        DB와 상위 계층을 함께 갱신한다 (updated_at/ETag는 원본 기준이라 바뀌지 않음).
+        전체 변환은 normalize_bible_content 명령으로 미리 수행할 수 있다.
+        """
+        if entry.get('verse_format', 0) >= VERSE_FORMAT:
+            return entry
+
+        verses = normalize_content(version, entry['content'], entry['content_type'])
+        cache_key = BibleContentCache.generate_cache_key(version, book, chapter)
+        BibleContentCache.objects.filter(cache_key=cache_key).update(
+            verses=verses,
+            verse_format=VERSE_FORMAT
+        )
+        entry = {**entry, 'verses': verses, 'verse_format': VERSE_FORMAT}
+        ChapterContentCache.store_entry(cache_key, entry)
+        return entry
+
     @staticmethod
     def _fetch_from_source(
         version: str,
         book: str,
-        chapter: int
+        chapter: int,
+        session: Optional[requests.Session] = None
     ) -> Tuple[str, str, str]:
         """
         원본 소스에서 성경 본문 직접 가져오기
 
+        Args:
+            session: 별도 세션 (없으면 원본 서버 공용 세션)
+
         Returns:
             Tuple[content, content_type, source_url]
         """
         # API.Bible 역본인 경우
         if version in API_BIBLE_VERSIONS:
             ApiBibleService = get_api_bible_service()
-            return ApiBibleService.fetch_chapter(version, book, chapter)
+            return ApiBibleService.fetch_chapter(version, book, chapter, session=session)
         
         # 한글 역본
         if version == 'KNT':
-            return BibleFetchService._fetch_knt(book, chapter)
+            return BibleFetchService._fetch_knt(book, chapter, session=session)
         elif version == 'WOORI':
-            return BibleFetchService._fetch_woori(book, chapter)
+            return BibleFetchService._fetch_woori(book, chapter, session=session)
         else:
-            return BibleFetchService._fetch_standard(version, book, chapter)
+            return BibleFetchService._fetch_standard(version, book, chapter, session=session)
 
     @staticmethod
-    def _fetch_knt(book: str, chapter: int) -> Tuple[str, str, str]:
+    def _fetch_knt(
+        book: str,
+        chapter: int,
+        session: Optional[requests.Session] = None
+    ) -> Tuple[str, str, str]:
         """
         새한글성경(KNT) 가져오기
 
@@ -257,8 +329,9 @@ class BibleFetchService:
             'chapter': f"{knt_book}.{chapter}"
         }
 
-        response = requests.get(
+        response = UpstreamClient.get(
             url,
+            session=session,
             params=params,
             timeout=REQUEST_TIMEOUT,
             headers={
@@ -280,7 +353,8 @@ class BibleFetchService:
     def _fetch_standard(
         version: str,
         book: str,
-        chapter: int
+        chapter: int,
+        session: Optional[requests.Session] = None
     ) -> Tuple[str, str, str]:
         """
         표준 번역본 가져오기 (GAE, HAN, SAE 등)
@@ -298,8 +372,9 @@ class BibleFetchService:
             'fontWeight': 'normal',
         }
 
-        response = requests.get(
+        response = UpstreamClient.get(
             url,
+            session=session,
             params=params,
             timeout=REQUEST_TIMEOUT,
             headers={
@@ -317,7 +392,11 @@ class BibleFetchService:
         return response.text, 'html', source_url
 
     @staticmethod
-    def _fetch_woori(book: str, chapter: int) -> Tuple[str, str, str]:
+    def _fetch_woori(
+        book: str,
+        chapter: int,
+        session: Optional[requests.Session] = None
+    ) -> Tuple[str, str, str]:
         """
         우리말성경(두라노) 가져오기
 
@@ -339,8 +418,9 @@ class BibleFetchService:
             'ct': chapter,
         }
 
-        response = requests.get(
+        response = UpstreamClient.get(
             url,
+            session=session,
             params=params,
             timeout=REQUEST_TIMEOUT,
             headers={
@@ -0,0 +1,252 @@
+"""
+성경 본문 다계층 캐시
+
+조회 순서: 프로세스 내 LRU → Redis(Django cache) → DB(BibleContentCache)
+- LRU는 본문 크기 합계 기준으로 오래된 항목부터 제거
+- 다른 프로세스의 LRU는 무효화 신호를 받지 못하므로 짧은 TTL로 수렴
+- 계층별 hit/miss 카운터 제공 (프로세스 단위)
+- 조건부 요청(ETag/Last-Modified) 검증값은 본문을 읽지 않고 조회 가능
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from bible_cache.models import BibleContentCache
+
+logger = logging.getLogger(__name__)
+
+# 항목 구조가 바뀌면 버전을 올려 이전 형식의 항목을 무시
+REDIS_KEY = 'bible_content:v3:{cache_key}'
+# 본문은 사실상 불변이므로 Redis에는 오래 보관 (변경 시 명시적으로 무효화)
+REDIS_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def _lru_max_bytes():
+    return getattr(settings, 'BIBLE_CONTENT_LRU_MAX_BYTES', 32 * 1024 * 1024)
+
+
+def _lru_ttl():
+    return getattr(settings, 'BIBLE_CONTENT_LRU_TTL', 300)
+
+
+class _SizedLRU:
+    """본문 크기 합계로 제한되는 스레드 안전 LRU"""
+
+    def __init__(self):
+        self._data = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry_size(entry):
+        size = len(entry['content'].encode('utf-8'))
+        if entry.get('verses'):
+            size += len(json.dumps(entry['verses'], ensure_ascii=False).encode('utf-8'))
+        return size
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, _, entry = item
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        size = self._entry_size(entry)
+        max_bytes = _lru_max_bytes()
+        if size > max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            # 제거 시 다시 인코딩하지 않도록 크기를 함께 보관
+            self._data[key] = (time.monotonic() + _lru_ttl(), size, entry)
+            self._size += size
+            while self._size > max_bytes and self._data:
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def _remove(self, key):
+        item = self._data.pop(key, None)
+        if item is not None:
+            self._size -= item[1]
+
+    @property
+    def size(self):
+        return self._size
+
+    def __len__(self):
+        return len(self._data)
+
+
+class ChapterContentCache:
+    """성경 본문 다계층 캐시"""
+
+    _lru = _SizedLRU()
+    _stats_lock = threading.Lock()
+    _stats = {}
+
+    @classmethod
+    def _count(cls, tier, result):
+        with cls._stats_lock:
+            tier_stats = cls._stats.setdefault(tier, {'hit': 0, 'miss': 0})
+            tier_stats[result] += 1
+
+    @staticmethod
+    def build_entry(obj):
+        """BibleContentCache 행 → 캐시 항목"""
+        return {
+            'content': obj.content,
+            'content_type': obj.content_type,
+            'content_hash': obj.content_hash,
+            'verses': obj.verses,
+            'verse_format': obj.verse_format,
+            'updated_at': obj.updated_at,
+        }
+
+    @classmethod
+    def get(cls, version: str, book: str, chapter: int):
+        """
+        캐시 항목 조회 (LRU → Redis → DB 순, 하위 계층 hit는 상위 계층에 채움)
+
+        Returns:
+            dict 또는 None (fetch_success인 DB 행이 없으면 None)
+        """
+        cache_key = BibleContentCache.generate_cache_key(version, book, chapter)
+
+        entry = cls._lru.get(cache_key)
+        if entry is not None:
+            cls._count('lru', 'hit')
+            return entry
+        cls._count('lru', 'miss')
+
+        redis_key = REDIS_KEY.format(cache_key=cache_key)
+        try:
+            entry = cache.get(redis_key)
+        except Exception as e:
+            logger.warning(f"Redis 본문 캐시 조회 실패: {cache_key} - {e}")
+            entry = None
+        if entry is not None:
+            cls._count('redis', 'hit')
+            cls._lru.set(cache_key, entry)
+            return entry
+        cls._count('redis', 'miss')
+
+        obj = BibleContentCache.get_cached_content(version, book, chapter)
+        if obj is None or not obj.fetch_success:
+            cls._count('db', 'miss')
+            return None
+        cls._count('db', 'hit')
+
+        entry = cls.build_entry(obj)
+        cls.store_entry(cache_key, entry)
+        return entry
+
+    @classmethod
+    def peek(cls, cache_key: str):
+        """상위 계층(LRU, Redis)만 조회 (DB 조회와 통계 집계 없음, 다른 워커의 fetch 결과 대기용)"""
+        entry = cls._lru.get(cache_key)
+        if entry is not None:
+            return entry
+        try:
+            return cache.get(REDIS_KEY.format(cache_key=cache_key))
+        except Exception as e:
+            logger.warning(f"Redis 본문 캐시 조회 실패: {cache_key} - {e}")
+            return None
+
+    @classmethod
+    def get_validators(cls, version: str, book: str, chapter: int):
+        """
+        조건부 요청 검증값 조회 (content_hash, updated_at)
+
+        상위 계층에 항목이 있으면 그대로 쓰고, 없으면 본문 컬럼 없이 DB에서 조회한다.
+        상위 계층은 채우지 않는다 (304 응답에는 본문이 필요 없음).
+        """
+        cache_key = BibleContentCache.generate_cache_key(version, book, chapter)
+
+        entry = cls._lru.get(cache_key)
+        if entry is None:
+            try:
+                entry = cache.get(REDIS_KEY.format(cache_key=cache_key))
+            except Exception as e:
+                logger.warning(f"Redis 본문 캐시 조회 실패: {cache_key} - {e}")
+        if entry is not None:
+            return {'content_hash': entry['content_hash'], 'updated_at': entry['updated_at']}
+
+        return BibleContentCache.objects.filter(
+            cache_key=cache_key,
+            fetch_success=True
+        ).values('content_hash', 'updated_at').first()
+
+    @classmethod
+    def set(cls, obj):
+        """저장된 BibleContentCache 행으로 상위 계층 갱신"""
+        if not obj.fetch_success:
+            return
+        cls.store_entry(obj.cache_key, cls.build_entry(obj))
+
+    @classmethod
+    def store_entry(cls, cache_key, entry):
+        """항목을 상위 계층(Redis, LRU)에 저장"""
+        try:
+            cache.set(REDIS_KEY.format(cache_key=cache_key), entry, timeout=REDIS_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Redis 본문 캐시 저장 실패: {cache_key} - {e}")
+        cls._lru.set(cache_key, entry)
+
+    @classmethod
+    def invalidate(cls, cache_key: str):
+        """상위 계층(LRU, Redis)에서 항목 제거"""
+        cls._lru.delete(cache_key)
+        try:
+            cache.delete(REDIS_KEY.format(cache_key=cache_key))
+        except Exception as e:
+            logger.warning(f"Redis 본문 캐시 삭제 실패: {cache_key} - {e}")
+
+    @classmethod
+    def invalidate_many(cls, cache_keys):
+        """여러 항목을 한 번에 제거 (bulk_update 등 시그널이 없는 경로용)"""
+        for cache_key in cache_keys:
+            cls._lru.delete(cache_key)
+        try:
+            cache.delete_many([REDIS_KEY.format(cache_key=key) for key in cache_keys])
+        except Exception as e:
+            logger.warning(f"Redis 본문 캐시 일괄 삭제 실패: {e}")
+
+    @classmethod
+    def clear_local(cls):
+        """프로세스 내 LRU 비우기"""
+        cls._lru.clear()
+
+    @classmethod
+    def get_stats(cls):
+        """계층별 hit/miss 및 LRU 사용량"""
+        with cls._stats_lock:
+            tiers = {tier: dict(values) for tier, values in cls._stats.items()}
+        return {
+            'tiers': tiers,
+            'lru': {
+                'entries': len(cls._lru),
+                'bytes': cls._lru.size,
+                'max_bytes': _lru_max_bytes(),
+            },
+        }
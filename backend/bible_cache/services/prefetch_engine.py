@@ -0,0 +1,263 @@
+"""
+성경 본문 대량 사전 캐싱 엔진
+
+- 스레드 풀로 동시에 가져오되, 원본 서버(호스트)별 동시 요청 수와 요청 간격을 제한
+- 모든 요청이 하나의 세션(연결 풀)을 공유하므로 keep-alive 연결을 재사용
+- 원본 서버가 죽어 서킷이 열리면 해당 서버 항목은 바로 실패 처리 (다시 실행하면 재시도)
+- 가져온 본문은 정규화 후 묶어서 저장 (upsert 한 번 + 상위 캐시 계층 무효화)
+- 저장이 끝난 항목은 체크포인트 파일에 기록하여 중단 후 다시 실행하면 이어서 진행
+- DB 작업은 호출한 스레드에서만 수행 (작업 스레드는 HTTP 요청과 정규화만 담당)
+"""
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from bible_cache.models import BibleContentCache
+from bible_cache.services import api_bible_service, bible_fetch_service
+from bible_cache.services.content_cache import ChapterContentCache
+from bible_cache.services.upstream import UpstreamClient
+from bible_cache.services.verse_normalizer import VERSE_FORMAT, normalize_content
+from utils.db import upsert_options
+
+logger = logging.getLogger(__name__)
+
+# (version, book, chapter)
+Target = Tuple[str, str, int]
+
+
+def source_host(version: str) -> str:
+    """번역본의 원본 서버 호스트 (호스트별 요청 제한 단위)"""
+    if version in bible_fetch_service.API_BIBLE_VERSIONS:
+        base_url = api_bible_service.API_BIBLE_BASE_URL
+    elif version == 'WOORI':
+        base_url = bible_fetch_service.DURANNO_BASE_URL
+    else:
+        base_url = bible_fetch_service.BSKOREA_BASE_URL
+    return urlsplit(base_url).netloc
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수와 요청 시작 간격(랜덤 딜레이) 제한"""
+
+    def __init__(self, per_host: int, min_delay: float, max_delay: float):
+        self.per_host = per_host
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._next_start = {}
+
+    def acquire(self, host: str):
+        with self._lock:
+            slot = self._slots.setdefault(host, threading.BoundedSemaphore(self.per_host))
+        slot.acquire()
+        # 다음 요청 시작 시각을 예약한 뒤 잠금 밖에서 대기
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + random.uniform(self.min_delay, self.max_delay)
+        if start > now:
+            time.sleep(start - now)
+
+    def release(self, host: str):
+        self._slots[host].release()
+
+
+class PrefetchCheckpoint:
+    """저장이 끝난 캐시 키 목록을 JSON 파일로 보관 (원자적 교체)"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.done = set()
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.done = set(json.load(f).get('done', []))
+
+    def mark_done(self, cache_keys: Iterable[str]):
+        self.done.update(cache_keys)
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'done': sorted(self.done)}, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.done = set()
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+@dataclass
+class PrefetchProgress:
+    total: int
+    processed: int = 0
+    success: int = 0
+    failed: int = 0
+    started_at: float = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """초당 처리 항목 수"""
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """남은 예상 시간 (초)"""
+        rate = self.rate
+        if not rate:
+            return None
+        return (self.total - self.processed) / rate
+
+
+class PrefetchEngine:
+    """
+    성경 본문 대량 사전 캐싱
+
+    on_result(progress, target, error): 항목 하나를 처리할 때마다 호출 (error는 실패 시 예외)
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        per_host: int = 2,
+        min_delay: float = 1.0,
+        max_delay: float = 4.0,
+        batch_size: int = 50,
+        checkpoint_path: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        on_result: Optional[Callable] = None,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.limiter = HostLimiter(max(1, per_host), min_delay, max_delay)
+        self.checkpoint = PrefetchCheckpoint(checkpoint_path)
+        # 연결 풀 크기를 동시성에 맞춘 전용 세션 (서킷 브레이커 상태는 일반 조회와 공유)
+        self.session = session or UpstreamClient.build_session(self.concurrency)
+        self.on_result = on_result
+        self._stop = threading.Event()
+
+    def stop(self):
+        """새 요청을 보내지 않고 진행 중인 요청만 마무리 (Ctrl+C 등)"""
+        self._stop.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def pending(self, targets: List[Target]) -> List[Target]:
+        """체크포인트에 기록된 항목 제외"""
+        return [
+            target for target in targets
+            if BibleContentCache.generate_cache_key(*target) not in self.checkpoint.done
+        ]
+
+    def _fetch(self, target: Target) -> dict:
+        """작업 스레드: 원본 요청 + 정규화 (DB 접근 없음)"""
+        version, book, chapter = target
+        host = source_host(version)
+        self.limiter.acquire(host)
+        try:
+            content, content_type, source_url = bible_fetch_service.BibleFetchService._fetch_from_source(
+                version, book, chapter, session=self.session
+            )
+        finally:
+            self.limiter.release(host)
+        return {
+            'version': version,
+            'book': book.lower(),
+            'chapter': chapter,
+            'content': content,
+            'content_type': content_type,
+            'source_url': source_url,
+            'verses': normalize_content(version, content, content_type),
+        }
+
+    def _flush(self, rows: List[dict]):
+        """묶음 저장 (upsert 한 번, 시그널이 없으므로 상위 캐시 계층 직접 무효화)"""
+        objs = [
+            BibleContentCache(
+                cache_key=BibleContentCache.generate_cache_key(row['version'], row['book'], row['chapter']),
+                content_hash=BibleContentCache.compute_content_hash(row['content']),
+                fetch_success=True,
+                verse_format=VERSE_FORMAT,
+                **row
+            )
+            for row in rows
+        ]
+        BibleContentCache.objects.bulk_create(
+            objs,
+            **upsert_options(['cache_key'], [
+                'content', 'content_type', 'content_hash', 'verses', 'verse_format',
+                'source_url', 'fetch_success', 'updated_at',
+            ])
+        )
+        cache_keys = [obj.cache_key for obj in objs]
+        ChapterContentCache.invalidate_many(cache_keys)
+        self.checkpoint.mark_done(cache_keys)
+        self.checkpoint.save()
+
+    def run(self, targets: List[Target]) -> PrefetchProgress:
+        """
+        대상 목록 사전 캐싱 (체크포인트에 있는 항목은 건너뜀)
+
+        모든 항목이 성공하면 체크포인트 파일을 삭제한다.
+        """
+        targets = self.pending(targets)
+        progress = PrefetchProgress(total=len(targets), started_at=time.monotonic())
+        queue = iter(targets)
+        batch = []
+        in_flight = {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            def submit_next():
+                # 대기열을 동시성의 두 배로 제한 (대상 전체를 한 번에 제출하지 않음)
+                while not self.stopped and len(in_flight) < self.concurrency * 2:
+                    target = next(queue, None)
+                    if target is None:
+                        return
+                    in_flight[executor.submit(self._fetch, target)] = target
+
+            submit_next()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    target = in_flight.pop(future)
+                    progress.processed += 1
+                    error = future.exception()
+                    if error is None:
+                        progress.success += 1
+                        batch.append(future.result())
+                    else:
+                        progress.failed += 1
+                        logger.warning(f"Prefetch 실패: {':'.join(map(str, target))} - {error}")
+                    if self.on_result:
+                        self.on_result(progress, target, error)
+
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+                    batch = []
+                submit_next()
+
+        if batch:
+            self._flush(batch)
+        if not self.stopped and not progress.failed:
+            self.checkpoint.clear()
+        return progress
@@ -0,0 +1,132 @@
+"""
+캐시 miss 요청 병합 (single-flight)
+
+같은 키에 대한 동시 요청 중 하나만 실제 작업(원본 fetch + 저장)을 수행하고 나머지는 그 결과를 받는다.
+- 같은 프로세스의 스레드: 진행 중인 호출을 공유하고 완료 이벤트를 기다림
+- 다른 워커 프로세스: Redis 잠금(cache.add)을 못 얻으면 결과가 캐시에 나타날 때까지 폴링
+- 잠금을 가진 워커가 실패하면(잠금은 풀렸는데 결과가 없음) 기다리던 요청도 실패로 처리
+  (호출 측이 이전 캐시로 fallback, 원본에 요청이 몰리지 않음)
+- 대기 시간이 지나도 결과가 없으면 직접 수행 (잠금 보유 워커가 죽은 경우 대비)
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY = 'single_flight:{namespace}:{key}'
+POLL_INTERVAL = 0.1
+
+
+class SingleFlightError(Exception):
+    """다른 워커의 작업이 결과 없이 끝남"""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """키 단위 요청 병합"""
+
+    def __init__(self, namespace: str, lock_timeout: Callable[[], float], wait_timeout: Callable[[], float]):
+        self.namespace = namespace
+        self._lock_timeout = lock_timeout
+        self._wait_timeout = wait_timeout
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = {'executed': 0, 'shared_local': 0, 'shared_remote': 0, 'wait_timeouts': 0}
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def do(self, key: str, fn: Callable, poll: Callable[[], Optional[object]]):
+        """
+        key에 대해 fn을 한 번만 실행하고 결과 반환
+
+        Args:
+            fn: 실제 작업 (결과를 poll로 조회할 수 있는 곳에 저장해야 함)
+            poll: 다른 워커가 저장한 결과 조회 (없으면 None)
+
+        Raises:
+            fn이 발생시킨 예외, 또는 다른 워커의 작업이 실패한 경우 SingleFlightError
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self._count('shared_local')
+            # 다른 워커 대기 + 직접 수행까지 걸릴 수 있는 시간만큼만 기다림
+            if not call.done.wait(self._lock_timeout() + self._wait_timeout()):
+                raise SingleFlightError(f"요청 병합 대기 시간 초과: {key}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run(key, fn, poll)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def _run(self, key, fn, poll):
+        lock_key = LOCK_KEY.format(namespace=self.namespace, key=key)
+        if cache.add(lock_key, 1, timeout=self._lock_timeout()):
+            try:
+                self._count('executed')
+                return fn()
+            finally:
+                cache.delete(lock_key)
+
+        # 다른 워커가 작업 중: 결과가 저장될 때까지 대기
+        deadline = time.monotonic() + self._wait_timeout()
+        while time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            result = poll()
+            if result is not None:
+                self._count('shared_remote')
+                return result
+            if cache.get(lock_key) is None:
+                # 잠금이 풀린 직후 저장된 경우를 한 번 더 확인
+                result = poll()
+                if result is not None:
+                    self._count('shared_remote')
+                    return result
+                raise SingleFlightError(f"다른 워커의 작업이 실패했습니다: {key}")
+
+        self._count('wait_timeouts')
+        logger.warning(f"요청 병합 대기 시간 초과, 직접 수행: {self.namespace}:{key}")
+        return fn()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, 'in_flight': len(self._calls)}
+
+
+def _fetch_lock_timeout():
+    return getattr(settings, 'BIBLE_FETCH_LOCK_TIMEOUT', 30)
+
+
+def _fetch_wait_timeout():
+    return getattr(settings, 'BIBLE_FETCH_WAIT_TIMEOUT', 20)
+
+
+# 원본 fetch 병합 (키: version:book:chapter)
+chapter_fetch_flight = SingleFlight('bible_fetch', _fetch_lock_timeout, _fetch_wait_timeout)
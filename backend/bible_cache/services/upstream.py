@@ -0,0 +1,185 @@
+"""
+성경 본문 원본 서버 HTTP 클라이언트
+
+- 모든 원본 요청이 하나의 세션(호스트별 keep-alive 연결 풀)을 공유
+- 호스트별 서킷 브레이커: 연속 실패가 기준을 넘으면 일정 시간 요청을 보내지 않고 바로 실패
+  (호출 측은 기존처럼 DB의 이전 캐시로 fallback)
+- 열린 뒤 reset 시간이 지나면 시험 요청 하나만 보내 성공하면 닫고, 실패하면 다시 열기
+- 연결 시도는 짧은 타임아웃으로 끊어 죽은 서버에서 전체 타임아웃만큼 기다리지 않음
+- 상태와 카운터는 프로세스 단위 (metrics 엔드포인트에서 조회)
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+def _pool_size():
+    return getattr(settings, 'BIBLE_UPSTREAM_POOL_SIZE', 10)
+
+
+def _connect_timeout():
+    return getattr(settings, 'BIBLE_UPSTREAM_CONNECT_TIMEOUT', 3)
+
+
+def _failure_threshold():
+    return getattr(settings, 'BIBLE_UPSTREAM_FAILURE_THRESHOLD', 5)
+
+
+def _reset_timeout():
+    return getattr(settings, 'BIBLE_UPSTREAM_RESET_TIMEOUT', 30)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """서킷이 열려 있어 요청을 보내지 않음"""
+
+
+class CircuitBreaker:
+    """호스트 하나의 서킷 브레이커"""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.stats = {'requests': 0, 'failures': 0, 'short_circuited': 0, 'opened': 0}
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """요청 가능 여부 확인 (열려 있으면 CircuitOpenError)"""
+        with self._lock:
+            if self.state == STATE_OPEN and time.monotonic() - self.opened_at >= _reset_timeout():
+                self.state = STATE_HALF_OPEN
+            # 반열림 상태에서는 시험 요청 하나만 통과
+            if self.state == STATE_OPEN or (self.state == STATE_HALF_OPEN and self.probing):
+                self.stats['short_circuited'] += 1
+                raise CircuitOpenError(f"원본 서버 일시 차단 중: {self.host}")
+            if self.state == STATE_HALF_OPEN:
+                self.probing = True
+            self.stats['requests'] += 1
+
+    def record_success(self):
+        with self._lock:
+            if self.state != STATE_CLOSED:
+                logger.info(f"원본 서버 복구: {self.host}")
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.stats['failures'] += 1
+            if self.state == STATE_HALF_OPEN or self.failures >= _failure_threshold():
+                if self.state != STATE_OPEN:
+                    self.stats['opened'] += 1
+                    logger.warning(f"원본 서버 차단 ({self.failures}회 연속 실패): {self.host}")
+                self.state = STATE_OPEN
+                self.opened_at = time.monotonic()
+            self.probing = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            retry_in = None
+            if self.state == STATE_OPEN:
+                retry_in = max(0.0, round(_reset_timeout() - (time.monotonic() - self.opened_at), 1))
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'retry_in': retry_in,
+                **self.stats,
+            }
+
+
+class UpstreamClient:
+    """원본 서버 공용 세션 + 호스트별 서킷 브레이커"""
+
+    _lock = threading.Lock()
+    _session = None
+    _breakers = {}
+
+    @staticmethod
+    def build_session(pool_size: int) -> requests.Session:
+        """호스트별 연결 풀 크기를 지정한 세션"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        with cls._lock:
+            if cls._session is None:
+                cls._session = cls.build_session(_pool_size())
+            return cls._session
+
+    @classmethod
+    def get_breaker(cls, host: str) -> CircuitBreaker:
+        with cls._lock:
+            breaker = cls._breakers.get(host)
+            if breaker is None:
+                breaker = cls._breakers[host] = CircuitBreaker(host)
+            return breaker
+
+    @classmethod
+    def get(
+        cls,
+        url: str,
+        timeout: float,
+        session: Optional[requests.Session] = None,
+        **kwargs
+    ) -> requests.Response:
+        """
+        GET 요청 (연결 실패/타임아웃/5xx는 서킷 브레이커 실패로 집계)
+
+        Args:
+            timeout: 응답 대기 시간 (연결 시도는 BIBLE_UPSTREAM_CONNECT_TIMEOUT으로 더 짧게 제한)
+            session: 별도 세션 (사전 캐싱처럼 연결 풀 크기가 다른 경우, 없으면 공용 세션)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있음 (requests.ConnectionError 하위 예외)
+        """
+        breaker = cls.get_breaker(urlsplit(url).netloc)
+        breaker.before_request()
+        try:
+            response = (session or cls.get_session()).get(
+                url,
+                timeout=(min(_connect_timeout(), timeout), timeout),
+                **kwargs
+            )
+        except requests.exceptions.RequestException:
+            breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """호스트별 서킷 상태와 요청 카운터"""
+        with cls._lock:
+            breakers = list(cls._breakers.values())
+        return {breaker.host: breaker.snapshot() for breaker in breakers}
+
+    @classmethod
+    def reset(cls):
+        """서킷 상태 초기화 (테스트/운영 수동 복구용)"""
+        with cls._lock:
+            cls._breakers = {}
@@ -0,0 +1,262 @@
+"""
+성경 본문 정규화
+
+원본 형식(bskorea HTML, KNT JSON, 우리말성경/API.Bible JSON)을 공통 절 배열로 변환
+    [{'verse': 1, 'text': '...', 'title': '...'(선택, 절 앞의 소제목)}, ...]
+
+- 원본 HTML의 글꼴/링크/각주 등 표시용 마크업은 모두 제거하고 텍스트만 보관
+- 파서가 바뀌면 VERSE_FORMAT을 올리고 normalize_bible_content 명령으로 다시 변환
+"""
+
+import json
+import logging
+import re
+from html.parser import HTMLParser
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 정규화 결과 형식 버전 (0 = 미변환)
+VERSE_FORMAT = 1
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_VERSE_NUMBER_RE = re.compile(r'\d+')
+
+# 종료 태그가 없는 요소
+_VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'wbr',
+})
+# 줄이 바뀌는 요소 (시가서처럼 한 절이 여러 줄에 걸친 경우 공백으로 연결)
+_BLOCK_TAGS = frozenset({'br', 'p', 'div', 'li', 'tr', 'td'})
+# 본문이 아닌 요소
+_SKIP_TAGS = frozenset({'script', 'style', 'select', 'form', 'input', 'sup'})
+# KNT(USX) 소제목 클래스
+_KNT_TITLE_CLASSES = frozenset({'s', 's1', 's2', 's3', 'ms', 'ms1', 'ms2', 'mr', 'd'})
+# KNT 각주/교차참조 클래스
+_KNT_SKIP_CLASSES = frozenset({'f', 'x', 'r', 'fr', 'ft', 'xo', 'xt'})
+
+
+def _clean(text: str) -> str:
+    return _WHITESPACE_RE.sub(' ', text.replace('\xa0', ' ')).strip()
+
+
+class _VerseHTMLParser(HTMLParser):
+    """
+    절 번호 마커 사이의 텍스트를 모으는 파서
+
+    마커가 나오면 새 절을 시작하고, 다음 마커/소제목/루트 종료까지의 텍스트를 해당 절에 붙인다.
+    같은 번호의 마커가 다시 나오면(시가서의 줄바꿈 등) 이전 절에 이어 붙인다.
+    하위 클래스에서 루트/마커/소제목/제외 요소를 판별한다.
+    """
+
+    # True면 is_root로 판별한 요소 안의 텍스트만 사용
+    has_root = False
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # (tag, 역할) 스택 - 역할: 'root', 'marker', 'title', 'skip' 또는 None
+        self._stack = []
+        self._verses = {}
+        self._order = []
+        self._current = None
+        self._pending_title = []
+        self._marker_text = []
+
+    # 하위 클래스 구현
+    def is_root(self, tag, attrs):
+        return True
+
+    def is_marker(self, tag, attrs):
+        raise NotImplementedError
+
+    def is_title(self, tag, attrs):
+        return False
+
+    def is_skip(self, tag, attrs):
+        return tag in _SKIP_TAGS or 'display:none' in attrs.get('style', '').replace(' ', '')
+
+    def _roles(self):
+        return {role for _, role in self._stack}
+
+    def _in_root(self):
+        return 'root' in self._roles() or not self.has_root
+
+    def _break_line(self):
+        if self._current is not None:
+            self._verses[self._current]['text'].append(' ')
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self._break_line()
+        if tag in _VOID_TAGS:
+            return
+        attrs = {name: value or '' for name, value in attrs}
+        roles = self._roles()
+
+        role = None
+        if 'skip' in roles or 'marker' in roles:
+            role = None
+        elif self.has_root and 'root' not in roles:
+            role = 'root' if self.is_root(tag, attrs) else None
+        elif self.is_skip(tag, attrs):
+            role = 'skip'
+        elif 'title' not in roles and self.is_title(tag, attrs):
+            role = 'title'
+            self._close_verse()
+        elif 'title' not in roles and self.is_marker(tag, attrs):
+            role = 'marker'
+            self._marker_text = []
+        self._stack.append((tag, role))
+
+    def handle_endtag(self, tag):
+        # 짝이 맞지 않는 종료 태그는 가장 가까운 같은 태그까지 닫고, 없으면 무시
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            return
+        if tag in _BLOCK_TAGS:
+            self._break_line()
+        while len(self._stack) > index:
+            _, role = self._stack.pop()
+            if role == 'marker':
+                self._start_verse(''.join(self._marker_text))
+            elif role == 'root':
+                self._close_verse()
+
+    def handle_data(self, data):
+        roles = self._roles()
+        if 'skip' in roles or not self._in_root():
+            return
+        if 'marker' in roles:
+            self._marker_text.append(data)
+        elif 'title' in roles:
+            self._pending_title.append(data)
+        elif self._current is not None:
+            self._verses[self._current]['text'].append(data)
+
+    def _start_verse(self, marker_text):
+        match = _VERSE_NUMBER_RE.search(marker_text)
+        if not match:
+            return
+        number = int(match.group())
+        verse = self._verses.get(number)
+        if verse is None:
+            verse = {'text': [], 'title': None}
+            self._verses[number] = verse
+            self._order.append(number)
+        title = _clean(''.join(self._pending_title))
+        if title and not verse['title']:
+            verse['title'] = title
+        self._pending_title = []
+        if verse['text']:
+            verse['text'].append(' ')
+        self._current = number
+
+    def _close_verse(self):
+        self._current = None
+
+    def result(self) -> List[dict]:
+        verses = []
+        for number in sorted(self._order):
+            text = _clean(''.join(self._verses[number]['text']))
+            if not text:
+                continue
+            item = {'verse': number, 'text': text}
+            if self._verses[number]['title']:
+                item['title'] = self._verses[number]['title']
+            verses.append(item)
+        return verses
+
+
+class _StandardParser(_VerseHTMLParser):
+    """bskorea korbibReadpage.php (#tdBible1, span.number, font.smallTitle)"""
+
+    has_root = True
+
+    def is_root(self, tag, attrs):
+        return attrs.get('id') == 'tdBible1'
+
+    def is_marker(self, tag, attrs):
+        return tag == 'span' and 'number' in attrs.get('class', '').split()
+
+    def is_title(self, tag, attrs):
+        return tag == 'font' and 'smallTitle' in attrs.get('class', '').split()
+
+    def is_skip(self, tag, attrs):
+        classes = attrs.get('class', '').split()
+        # 장 번호와 본문 중간의 참조 링크는 제외 (소제목 안의 링크 텍스트는 유지)
+        if 'chapNum' in classes:
+            return True
+        if tag == 'a' and 'title' not in self._roles():
+            return True
+        return super().is_skip(tag, attrs)
+
+
+class _KntParser(_VerseHTMLParser):
+    """새한글성경 JSON의 content HTML (span.v, p.s 등 USX 클래스)"""
+
+    def is_marker(self, tag, attrs):
+        classes = attrs.get('class', '').split()
+        return tag == 'span' and 'v' in classes
+
+    def is_title(self, tag, attrs):
+        return bool(_KNT_TITLE_CLASSES & set(attrs.get('class', '').split()))
+
+    def is_skip(self, tag, attrs):
+        if _KNT_SKIP_CLASSES & set(attrs.get('class', '').split()) or 'data-caller' in attrs:
+            return True
+        return super().is_skip(tag, attrs)
+
+
+def _parse_html(parser_class, html: str) -> List[dict]:
+    parser = parser_class()
+    parser.feed(html)
+    parser.close()
+    return parser.result()
+
+
+def _normalize_verse_list(items) -> List[dict]:
+    """이미 절 배열인 JSON(우리말성경, API.Bible)을 공통 형식으로 정리"""
+    verses = {}
+    for item in items:
+        try:
+            number = int(item['verse'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        text = _clean(str(item.get('text') or ''))
+        if not text:
+            continue
+        if number in verses:
+            verses[number]['text'] += ' ' + text
+        else:
+            verses[number] = {'verse': number, 'text': text}
+    return [verses[number] for number in sorted(verses)]
+
+
+def normalize_content(version: str, content: str, content_type: str) -> Optional[List[dict]]:
+    """
+    원본 콘텐츠 → 절 배열
+
+    Returns:
+        절 배열, 형식을 알 수 없거나 절을 찾지 못하면 None
+    """
+    if not content:
+        return None
+
+    try:
+        if content_type == 'json':
+            data = json.loads(content)
+            if isinstance(data.get('verses'), list):
+                verses = _normalize_verse_list(data['verses'])
+            elif data.get('content'):
+                verses = _parse_html(_KntParser, data['content'])
+            else:
+                verses = []
+        else:
+            verses = _parse_html(_StandardParser, content)
+    except (ValueError, AttributeError) as e:
+        logger.warning(f"본문 정규화 실패: {version} - {e}")
+        return None
+
+    return verses or None
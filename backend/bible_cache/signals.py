@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import BibleContentCache
+from .services.content_cache import ChapterContentCache
+
+
+@receiver(post_save, sender=BibleContentCache)
+@receiver(post_delete, sender=BibleContentCache)
+def invalidate_chapter_content_cache(sender, instance, **kwargs):
+    """본문 캐시 행 변경(관리자 수정 포함) 시 LRU/Redis 계층 무효화"""
+    cache_key = instance.cache_key
+    transaction.on_commit(lambda: ChapterContentCache.invalidate(cache_key))
@@ -2,14 +2,43 @@
 성경 본문 캐시 테스트
 """
 
-from django.test import TestCase
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.constants import OnConflict
+from django.test import TestCase, override_settings
 from rest_framework.test import APITestCase
 from rest_framework import status
 from unittest.mock import patch, MagicMock
 
 from bible_cache.models import BibleContentCache
-from bible_cache.services import BibleFetchService
+from bible_cache.services import BibleFetchService, ChapterContentCache
 from bible_cache.services.bible_fetch_service import BibleFetchError
+from bible_cache.services.prefetch_engine import PrefetchEngine
+from bible_cache.services.single_flight import LOCK_KEY, SingleFlight, SingleFlightError
+from bible_cache.services.upstream import UpstreamClient
+from bible_cache.services.verse_normalizer import VERSE_FORMAT, normalize_content
+
+STANDARD_HTML = '''<html><body><div class="fontcontrol"><select><option>1</option></select></div>
+<div id="tdBible1"><font class="chapNum">제 1 장</font><br>
+<font class="smallTitle">천지 창조 <a href="#">(요 1:1)</a></font><br>
+<span><span class="number">1&nbsp;&nbsp;&nbsp;</span>태초에 <font class="name">하나님</font>이 천지를 창조하시니라<a class="comment" href="#">1)</a></span><br>
+<div class="D2" style="display: none">각주</div>
+<span><span class="number">2&nbsp;</span>땅이 혼돈하고
+ 공허하며</font></span><br>
+</div><div>3 footer</div></body></html>'''
 
 
 class BibleContentCacheModelTest(TestCase):
@@ -78,7 +107,7 @@ class BibleFetchServiceTest(TestCase):
 
         self.assertIn('지원하지 않는 번역본', str(context.exception))
 
-    @patch('bible_cache.services.bible_fetch_service.requests.get')
+    @patch('requests.Session.get')
     def test_fetch_standard_version(self, mock_get):
         """표준 번역본 fetch 테스트"""
         mock_response = MagicMock()
@@ -95,7 +124,7 @@ class BibleFetchServiceTest(TestCase):
         self.assertFalse(from_cache)
         self.assertIn('Bible content', content)
 
-    @patch('bible_cache.services.bible_fetch_service.requests.get')
+    @patch('requests.Session.get')
     def test_fetch_knt_version(self, mock_get):
         """KNT 번역본 fetch 테스트"""
         mock_response = MagicMock()
@@ -124,7 +153,7 @@ class BibleFetchServiceTest(TestCase):
         )
 
         # fetch 실패 시뮬레이션
-        with patch('bible_cache.services.bible_fetch_service.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = Exception('Network error')
 
             content, content_type, from_cache = BibleFetchService.get_bible_content(
@@ -135,6 +164,59 @@ class BibleFetchServiceTest(TestCase):
             self.assertEqual(content, 'Cached content')
 
 
+class ChapterContentCacheTest(TestCase):
+    """본문 다계층 캐시 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        ChapterContentCache.clear_local()
+
+    def _save(self, chapter, content):
+        BibleContentCache.save_to_cache(
+            version='GAE',
+            book='gen',
+            chapter=chapter,
+            content=content,
+            content_type='html'
+        )
+
+    def test_db_hit_fills_upper_tiers(self):
+        """DB hit 이후에는 DB 조회 없이 응답"""
+        self._save(1, 'Cached content')
+
+        BibleFetchService.get_bible_content('GAE', 'gen', 1)
+        with self.assertNumQueries(0):
+            content, _, from_cache = BibleFetchService.get_bible_content('GAE', 'gen', 1)
+
+        self.assertTrue(from_cache)
+        self.assertEqual(content, 'Cached content')
+
+    @override_settings(BIBLE_CONTENT_LRU_MAX_BYTES=10)
+    def test_lru_size_eviction(self):
+        """LRU 크기 초과 시 오래된 항목부터 제거"""
+        self._save(1, 'aaaaaa')
+        self._save(2, 'bbbbbb')
+
+        ChapterContentCache.get('GAE', 'gen', 1)
+        ChapterContentCache.get('GAE', 'gen', 2)
+
+        stats = ChapterContentCache.get_stats()
+        self.assertEqual(stats['lru']['entries'], 1)
+        self.assertLessEqual(stats['lru']['bytes'], 10)
+
+    def test_admin_update_invalidates(self):
+        """행이 수정되면 상위 계층 무효화"""
+        self._save(1, 'Old content')
+        ChapterContentCache.get('GAE', 'gen', 1)
+
+        obj = BibleContentCache.objects.get(cache_key='GAE:gen:1')
+        obj.content = 'New content'
+        with self.captureOnCommitCallbacks(execute=True):
+            obj.save()
+
+        self.assertEqual(ChapterContentCache.get('GAE', 'gen', 1)['content'], 'New content')
+
+
 class BibleCacheAPITest(APITestCase):
     """API 엔드포인트 테스트"""
 
@@ -159,7 +241,7 @@ class BibleCacheAPITest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-    @patch('bible_cache.services.bible_fetch_service.requests.get')
+    @patch('requests.Session.get')
     def test_get_bible_content_success(self, mock_get):
         """성경 본문 조회 성공"""
         mock_response = MagicMock()
@@ -196,3 +278,363 @@ class BibleCacheAPITest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(response.data['cached'])
+
+
+class BibleContentConditionalGetTest(APITestCase):
+    """ETag/Last-Modified 조건부 요청 테스트"""
+
+    url = '/api/v1/bible-cache/GAE/gen/1/'
+
+    def setUp(self):
+        cache.clear()
+        ChapterContentCache.clear_local()
+        self.obj, _ = BibleContentCache.save_to_cache(
+            version='GAE',
+            book='gen',
+            chapter=1,
+            content='Cached content',
+            content_type='html'
+        )
+
+    def test_hash_follows_content(self):
+        """저장 경로와 무관하게 본문 해시 유지"""
+        self.assertEqual(
+            self.obj.content_hash,
+            BibleContentCache.compute_content_hash('Cached content')
+        )
+
+        BibleContentCache.save_to_cache(
+            version='GAE', book='gen', chapter=1, content='Updated', content_type='html'
+        )
+        self.obj.refresh_from_db()
+        self.assertEqual(self.obj.content_hash, BibleContentCache.compute_content_hash('Updated'))
+
+    def test_cache_headers(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], self.obj.etag)
+        self.assertIn('Last-Modified', response)
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_if_none_match_returns_304_without_content(self):
+        """검증값은 본문 없이 조회하고, 상위 계층에 있으면 DB도 조회하지 않음"""
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.obj.etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], self.obj.etag)
+        self.assertFalse(response.content)
+
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=f'W/{self.obj.etag}')
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_stale_etag_returns_content(self):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH='"outdated"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['content'], 'Cached content')
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(self.url)['Last-Modified']
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE='Mon, 01 Jan 2001 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class VerseNormalizerTest(TestCase):
+    """원본 형식별 절 배열 정규화 테스트"""
+
+    def test_standard_html(self):
+        verses = normalize_content('GAE', STANDARD_HTML, 'html')
+
+        self.assertEqual(verses, [
+            {'verse': 1, 'text': '태초에 하나님이 천지를 창조하시니라', 'title': '천지 창조 (요 1:1)'},
+            {'verse': 2, 'text': '땅이 혼돈하고 공허하며'},
+        ])
+
+    def test_knt_json(self):
+        """각주 제외, 여러 줄에 걸친 절은 이어 붙임"""
+        content = json.dumps({
+            'found': True,
+            'content': (
+                '<p class="s">창조</p>'
+                '<p class="p"><span class="verse-span" data-verse-id="GEN.1.1"><span class="v">1</span>'
+                '처음에<span class="f" data-caller="+"><span class="ft">각주</span></span> 하나님이</span></p>'
+                '<p class="q1"><span class="verse-span" data-verse-id="GEN.1.1">창조하셨다.</span>'
+                '<span class="verse-span" data-verse-id="GEN.1.2"><span class="v">2</span>땅은</span></p>'
+            ),
+        }, ensure_ascii=False)
+
+        self.assertEqual(normalize_content('KNT', content, 'json'), [
+            {'verse': 1, 'text': '처음에 하나님이 창조하셨다.', 'title': '창조'},
+            {'verse': 2, 'text': '땅은'},
+        ])
+
+    def test_verse_list_json(self):
+        content = json.dumps({'verses': [{'verse': 2, 'text': ' b '}, {'verse': 1, 'text': 'a'}]})
+
+        self.assertEqual(normalize_content('WOORI', content, 'json'), [
+            {'verse': 1, 'text': 'a'},
+            {'verse': 2, 'text': 'b'},
+        ])
+
+    def test_unrecognized_content(self):
+        self.assertIsNone(normalize_content('GAE', '<html>Bible content</html>', 'html'))
+
+    def test_backfill_command(self):
+        cache.clear()
+        ChapterContentCache.clear_local()
+        BibleContentCache.save_to_cache(
+            version='GAE', book='gen', chapter=1, content=STANDARD_HTML, content_type='html'
+        )
+        ChapterContentCache.get('GAE', 'gen', 1)
+
+        call_command('normalize_bible_content', stdout=StringIO())
+
+        obj = BibleContentCache.objects.get(cache_key='GAE:gen:1')
+        self.assertEqual(obj.verse_format, VERSE_FORMAT)
+        self.assertEqual(len(obj.verses), 2)
+        # 상위 계층도 무효화되어 변환 결과가 보임
+        self.assertEqual(ChapterContentCache.get('GAE', 'gen', 1)['verses'], obj.verses)
+
+    def test_normalized_response(self):
+        cache.clear()
+        ChapterContentCache.clear_local()
+        BibleContentCache.save_to_cache(
+            version='GAE', book='gen', chapter=1, content=STANDARD_HTML, content_type='html'
+        )
+
+        response = self.client.get('/api/v1/bible-cache/GAE/gen/1/?normalized=true')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()['data']
+        self.assertNotIn('content', data)
+        self.assertEqual(data['verses'][0]['verse'], 1)
+        # 원본 응답과 ETag가 구분됨
+        raw = self.client.get('/api/v1/bible-cache/GAE/gen/1/')
+        self.assertNotEqual(response['ETag'], raw['ETag'])
+
+
+@contextmanager
+def mysql_style_upsert():
+    """
+    MySQL처럼 upsert 충돌 대상을 지정할 수 없는 백엔드 흉내
+
+    대상 없는 ON CONFLICT DO UPDATE(SQLite 3.35+)는 ON DUPLICATE KEY UPDATE처럼 유니크 인덱스로 충돌을 판단한다.
+    """
+    quote = connection.ops.quote_name
+    original = connection.ops.on_conflict_suffix_sql
+
+    def on_conflict_suffix_sql(fields, on_conflict, update_fields, unique_fields):
+        if on_conflict != OnConflict.UPDATE:
+            return original(fields, on_conflict, update_fields, unique_fields)
+        return 'ON CONFLICT DO UPDATE SET ' + ', '.join(
+            f'{quote(field)} = EXCLUDED.{quote(field)}' for field in update_fields
+        )
+
+    with patch.object(connection.features, 'supports_update_conflicts_with_target', False), \
+            patch.object(connection.ops, 'on_conflict_suffix_sql', on_conflict_suffix_sql):
+        yield
+
+
+class _StubBibleHandler(BaseHTTPRequestHandler):
+    """성서공회 본문 페이지 흉내 (chap=3은 서버 오류)"""
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        self.server.requested.append(int(query['chap'][0]))
+        if query['chap'][0] == '3':
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = STANDARD_HTML.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class PrefetchEngineTest(TestCase):
+    """로컬 스텁 서버를 상대로 한 사전 캐싱 엔진 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        ChapterContentCache.clear_local()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _StubBibleHandler)
+        self.server.requested = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        base_url = f'http://127.0.0.1:{self.server.server_port}'
+        UpstreamClient.reset()
+        patcher = patch('bible_cache.services.bible_fetch_service.BSKOREA_BASE_URL', base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        fd, self.checkpoint_path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        os.remove(self.checkpoint_path)
+        self.addCleanup(lambda: os.path.exists(self.checkpoint_path) and os.remove(self.checkpoint_path))
+
+    def _engine(self):
+        return PrefetchEngine(
+            concurrency=3, per_host=2, min_delay=0, max_delay=0,
+            batch_size=2, checkpoint_path=self.checkpoint_path
+        )
+
+    def test_batched_write_and_resume(self):
+        targets = [('GAE', 'gen', chapter) for chapter in range(1, 5)]
+
+        progress = self._engine().run(targets)
+
+        self.assertEqual((progress.success, progress.failed), (3, 1))
+        rows = BibleContentCache.objects.filter(version='GAE').order_by('chapter')
+        self.assertEqual([obj.chapter for obj in rows], [1, 2, 4])
+        obj = rows[0]
+        self.assertEqual(obj.content_hash, BibleContentCache.compute_content_hash(STANDARD_HTML))
+        self.assertEqual(obj.verse_format, VERSE_FORMAT)
+        self.assertEqual(len(obj.verses), 2)
+
+        # 실패가 있으면 체크포인트가 남고, 다시 실행하면 실패한 항목만 요청
+        with open(self.checkpoint_path, encoding='utf-8') as f:
+            self.assertEqual(set(json.load(f)['done']), {'GAE:gen:1', 'GAE:gen:2', 'GAE:gen:4'})
+        self.server.requested.clear()
+        progress = self._engine().run(targets)
+        self.assertEqual(self.server.requested, [3])
+        self.assertEqual(progress.total, 1)
+
+    def test_upsert_overwrites_and_invalidates_tiers(self):
+        BibleContentCache.save_to_cache(version='GAE', book='gen', chapter=1, content='old', content_type='html')
+        self.assertEqual(ChapterContentCache.get('GAE', 'gen', 1)['content'], 'old')
+
+        progress = self._engine().run([('GAE', 'gen', 1)])
+
+        self.assertEqual(progress.success, 1)
+        self.assertEqual(BibleContentCache.objects.filter(cache_key='GAE:gen:1').count(), 1)
+        self.assertEqual(ChapterContentCache.get('GAE', 'gen', 1)['content'], STANDARD_HTML)
+        # 모두 성공하면 체크포인트 삭제
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_upsert_without_conflict_target(self):
+        BibleContentCache.save_to_cache(version='GAE', book='gen', chapter=1, content='old', content_type='html')
+
+        # MySQL: unique_fields 없이 cache_key 유니크 인덱스로 갱신
+        with mysql_style_upsert():
+            progress = self._engine().run([('GAE', 'gen', 1), ('GAE', 'gen', 2)])
+
+        self.assertEqual(progress.success, 2)
+        self.assertEqual(BibleContentCache.objects.filter(version='GAE').count(), 2)
+        self.assertEqual(BibleContentCache.objects.get(cache_key='GAE:gen:1').content, STANDARD_HTML)
+
+
+@override_settings(BIBLE_UPSTREAM_FAILURE_THRESHOLD=2, BIBLE_UPSTREAM_RESET_TIMEOUT=60)
+class UpstreamCircuitBreakerTest(APITestCase):
+    """원본 서버 서킷 브레이커 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        ChapterContentCache.clear_local()
+        UpstreamClient.reset()
+        BibleContentCache.save_to_cache(
+            version='GAE', book='gen', chapter=1, content=STANDARD_HTML, content_type='html'
+        )
+
+    @patch('requests.Session.get')
+    def test_open_circuit_fails_fast_to_stale_cache(self, mock_get):
+        mock_get.side_effect = requests.exceptions.ConnectTimeout('down')
+
+        for _ in range(3):
+            entry = BibleFetchService.get_bible_entry('GAE', 'gen', 1, force_refresh=True)
+            self.assertTrue(entry['stale'])
+
+        # 연속 2회 실패 후에는 요청을 보내지 않음
+        self.assertEqual(mock_get.call_count, 2)
+        host = UpstreamClient.get_stats()['www.bskorea.or.kr']
+        self.assertEqual(host['state'], 'open')
+        self.assertEqual(host['short_circuited'], 1)
+
+        admin = get_user_model().objects.create_user(
+            username='admin', password='pw', nickname='admin', is_staff=True
+        )
+        self.client.force_authenticate(admin)
+        response = self.client.get('/api/v1/bible-cache/metrics/')
+        self.assertEqual(response.data['upstream']['www.bskorea.or.kr']['state'], 'open')
+
+    @patch('requests.Session.get')
+    def test_half_open_probe_closes_circuit(self, mock_get):
+        mock_get.side_effect = requests.exceptions.ConnectionError('down')
+        for _ in range(2):
+            BibleFetchService.get_bible_entry('GAE', 'gen', 1, force_refresh=True)
+
+        mock_get.side_effect = None
+        mock_get.return_value = MagicMock(status_code=200, text=STANDARD_HTML, url='https://www.bskorea.or.kr/')
+        with override_settings(BIBLE_UPSTREAM_RESET_TIMEOUT=0):
+            entry = BibleFetchService.get_bible_entry('GAE', 'gen', 1, force_refresh=True)
+
+        self.assertFalse(entry['stale'])
+        self.assertEqual(UpstreamClient.get_stats()['www.bskorea.or.kr']['state'], 'closed')
+
+
+class SingleFlightTest(TestCase):
+    """캐시 miss 요청 병합 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.flight = SingleFlight('test', lambda: 5, lambda: 2)
+        self.lock_key = LOCK_KEY.format(namespace='test', key='GAE:gen:1')
+        self.calls = 0
+
+    def _fetch(self):
+        self.calls += 1
+        time.sleep(0.2)
+        return {'content': 'fresh'}
+
+    def test_concurrent_threads_share_one_call(self):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                self.flight.do('GAE:gen:1', self._fetch, lambda: None)
+            ))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [{'content': 'fresh'}] * 8)
+        self.assertEqual(self.flight.get_stats()['shared_local'], 7)
+
+    def test_waits_for_other_worker_result(self):
+        # 다른 워커가 잠금을 잡고 결과를 저장한 뒤 잠금 해제
+        store = {}
+        cache.add(self.lock_key, 1)
+
+        def finish():
+            store['entry'] = {'content': 'remote'}
+            cache.delete(self.lock_key)
+        threading.Timer(0.3, finish).start()
+
+        result = self.flight.do('GAE:gen:1', self._fetch, lambda: store.get('entry'))
+
+        self.assertEqual(result, {'content': 'remote'})
+        self.assertEqual(self.calls, 0)
+
+    def test_other_worker_failure_is_not_retried(self):
+        cache.add(self.lock_key, 1)
+        threading.Timer(0.2, lambda: cache.delete(self.lock_key)).start()
+
+        with self.assertRaises(SingleFlightError):
+            self.flight.do('GAE:gen:1', self._fetch, lambda: None)
+        self.assertEqual(self.calls, 0)
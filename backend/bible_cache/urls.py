@@ -5,6 +5,9 @@ urlpatterns = [
     # 지원 번역본 목록
     path('versions/', views.get_supported_versions, name='bible-cache-versions'),
 
+    # 캐시 지표 (관리자)
+    path('metrics/', views.get_cache_metrics, name='bible-cache-metrics'),
+
     # 성경 본문 조회
     path(
         '<str:version>/<str:book>/<int:chapter>/',
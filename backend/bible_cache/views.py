@@ -3,13 +3,19 @@
 """
 
 import logging
+from django.conf import settings
+from django.utils import timezone
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 
-from bible_cache.services import BibleFetchService
+from bible_cache.services import BibleFetchService, ChapterContentCache
 from bible_cache.services.bible_fetch_service import BibleFetchError, SUPPORTED_VERSIONS
+from bible_cache.services.single_flight import chapter_fetch_flight
+from bible_cache.services.upstream import UpstreamClient
+from bible_cache.services.verse_normalizer import VERSE_FORMAT
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +27,7 @@ def get_bible_content(request, version: str, book: str, chapter: int):
     성경 본문 조회 API
 
     캐시에서 먼저 조회하고, 없으면 원본에서 가져와 캐싱 후 반환
+    ETag(본문 해시)/Last-Modified를 내려주고, 조건부 요청이 일치하면 본문 없이 304 반환
 
     URL: GET /api/v1/bible-cache/{version}/{book}/{chapter}/
 
@@ -31,6 +38,10 @@ def get_bible_content(request, version: str, book: str, chapter: int):
 
     Query Parameters:
         force_refresh: 캐시 무시하고 강제 새로고침 (optional, default=false)
+        normalized: true면 원본 content 대신 정규화된 verses 배열만 반환 (optional, default=false)
+
+    Request Headers:
+        If-None-Match / If-Modified-Since: 조건부 요청 (force_refresh면 무시)
 
     Response:
         200: {
@@ -39,11 +50,13 @@ def get_bible_content(request, version: str, book: str, chapter: int):
                 "version": "GAE",
                 "book": "gen",
                 "chapter": 1,
-                "content": "...",
+                "content": "...",            (normalized=true면 생략)
                 "content_type": "html",
+                "verses": [{"verse": 1, "text": "...", "title": "..."}],  (normalized=true일 때)
                 "from_cache": true
             }
         }
+        304: 클라이언트 캐시가 최신 (본문 없음)
         400: 잘못된 요청 (지원하지 않는 버전, 잘못된 장 번호 등)
         503: 원본 서버 및 캐시 모두에서 데이터를 가져올 수 없음
     """
@@ -72,26 +85,42 @@ def get_bible_content(request, version: str, book: str, chapter: int):
 
     # 강제 새로고침 옵션
     force_refresh = request.query_params.get('force_refresh', 'false').lower() == 'true'
+    normalized = request.query_params.get('normalized', 'false').lower() == 'true'
+
+    # 조건부 요청은 본문을 읽지 않고 검증값만으로 판단
+    if not force_refresh and _has_conditional_headers(request):
+        validators = ChapterContentCache.get_validators(version, book, chapter)
+        if validators and _is_not_modified(request, validators, normalized):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            _set_cache_headers(response, validators, normalized, cacheable=True)
+            return response
 
     try:
-        content, content_type, from_cache = BibleFetchService.get_bible_content(
+        entry = BibleFetchService.get_bible_entry(
             version=version,
             book=book,
             chapter=chapter,
             force_refresh=force_refresh
         )
 
-        return Response({
-            'success': True,
-            'data': {
-                'version': version,
-                'book': book,
-                'chapter': chapter,
-                'content': content,
-                'content_type': content_type,
-                'from_cache': from_cache
-            }
-        })
+        data = {
+            'version': version,
+            'book': book,
+            'chapter': chapter,
+            'content_type': entry['content_type'],
+            'from_cache': entry['from_cache']
+        }
+        if normalized:
+            data['verses'] = entry['verses'] or []
+        else:
+            data['content'] = entry['content']
+
+        response = Response({'success': True, 'data': data})
+        # 원본 실패로 이전 캐시를 준 경우와 강제 새로고침 응답은 공유 캐시에 두지 않음
+        _set_cache_headers(
+            response, entry, normalized, cacheable=not (force_refresh or entry['stale'])
+        )
+        return response
 
     except BibleFetchError as e:
         logger.error(f"성경 본문 조회 실패: {version}:{book}:{chapter} - {e}")
@@ -177,6 +206,72 @@ def get_supported_versions(request):
     })
 
 
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def get_cache_metrics(request):
+    """
+    본문 캐시 계층별 hit/miss, 원본 서버별 서킷 상태, 캐시 miss 요청 병합 지표 (현재 프로세스 기준)
+
+    URL: GET /api/v1/bible-cache/metrics/
+    """
+    return Response({
+        'content_cache': ChapterContentCache.get_stats(),
+        'upstream': UpstreamClient.get_stats(),
+        'fetch_coalescing': chapter_fetch_flight.get_stats(),
+    })
+
+
+def _has_conditional_headers(request) -> bool:
+    return 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
+
+
+def _last_modified_timestamp(updated_at) -> int:
+    # USE_TZ=False이므로 naive datetime은 TIME_ZONE 기준으로 해석
+    if timezone.is_naive(updated_at):
+        updated_at = timezone.make_aware(updated_at)
+    return int(updated_at.timestamp())
+
+
+def _etag(content_hash: str, normalized: bool) -> str:
+    """원본과 정규화 응답은 표현이 다르므로 ETag를 구분"""
+    if normalized:
+        return f'"{content_hash}-v{VERSE_FORMAT}"'
+    return f'"{content_hash}"'
+
+
+def _is_not_modified(request, validators: dict, normalized: bool) -> bool:
+    """If-None-Match가 있으면 ETag로만 비교, 없으면 If-Modified-Since로 비교"""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        if not validators['content_hash']:
+            return False
+        etags = parse_etags(if_none_match)
+        if '*' in etags:
+            return True
+        # 약한 비교 (W/ 접두사 무시)
+        return _etag(validators['content_hash'], normalized) in {
+            etag.removeprefix('W/') for etag in etags
+        }
+
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    if if_modified_since is None:
+        return False
+    return _last_modified_timestamp(validators['updated_at']) <= if_modified_since
+
+
+def _set_cache_headers(response, entry: dict, normalized: bool, cacheable: bool):
+    """ETag/Last-Modified/Cache-Control 설정"""
+    if entry.get('content_hash'):
+        response['ETag'] = _etag(entry['content_hash'], normalized)
+    if entry.get('updated_at'):
+        response['Last-Modified'] = http_date(_last_modified_timestamp(entry['updated_at']))
+    if cacheable:
+        max_age = getattr(settings, 'BIBLE_CONTENT_HTTP_MAX_AGE', 60 * 60 * 24 * 7)
+        response['Cache-Control'] = f'public, max-age={max_age}, immutable'
+    else:
+        response['Cache-Control'] = 'no-cache'
+
+
 def _get_fallback_url(version: str, book: str, chapter: int) -> str:
     """직접 링크 생성 (대한성서공회 또는 두라노)"""
     if version == 'KNT':
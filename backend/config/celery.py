@@ -13,4 +13,12 @@ app.conf.beat_schedule = {
         'task': 'todos.tasks.generate_hasena_summary_task',
         'schedule': crontab(minute='*/5', hour='0-5', day_of_week='1-6'),
     },
+    'rebuild-leaderboards': {
+        'task': 'todos.tasks.rebuild_leaderboards_task',
+        'schedule': crontab(minute=30, hour=4),
+    },
+    'prune-sync-changes': {
+        'task': 'todos.tasks.prune_sync_changes_task',
+        'schedule': crontab(minute=45, hour=4),
+    },
 }
@@ -53,6 +53,7 @@ INSTALLED_APPS = [
     # Local apps
     'accounts.apps.AccountsConfig',
     'bible_cache.apps.BibleCacheConfig',
+    'search.apps.SearchConfig',
 ]
 
 MIDDLEWARE = [
@@ -312,6 +313,20 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Asia/Seoul'
 CELERY_ENABLE_UTC = False
 
+# 프로필 통계/업적 재계산 디바운스 (초)
+STATS_RECOMPUTE_DEBOUNCE_SECONDS = int(os.environ.get('STATS_RECOMPUTE_DEBOUNCE_SECONDS', '10'))
+# 진도 저장 후 통계가 반영되기까지 허용하는 최대 지연 (초)
+STATS_RECOMPUTE_MAX_STALENESS_SECONDS = int(os.environ.get('STATS_RECOMPUTE_MAX_STALENESS_SECONDS', '60'))
+# 일괄 진도 저장 요청 한 번에 허용하는 최대 스케줄 수
+PROGRESS_BULK_MAX_SCHEDULES = int(os.environ.get('PROGRESS_BULK_MAX_SCHEDULES', '2000'))
+# 오프라인 동기화: 한 번에 반환할 변경 로그 수, 한 번에 받을 클라이언트 변경 수
+SYNC_PAGE_SIZE = int(os.environ.get('SYNC_PAGE_SIZE', '500'))
+SYNC_MAX_MUTATIONS = int(os.environ.get('SYNC_MAX_MUTATIONS', '500'))
+# 커밋 순서가 뒤바뀐 변경을 놓치지 않도록 cursor를 넘기지 않는 최근 구간 (초)
+SYNC_SETTLE_SECONDS = int(os.environ.get('SYNC_SETTLE_SECONDS', '5'))
+# 변경 로그 보관 기간 (이보다 오래된 cursor는 전체 동기화)
+SYNC_CHANGE_RETENTION_DAYS = int(os.environ.get('SYNC_CHANGE_RETENTION_DAYS', '30'))
+
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
@@ -319,6 +334,35 @@ CACHES = {
     }
 }
 
+# 성경 본문 프로세스 내 LRU 캐시 (최대 크기, 다른 프로세스 무효화 반영까지의 TTL)
+BIBLE_CONTENT_LRU_MAX_BYTES = int(os.environ.get('BIBLE_CONTENT_LRU_MAX_BYTES', str(32 * 1024 * 1024)))
+BIBLE_CONTENT_LRU_TTL = int(os.environ.get('BIBLE_CONTENT_LRU_TTL', '300'))
+# 본문 응답 HTTP 캐시 기간 (초, Cache-Control max-age)
+BIBLE_CONTENT_HTTP_MAX_AGE = int(os.environ.get('BIBLE_CONTENT_HTTP_MAX_AGE', str(60 * 60 * 24 * 7)))
+# 성경 원본 서버 연결 풀 (호스트별 최대 연결 수, 연결 시도 타임아웃 초)
+BIBLE_UPSTREAM_POOL_SIZE = int(os.environ.get('BIBLE_UPSTREAM_POOL_SIZE', '10'))
+BIBLE_UPSTREAM_CONNECT_TIMEOUT = int(os.environ.get('BIBLE_UPSTREAM_CONNECT_TIMEOUT', '3'))
+# 원본 서버 서킷 브레이커 (연속 실패 횟수 기준, 차단 후 재시도까지 초)
+BIBLE_UPSTREAM_FAILURE_THRESHOLD = int(os.environ.get('BIBLE_UPSTREAM_FAILURE_THRESHOLD', '5'))
+BIBLE_UPSTREAM_RESET_TIMEOUT = int(os.environ.get('BIBLE_UPSTREAM_RESET_TIMEOUT', '30'))
+# 캐시 miss 원본 fetch 병합 (Redis 잠금 유지 초, 다른 워커의 결과를 기다리는 최대 초)
+BIBLE_FETCH_LOCK_TIMEOUT = int(os.environ.get('BIBLE_FETCH_LOCK_TIMEOUT', '30'))
+BIBLE_FETCH_WAIT_TIMEOUT = int(os.environ.get('BIBLE_FETCH_WAIT_TIMEOUT', '20'))
+
+# 검색 후보 상한 (색인에서 겹친 조각 수 상위 N개만 불러와 정렬)
+SEARCH_MAX_CANDIDATES = int(os.environ.get('SEARCH_MAX_CANDIDATES', '200'))
+# 색인 행이 이 수 이상인 조각은 흔한 조각으로 보고 후보 조회에서 제외
+SEARCH_MAX_POSTINGS = int(os.environ.get('SEARCH_MAX_POSTINGS', '5000'))
+
+# 친구 활동 피드 타임라인 (사용자별 최대 항목 수, 갱신이 없으면 만료되는 일수)
+FEED_TIMELINE_SIZE = int(os.environ.get('FEED_TIMELINE_SIZE', '500'))
+FEED_TIMELINE_TTL_DAYS = int(os.environ.get('FEED_TIMELINE_TTL_DAYS', '14'))
+# 팔로워가 이 수 이상인 사용자의 활동은 타임라인에 전달하지 않고 조회 시 가져옴
+FEED_FANOUT_MAX_FOLLOWERS = int(os.environ.get('FEED_FANOUT_MAX_FOLLOWERS', '5000'))
+
+# 엑셀 일정 가져오기 작업 제한 시간 (분, 넘으면 워커 중단으로 보고 실패 처리)
+SCHEDULE_IMPORT_TIMEOUT_MINUTES = int(os.environ.get('SCHEDULE_IMPORT_TIMEOUT_MINUTES', '15'))
+
 # 필수 환경변수 검증
 required_env_vars = [
     'KAKAO_CLIENT_ID',
@@ -0,0 +1,96 @@
+"""
+검색 색인 벤치마크 명령어
+
+가상 사용자를 만들어 색인한 뒤 닉네임 검색 시간을 측정합니다.
+모든 데이터는 하나의 트랜잭션에서 만들고 마지막에 롤백합니다 (--keep이면 유지).
+
+사용법:
+    python manage.py benchmark_search
+    python manage.py benchmark_search --users 1000000 --batch-size 10000
+"""
+
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from search.models import SearchGram
+from search.services.ngram_index import object_grams, search
+
+# 한글 닉네임 조합용 음절
+SYLLABLES = '가나다라마바사아자차카타파하민수지영현우서준도윤하은예린성경말씀매일읽기믿음소망사랑'
+
+
+class Command(BaseCommand):
+    help = '가상 사용자로 검색 색인 성능을 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100000, help='가상 사용자 수 (기본값: 100000)')
+        parser.add_argument('--batch-size', type=int, default=5000, help='한 번에 저장할 사용자 수')
+        parser.add_argument('--queries', type=int, default=200, help='측정할 검색 횟수')
+        parser.add_argument('--seed', type=int, default=1, help='난수 시드')
+        parser.add_argument('--keep', action='store_true', help='생성한 데이터를 롤백하지 않음')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+
+        with transaction.atomic():
+            nicknames = self._populate(rng, options['users'], options['batch_size'])
+            self._measure(rng, nicknames, options['queries'])
+            if not options['keep']:
+                transaction.set_rollback(True)
+                self.stdout.write('생성한 데이터를 롤백합니다.')
+
+    def _populate(self, rng, total, batch_size):
+        User = get_user_model()
+        prefix = f'bench{int(time.time())}'
+        nicknames = []
+        started = time.monotonic()
+
+        for start in range(0, total, batch_size):
+            users = []
+            for index in range(start, min(start + batch_size, total)):
+                nickname = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))) + str(index)
+                users.append(User(username=f'{prefix}_{index}', nickname=nickname, password='!'))
+            User.objects.bulk_create(users)
+            # bulk_create는 시그널이 없고 MySQL에서는 ID도 채우지 않으므로 다시 조회해 색인 행을 직접 만듦
+            users = User.objects.filter(
+                username__in=[user.username for user in users]
+            ).only('pk', 'nickname', 'username')
+            SearchGram.objects.bulk_create([
+                SearchGram(kind='user', gram=gram, object_id=user.pk)
+                for user in users
+                for gram in object_grams('user', user)
+            ], batch_size=batch_size * 4)
+            nicknames.extend(user.nickname for user in users)
+            self.stdout.write(f'  {len(nicknames)}/{total}명 생성 ({time.monotonic() - started:.1f}초)')
+
+        return nicknames
+
+    def _measure(self, rng, nicknames, count):
+        timings = []
+        result_counts = []
+        for _ in range(count):
+            nickname = rng.choice(nicknames)
+            # 닉네임 일부(2~4글자)로 검색
+            length = rng.randint(2, min(4, len(nickname)))
+            start = rng.randint(0, len(nickname) - length)
+            query = nickname[start:start + length]
+
+            started = time.perf_counter()
+            users, _ = search('user', query, limit=20)
+            timings.append((time.perf_counter() - started) * 1000)
+            result_counts.append(len(users))
+
+        timings.sort()
+        self.stdout.write('\n' + '=' * 50)
+        self.stdout.write(f'검색 {count}회, 평균 결과 {statistics.mean(result_counts):.1f}개')
+        self.stdout.write(
+            f'p50 {timings[len(timings) // 2]:.1f}ms, '
+            f'p95 {timings[int(len(timings) * 0.95) - 1]:.1f}ms, '
+            f'max {timings[-1]:.1f}ms'
+        )
+        self.stdout.write('=' * 50)
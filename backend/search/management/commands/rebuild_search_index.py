@@ -0,0 +1,28 @@
+"""
+검색 색인 재구성 명령어
+
+사용법:
+    python manage.py rebuild_search_index
+    python manage.py rebuild_search_index user
+    python manage.py rebuild_search_index group --batch-size 5000
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from search.services import INDEX_SOURCES, rebuild_index
+
+
+class Command(BaseCommand):
+    help = '사용자/그룹 검색 색인을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', nargs='?', help=f'특정 대상만 처리 ({", ".join(INDEX_SOURCES)})')
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 저장할 색인 행 수')
+
+    def handle(self, *args, **options):
+        kinds = [options['kind']] if options['kind'] else list(INDEX_SOURCES)
+        for kind in kinds:
+            if kind not in INDEX_SOURCES:
+                raise CommandError(f'알 수 없는 대상: {kind}')
+            indexed = rebuild_index(kind, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'{kind}: {indexed}개 색인 완료'))
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchGram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('user', '사용자'), ('group', '그룹')], max_length=10)),
+                ('gram', models.CharField(help_text='소문자로 정규화한 2글자 조각', max_length=8)),
+                ('object_id', models.BigIntegerField(help_text='대상 ID (User.id 또는 ReadingGroup.id)')),
+            ],
+            options={
+                'verbose_name': '검색 색인',
+                'verbose_name_plural': '검색 색인',
+                'indexes': [models.Index(fields=['object_id', 'kind'], name='search_gram_object_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'gram', 'object_id'), name='unique_search_gram')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+from search.services.ngram_index import INDEX_SOURCES, tokenize
+
+
+def backfill_search_grams(apps, schema_editor):
+    """기존 사용자/그룹 색인 (이후로는 signals.py에서 갱신)"""
+    SearchGram = apps.get_model('search', 'SearchGram')
+
+    for kind, source in INDEX_SOURCES.items():
+        model = apps.get_model(source.model_label)
+        rows = []
+        for obj in model.objects.only('pk', *source.fields).order_by('pk').iterator(chunk_size=1000):
+            grams = set()
+            for field in source.fields:
+                grams |= tokenize(getattr(obj, field), source.max_chars)
+            rows.extend(SearchGram(kind=kind, gram=gram, object_id=obj.pk) for gram in grams)
+            if len(rows) >= 5000:
+                SearchGram.objects.bulk_create(rows, ignore_conflicts=True)
+                rows = []
+        if rows:
+            SearchGram.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+        ('accounts', '0013_user_book_completion'),
+        ('todos', '0025_reading_group_member_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_grams, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class SearchGram(models.Model):
+    """
+    검색용 n-gram 색인 (대상별 고유 2글자 조각)
+
+    사용자 닉네임/아이디, 그룹 이름/설명을 조각으로 나눠 저장하고
+    검색어 조각이 많이 겹치는 대상부터 찾는다 (services.ngram_index).
+    """
+    KIND_CHOICES = [
+        ('user', '사용자'),
+        ('group', '그룹'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    gram = models.CharField(max_length=8, help_text="소문자로 정규화한 2글자 조각")
+    object_id = models.BigIntegerField(help_text="대상 ID (User.id 또는 ReadingGroup.id)")
+
+    class Meta:
+        verbose_name = '검색 색인'
+        verbose_name_plural = '검색 색인'
+        constraints = [
+            # 조회는 (kind, gram) 접두 인덱스만으로 object_id까지 처리
+            models.UniqueConstraint(fields=['kind', 'gram', 'object_id'], name='unique_search_gram'),
+        ]
+        indexes = [
+            # 대상별 색인 갱신용, object_id를 앞에 두어 검색의 GROUP BY object_id가
+            # 이 인덱스로 전체 스캔하는 실행 계획을 고르지 않도록 함
+            models.Index(fields=['object_id', 'kind'], name='search_gram_object_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.gram}:{self.object_id}"
@@ -0,0 +1,17 @@
+from .ngram_index import (
+    INDEX_SOURCES,
+    index_object,
+    rebuild_index,
+    remove_object,
+    search,
+    tokenize,
+)
+
+__all__ = [
+    'INDEX_SOURCES',
+    'index_object',
+    'rebuild_index',
+    'remove_object',
+    'search',
+    'tokenize',
+]
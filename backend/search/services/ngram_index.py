@@ -0,0 +1,214 @@
+"""
+n-gram 검색 색인
+
+- 대상 텍스트를 정규화(NFKC, 소문자, 공백 제거)한 뒤 2글자 조각으로 나눠 SearchGram에 저장
+  (한글 닉네임처럼 띄어쓰기/형태소 구분이 없는 짧은 문자열에 맞춤, 1글자 텍스트는 그대로 저장)
+- 검색은 (kind, gram) 인덱스로 조각이 겹치는 대상만 모아 겹친 수로 1차 정렬하고,
+  상위 후보(SEARCH_MAX_CANDIDATES)만 불러와 정확 일치 > 접두 일치 > 부분 일치 순으로 다시 정렬
+- 긴 검색어는 조각의 70%만 겹쳐도 후보로 인정 (오타 허용)
+- 색인 행이 많은 흔한 조각은 후보 조회에서 빼서 검색 시간이 대상 수에 비례해 늘지 않도록 함
+- 색인은 signals.py에서 저장/삭제 시 바뀐 조각만 갱신, 전체 재구성은 rebuild_search_index 명령
+"""
+
+import math
+import unicodedata
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from ..models import SearchGram
+
+GRAM_SIZE = 2
+# 검색어 조각 중 이 비율 이상이 겹쳐야 후보 (올림)
+MIN_MATCH_RATIO = 0.7
+# 검색어 최대 길이 (조각 수 제한)
+MAX_QUERY_CHARS = 50
+# 조각별 색인 행 수 캐시 (흔한 조각 판별용)
+GRAM_COUNT_KEY = 'search:gram_count:{kind}:{gram}'
+GRAM_COUNT_TIMEOUT = 60 * 60
+
+
+@dataclass(frozen=True)
+class IndexSource:
+    model_label: str
+    fields: tuple
+    # 필드별 색인할 최대 글자 수 (긴 설명으로 색인 행이 늘어나지 않도록)
+    max_chars: int = 200
+
+    @property
+    def model(self):
+        return apps.get_model(self.model_label)
+
+
+INDEX_SOURCES = {
+    'user': IndexSource('accounts.User', ('nickname', 'username')),
+    'group': IndexSource('todos.ReadingGroup', ('name', 'description')),
+}
+
+
+def get_max_candidates():
+    return getattr(settings, 'SEARCH_MAX_CANDIDATES', 200)
+
+
+def get_max_postings():
+    return getattr(settings, 'SEARCH_MAX_POSTINGS', 5000)
+
+
+def _common_grams(kind, grams):
+    """
+    색인 행이 SEARCH_MAX_POSTINGS개 이상인 조각
+
+    조각별 개수는 상한까지만 세고(인덱스 범위 스캔) 한 시간 동안 캐시한다.
+    """
+    limit = get_max_postings()
+    keys = {GRAM_COUNT_KEY.format(kind=kind, gram=gram): gram for gram in grams}
+    counts = {keys[key]: count for key, count in cache.get_many(list(keys)).items()}
+
+    missing = {}
+    for key, gram in keys.items():
+        if gram not in counts:
+            counts[gram] = SearchGram.objects.filter(kind=kind, gram=gram)[:limit].count()
+            missing[key] = counts[gram]
+    if missing:
+        cache.set_many(missing, timeout=GRAM_COUNT_TIMEOUT)
+
+    return {gram for gram, count in counts.items() if count >= limit}
+
+
+def normalize(text):
+    return ''.join(unicodedata.normalize('NFKC', text or '').lower().split())
+
+
+def tokenize(text, max_chars=None):
+    """정규화한 텍스트의 고유 2글자 조각 집합"""
+    text = normalize(text)[:max_chars]
+    if len(text) < GRAM_SIZE:
+        return {text} if text else set()
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def object_grams(kind, obj):
+    source = INDEX_SOURCES[kind]
+    grams = set()
+    for field in source.fields:
+        grams |= tokenize(getattr(obj, field), source.max_chars)
+    return grams
+
+
+def index_object(kind, obj):
+    """대상 하나의 색인 갱신 (바뀐 조각만 추가/삭제)"""
+    grams = object_grams(kind, obj)
+    existing = set(SearchGram.objects.filter(
+        kind=kind,
+        object_id=obj.pk
+    ).values_list('gram', flat=True))
+
+    removed = existing - grams
+    if removed:
+        SearchGram.objects.filter(kind=kind, object_id=obj.pk, gram__in=removed).delete()
+    added = grams - existing
+    if added:
+        SearchGram.objects.bulk_create(
+            [SearchGram(kind=kind, gram=gram, object_id=obj.pk) for gram in added],
+            ignore_conflicts=True
+        )
+
+
+def remove_object(kind, object_id):
+    SearchGram.objects.filter(kind=kind, object_id=object_id).delete()
+
+
+def rebuild_index(kind, batch_size=1000):
+    """kind 전체 색인 재구성, 색인한 대상 수 반환"""
+    source = INDEX_SOURCES[kind]
+    SearchGram.objects.filter(kind=kind).delete()
+
+    indexed = 0
+    rows = []
+    queryset = source.model.objects.only('pk', *source.fields).order_by('pk')
+    for obj in queryset.iterator(chunk_size=batch_size):
+        rows.extend(SearchGram(kind=kind, gram=gram, object_id=obj.pk) for gram in object_grams(kind, obj))
+        indexed += 1
+        if len(rows) >= batch_size:
+            SearchGram.objects.bulk_create(rows, batch_size=batch_size, ignore_conflicts=True)
+            rows = []
+    if rows:
+        SearchGram.objects.bulk_create(rows, batch_size=batch_size, ignore_conflicts=True)
+    return indexed
+
+
+def _rank(kind, obj, query, hits):
+    """정렬 키 (큰 값이 앞): 필드 일치 정도, 겹친 조각 수, 짧은 텍스트 우선"""
+    best = 0
+    shortest = math.inf
+    for field in INDEX_SOURCES[kind].fields:
+        text = normalize(getattr(obj, field))
+        if not text:
+            continue
+        if text == query:
+            score = 3
+        elif text.startswith(query):
+            score = 2
+        elif query in text:
+            score = 1
+        else:
+            score = 0
+        if score > best or (score == best and len(text) < shortest):
+            best, shortest = max(best, score), len(text)
+    return best, hits, -shortest, obj.pk
+
+
+def search(kind, query, queryset=None, limit=20, offset=0, filter_candidates=False):
+    """
+    색인으로 대상 검색
+
+    Args:
+        queryset: 결과를 불러올 쿼리셋 (select_related 등, 기본은 전체)
+        filter_candidates: queryset 조건을 후보 조회 단계에도 적용
+            (비공개 그룹 제외처럼 걸러지는 대상이 많을 때, 후보 상한에 밀려 결과가 비지 않도록)
+
+    Returns:
+        (순위대로 정렬된 대상 목록, 다음 페이지 존재 여부)
+    """
+    source = INDEX_SOURCES[kind]
+    if queryset is None:
+        queryset = source.model.objects.all()
+
+    normalized = normalize(query)[:MAX_QUERY_CHARS]
+    grams = tokenize(normalized)
+    if not grams:
+        return [], False
+    required = math.ceil(len(grams) * MIN_MATCH_RATIO)
+
+    # 흔한 조각(카카오 아이디 접두어, 숫자 등)은 후보가 너무 많으므로 드문 조각으로만 후보를 찾음
+    common = _common_grams(kind, grams)
+    rare = grams - common
+    candidates = SearchGram.objects.filter(kind=kind, gram__in=rare or grams)
+    if rare:
+        # 흔한 조각은 모두 겹친다고 보고 나머지를 드문 조각에서 요구
+        required = max(required - len(common), 1)
+    else:
+        # 모두 흔한 조각이면 한 조각의 최근 대상 일부로 범위를 제한 (결과가 일부만 나올 수 있음)
+        recent_ids = list(SearchGram.objects.filter(
+            kind=kind,
+            gram=min(grams)
+        ).order_by('-object_id').values_list('object_id', flat=True)[:get_max_postings()])
+        candidates = candidates.filter(object_id__in=recent_ids)
+    if filter_candidates:
+        candidates = candidates.filter(object_id__in=queryset.values('pk'))
+    hits = dict(
+        candidates.values('object_id').annotate(
+            hits=Count('id')
+        ).filter(
+            hits__gte=required
+        ).order_by('-hits', '-object_id').values_list('object_id', 'hits')[:get_max_candidates()]
+    )
+    if not hits:
+        return [], False
+
+    objects = list(queryset.filter(pk__in=hits.keys()))
+    objects.sort(key=lambda obj: _rank(kind, obj, normalized, hits[obj.pk]), reverse=True)
+    return objects[offset:offset + limit], len(objects) > offset + limit
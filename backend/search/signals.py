@@ -0,0 +1,23 @@
+from django.db.models.signals import post_save, post_delete
+
+from .services.ngram_index import INDEX_SOURCES, index_object, remove_object
+
+
+def _connect(kind, source):
+    """색인 대상 모델 저장/삭제 시 색인 갱신 (색인 필드가 바뀌지 않은 부분 저장은 무시)"""
+
+    def update_index(sender, instance, update_fields=None, **kwargs):
+        if update_fields is not None and not set(update_fields) & set(source.fields):
+            return
+        index_object(kind, instance)
+
+    def delete_index(sender, instance, **kwargs):
+        remove_object(kind, instance.pk)
+
+    uid = f'search_index_{kind}'
+    post_save.connect(update_index, sender=source.model, weak=False, dispatch_uid=f'{uid}_save')
+    post_delete.connect(delete_index, sender=source.model, weak=False, dispatch_uid=f'{uid}_delete')
+
+
+for _kind, _source in INDEX_SOURCES.items():
+    _connect(_kind, _source)
@@ -0,0 +1,116 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from todos.models import ReadingGroup
+
+from .models import SearchGram
+from .services import rebuild_index, search, tokenize
+
+
+class NgramIndexTest(TestCase):
+    """n-gram 색인 갱신과 검색 순위 테스트"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('매일 1독'), {'매일', '일1', '1독'})
+        self.assertEqual(tokenize('Ａb'), {'ab'})
+        self.assertEqual(tokenize('말'), {'말'})
+        self.assertEqual(tokenize('  '), set())
+
+    def test_signals_keep_index_in_sync(self):
+        user = User.objects.create_user(username='reader', password='pw', nickname='말씀읽기')
+        self.assertEqual(search('user', '씀읽')[0], [user])
+
+        user.nickname = '믿음소망'
+        user.save()
+        self.assertEqual(search('user', '씀읽')[0], [])
+        self.assertEqual(search('user', '소망')[0], [user])
+
+        user_id = user.id
+        user.delete()
+        self.assertFalse(SearchGram.objects.filter(kind='user', object_id=user_id).exists())
+
+    def test_ranking_and_typo_tolerance(self):
+        contains = User.objects.create_user(username='u1', password='pw', nickname='오늘도말씀묵상')
+        prefix = User.objects.create_user(username='u2', password='pw', nickname='말씀묵상일기')
+        exact = User.objects.create_user(username='u3', password='pw', nickname='말씀묵상')
+
+        users, has_more = search('user', '말씀 묵상')
+        self.assertEqual(users, [exact, prefix, contains])
+        self.assertFalse(has_more)
+
+        # 한 글자가 틀려도 조각 대부분이 겹치면 후보
+        self.assertIn(exact, search('user', '말씀묵삼')[0] + search('user', '말씀묵상하')[0])
+        self.assertEqual(search('user', '말씀묵상', limit=2), ([exact, prefix], True))
+        self.assertEqual(search('user', '말씀묵상', limit=2, offset=2), ([contains], False))
+
+    @override_settings(SEARCH_MAX_POSTINGS=3)
+    def test_common_grams_are_skipped(self):
+        for index in range(4):
+            User.objects.create_user(username=f'kakao_{index}', password='pw', nickname=f'회원{index}')
+        target = User.objects.create_user(username='kakao_9', password='pw', nickname='새벽기도')
+
+        # 'ka', 'ak' 등은 흔한 조각이므로 드문 조각으로만 후보를 찾음
+        self.assertEqual(search('user', 'kakao새벽')[0], [target])
+        # 모두 흔한 조각이면 최근 대상 일부에서 찾음
+        self.assertEqual(len(search('user', 'kakao')[0]), 3)
+
+    def test_rebuild_index(self):
+        group = ReadingGroup.objects.create(
+            name='청년부 통독', description='함께 읽어요',
+            creator=User.objects.create_user(username='leader', password='pw')
+        )
+        SearchGram.objects.all().delete()
+
+        self.assertEqual(rebuild_index('group'), 1)
+        self.assertEqual(search('group', '통독')[0], [group])
+        self.assertEqual(search('group', '읽어')[0], [group])
+
+    def test_benchmark_command_rolls_back(self):
+        call_command('benchmark_search', users=300, batch_size=100, queries=20, stdout=StringIO())
+        self.assertFalse(User.objects.filter(username__startswith='bench').exists())
+
+
+class SearchAPITest(TestCase):
+    """사용자/그룹 검색 API 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.me = User.objects.create_user(username='me', password='pw', nickname='성경읽기왕')
+
+    def test_search_users_paging_and_query_count(self):
+        for index in range(25):
+            User.objects.create_user(username=f'reader{index}', password='pw', nickname=f'성경읽기{index}')
+        self.client.force_authenticate(self.me)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/accounts/search/', {'q': '성경읽기'})
+        data = response.data['data']
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['users']), 20)
+        self.assertTrue(data['has_more'])
+        self.assertNotIn('me', [user['username'] for user in data['users']])
+        # 조각 개수 + 후보 + 대상 + 팔로잉 (결과 수와 무관)
+        self.assertLessEqual(len(ctx.captured_queries), 10)
+
+        response = self.client.get('/api/v1/accounts/search/', {'q': '성경읽기', 'page': 2})
+        self.assertEqual(len(response.data['data']['users']), 5)
+        self.assertFalse(response.data['data']['has_more'])
+
+    def test_group_search_excludes_private(self):
+        public = ReadingGroup.objects.create(name='새벽 통독반', is_public=True, creator=self.me)
+        ReadingGroup.objects.create(name='비밀 통독반', is_public=False, creator=self.me)
+
+        response = self.client.get('/api/v1/todos/groups/', {'search': '통독'})
+        self.assertEqual([group['id'] for group in response.data['groups']], [public.id])
+        self.assertFalse(response.data['has_more'])
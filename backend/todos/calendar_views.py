@@ -3,7 +3,6 @@
 """
 from datetime import date, timedelta
 from calendar import monthrange
-from collections import defaultdict
 
 from django.db import transaction
 from django.db.models import Q
@@ -15,9 +14,14 @@ from rest_framework.response import Response
 
 from .models import (
     UserPlanDisplaySettings, PlanSubscription,
-    DailyBibleSchedule, UserBibleProgress
+    DailyBibleSchedule
 )
 from .serializers import UserPlanDisplaySettingsSerializer
+from .services.calendar_projection import (
+    build_calendar_grid, build_calendar_year, bump_calendar, format_chapters,
+    get_calendar_display_settings
+)
+from .services.progress_snapshot import get_progress_snapshot
 from .views import book_to_code
 
 
@@ -100,6 +104,10 @@ def reorder_calendar_settings(request):
                 user=request.user
             ).update(display_order=display_order)
 
+        # update()는 시그널이 없으므로 캘린더 캐시를 직접 무효화
+        user_id = request.user.id
+        transaction.on_commit(lambda: bump_calendar(user_id))
+
     # 업데이트된 설정 반환
     settings = UserPlanDisplaySettings.objects.filter(
         user=request.user,
@@ -138,81 +146,54 @@ def get_calendar_month_data(request):
     start_date = date(year, month, 1)
     end_date = date(year, month, last_day)
 
-    # 사용자의 활성 구독 및 표시 설정 조회
-    display_settings = UserPlanDisplaySettings.objects.filter(
-        user=request.user,
-        subscription__is_active=True
-    ).select_related('subscription', 'subscription__plan')
+    # 날짜별 항목은 (사용자, 월)별 캐시, 없으면 구독 1 쿼리 + 모든 플랜의 해당 월 스케줄 1 쿼리
+    display_settings = get_calendar_display_settings(request.user)
+    calendar_data = build_calendar_grid(request.user, start_date, end_date)
 
-    # 설정을 subscription_id로 매핑
-    settings_map = {ds.subscription_id: ds for ds in display_settings}
+    # 설정 정보도 함께 반환 (이미 표시 순서대로 정렬되어 있음)
+    settings_serializer = UserPlanDisplaySettingsSerializer(display_settings, many=True)
 
-    # 결과 데이터 구조
-    calendar_data = defaultdict(list)
+    return Response({
+        'success': True,
+        'calendar': calendar_data,
+        'settings': settings_serializer.data,
+        'meta': {
+            'year': year,
+            'month': month
+        }
+    })
 
-    # 각 구독에 대해 스케줄 및 진행 상태 조회
-    for display_setting in display_settings:
-        subscription = display_setting.subscription
-        plan = subscription.plan
 
-        # 해당 플랜의 스케줄 조회
-        schedules = DailyBibleSchedule.objects.filter(
-            plan=plan,
-            date__range=[start_date, end_date]
-        ).order_by('date')
-
-        # 진행 상태 조회 (해당 구독의)
-        progress_map = {}
-        progress_records = UserBibleProgress.objects.filter(
-            subscription=subscription,
-            schedule__date__range=[start_date, end_date]
-        ).select_related('schedule')
-
-        for progress in progress_records:
-            progress_map[progress.schedule_id] = progress.is_completed
-
-        # 날짜별 데이터 구성
-        for schedule in schedules:
-            date_str = schedule.date.isoformat()
-
-            # 챕터 형식화
-            if schedule.start_chapter == schedule.end_chapter:
-                chapters = f"{schedule.start_chapter}장"
-            else:
-                chapters = f"{schedule.start_chapter}-{schedule.end_chapter}장"
-
-            calendar_data[date_str].append({
-                'plan_id': plan.id,
-                'plan_name': plan.name,
-                'subscription_id': subscription.id,
-                'color': display_setting.color,
-                'book': schedule.book,
-                'chapters': chapters,
-                'is_completed': progress_map.get(schedule.id, False),
-                'schedule_id': schedule.id,
-                'is_visible': display_setting.is_visible
-            })
-
-    # 표시 순서에 따라 각 날짜의 데이터 정렬
-    for date_str in calendar_data:
-        calendar_data[date_str].sort(
-            key=lambda x: settings_map.get(x['subscription_id'], {}).display_order
-            if hasattr(settings_map.get(x['subscription_id'], {}), 'display_order')
-            else 999
-        )
-
-    # 설정 정보도 함께 반환
-    settings_serializer = UserPlanDisplaySettingsSerializer(
-        display_settings.order_by('display_order'), many=True
-    )
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_calendar_year_data(request):
+    """
+    멀티플랜 연간 캘린더 데이터 조회 (월간 조회와 같은 쿼리 수)
+    GET /api/v1/todos/calendar/year/?year=2025
+
+    calendar는 {월: {날짜: [항목]}} 형태이며 항목 구조는 월간 조회와 같음
+    """
+    today = date.today()
+    try:
+        year = int(request.query_params.get('year') or today.year)
+        if not date.min.year <= year <= date.max.year:
+            raise ValueError(year)
+    except ValueError:
+        return Response({
+            'success': False,
+            'error': f'year는 {date.min.year}~{date.max.year} 사이의 숫자여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    display_settings = get_calendar_display_settings(request.user)
+    months = build_calendar_year(request.user, year)
+    settings_serializer = UserPlanDisplaySettingsSerializer(display_settings, many=True)
 
     return Response({
         'success': True,
-        'calendar': dict(calendar_data),
+        'calendar': months,
         'settings': settings_serializer.data,
         'meta': {
-            'year': year,
-            'month': month
+            'year': year
         }
     })
 
@@ -231,53 +212,41 @@ def get_last_incomplete_positions(request):
     subscriptions = PlanSubscription.objects.filter(
         user=request.user,
         is_active=True
-    ).select_related('plan')
+    ).select_related('plan', 'progress_bitmap')
 
+    # 구독별 오늘(포함) 이전의 가장 최근 미완료 스케줄 (진도 스냅샷에서 계산)
+    last_incomplete = {}
     for subscription in subscriptions:
-        plan = subscription.plan
+        snapshot = get_progress_snapshot(subscription, today)
+        index = snapshot.last_incomplete_until(today)
+        if index is not None:
+            last_incomplete[subscription] = snapshot.metadata.schedule_ids[index]
+
+    if not last_incomplete:
+        return Response({'success': True, 'positions': []})
 
-        # 오늘 이전의 미완료 스케줄 찾기
-        # 1. 해당 플랜의 모든 스케줄 중 오늘 이전 것
-        # 2. UserBibleProgress가 없거나 is_completed=False인 것
-        incomplete_schedules = DailyBibleSchedule.objects.filter(
-            plan=plan,
-            date__lte=today
-        ).exclude(
-            progress_records__subscription=subscription,
-            progress_records__is_completed=True
-        ).order_by('-date')
-
-        if incomplete_schedules.exists():
-            schedule = incomplete_schedules.first()
-
-            # 챕터 형식화
-            if schedule.start_chapter == schedule.end_chapter:
-                chapters = f"{schedule.start_chapter}장"
-            else:
-                chapters = f"{schedule.start_chapter}-{schedule.end_chapter}장"
-
-            # 표시 설정에서 색상 가져오기
-            try:
-                display_setting = UserPlanDisplaySettings.objects.get(
-                    user=request.user,
-                    subscription=subscription
-                )
-                color = display_setting.color
-            except UserPlanDisplaySettings.DoesNotExist:
-                color = '#3B82F6'
-
-            positions.append({
-                'plan_id': plan.id,
-                'plan_name': plan.name,
-                'subscription_id': subscription.id,
-                'color': color,
-                'date': schedule.date.isoformat(),
-                'book': schedule.book,
-                'book_code': book_to_code.get(schedule.book, 'gen'),
-                'chapters': chapters,
-                'start_chapter': schedule.start_chapter,
-                'schedule_id': schedule.id
-            })
+    schedules = DailyBibleSchedule.objects.in_bulk(last_incomplete.values())
+    colors = dict(UserPlanDisplaySettings.objects.filter(
+        user=request.user,
+        subscription__in=list(last_incomplete)
+    ).values_list('subscription_id', 'color'))
+
+    for subscription, schedule_id in last_incomplete.items():
+        plan = subscription.plan
+        schedule = schedules[schedule_id]
+
+        positions.append({
+            'plan_id': plan.id,
+            'plan_name': plan.name,
+            'subscription_id': subscription.id,
+            'color': colors.get(subscription.id, '#3B82F6'),
+            'date': schedule.date.isoformat(),
+            'book': schedule.book,
+            'book_code': book_to_code.get(schedule.book, 'gen'),
+            'chapters': format_chapters(schedule.start_chapter, schedule.end_chapter),
+            'start_chapter': schedule.start_chapter,
+            'schedule_id': schedule.id
+        })
 
     # 날짜 기준 정렬 (가장 최근 미완료가 먼저)
     positions.sort(key=lambda x: x['date'], reverse=True)
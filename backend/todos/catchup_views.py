@@ -5,6 +5,7 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.db.models import Sum
@@ -18,9 +19,9 @@ from .serializers import (
     OverdueScheduleSerializer
 )
 from .services import (
-    get_overdue_schedules, get_overdue_schedules_in_range,
-    calculate_catchup_schedule, calculate_suggested_settings,
-    copy_completed_progress, get_celebration_data
+    calculate_catchup_schedule, create_catchup_schedules, calculate_suggested_settings,
+    copy_completed_progress, get_celebration_data,
+    get_progress_snapshot
 )
 
 
@@ -38,14 +39,10 @@ def catchup_status(request, subscription_id):
         is_active=True
     )
 
-    # 밀린 스케줄 조회
-    overdue_schedules = get_overdue_schedules(subscription)
-    overdue_list = list(overdue_schedules)
-
-    # 밀린 장 수 계산
-    overdue_chapters = sum(
-        s.end_chapter - s.start_chapter + 1 for s in overdue_list
-    )
+    # 밀린 스케줄 (진도 스냅샷에서 계산, 스케줄 행은 응답용으로만 조회)
+    snapshot = get_progress_snapshot(subscription)
+    overdue_list = snapshot.load_schedules(snapshot.overdue_indices)
+    overdue_chapters = snapshot.chapters(snapshot.overdue_indices)
 
     # 밀린 기간
     overdue_range = None
@@ -97,9 +94,10 @@ def catchup_preview(request, subscription_id):
 
     # 범위 결정
     today = timezone.now().date()
-    overdue_schedules = get_overdue_schedules(subscription)
+    snapshot = get_progress_snapshot(subscription, today)
+    overdue_indices = snapshot.overdue_indices
 
-    if not overdue_schedules.exists():
+    if not overdue_indices:
         return Response({
             'valid': False,
             'summary': {},
@@ -107,12 +105,11 @@ def catchup_preview(request, subscription_id):
             'warnings': ['밀린 스케줄이 없습니다.']
         })
 
-    range_start = data.get('range_start') or overdue_schedules.first().date
-    range_end = data.get('range_end') or overdue_schedules.last().date
+    range_start = data.get('range_start') or snapshot.metadata.date_at(overdue_indices[0])
+    range_end = data.get('range_end') or snapshot.metadata.date_at(overdue_indices[-1])
 
     # 범위 내 밀린 스케줄
-    target_schedules = get_overdue_schedules_in_range(subscription, range_start, range_end)
-    target_list = list(target_schedules)
+    target_list = snapshot.load_schedules(snapshot.incomplete_in_range(range_start, range_end))
 
     if not target_list:
         return Response({
@@ -205,12 +202,10 @@ def catchup_create(request, subscription_id):
     data = serializer.validated_data
 
     # 범위 내 밀린 스케줄 확인
-    target_schedules = get_overdue_schedules_in_range(
-        subscription,
-        data['range_start'],
-        data['range_end']
+    snapshot = get_progress_snapshot(subscription)
+    target_list = snapshot.load_schedules(
+        snapshot.incomplete_in_range(data['range_start'], data['range_end'])
     )
-    target_list = list(target_schedules)
 
     if not target_list:
         return Response(
@@ -218,12 +213,6 @@ def catchup_create(request, subscription_id):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    # 세션 생성
-    session = CatchupSession.objects.create(
-        subscription=subscription,
-        **data
-    )
-
     # 스케줄 분배
     today = timezone.now().date()
     distributed, remaining = calculate_catchup_schedule(
@@ -235,17 +224,16 @@ def catchup_create(request, subscription_id):
         weekend_multiplier=float(data.get('weekend_multiplier', 1.0))
     )
 
-    # CatchupSchedule 생성
-    for day_data in distributed:
-        for original_schedule in day_data['items']:
-            CatchupSchedule.objects.create(
-                session=session,
-                original_schedule=original_schedule,
-                scheduled_date=day_data['date']
-            )
+    # 세션과 CatchupSchedule을 한 트랜잭션에서 일괄 생성
+    with transaction.atomic():
+        session = CatchupSession.objects.create(
+            subscription=subscription,
+            **data
+        )
+        create_catchup_schedules(session, distributed)
 
-    # 이미 완료된 진도 복사
-    copy_completed_progress(subscription, session)
+        # 이미 완료된 진도 복사
+        copy_completed_progress(subscription, session)
 
     return Response(
         CatchupSessionSerializer(session).data,
@@ -290,41 +278,38 @@ def catchup_session_update(request, session_id):
         if field in request.data:
             setattr(session, field, request.data[field])
 
-    session.save()
+    with transaction.atomic():
+        session.save()
 
-    # 재계산 요청 시
-    if request.data.get('recalculate'):
-        # 미완료 스케줄 삭제 후 재분배
-        session.schedules.filter(is_completed=False).delete()
-
-        # 남은 원본 스케줄 다시 분배
-        remaining_originals = get_overdue_schedules_in_range(
-            session.subscription,
-            session.range_start,
-            session.range_end
-        ).exclude(
-            id__in=session.schedules.values_list('original_schedule_id', flat=True)
-        )
+        # 재계산 요청 시
+        if request.data.get('recalculate'):
+            _redistribute_session(session)
 
-        today = timezone.now().date()
-        distributed, _ = calculate_catchup_schedule(
-            list(remaining_originals),
-            start_date=today,
-            target_date=session.target_rejoin_date,
-            max_daily_readings=session.max_daily_readings,
-            max_daily_chapters=session.max_daily_chapters,
-            weekend_multiplier=float(session.weekend_multiplier)
-        )
+    return Response(CatchupSessionSerializer(session).data)
 
-        for day_data in distributed:
-            for original_schedule in day_data['items']:
-                CatchupSchedule.objects.create(
-                    session=session,
-                    original_schedule=original_schedule,
-                    scheduled_date=day_data['date']
-                )
 
-    return Response(CatchupSessionSerializer(session).data)
+def _redistribute_session(session):
+    """미완료 스케줄 삭제 후 남은 원본 스케줄을 오늘부터 다시 분배"""
+    session.schedules.filter(is_completed=False).delete()
+
+    # 남은 원본 스케줄 다시 분배
+    snapshot = get_progress_snapshot(session.subscription)
+    kept = set(session.schedules.values_list('original_schedule_id', flat=True))
+    remaining_originals = snapshot.load_schedules([
+        index for index in snapshot.incomplete_in_range(session.range_start, session.range_end)
+        if snapshot.metadata.schedule_ids[index] not in kept
+    ])
+
+    today = timezone.now().date()
+    distributed, _ = calculate_catchup_schedule(
+        remaining_originals,
+        start_date=today,
+        target_date=session.target_rejoin_date,
+        max_daily_readings=session.max_daily_readings,
+        max_daily_chapters=session.max_daily_chapters,
+        weekend_multiplier=float(session.weekend_multiplier)
+    )
+    create_catchup_schedules(session, distributed)
 
 
 @api_view(['GET'])
@@ -0,0 +1,58 @@
+"""
+친구 활동 피드 API 뷰
+"""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .services.activity_feed import get_feed
+
+FEED_PAGE_SIZE = 20
+FEED_PAGE_MAX_SIZE = 50
+
+
+def _serialize_activity(activity):
+    user = activity.user
+    return {
+        'id': activity.id,
+        'type': activity.verb,
+        'user': {
+            'id': user.id,
+            'nickname': user.nickname,
+            'profile_image': user.profile_image,
+        },
+        'object_id': activity.object_id,
+        'data': activity.data,
+        'created_at': activity.created_at,
+        'updated_at': activity.updated_at,
+    }
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_friend_feed(request):
+    """
+    팔로잉 사용자의 활동 피드 (최신순)
+    GET /api/v1/todos/feed/?cursor=123&limit=20
+
+    - type: reading(오늘 읽은 분량, data.count/books), achievement(data.title), group_join(data.group_name)
+    - next_cursor가 있으면 cursor로 넘겨 다음 페이지 조회
+    """
+    try:
+        cursor = request.query_params.get('cursor')
+        cursor = int(cursor) if cursor else None
+        limit = min(max(int(request.query_params.get('limit', FEED_PAGE_SIZE)), 1), FEED_PAGE_MAX_SIZE)
+    except (TypeError, ValueError):
+        return Response({
+            'success': False,
+            'error': 'cursor와 limit은 숫자여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    activities, next_cursor = get_feed(request.user, before=cursor, limit=limit)
+    return Response({
+        'success': True,
+        'activities': [_serialize_activity(activity) for activity in activities],
+        'has_more': next_cursor is not None,
+        'next_cursor': next_cursor,
+    })
@@ -3,21 +3,56 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count
+from django.db import transaction
+from django.db.models import Prefetch, Q
 from django.utils import timezone
 from accounts.models import User
 from accounts.serializers import UserSearchSerializer
 from .models import ReadingGroup, GroupMembership, GroupInvitation, BibleReadingPlan
 from .serializers import BibleReadingPlanSerializer
+from .services.group_membership import GroupFullError, add_member, remove_member
+from search.services import search as search_index
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 그룹 목록 페이지 크기 (기본, 최대)
+GROUP_PAGE_SIZE = 20
+GROUP_PAGE_MAX_SIZE = 50
+
 
 class ReadingGroupSerializer:
     """그룹 시리얼라이저 (간단 구현)"""
     @staticmethod
-    def to_dict(group, request=None):
+    def optimize(queryset):
+        """to_dict에 필요한 생성자/플랜을 미리 조회"""
+        return queryset.select_related('creator').prefetch_related(
+            Prefetch('plans', queryset=BibleReadingPlan.objects.select_related('created_by'))
+        )
+
+    @staticmethod
+    def get_memberships(groups, request):
+        """요청 사용자의 활성 멤버십 {group_id: membership} (쿼리 1개)"""
+        if not (request and request.user.is_authenticated) or not groups:
+            return {}
+        return {
+            membership.group_id: membership
+            for membership in GroupMembership.objects.filter(
+                group_id__in=[group.id for group in groups],
+                user=request.user,
+                is_active=True
+            )
+        }
+
+    @staticmethod
+    def to_list(groups, request=None):
+        """여러 그룹 직렬화 (멤버십은 한 번에 조회)"""
+        groups = list(groups)
+        memberships = ReadingGroupSerializer.get_memberships(groups, request)
+        return [ReadingGroupSerializer.to_dict(group, request, memberships) for group in groups]
+
+    @staticmethod
+    def to_dict(group, request=None, memberships=None):
         data = {
             'id': group.id,
             'name': group.name,
@@ -37,23 +72,28 @@ class ReadingGroupSerializer:
         }
 
         # 로그인한 사용자의 멤버십 상태
-        if request and request.user.is_authenticated:
-            membership = GroupMembership.objects.filter(
-                group=group,
-                user=request.user,
-                is_active=True
-            ).first()
-            data['is_member'] = membership is not None
-            data['my_role'] = membership.get_role_display() if membership else None
-            data['show_in_profile'] = membership.show_in_profile if membership else True
-        else:
-            data['is_member'] = False
-            data['my_role'] = None
-            data['show_in_profile'] = True
+        if memberships is None:
+            memberships = ReadingGroupSerializer.get_memberships([group], request)
+        membership = memberships.get(group.id)
+        data['is_member'] = membership is not None
+        data['my_role'] = membership.get_role_display() if membership else None
+        data['show_in_profile'] = membership.show_in_profile if membership else True
 
         return data
 
 
+def _parse_page_params(request):
+    """cursor(마지막 그룹 ID)와 limit 파싱"""
+    cursor = request.query_params.get('cursor')
+    limit = request.query_params.get('limit', GROUP_PAGE_SIZE)
+    try:
+        cursor = int(cursor) if cursor else None
+        limit = min(max(int(limit), 1), GROUP_PAGE_MAX_SIZE)
+    except (TypeError, ValueError):
+        raise ValueError('cursor와 limit은 숫자여야 합니다.')
+    return cursor, limit
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def create_group(request):
@@ -86,25 +126,21 @@ def create_group(request):
                 'error': '유효하지 않은 플랜 ID가 포함되어 있습니다.'
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # 그룹 생성
-        group = ReadingGroup.objects.create(
-            name=name,
-            description=description,
-            creator=request.user,
-            is_public=is_public,
-            max_members=max_members
-        )
+        with transaction.atomic():
+            # 그룹 생성
+            group = ReadingGroup.objects.create(
+                name=name,
+                description=description,
+                creator=request.user,
+                is_public=is_public,
+                max_members=max_members
+            )
 
-        # ManyToMany 관계 설정
-        group.plans.set(plans)
+            # ManyToMany 관계 설정
+            group.plans.set(plans)
 
-        # 생성자를 관리자로 추가
-        GroupMembership.objects.create(
-            group=group,
-            user=request.user,
-            role='admin',
-            is_active=True
-        )
+            # 생성자를 관리자로 추가
+            add_member(group, request.user, role='admin', check_capacity=False)
 
         return Response({
             'success': True,
@@ -129,40 +165,67 @@ def get_groups(request):
         only_public = request.query_params.get('only_public', 'false').lower() == 'true'
         only_mine = request.query_params.get('only_mine', 'false').lower() == 'true'
         
+        try:
+            cursor, limit = _parse_page_params(request)
+        except ValueError as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+
         # 기본 쿼리셋
         groups = ReadingGroup.objects.all()
         
-        # 검색
-        if search:
+        # 1글자 검색은 색인 조각보다 짧으므로 기존 부분 일치로 처리
+        if search and len(search.strip()) < 2:
             groups = groups.filter(
                 Q(name__icontains=search) | Q(description__icontains=search)
             )
         
         # 플랜 필터
         if plan_id:
-            groups = groups.filter(plan_id=plan_id)
+            groups = groups.filter(plans__id=plan_id)
         
         # 공개 그룹만
         if only_public or not request.user.is_authenticated:
             groups = groups.filter(is_public=True)
         
-        # 내 그룹만
+        # 내 그룹만 (조인 대신 서브쿼리로 중복 행 방지)
         if only_mine and request.user.is_authenticated:
-            groups = groups.filter(
-                memberships__user=request.user,
-                memberships__is_active=True
-            ).distinct()
-
-        # 정렬 (distinct 이후에 정렬)
-        groups = groups.distinct().order_by('-created_at')[:50]
+            groups = groups.filter(id__in=GroupMembership.objects.filter(
+                user=request.user,
+                is_active=True
+            ).values('group_id'))
+
+        if search and len(search.strip()) >= 2:
+            # 검색 색인 순위순 (cursor는 순위 목록의 다음 위치)
+            offset = cursor or 0
+            groups, has_more = search_index(
+                'group', search,
+                queryset=ReadingGroupSerializer.optimize(groups),
+                limit=limit,
+                offset=offset,
+                filter_candidates=True
+            )
+            next_cursor = offset + limit if has_more else None
+        else:
+            # 최신순 keyset 페이지네이션 (ID는 생성 순서와 같음)
+            if cursor:
+                groups = groups.filter(id__lt=cursor)
+            groups = list(ReadingGroupSerializer.optimize(groups).order_by('-id')[:limit + 1])
+            has_more = len(groups) > limit
+            groups = groups[:limit]
+            next_cursor = groups[-1].id if has_more else None
         
         # 시리얼라이즈
-        groups_data = [ReadingGroupSerializer.to_dict(group, request) for group in groups]
+        groups_data = ReadingGroupSerializer.to_list(groups, request)
         
         return Response({
             'success': True,
             'groups': groups_data,
-            'total': len(groups_data)
+            'total': len(groups_data),
+            'has_more': has_more,
+            'next_cursor': next_cursor
         })
     except Exception as e:
         logger.error(f"Error getting groups: {str(e)}")
@@ -177,7 +240,7 @@ def get_groups(request):
 def get_group_detail(request, group_id):
     """그룹 상세 조회"""
     try:
-        group = get_object_or_404(ReadingGroup, id=group_id)
+        group = get_object_or_404(ReadingGroupSerializer.optimize(ReadingGroup.objects.all()), id=group_id)
         
         # 비공개 그룹이고 멤버가 아닌 경우
         if not group.is_public:
@@ -232,21 +295,20 @@ def join_group(request, group_id):
                 }, status=status.HTTP_400_BAD_REQUEST)
             else:
                 # 비활성 멤버십 재활성화
-                existing_membership.is_active = True
-                existing_membership.save()
+                try:
+                    add_member(group, request.user)
+                except GroupFullError as e:
+                    return Response({
+                        'success': False,
+                        'error': str(e)
+                    }, status=status.HTTP_400_BAD_REQUEST)
                 return Response({
                     'success': True,
                     'message': '그룹에 다시 가입했습니다.'
                 })
         
-        # 그룹이 가득 찼는지 확인
-        if group.is_full:
-            return Response({
-                'success': False,
-                'error': '그룹이 가득 찼습니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
         # 비공개 그룹은 초대가 필요
+        invitation = None
         if not group.is_public:
             invitation = GroupInvitation.objects.filter(
                 group=group,
@@ -259,19 +321,21 @@ def join_group(request, group_id):
                     'success': False,
                     'error': '비공개 그룹은 초대가 필요합니다.'
                 }, status=status.HTTP_403_FORBIDDEN)
-            
-            # 초대 수락 처리
-            invitation.status = 'accepted'
-            invitation.responded_at = timezone.now()
-            invitation.save()
         
-        # 멤버십 생성
-        membership = GroupMembership.objects.create(
-            group=group,
-            user=request.user,
-            role='member',
-            is_active=True
-        )
+        # 멤버십 생성 (정원 확인 포함, 가득 차면 초대는 수락 처리하지 않음)
+        try:
+            with transaction.atomic():
+                add_member(group, request.user)
+                if invitation:
+                    # 초대 수락 처리
+                    invitation.status = 'accepted'
+                    invitation.responded_at = timezone.now()
+                    invitation.save()
+        except GroupFullError as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
         
         return Response({
             'success': True,
@@ -313,8 +377,7 @@ def leave_group(request, group_id):
             }, status=status.HTTP_400_BAD_REQUEST)
         
         # 멤버십 비활성화
-        membership.is_active = False
-        membership.save()
+        remove_member(membership)
         
         return Response({
             'success': True,
@@ -458,16 +521,19 @@ def invite_to_group(request, group_id):
 def get_my_invitations(request):
     """내 초대 목록 조회"""
     try:
-        invitations = GroupInvitation.objects.filter(
+        invitations = list(GroupInvitation.objects.filter(
             invitee=request.user,
             status='pending'
-        ).select_related('group', 'inviter').order_by('-created_at')
+        ).select_related('group__creator', 'inviter').prefetch_related(
+            Prefetch('group__plans', queryset=BibleReadingPlan.objects.select_related('created_by'))
+        ).order_by('-created_at'))
+        groups_data = ReadingGroupSerializer.to_list([invitation.group for invitation in invitations], request)
         
         invitations_data = []
-        for invitation in invitations:
+        for invitation, group_data in zip(invitations, groups_data):
             invitations_data.append({
                 'id': invitation.id,
-                'group': ReadingGroupSerializer.to_dict(invitation.group, request),
+                'group': group_data,
                 'inviter': UserSearchSerializer(invitation.inviter, context={'request': request}).data,
                 'message': invitation.message,
                 'created_at': invitation.created_at
@@ -508,24 +574,18 @@ def respond_to_invitation(request, invitation_id):
         invitation.responded_at = timezone.now()
         
         if action == 'accept':
-            # 그룹이 가득 찼는지 확인
-            if invitation.group.is_full:
+            # 멤버십 생성 (정원 확인 포함)
+            try:
+                with transaction.atomic():
+                    add_member(invitation.group, request.user)
+                    invitation.status = 'accepted'
+                    invitation.save()
+            except GroupFullError as e:
                 return Response({
                     'success': False,
-                    'error': '그룹이 가득 찼습니다.'
+                    'error': str(e)
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            # 멤버십 생성
-            GroupMembership.objects.create(
-                group=invitation.group,
-                user=request.user,
-                role='member',
-                is_active=True
-            )
-            
-            invitation.status = 'accepted'
-            invitation.save()
-            
             return Response({
                 'success': True,
                 'message': '초대를 수락했습니다.',
@@ -583,8 +643,8 @@ def get_user_public_groups(request, user_id):
                 is_public=True
             ).distinct()
 
-        groups = groups.order_by('-created_at')[:50]
-        groups_data = [ReadingGroupSerializer.to_dict(g, request) for g in groups]
+        groups = ReadingGroupSerializer.optimize(groups).order_by('-created_at')[:50]
+        groups_data = ReadingGroupSerializer.to_list(groups, request)
 
         return Response({
             'success': True,
@@ -0,0 +1,27 @@
+"""
+Redis 리더보드(materialized view)를 전체 재구성하는 management command
+
+Usage:
+    python manage.py rebuild_leaderboards
+"""
+
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+
+from todos.services.leaderboard import get_client, rebuild_leaderboards
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Redis 리더보드를 전체 사용자 기준으로 재구성합니다.'
+
+    def handle(self, *args, **options):
+        if get_client() is None:
+            self.stdout.write(self.style.WARNING('캐시 백엔드가 Redis가 아니어서 리더보드를 만들지 않습니다.'))
+            return
+
+        users = User.objects.filter(is_active=True).select_related('profile').iterator()
+        count = rebuild_leaderboards(users)
+
+        self.stdout.write(self.style.SUCCESS(f'리더보드 재구성 완료: {count}명'))
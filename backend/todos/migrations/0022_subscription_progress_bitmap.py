@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0021_dailybibleschedule_schedule_plan_date_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubscriptionProgressBitmap',
+            fields=[
+                ('subscription', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='progress_bitmap', serialize=False, to='todos.plansubscription')),
+                ('bits', models.BinaryField(help_text='완료 비트맵 (little-endian, NULL이면 재계산 필요)', null=True)),
+                ('signature', models.BigIntegerField(help_text='생성 시점의 플랜 스케줄 구성 signature', null=True)),
+                ('version', models.PositiveIntegerField(default=0, help_text='갱신/무효화마다 증가 (재계산 결과 저장 시 경합 확인)')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '구독 완료 비트맵',
+                'verbose_name_plural': '구독 완료 비트맵',
+            },
+        ),
+    ]
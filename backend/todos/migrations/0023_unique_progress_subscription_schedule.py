@@ -0,0 +1,35 @@
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_progress(apps, schema_editor):
+    """(구독, 스케줄)별 중복 진도 정리 - 완료 기록을 우선으로, 같으면 가장 최근 행만 남김"""
+    UserBibleProgress = apps.get_model('todos', 'UserBibleProgress')
+
+    duplicates = UserBibleProgress.objects.values('subscription_id', 'schedule_id').annotate(
+        row_count=Count('id')
+    ).filter(row_count__gt=1)
+
+    for duplicate in duplicates.iterator():
+        rows = list(UserBibleProgress.objects.filter(
+            subscription_id=duplicate['subscription_id'],
+            schedule_id=duplicate['schedule_id']
+        ).order_by('-is_completed', '-updated_at', '-id').values_list('id', flat=True))
+        UserBibleProgress.objects.filter(id__in=rows[1:]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0022_subscription_progress_bitmap'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_progress, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='userbibleprogress',
+            constraint=models.UniqueConstraint(
+                fields=('subscription', 'schedule'), name='unique_progress_subscription_schedule'
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0023_unique_progress_subscription_schedule'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncChange',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('entity', models.CharField(choices=[('bookmark', '북마크'), ('highlight', '하이라이트'), ('note', '묵상노트'), ('reading_record', '개인 읽기 기록'), ('progress', '플랜 진도'), ('subscription', '플랜 구독')], max_length=20)),
+                ('object_id', models.BigIntegerField(help_text='대상 ID (진도는 schedule_id, 구독은 plan_id)')),
+                ('op', models.CharField(choices=[('upsert', '생성/수정'), ('delete', '삭제')], max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sync_changes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '동기화 변경 로그',
+                'verbose_name_plural': '동기화 변경 로그',
+                'indexes': [models.Index(fields=['user', 'id'], name='sync_change_user_id_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:31
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_member_count(apps, schema_editor):
+    """기존 그룹의 활성 멤버 수 채우기"""
+    ReadingGroup = apps.get_model('todos', 'ReadingGroup')
+    GroupMembership = apps.get_model('todos', 'GroupMembership')
+
+    active_count = GroupMembership.objects.filter(
+        group_id=OuterRef('pk'),
+        is_active=True
+    ).order_by().values('group_id').annotate(total=Count('id')).values('total')
+    ReadingGroup.objects.update(member_count=Coalesce(Subquery(active_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0024_sync_change'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='readinggroup',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, help_text='활성 멤버 수'),
+        ),
+        migrations.RunPython(backfill_member_count, migrations.RunPython.noop),
+    ]
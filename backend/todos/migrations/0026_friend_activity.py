@@ -0,0 +1,36 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0025_reading_group_member_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FriendActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verb', models.CharField(choices=[('reading', '말씀 읽기'), ('achievement', '업적 달성'), ('group_join', '그룹 가입')], max_length=20)),
+                ('object_id', models.BigIntegerField(blank=True, help_text='업적/그룹 ID', null=True)),
+                ('data', models.JSONField(blank=True, default=dict, help_text='표시용 데이터 (읽은 장 수, 업적/그룹 이름 등)')),
+                ('activity_date', models.DateField(blank=True, help_text='하루 단위로 합산하는 활동의 날짜', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='friend_activities', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '친구 활동',
+                'verbose_name_plural': '친구 활동',
+                'ordering': ['-id'],
+                'indexes': [models.Index(fields=['user', '-id'], name='friend_activity_user_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'verb', 'activity_date'), name='unique_daily_friend_activity')],
+            },
+        ),
+    ]
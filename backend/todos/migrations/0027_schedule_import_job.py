@@ -0,0 +1,43 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('todos', '0026_friend_activity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScheduleImportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('update_mode', models.CharField(choices=[('add', '추가'), ('update', '갱신'), ('replace', '교체')], default='add', max_length=10)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '처리 중'), ('completed', '완료'), ('failed', '실패')], default='pending', max_length=10)),
+                ('file_name', models.CharField(blank=True, max_length=255)),
+                ('source', models.BinaryField(help_text='업로드한 파일 (처리 후 비움)', null=True)),
+                ('total_rows', models.PositiveIntegerField(blank=True, help_text='데이터 행 수 (헤더 제외)', null=True)),
+                ('processed_rows', models.PositiveIntegerField(default=0)),
+                ('created_count', models.PositiveIntegerField(default=0)),
+                ('updated_count', models.PositiveIntegerField(default=0)),
+                ('error_count', models.PositiveIntegerField(default=0)),
+                ('errors', models.JSONField(blank=True, default=list, help_text='행별 오류 [{row, error}] (최대 MAX_REPORTED_ERRORS개)')),
+                ('message', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='schedule_import_jobs', to=settings.AUTH_USER_MODEL)),
+                ('plan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='import_jobs', to='todos.biblereadingplan')),
+            ],
+            options={
+                'verbose_name': '일정 가져오기 작업',
+                'verbose_name_plural': '일정 가져오기 작업',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
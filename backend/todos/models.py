@@ -114,6 +114,12 @@ class UserBibleProgress(models.Model):
         indexes = [
             models.Index(fields=['subscription', 'is_completed'], name='progress_sub_completed_idx'),
         ]
+        constraints = [
+            # 일괄 진도 저장의 upsert(ON DUPLICATE KEY UPDATE) 기준
+            models.UniqueConstraint(
+                fields=['subscription', 'schedule'], name='unique_progress_subscription_schedule'
+            ),
+        ]
 
     @property
     def status(self):
@@ -126,6 +132,31 @@ class UserBibleProgress(models.Model):
         except DailyBibleSchedule.DoesNotExist:
             return "no_schedule"
 
+class SubscriptionProgressBitmap(models.Model):
+    """
+    구독별 완료 비트맵 (진도 읽기 모델)
+
+    플랜 스케줄을 (date, id) 순으로 정렬했을 때 i번째 스케줄을 완료했으면 i번째 비트가 1.
+    원본은 UserBibleProgress이며, 이 테이블은 진도 변경 시 함께 갱신되거나 무효화(bits=NULL)된다.
+    """
+    subscription = models.OneToOneField(
+        PlanSubscription,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='progress_bitmap',
+    )
+    bits = models.BinaryField(null=True, help_text="완료 비트맵 (little-endian, NULL이면 재계산 필요)")
+    signature = models.BigIntegerField(null=True, help_text="생성 시점의 플랜 스케줄 구성 signature")
+    version = models.PositiveIntegerField(default=0, help_text="갱신/무효화마다 증가 (재계산 결과 저장 시 경합 확인)")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "구독 완료 비트맵"
+        verbose_name_plural = "구독 완료 비트맵"
+
+    def __str__(self):
+        return f"{self.subscription_id} 완료 비트맵"
+
 class VideoBibleIntro(models.Model):
     """성경 영상 개론 플랜"""
     plan = models.ForeignKey(
@@ -278,6 +309,8 @@ class ReadingGroup(models.Model):
     )
     is_public = models.BooleanField(default=False, help_text="공개 그룹 여부")
     max_members = models.IntegerField(default=50, help_text="최대 멤버 수")
+    # 활성 멤버 수 (가입/탈퇴 시 services.group_membership에서 원자적으로 증감)
+    member_count = models.PositiveIntegerField(default=0, help_text="활성 멤버 수")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -294,10 +327,6 @@ class ReadingGroup(models.Model):
             plan_names += f" 외 {self.plans.count() - 2}개"
         return f"{self.name} ({plan_names})" if plan_names else self.name
 
-    @property
-    def member_count(self):
-        return self.memberships.filter(is_active=True).count()
-
     @property
     def is_full(self):
         return self.member_count >= self.max_members
@@ -582,6 +611,49 @@ class PersonalReadingRecord(models.Model):
         return f"{self.user.nickname} - {self.book} {self.chapter}"
 
 
+class SyncChange(models.Model):
+    """
+    오프라인 동기화 변경 로그
+
+    id가 서버 변경 순번(클라이언트 cursor)이며, 행별 최신 상태는 원본 테이블에서 다시 읽는다.
+    """
+    ENTITY_CHOICES = [
+        ('bookmark', '북마크'),
+        ('highlight', '하이라이트'),
+        ('note', '묵상노트'),
+        ('reading_record', '개인 읽기 기록'),
+        ('progress', '플랜 진도'),
+        ('subscription', '플랜 구독'),
+    ]
+    OP_UPSERT = 'upsert'
+    OP_DELETE = 'delete'
+    OP_CHOICES = [
+        (OP_UPSERT, '생성/수정'),
+        (OP_DELETE, '삭제'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='sync_changes'
+    )
+    entity = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    object_id = models.BigIntegerField(help_text="대상 ID (진도는 schedule_id, 구독은 plan_id)")
+    op = models.CharField(max_length=10, choices=OP_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'id'], name='sync_change_user_id_idx'),
+        ]
+        verbose_name = "동기화 변경 로그"
+        verbose_name_plural = "동기화 변경 로그"
+
+    def __str__(self):
+        return f"{self.id} {self.entity}:{self.object_id} {self.op}"
+
+
 class CatchupSession(models.Model):
     """따라잡기 세션"""
 
@@ -737,3 +809,101 @@ class CatchupSchedule(models.Model):
         self.is_completed = False
         self.completed_at = None
         self.save()
+
+
+class FriendActivity(models.Model):
+    """
+    친구 활동 피드 항목 (services/activity_feed.py에서 팔로워 타임라인으로 전달)
+    - reading: 하루 단위로 하나의 행에 합산 (activity_date 기준)
+    - achievement, group_join: 이벤트마다 한 행 (activity_date 없음)
+    """
+    VERB_READING = 'reading'
+    VERB_ACHIEVEMENT = 'achievement'
+    VERB_GROUP_JOIN = 'group_join'
+    VERB_CHOICES = [
+        (VERB_READING, '말씀 읽기'),
+        (VERB_ACHIEVEMENT, '업적 달성'),
+        (VERB_GROUP_JOIN, '그룹 가입'),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='friend_activities'
+    )
+    verb = models.CharField(max_length=20, choices=VERB_CHOICES)
+    object_id = models.BigIntegerField(null=True, blank=True, help_text="업적/그룹 ID")
+    data = models.JSONField(default=dict, blank=True, help_text="표시용 데이터 (읽은 장 수, 업적/그룹 이름 등)")
+    activity_date = models.DateField(null=True, blank=True, help_text="하루 단위로 합산하는 활동의 날짜")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-id']
+        constraints = [
+            # activity_date가 NULL인 활동은 제약에 걸리지 않음
+            models.UniqueConstraint(fields=['user', 'verb', 'activity_date'], name='unique_daily_friend_activity'),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-id'], name='friend_activity_user_idx'),
+        ]
+        verbose_name = "친구 활동"
+        verbose_name_plural = "친구 활동"
+
+    def __str__(self):
+        return f"{self.user_id} - {self.verb} ({self.created_at})"
+
+
+class ScheduleImportJob(models.Model):
+    """엑셀 일정 가져오기 작업 (services/schedule_import.py, Celery 태스크에서 처리)"""
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '처리 중'),
+        (STATUS_COMPLETED, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+    MODE_CHOICES = [
+        ('add', '추가'),
+        ('update', '갱신'),
+        ('replace', '교체'),
+    ]
+
+    plan = models.ForeignKey(
+        BibleReadingPlan,
+        on_delete=models.CASCADE,
+        related_name='import_jobs'
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='schedule_import_jobs'
+    )
+    update_mode = models.CharField(max_length=10, choices=MODE_CHOICES, default='add')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    file_name = models.CharField(max_length=255, blank=True)
+    source = models.BinaryField(null=True, editable=False, help_text="업로드한 파일 (처리 후 비움)")
+
+    total_rows = models.PositiveIntegerField(null=True, blank=True, help_text="데이터 행 수 (헤더 제외)")
+    processed_rows = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True, help_text="행별 오류 [{row, error}] (최대 MAX_REPORTED_ERRORS개)")
+    message = models.CharField(max_length=255, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "일정 가져오기 작업"
+        verbose_name_plural = "일정 가져오기 작업"
+
+    def __str__(self):
+        return f"{self.plan_id} - {self.file_name} ({self.status})"
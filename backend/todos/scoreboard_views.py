@@ -4,17 +4,23 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.db.models import Count, Q, F, Sum, Case, When, IntegerField, Prefetch
 from django.utils import timezone
-from django.core.cache import cache
 from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
 from datetime import datetime, timedelta
 from accounts.models import User, UserProfile, Follow
 from accounts.serializers import UserSearchSerializer
 from .models import UserBibleProgress, PlanSubscription, DailyBibleSchedule, ReadingGroup, GroupMembership
+from .services.plan_metadata import get_plan_metadata
+from .services import leaderboard as leaderboard_store
+from .services.scoreboard_cache import plan_namespace, group_namespace, user_namespace
+from utils.cache import get_or_rebuild
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 스코어보드 캐시는 이벤트(세대 bump)로 무효화되므로 만료 시간은 안전장치 용도
+SCOREBOARD_CACHE_TIMEOUT = 60 * 60
+
 
 # ===== Helper Functions =====
 
@@ -56,44 +62,62 @@ def calculate_progress_rate(user, plan_id=None):
     주의: UserProfile.total_completed_days는 모든 플랜에 걸친 고유 날짜 수이므로
     특정 플랜의 진도율 계산에는 사용하지 않습니다.
     """
-    try:
-        subscriptions = PlanSubscription.objects.filter(user=user, is_active=True)
-        if not subscriptions.exists():
-            return 0
+    return calculate_progress_rates([user.id], plan_id)[user.id]
 
-        if plan_id:
-            # 특정 플랜의 진행률
-            subscription = subscriptions.filter(plan_id=plan_id).first()
-        else:
-            # 첫 번째 활성 플랜 기준
-            subscription = subscriptions.first()
 
-        if not subscription:
-            return 0
+def calculate_progress_rates(user_ids, plan_id=None):
+    """여러 사용자의 진행률 일괄 계산 - {user_id: 진행률}
+
+    calculate_progress_rate와 같은 기준(해당 플랜, 없으면 첫 번째 활성 구독)으로 계산하며,
+    사용자 수와 관계없이 구독 조회 1회 + 완료 수 집계 1회로 처리합니다.
+    오늘까지의 스케줄 수는 플랜 메타데이터 캐시에서 가져옵니다.
+    """
+    user_ids = list(user_ids)
+    rates = {user_id: 0 for user_id in user_ids}
+    if not user_ids:
+        return rates
+
+    try:
+        subscriptions = PlanSubscription.objects.filter(user_id__in=user_ids, is_active=True)
+        if plan_id:
+            subscriptions = subscriptions.filter(plan_id=plan_id)
 
-        # 해당 플랜의 오늘까지 스케줄 수
-        total_schedules = DailyBibleSchedule.objects.filter(
-            plan=subscription.plan,
-            date__lte=timezone.now().date()
-        ).count()
+        # 사용자별 기준 구독 (플랜 미지정 시 첫 번째 활성 구독)
+        subscription_by_user = {}
+        for sub_id, user_id, sub_plan_id in subscriptions.order_by('id').values_list('id', 'user_id', 'plan_id'):
+            subscription_by_user.setdefault(user_id, (sub_id, sub_plan_id))
 
-        if total_schedules == 0:
-            return 0
+        if not subscription_by_user:
+            return rates
 
-        # 해당 구독의 완료 스케줄 수 (플랜 기준으로 일관성 있게 계산)
-        completed_schedules = UserBibleProgress.objects.filter(
-            subscription=subscription,
-            is_completed=True
-        ).count()
+        completed_by_subscription = dict(
+            UserBibleProgress.objects.filter(
+                subscription_id__in=[sub_id for sub_id, _ in subscription_by_user.values()],
+                is_completed=True
+            ).values('subscription_id').annotate(cnt=Count('id')).values_list('subscription_id', 'cnt')
+        )
 
-        return round((completed_schedules / total_schedules * 100), 2)
+        today = timezone.now().date()
+        totals_by_plan = {}
+        for user_id, (sub_id, sub_plan_id) in subscription_by_user.items():
+            if sub_plan_id not in totals_by_plan:
+                totals_by_plan[sub_plan_id] = get_plan_metadata(sub_plan_id).schedules_until(today)
+            total_schedules = totals_by_plan[sub_plan_id]
+            if total_schedules:
+                completed_schedules = completed_by_subscription.get(sub_id, 0)
+                rates[user_id] = round((completed_schedules / total_schedules * 100), 2)
     except Exception as e:
-        logger.error(f"Error calculating progress rate for user {user.id}: {str(e)}")
-        return 0
+        logger.error(f"Error calculating progress rates: {str(e)}", exc_info=True)
+
+    return rates
 
 
-def build_leaderboard_entry(user, completed_count, plan_id=None, is_me=False, extra_fields=None):
-    """리더보드 엔트리 생성"""
+def build_leaderboard_entry(user, completed_count, plan_id=None, is_me=False, extra_fields=None,
+                            progress_rates=None):
+    """리더보드 엔트리 생성
+
+    progress_rates: calculate_progress_rates 결과 (없으면 사용자별로 계산)
+    """
     profile = getattr(user, 'profile', None)
 
     if not profile:
@@ -113,7 +137,10 @@ def build_leaderboard_entry(user, completed_count, plan_id=None, is_me=False, ex
             'is_me': is_me
         },
         'completed_days': completed_count,
-        'progress_rate': calculate_progress_rate(user, plan_id),
+        'progress_rate': (
+            progress_rates.get(user.id, 0) if progress_rates is not None
+            else calculate_progress_rate(user, plan_id)
+        ),
         'current_streak': current_streak,
         'longest_streak': longest_streak
     }
@@ -148,6 +175,42 @@ def rank_leaderboard(leaderboard, limit=None):
     return leaderboard
 
 
+def get_materialized_leaderboard(plan_id, period, limit):
+    """Redis ZSET 리더보드에서 상위 N명 엔트리 생성 (사용 불가 시 None)"""
+    if not leaderboard_store.is_available():
+        return None
+
+    try:
+        top_scores = leaderboard_store.get_top_scores(period, plan_id, limit)
+    except Exception as e:
+        logger.error(f"Error reading materialized leaderboard: {str(e)}", exc_info=True)
+        return None
+
+    users = User.objects.select_related('profile').in_bulk([user_id for user_id, _ in top_scores])
+    progress_rates = calculate_progress_rates(users.keys(), plan_id)
+
+    return [
+        build_leaderboard_entry(
+            user=users[user_id],
+            completed_count=score,
+            plan_id=plan_id,
+            progress_rates=progress_rates
+        )
+        for user_id, score in top_scores
+        if user_id in users
+    ]
+
+
+def with_is_me(result, user):
+    """여러 사용자가 공유하는 캐시 결과에 요청 사용자 표시 (캐시 값은 변경하지 않음)"""
+    me_id = user.id if user.is_authenticated else None
+    leaderboard = [
+        {**entry, 'user': {**entry['user'], 'is_me': entry['user']['id'] == me_id}}
+        for entry in result['leaderboard']
+    ]
+    return {**result, 'leaderboard': leaderboard}
+
+
 # ===== API Views =====
 
 
@@ -161,74 +224,76 @@ def get_scoreboard(request):
         period = request.query_params.get('period', 'all')  # all, week, month
         limit = int(request.query_params.get('limit', 100))
 
-        # 캐시 키 생성
-        cache_key = f'scoreboard:global:{period}:{plan_id}:{limit}'
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
-
-        # 기본 쿼리셋
-        users_query = User.objects.filter(is_active=True).select_related('profile')
-
-        # 플랜 필터링
-        if plan_id:
-            users_query = users_query.filter(
-                plansubscription__plan_id=plan_id,
-                plansubscription__is_active=True
-            ).distinct()
-
-        # 공개 프로필 또는 본인
-        if request.user.is_authenticated:
-            users_query = users_query.filter(
-                Q(profile__is_public=True) | Q(id=request.user.id)
-            )
-        else:
-            users_query = users_query.filter(profile__is_public=True)
-
-        # 완료 일수 annotate 추가 (N+1 쿼리 해결)
-        if period == 'all':
-            # 전체 기간은 UserProfile의 total_completed_days 사용
-            users_query = users_query.annotate(
-                completed_count=F('profile__total_completed_days')
-            )
-        else:
-            # 기간별로는 annotate로 계산
-            users_query = users_query.annotate(
-                completed_count=get_completed_days_annotation(period, plan_id)
-            )
-
-        # 정렬 (DB 레벨에서 처리)
-        users_query = users_query.order_by('-completed_count')[:limit * 2]  # 여유있게 가져오기
-
-        # 리더보드 구성
-        leaderboard = []
-        for user in users_query:
-            # completed_count가 0인 사용자는 제외 (선택사항)
-            if user.completed_count == 0 and len(leaderboard) >= limit:
-                continue
-
-            entry = build_leaderboard_entry(
-                user=user,
-                completed_count=user.completed_count,
-                plan_id=plan_id,
-                is_me=(user == request.user if request.user.is_authenticated else False)
-            )
-            leaderboard.append(entry)
-
-        # 순위 부여 및 제한
-        leaderboard = rank_leaderboard(leaderboard, limit)
-
-        result = {
-            'success': True,
-            'leaderboard': leaderboard,
-            'period': period,
-            'plan_id': plan_id
-        }
+        # 플랜 진도가 바뀌면 세대가 올라가 새 키로 재계산 (한 워커만 재계산, 나머지는 이전 값 제공)
+        def build_result():
+            # materialized 리더보드(Redis ZSET)가 있으면 상위 N명만 조회
+            leaderboard = get_materialized_leaderboard(plan_id, period, limit)
+
+            if leaderboard is None:
+                # 기본 쿼리셋
+                users_query = User.objects.filter(is_active=True).select_related('profile')
+
+                # 플랜 필터링
+                if plan_id:
+                    users_query = users_query.filter(
+                        plansubscription__plan_id=plan_id,
+                        plansubscription__is_active=True
+                    ).distinct()
+
+                # 공개 프로필만 (모든 사용자가 공유하는 캐시이므로 본인 비공개 프로필은 제외)
+                users_query = users_query.filter(profile__is_public=True)
+
+                # 완료 일수 annotate 추가 (N+1 쿼리 해결)
+                if period == 'all':
+                    # 전체 기간은 UserProfile의 total_completed_days 사용
+                    users_query = users_query.annotate(
+                        completed_count=F('profile__total_completed_days')
+                    )
+                else:
+                    # 기간별로는 annotate로 계산
+                    users_query = users_query.annotate(
+                        completed_count=get_completed_days_annotation(period, plan_id)
+                    )
+
+                # 정렬 (DB 레벨에서 처리)
+                users_query = users_query.order_by('-completed_count')[:limit * 2]  # 여유있게 가져오기
+
+                # 리더보드 구성 (진행률은 일괄 계산)
+                users = list(users_query)
+                progress_rates = calculate_progress_rates([user.id for user in users], plan_id)
+                leaderboard = []
+                for user in users:
+                    # completed_count가 0인 사용자는 제외 (선택사항)
+                    if user.completed_count == 0 and len(leaderboard) >= limit:
+                        continue
+
+                    entry = build_leaderboard_entry(
+                        user=user,
+                        completed_count=user.completed_count,
+                        plan_id=plan_id,
+                        progress_rates=progress_rates
+                    )
+                    leaderboard.append(entry)
+
+            # 순위 부여 및 제한
+            leaderboard = rank_leaderboard(leaderboard, limit)
+
+            result = {
+                'success': True,
+                'leaderboard': leaderboard,
+                'period': period,
+                'plan_id': plan_id
+            }
+            return result
 
-        # 캐시 저장 (5분)
-        cache.set(cache_key, result, 300)
+        result = get_or_rebuild(
+            f'scoreboard:global:{period}:{plan_id}:{limit}',
+            build_result,
+            namespaces=(plan_namespace(plan_id),),
+            timeout=SCOREBOARD_CACHE_TIMEOUT
+        )
 
-        return Response(result)
+        return Response(with_is_me(result, request.user))
     except Exception as e:
         logger.error(f"Error getting scoreboard: {str(e)}", exc_info=True)
         return Response({
@@ -247,70 +312,73 @@ def get_friends_scoreboard(request):
         period = request.query_params.get('period', 'all')
         follow_type = request.query_params.get('type', 'mutual')  # mutual 또는 following
 
-        # 캐시 키 생성
-        cache_key = f'scoreboard:friends:{request.user.id}:{follow_type}:{period}:{plan_id}'
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
-
-        # 팔로우 관계에 따른 사용자 쿼리
-        if follow_type == 'following':
-            # 내가 팔로우하는 모든 사람
-            friends = User.objects.filter(
-                followers__follower=request.user
-            ).distinct().select_related('profile')
-        else:
-            # 상호 팔로우 (기본값)
-            friends = User.objects.filter(
-                followers__follower=request.user,
-                following__following=request.user
-            ).distinct().select_related('profile')
-
-        # 본인 포함 (ID로 쿼리 통합)
-        friend_ids = list(friends.values_list('id', flat=True))
-        user_ids = friend_ids + [request.user.id]
-
-        # 통합 쿼리셋 (본인 포함)
-        users_query = User.objects.filter(id__in=user_ids).select_related('profile')
-
-        # 완료 일수 annotate 추가
-        if period == 'all':
-            users_query = users_query.annotate(
-                completed_count=F('profile__total_completed_days')
-            )
-        else:
-            users_query = users_query.annotate(
-                completed_count=get_completed_days_annotation(period, plan_id)
-            )
-
-        # 정렬
-        users_query = users_query.order_by('-completed_count')
-
-        # 리더보드 구성
-        leaderboard = []
-        for user in users_query:
-            entry = build_leaderboard_entry(
-                user=user,
-                completed_count=user.completed_count,
-                plan_id=plan_id,
-                is_me=(user.id == request.user.id)
-            )
-            leaderboard.append(entry)
-
-        # 순위 부여
-        leaderboard = rank_leaderboard(leaderboard)
-
-        result = {
-            'success': True,
-            'leaderboard': leaderboard,
-            'period': period,
-            'plan_id': plan_id,
-            'type': follow_type,
-            'total_friends': len(friend_ids)
-        }
+        # 팔로우 관계나 플랜 진도가 바뀌면 세대가 올라가 새 키로 재계산
+        def build_result():
+            # 팔로우 관계에 따른 사용자 쿼리
+            if follow_type == 'following':
+                # 내가 팔로우하는 모든 사람
+                friends = User.objects.filter(
+                    followers__follower=request.user
+                ).distinct().select_related('profile')
+            else:
+                # 상호 팔로우 (기본값)
+                friends = User.objects.filter(
+                    followers__follower=request.user,
+                    following__following=request.user
+                ).distinct().select_related('profile')
+
+            # 본인 포함 (ID로 쿼리 통합)
+            friend_ids = list(friends.values_list('id', flat=True))
+            user_ids = friend_ids + [request.user.id]
+
+            # 통합 쿼리셋 (본인 포함)
+            users_query = User.objects.filter(id__in=user_ids).select_related('profile')
+
+            # 완료 일수 annotate 추가
+            if period == 'all':
+                users_query = users_query.annotate(
+                    completed_count=F('profile__total_completed_days')
+                )
+            else:
+                users_query = users_query.annotate(
+                    completed_count=get_completed_days_annotation(period, plan_id)
+                )
+
+            # 정렬
+            users_query = users_query.order_by('-completed_count')
+
+            # 리더보드 구성 (진행률은 일괄 계산)
+            progress_rates = calculate_progress_rates(user_ids, plan_id)
+            leaderboard = []
+            for user in users_query:
+                entry = build_leaderboard_entry(
+                    user=user,
+                    completed_count=user.completed_count,
+                    plan_id=plan_id,
+                    is_me=(user.id == request.user.id),
+                    progress_rates=progress_rates
+                )
+                leaderboard.append(entry)
+
+            # 순위 부여
+            leaderboard = rank_leaderboard(leaderboard)
+
+            result = {
+                'success': True,
+                'leaderboard': leaderboard,
+                'period': period,
+                'plan_id': plan_id,
+                'type': follow_type,
+                'total_friends': len(friend_ids)
+            }
+            return result
 
-        # 캐시 저장 (3분 - 친구는 더 자주 업데이트)
-        cache.set(cache_key, result, 180)
+        result = get_or_rebuild(
+            f'scoreboard:friends:{request.user.id}:{follow_type}:{period}:{plan_id}',
+            build_result,
+            namespaces=(user_namespace(request.user.id), plan_namespace(plan_id)),
+            timeout=SCOREBOARD_CACHE_TIMEOUT
+        )
 
         return Response(result)
     except Exception as e:
@@ -376,101 +444,104 @@ def get_group_scoreboard(request, group_id):
                     'error': '그룹에 플랜이 없습니다.'
                 }, status=status.HTTP_404_NOT_FOUND)
 
-        # 캐시 키
-        cache_key = f'scoreboard:group:{group_id}:{plan.id}:{period}'
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
-
-        # 그룹 멤버 쿼리 - annotate로 최적화
-        members = User.objects.filter(
-            group_memberships__group=group,
-            group_memberships__is_active=True
-        ).distinct().select_related('profile')
-
-        # 완료 일수 annotate
-        if period == 'all':
-            members = members.annotate(
-                completed_count=F('profile__total_completed_days')
-            )
-        else:
-            members = members.annotate(
-                completed_count=get_completed_days_annotation(period, plan.id)
-            )
-
-        # 멤버십 정보 Prefetch
-        members = members.prefetch_related(
-            Prefetch('group_memberships',
-                     queryset=GroupMembership.objects.filter(group=group),
-                     to_attr='current_membership')
-        )
+        # 멤버십이나 멤버 진도가 바뀌면 세대가 올라가 새 키로 재계산
+        def build_result():
+            # 그룹 멤버 쿼리 - annotate로 최적화
+            members = User.objects.filter(
+                group_memberships__group=group,
+                group_memberships__is_active=True
+            ).distinct().select_related('profile')
 
-        # 플랜 구독 Prefetch
-        members = members.prefetch_related(
-            Prefetch(
-                'plansubscription_set',
-                queryset=PlanSubscription.objects.filter(plan=plan, is_active=True),
-                to_attr='active_plan_subscriptions'
+            # 완료 일수 annotate
+            if period == 'all':
+                members = members.annotate(
+                    completed_count=F('profile__total_completed_days')
+                )
+            else:
+                members = members.annotate(
+                    completed_count=get_completed_days_annotation(period, plan.id)
+                )
+
+            # 멤버십 정보 Prefetch
+            members = members.prefetch_related(
+                Prefetch('group_memberships',
+                         queryset=GroupMembership.objects.filter(group=group),
+                         to_attr='current_membership')
             )
-        )
 
-        # 정렬
-        members = members.order_by('-completed_count')
-
-        # 리더보드 구성
-        leaderboard = []
-        for user in members:
-            # 플랜 구독 확인
-            subscriptions = getattr(user, 'active_plan_subscriptions', [])
-            subscription = subscriptions[0] if subscriptions else None
-
-            if not subscription:
-                continue
-
-            # 멤버십 정보
-            membership = user.current_membership[0] if user.current_membership else None
-            if not membership:
-                continue
-
-            # 엔트리 생성
-            entry = build_leaderboard_entry(
-                user=user,
-                completed_count=user.completed_count,
-                plan_id=plan.id,
-                is_me=(user == request.user if request.user.is_authenticated else False),
-                extra_fields={
-                    'joined_at': membership.joined_at
-                }
+            # 플랜 구독 Prefetch
+            members = members.prefetch_related(
+                Prefetch(
+                    'plansubscription_set',
+                    queryset=PlanSubscription.objects.filter(plan=plan, is_active=True),
+                    to_attr='active_plan_subscriptions'
+                )
             )
 
-            # role 추가
-            entry['user']['role'] = membership.get_role_display()
-            leaderboard.append(entry)
-
-        # 순위 부여
-        leaderboard = rank_leaderboard(leaderboard)
-
-        result = {
-            'success': True,
-            'group': {
-                'id': group.id,
-                'name': group.name,
-                'description': group.description,
-                'member_count': group.member_count
-            },
-            'plan': {
-                'id': plan.id,
-                'name': plan.name,
-                'description': plan.description
-            },
-            'leaderboard': leaderboard,
-            'period': period
-        }
-
-        # 캐시 저장 (3분)
-        cache.set(cache_key, result, 180)
+            # 정렬
+            members = members.order_by('-completed_count')
+
+            # 리더보드 구성 (진행률은 일괄 계산)
+            members = list(members)
+            progress_rates = calculate_progress_rates([user.id for user in members], plan.id)
+            leaderboard = []
+            for user in members:
+                # 플랜 구독 확인
+                subscriptions = getattr(user, 'active_plan_subscriptions', [])
+                subscription = subscriptions[0] if subscriptions else None
+
+                if not subscription:
+                    continue
+
+                # 멤버십 정보
+                membership = user.current_membership[0] if user.current_membership else None
+                if not membership:
+                    continue
+
+                # 엔트리 생성
+                entry = build_leaderboard_entry(
+                    user=user,
+                    completed_count=user.completed_count,
+                    plan_id=plan.id,
+                    extra_fields={
+                        'joined_at': membership.joined_at
+                    },
+                    progress_rates=progress_rates
+                )
+
+                # role 추가
+                entry['user']['role'] = membership.get_role_display()
+                leaderboard.append(entry)
+
+            # 순위 부여
+            leaderboard = rank_leaderboard(leaderboard)
+
+            result = {
+                'success': True,
+                'group': {
+                    'id': group.id,
+                    'name': group.name,
+                    'description': group.description,
+                    'member_count': group.member_count
+                },
+                'plan': {
+                    'id': plan.id,
+                    'name': plan.name,
+                    'description': plan.description
+                },
+                'leaderboard': leaderboard,
+                'period': period
+            }
+            return result
 
-        return Response(result)
+        result = get_or_rebuild(
+            f'scoreboard:group:{group_id}:{plan.id}:{period}',
+            build_result,
+            namespaces=(group_namespace(group_id),),
+            timeout=SCOREBOARD_CACHE_TIMEOUT
+        )
+
+        return Response(with_is_me(result, request.user))
     except Exception as e:
         logger.error(f"Error getting group scoreboard: {str(e)}", exc_info=True)
         return Response({
@@ -487,12 +558,6 @@ def get_my_ranking(request):
         plan_id = request.query_params.get('plan_id')
         period = request.query_params.get('period', 'all')
 
-        # 캐시 키
-        cache_key = f'scoreboard:my_ranking:{request.user.id}:{period}:{plan_id}'
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            return Response(cached_data)
-
         # 내 프로필
         profile = getattr(request.user, 'profile', None)
         if not profile:
@@ -511,89 +576,113 @@ def get_my_ranking(request):
                 'plan_id': plan_id
             })
 
-        # 내 완료 일수
-        if period == 'all':
-            my_completed_days = profile.total_completed_days
-        else:
-            completed_filter = {
-                'subscription__user': request.user,
-                'is_completed': True
-            }
-            start_date = get_period_filter(period)
-            if start_date:
-                completed_filter['completed_at__gte'] = start_date
-
+        # 내 진도나 플랜 진도가 바뀌면 세대가 올라가 새 키로 재계산
+        def build_result():
+            materialized = leaderboard_store.is_available()
+
+            # 내 완료 일수 (materialized 리더보드가 있으면 다른 사용자와 같은 날짜 버킷 기준 점수)
+            my_completed_days = None
+            if materialized:
+                try:
+                    my_completed_days = leaderboard_store.get_user_score(period, request.user.id, plan_id)
+                except Exception as e:
+                    logger.error(f"Error reading materialized leaderboard: {str(e)}", exc_info=True)
+
+            if my_completed_days is None and period == 'all':
+                my_completed_days = profile.total_completed_days
+            elif my_completed_days is None:
+                completed_filter = {
+                    'subscription__user': request.user,
+                    'is_completed': True
+                }
+                start_date = get_period_filter(period)
+                if start_date:
+                    completed_filter['completed_at__gte'] = start_date
+
+                if plan_id:
+                    completed_filter['subscription__plan_id'] = plan_id
+
+                my_completed_days = UserBibleProgress.objects.filter(**completed_filter).count()
+
+            # 나보다 많이 완료한 사용자 수 계산 (최적화)
+            users_ahead = None
+            if materialized:
+                # materialized 리더보드: ZCOUNT로 O(log n)
+                try:
+                    users_ahead = leaderboard_store.count_users_ahead(period, my_completed_days, plan_id)
+                except Exception as e:
+                    logger.error(f"Error reading materialized leaderboard: {str(e)}", exc_info=True)
+
+            if users_ahead is None and period == 'all':
+                # 전체 기간은 UserProfile 사용
+                users_ahead = UserProfile.objects.filter(
+                    total_completed_days__gt=my_completed_days,
+                    is_public=True
+                ).count()
+            elif users_ahead is None:
+                # 기간별은 Subquery 사용 (대폭 최적화)
+                from django.db.models import Subquery, OuterRef
+
+                # 각 사용자의 완료 일수를 서브쿼리로 계산
+                progress_filter = Q(
+                    subscription__user=OuterRef('pk'),
+                    is_completed=True
+                )
+
+                start_date = get_period_filter(period)
+                if start_date:
+                    progress_filter &= Q(completed_at__gte=start_date)
+
+                if plan_id:
+                    progress_filter &= Q(subscription__plan_id=plan_id)
+
+                users_ahead = User.objects.filter(
+                    is_active=True,
+                    profile__is_public=True
+                ).exclude(
+                    id=request.user.id
+                ).annotate(
+                    completed_count=get_completed_days_annotation(period, plan_id)
+                ).filter(
+                    completed_count__gt=my_completed_days
+                ).count()
+
+            my_rank = users_ahead + 1
+
+            # 전체 활성 사용자 수
             if plan_id:
-                completed_filter['subscription__plan_id'] = plan_id
-
-            my_completed_days = UserBibleProgress.objects.filter(**completed_filter).count()
-
-        # 나보다 많이 완료한 사용자 수 계산 (최적화)
-        if period == 'all':
-            # 전체 기간은 UserProfile 사용
-            users_ahead = UserProfile.objects.filter(
-                total_completed_days__gt=my_completed_days,
-                is_public=True
-            ).count()
-        else:
-            # 기간별은 Subquery 사용 (대폭 최적화)
-            from django.db.models import Subquery, OuterRef
-
-            # 각 사용자의 완료 일수를 서브쿼리로 계산
-            progress_filter = Q(
-                subscription__user=OuterRef('pk'),
-                is_completed=True
-            )
-
-            start_date = get_period_filter(period)
-            if start_date:
-                progress_filter &= Q(completed_at__gte=start_date)
+                total_users = PlanSubscription.objects.filter(
+                    plan_id=plan_id,
+                    is_active=True,
+                    user__is_active=True
+                ).values('user').distinct().count()
+            else:
+                total_users = UserProfile.objects.filter(
+                    user__is_active=True,
+                    is_public=True
+                ).count()
+
+            result = {
+                'success': True,
+                'ranking': {
+                    'rank': my_rank,
+                    'total_users': total_users,
+                    'completed_days': my_completed_days,
+                    'current_streak': profile.current_streak,
+                    'longest_streak': profile.longest_streak,
+                    'percentile': round((1 - (my_rank / total_users)) * 100, 2) if total_users > 0 else 0
+                },
+                'period': period,
+                'plan_id': plan_id
+            }
+            return result
 
-            if plan_id:
-                progress_filter &= Q(subscription__plan_id=plan_id)
-
-            users_ahead = User.objects.filter(
-                is_active=True,
-                profile__is_public=True
-            ).exclude(
-                id=request.user.id
-            ).annotate(
-                completed_count=get_completed_days_annotation(period, plan_id)
-            ).filter(
-                completed_count__gt=my_completed_days
-            ).count()
-
-        my_rank = users_ahead + 1
-
-        # 전체 활성 사용자 수
-        if plan_id:
-            total_users = PlanSubscription.objects.filter(
-                plan_id=plan_id,
-                is_active=True,
-                user__is_active=True
-            ).values('user').distinct().count()
-        else:
-            total_users = UserProfile.objects.filter(
-                user__is_active=True,
-                is_public=True
-            ).count()
-
-        result = {
-            'success': True,
-            'ranking': {
-                'rank': my_rank,
-                'total_users': total_users,
-                'completed_days': my_completed_days,
-                'current_streak': profile.current_streak,
-                'longest_streak': profile.longest_streak,
-                'percentile': round((1 - (my_rank / total_users)) * 100, 2) if total_users > 0 else 0
-            },
-            'period': period,
-            'plan_id': plan_id
-        }
-
-        # 캐시 저장 (2분 - 자주 변경될 수 있으므로 짧게)
-        cache.set(cache_key, result, 120)
+        result = get_or_rebuild(
+            f'scoreboard:my_ranking:{request.user.id}:{period}:{plan_id}',
+            build_result,
+            namespaces=(user_namespace(request.user.id), plan_namespace(plan_id)),
+            timeout=SCOREBOARD_CACHE_TIMEOUT
+        )
 
         return Response(result)
     except Exception as e:
@@ -3,16 +3,116 @@ from .catchup import (
     get_overdue_schedules,
     get_overdue_schedules_in_range,
     calculate_catchup_schedule,
+    create_catchup_schedules,
     calculate_suggested_settings,
     copy_completed_progress,
     get_celebration_data,
 )
+from .stats_recompute import (
+    mark_user_stats_dirty,
+    process_dirty_user,
+    get_queue_lag_stats,
+)
+from .plan_metadata import (
+    PlanMetadata,
+    get_plan_metadata,
+    invalidate_plan_metadata,
+)
+from .progress_snapshot import (
+    ProgressSnapshot,
+    get_progress_snapshot,
+    apply_progress_changes,
+    invalidate_progress_snapshot,
+)
+from .progress_writer import (
+    ProgressChange,
+    ProgressUpdateError,
+    apply_progress_batch,
+    parse_progress_change,
+    progress_changed,
+)
+from .change_log import (
+    record_change,
+    record_changes,
+    prune_change_log,
+)
+from .calendar_projection import (
+    build_calendar_grid,
+    build_calendar_year,
+    build_profile_calendar,
+    bump_calendar,
+    get_calendar_display_settings,
+)
+from .group_membership import (
+    GroupFullError,
+    add_member,
+    remove_member,
+)
+from .activity_feed import (
+    get_feed,
+    record_activity,
+    record_reading,
+)
+from .schedule_import import (
+    ScheduleImportError,
+    fail_stale_job,
+    run_import,
+    serialize_job,
+    start_import,
+)
+from .streak import (
+    calculate_streaks,
+    RestDayCalendar,
+    WeeklyRestCalendar,
+    DAILY_CALENDAR,
+    SUNDAY_REST_CALENDAR,
+)
 
 __all__ = [
     'get_overdue_schedules',
     'get_overdue_schedules_in_range',
     'calculate_catchup_schedule',
+    'create_catchup_schedules',
     'calculate_suggested_settings',
     'copy_completed_progress',
     'get_celebration_data',
+    'mark_user_stats_dirty',
+    'process_dirty_user',
+    'get_queue_lag_stats',
+    'PlanMetadata',
+    'get_plan_metadata',
+    'invalidate_plan_metadata',
+    'ProgressSnapshot',
+    'get_progress_snapshot',
+    'apply_progress_changes',
+    'invalidate_progress_snapshot',
+    'ProgressChange',
+    'ProgressUpdateError',
+    'apply_progress_batch',
+    'parse_progress_change',
+    'progress_changed',
+    'record_change',
+    'record_changes',
+    'prune_change_log',
+    'build_calendar_grid',
+    'build_calendar_year',
+    'build_profile_calendar',
+    'bump_calendar',
+    'get_calendar_display_settings',
+    'GroupFullError',
+    'add_member',
+    'remove_member',
+    'get_feed',
+    'record_activity',
+    'record_reading',
+    'ScheduleImportError',
+    'fail_stale_job',
+    'run_import',
+    'serialize_job',
+    'start_import',
+    'calculate_streaks',
+    'RestDayCalendar',
+    'WeeklyRestCalendar',
+    'DAILY_CALENDAR',
+    'SUNDAY_REST_CALENDAR',
 ]
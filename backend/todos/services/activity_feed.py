@@ -0,0 +1,231 @@
+"""
+친구 활동 피드 (Redis Sorted Set 타임라인)
+- 활동(FriendActivity)이 생기면 팔로워마다 타임라인 ZSET에 활동 ID를 추가 (fan-out-on-write, Celery 태스크)
+  - 타임라인은 최근 FEED_TIMELINE_SIZE개만 유지, FEED_TIMELINE_TTL_DAYS일 동안 갱신이 없으면 만료
+  - 팔로워가 FEED_FANOUT_MAX_FOLLOWERS명 이상인 사용자의 활동은 전달하지 않고 조회 시 DB에서 가져옴
+    (fan-out-on-read, 한 사람의 활동으로 수만 개의 타임라인 쓰기가 생기지 않도록)
+- 조회는 ZREVRANGEBYSCORE 한 번(점수 = 활동 ID)으로 cursor 이전 항목을 가져온 뒤 DB에서 한 번에 조회
+- 타임라인이 없으면(만료, 팔로우 변경으로 삭제) 팔로잉 사용자의 최근 활동으로 다시 구성
+- 점수 0인 표시 멤버로 "구성된 타임라인"과 fan-out으로 일부만 생긴 키를 구분
+- 캐시 백엔드가 Redis가 아니면 타임라인 없이 매번 DB에서 모음
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from accounts.models import Follow
+from ..models import FriendActivity
+from .leaderboard import get_client
+
+logger = logging.getLogger(__name__)
+
+FEED_TIMELINE_KEY = 'feed:timeline:{user_id}'
+# 타임라인 구성 여부 표시 멤버 (점수 0, 조회 범위에서 제외)
+BUILT_MEMBER = '0'
+FAN_OUT_BATCH_SIZE = 500
+# 하루 읽기 활동에 기록할 최대 책 수
+MAX_READING_BOOKS = 10
+
+
+def get_timeline_size():
+    return getattr(settings, 'FEED_TIMELINE_SIZE', 500)
+
+
+def get_fan_out_max_followers():
+    return getattr(settings, 'FEED_FANOUT_MAX_FOLLOWERS', 5000)
+
+
+def get_timeline_ttl():
+    return getattr(settings, 'FEED_TIMELINE_TTL_DAYS', 14) * 60 * 60 * 24
+
+
+def _timeline_key(user_id):
+    return cache.make_key(FEED_TIMELINE_KEY.format(user_id=user_id))
+
+
+# ===== 기록 =====
+
+def _enqueue_fan_out(activity_id):
+    from todos.tasks import fan_out_activity_task
+
+    try:
+        fan_out_activity_task.delay(activity_id)
+    except Exception as e:
+        # 브로커 장애 시 이미 구성된 타임라인에서는 빠지지만, 타임라인을 다시 구성하면 포함됨
+        logger.error(f"Error in enqueue feed fan-out: {str(e)}", exc_info=True)
+
+
+def _fan_out_on_commit(activity):
+    if get_client() is not None:
+        activity_id = activity.id
+        transaction.on_commit(lambda: _enqueue_fan_out(activity_id))
+
+
+def record_activity(user_id, verb, object_id=None, data=None):
+    """활동 기록 (커밋되면 팔로워 타임라인으로 전달)"""
+    activity = FriendActivity.objects.create(user_id=user_id, verb=verb, object_id=object_id, data=data or {})
+    _fan_out_on_commit(activity)
+    return activity
+
+
+def record_reading(user_id, completed, books):
+    """
+    오늘의 읽기 활동에 완료한 분량 합산
+
+    하루의 첫 완료에서만 행을 만들어 전달하고, 이후에는 같은 행의 데이터만 갱신한다
+    (타임라인에는 ID만 있으므로 조회 시 최신 값이 보임).
+    """
+    lookup = {'user_id': user_id, 'verb': FriendActivity.VERB_READING, 'activity_date': timezone.now().date()}
+    with transaction.atomic():
+        activity = FriendActivity.objects.select_for_update().filter(**lookup).first()
+        if activity is None:
+            try:
+                with transaction.atomic():
+                    activity = FriendActivity.objects.create(
+                        **lookup,
+                        data={'count': completed, 'books': list(books)[:MAX_READING_BOOKS]}
+                    )
+            except IntegrityError:
+                # 동시에 만든 요청이 있으면 그 행에 합산
+                activity = FriendActivity.objects.select_for_update().get(**lookup)
+            else:
+                _fan_out_on_commit(activity)
+                return activity
+
+        books = list(dict.fromkeys(activity.data.get('books', []) + list(books)))
+        activity.data = {
+            'count': activity.data.get('count', 0) + completed,
+            'books': books[:MAX_READING_BOOKS]
+        }
+        activity.save(update_fields=['data', 'updated_at'])
+    return activity
+
+
+# ===== 타임라인 =====
+
+def is_fan_out_on_read(user):
+    """팔로워가 많아 활동을 조회 시점에 가져오는 사용자인지"""
+    profile = getattr(user, 'profile', None)
+    return bool(profile and profile.followers_count >= get_fan_out_max_followers())
+
+
+def fan_out(activity_id):
+    """활동을 팔로워 타임라인에 추가 (Celery 태스크), 전달한 팔로워 수 반환"""
+    client = get_client()
+    if client is None:
+        return 0
+    activity = FriendActivity.objects.select_related('user__profile').filter(id=activity_id).first()
+    if activity is None or is_fan_out_on_read(activity.user):
+        return 0
+
+    size = get_timeline_size()
+    ttl = get_timeline_ttl()
+    follower_ids = Follow.objects.filter(following_id=activity.user_id).values_list('follower_id', flat=True)
+
+    count = 0
+    pipe = client.pipeline(transaction=False)
+    for follower_id in follower_ids.iterator(chunk_size=FAN_OUT_BATCH_SIZE):
+        key = _timeline_key(follower_id)
+        pipe.zadd(key, {str(activity.id): activity.id})
+        # 표시 멤버(순위 0)를 남기고 오래된 항목 정리
+        pipe.zremrangebyrank(key, 1, -(size + 1))
+        pipe.expire(key, ttl)
+        count += 1
+        if count % FAN_OUT_BATCH_SIZE == 0:
+            pipe.execute()
+    pipe.execute()
+    return count
+
+
+def invalidate_timeline(user_id):
+    """팔로우 관계가 바뀌면 타임라인 삭제 (다음 조회에서 다시 구성)"""
+    client = get_client()
+    if client is None:
+        return
+    try:
+        client.delete(_timeline_key(user_id))
+    except Exception as e:
+        logger.error(f"Error in invalidate feed timeline: {str(e)}", exc_info=True)
+
+
+def _followee_activity_ids(user, limit, before=None, user_ids=None, exclude_user_ids=()):
+    """팔로잉 사용자(또는 user_ids)의 최근 활동 ID (최신순)"""
+    if user_ids is None:
+        user_ids = Follow.objects.filter(follower=user).values('following_id')
+    queryset = FriendActivity.objects.filter(user_id__in=user_ids)
+    if exclude_user_ids:
+        queryset = queryset.exclude(user_id__in=exclude_user_ids)
+    if before:
+        queryset = queryset.filter(id__lt=before)
+    return list(queryset.order_by('-id').values_list('id', flat=True)[:limit])
+
+
+def _rebuild_timeline(client, user, pulled_user_ids):
+    """팔로잉 사용자의 최근 활동으로 타임라인 구성 (조회 시 직접 가져오는 사용자는 제외)"""
+    ids = _followee_activity_ids(user, get_timeline_size(), exclude_user_ids=pulled_user_ids)
+    key = _timeline_key(user.id)
+    pipe = client.pipeline(transaction=True)
+    pipe.delete(key)
+    pipe.zadd(key, {BUILT_MEMBER: 0, **{str(activity_id): activity_id for activity_id in ids}})
+    pipe.expire(key, get_timeline_ttl())
+    pipe.execute()
+    return ids
+
+
+def _read_timeline(client, user, pulled_user_ids, before, count):
+    """타임라인에서 before 이전 활동 ID count개 (범위 조회 한 번)"""
+    key = _timeline_key(user.id)
+    pipe = client.pipeline(transaction=False)
+    pipe.zscore(key, BUILT_MEMBER)
+    pipe.zrevrangebyscore(key, f'({before}' if before else '+inf', '(0', start=0, num=count)
+    built, members = pipe.execute()
+    if built is not None:
+        return [int(member) for member in members]
+
+    ids = _rebuild_timeline(client, user, pulled_user_ids)
+    return [activity_id for activity_id in ids if not before or activity_id < before][:count]
+
+
+def get_feed(user, before=None, limit=20):
+    """
+    친구 활동 피드 한 페이지
+
+    Args:
+        before: 이 활동 ID보다 이전 항목부터 (이전 페이지의 next_cursor)
+
+    Returns:
+        (활동 목록, 다음 cursor 또는 None)
+        비공개 프로필/언팔로우한 사용자의 활동은 빠지므로 페이지가 limit보다 짧을 수 있음
+    """
+    max_followers = get_fan_out_max_followers()
+    pulled_user_ids = list(Follow.objects.filter(
+        follower=user,
+        following__profile__followers_count__gte=max_followers
+    ).values_list('following_id', flat=True))
+
+    ids = None
+    client = get_client()
+    if client is not None:
+        try:
+            ids = _read_timeline(client, user, pulled_user_ids, before, limit + 1)
+        except Exception as e:
+            logger.error(f"Error in read feed timeline: {str(e)}", exc_info=True)
+
+    if ids is None:
+        ids = _followee_activity_ids(user, limit + 1, before=before)
+    elif pulled_user_ids:
+        pulled = _followee_activity_ids(user, limit + 1, before=before, user_ids=pulled_user_ids)
+        ids = sorted(set(ids) | set(pulled), reverse=True)
+
+    ids = ids[:limit + 1]
+    next_cursor = ids[limit - 1] if len(ids) > limit else None
+    activities = FriendActivity.objects.filter(
+        id__in=ids[:limit],
+        user_id__in=Follow.objects.filter(follower=user).values('following_id'),
+        user__profile__is_public=True
+    ).select_related('user__profile').order_by('-id')
+    return list(activities), next_cursor
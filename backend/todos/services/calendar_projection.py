@@ -0,0 +1,205 @@
+"""
+멀티 플랜 캘린더 구성 (내 캘린더, 프로필 캘린더 공용)
+- 활성 구독(플랜/표시 설정/완료 비트맵 포함)을 한 번, 기간 내 전체 플랜의 스케줄을 한 번 조회
+- 완료 여부는 구독 완료 비트맵에서 확인 (비트맵이 무효화된 구독만 재계산)
+- 스케줄을 (날짜, 표시 순서)로 정렬해 한 번 순회하며 구성
+- 결과는 (사용자, 기간)별로 캐시하고 진도/표시 설정/구독/스케줄 변경 시 세대 bump로 무효화 (signals.py)
+"""
+
+from functools import lru_cache
+from datetime import date
+
+from django.core.exceptions import ObjectDoesNotExist
+
+from utils.cache import bump_generation, get_or_rebuild
+
+from ..models import DailyBibleSchedule, PlanSubscription, UserPlanDisplaySettings
+from ..utils import abbreviate_schedule, get_plan_color
+from .progress_snapshot import get_progress_snapshot
+
+CALENDAR_CACHE_TIMEOUT = 60 * 60
+# 스케줄 변경은 드물고 구독자 전체에 영향을 주므로 전역 세대 하나로 처리
+SCHEDULE_NAMESPACE = 'calendar:schedules'
+
+
+def calendar_namespace(user_id):
+    return f'calendar:user:{user_id}'
+
+
+def bump_calendar(*user_ids):
+    bump_generation(*[calendar_namespace(user_id) for user_id in user_ids])
+
+
+def bump_calendar_schedules():
+    bump_generation(SCHEDULE_NAMESPACE)
+
+
+def format_chapters(start_chapter, end_chapter):
+    if start_chapter == end_chapter:
+        return f"{start_chapter}장"
+    return f"{start_chapter}-{end_chapter}장"
+
+
+@lru_cache(maxsize=4096)
+def abbreviate(book, start_chapter, end_chapter):
+    """(책, 시작 장, 끝 장)별 축약 표기 (예: '히 1-6')"""
+    return abbreviate_schedule(book, start_chapter, end_chapter)
+
+
+def get_calendar_display_settings(user):
+    """활성 구독의 표시 설정 목록 (표시 순서대로, 쿼리 1개)"""
+    return list(UserPlanDisplaySettings.objects.filter(
+        user=user,
+        subscription__is_active=True
+    ).select_related('subscription', 'subscription__plan'))
+
+
+def _ordered_subscriptions(user_id):
+    """
+    활성 구독을 표시 순서대로 (구독, 표시 설정) 목록으로 반환 (쿼리 1개)
+
+    표시 설정이 없는 구독은 뒤에 붙는다.
+    """
+    subscriptions = PlanSubscription.objects.filter(
+        user_id=user_id,
+        is_active=True
+    ).select_related('plan', 'progress_bitmap', 'display_settings').order_by('id')
+
+    with_settings = []
+    without_settings = []
+    for subscription in subscriptions:
+        try:
+            with_settings.append((subscription, subscription.display_settings))
+        except ObjectDoesNotExist:
+            without_settings.append((subscription, None))
+
+    with_settings.sort(key=lambda item: (item[1].display_order, item[1].created_at))
+    return with_settings + without_settings
+
+
+def build_projection(user_id, start_date, end_date):
+    """
+    start_date ~ end_date(모두 포함)의 캘린더 원본 데이터 (쿼리 2개 + 무효화된 비트맵 재계산)
+
+    Returns:
+        {
+            'plans': [{subscription_id, plan_id, plan_name, color, is_visible, has_settings}, ...],
+            'entries': [(날짜, plans 인덱스, schedule_id, book, start_chapter, end_chapter, is_completed), ...]
+        }
+        entries는 (날짜, 표시 순서, schedule_id) 순으로 정렬
+    """
+    plans = []
+    plan_index = {}
+    snapshots = []
+    for index, (subscription, display_setting) in enumerate(_ordered_subscriptions(user_id)):
+        plans.append({
+            'subscription_id': subscription.id,
+            'plan_id': subscription.plan_id,
+            'plan_name': subscription.plan.name,
+            'color': display_setting.color if display_setting else get_plan_color(index),
+            'is_visible': display_setting.is_visible if display_setting else True,
+            'has_settings': display_setting is not None,
+        })
+        plan_index[subscription.plan_id] = index
+        snapshots.append(get_progress_snapshot(subscription))
+
+    if not plans:
+        return {'plans': [], 'entries': []}
+
+    schedules = DailyBibleSchedule.objects.filter(
+        plan_id__in=plan_index.keys(),
+        date__range=[start_date, end_date]
+    ).values_list('id', 'plan_id', 'date', 'book', 'start_chapter', 'end_chapter')
+
+    entries = []
+    for schedule_id, plan_id, schedule_date, book, start_chapter, end_chapter in schedules:
+        index = plan_index[plan_id]
+        entries.append((
+            schedule_date, index, schedule_id, book, start_chapter, end_chapter,
+            snapshots[index].is_schedule_completed(schedule_id)
+        ))
+    entries.sort(key=lambda entry: entry[:3])
+    return {'plans': plans, 'entries': entries}
+
+
+def get_calendar_projection(user_id, start_date, end_date):
+    """캐시된 캘린더 원본 데이터 (없으면 생성)"""
+    return get_or_rebuild(
+        f'calendar:projection:{user_id}:{start_date.isoformat()}:{end_date.isoformat()}',
+        lambda: build_projection(user_id, start_date, end_date),
+        namespaces=(calendar_namespace(user_id), SCHEDULE_NAMESPACE),
+        timeout=CALENDAR_CACHE_TIMEOUT
+    )
+
+
+def build_calendar_grid(user, start_date, end_date):
+    """
+    내 캘린더 날짜별 항목 (표시 설정이 있는 구독만)
+
+    Returns:
+        {'YYYY-MM-DD': [항목, ...]} (각 날짜의 항목은 표시 순서)
+    """
+    projection = get_calendar_projection(user.id, start_date, end_date)
+    plans = projection['plans']
+
+    calendar_data = {}
+    for schedule_date, index, schedule_id, book, start_chapter, end_chapter, is_completed in projection['entries']:
+        plan = plans[index]
+        if not plan['has_settings']:
+            continue
+        calendar_data.setdefault(schedule_date.isoformat(), []).append({
+            'plan_id': plan['plan_id'],
+            'plan_name': plan['plan_name'],
+            'subscription_id': plan['subscription_id'],
+            'color': plan['color'],
+            'book': book,
+            'chapters': format_chapters(start_chapter, end_chapter),
+            'is_completed': is_completed,
+            'schedule_id': schedule_id,
+            'is_visible': plan['is_visible']
+        })
+    return calendar_data
+
+
+def build_calendar_year(user, year):
+    """연간 캘린더 {월: 날짜별 항목} (쿼리 수는 월간 조회와 같음)"""
+    grid = build_calendar_grid(user, date(year, 1, 1), date(year, 12, 31))
+
+    months = {month: {} for month in range(1, 13)}
+    for date_str, items in grid.items():
+        months[int(date_str[5:7])][date_str] = items
+    return months
+
+
+def build_profile_calendar(user_id, start_date, end_date):
+    """
+    프로필 캘린더 항목 목록과 플랜 정보
+
+    Returns:
+        (calendar 항목 목록, plans 목록)
+    """
+    projection = get_calendar_projection(user_id, start_date, end_date)
+    plans = projection['plans']
+
+    plans_info = [
+        {'id': plan['plan_id'], 'name': plan['plan_name'], 'color': plan['color']}
+        for plan in plans
+    ]
+    calendar_data = [
+        {
+            'date': schedule_date,
+            'is_completed': is_completed,
+            'book': book,
+            'start_chapter': start_chapter,
+            'end_chapter': end_chapter,
+            'chapters': f"{start_chapter}-{end_chapter}장",
+            'plan_id': plans[index]['plan_id'],
+            'plan_name': plans[index]['plan_name'],
+            'color': plans[index]['color'],
+            'schedule_id': schedule_id,
+            'schedule_text': abbreviate(book, start_chapter, end_chapter)
+        }
+        for schedule_date, index, schedule_id, book, start_chapter, end_chapter, is_completed
+        in projection['entries']
+    ]
+    return calendar_data, plans_info
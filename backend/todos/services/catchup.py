@@ -1,6 +1,7 @@
 """
 Catchup 기능 관련 서비스 로직
 """
+from collections import deque
 from datetime import date, timedelta
 from typing import List, Tuple, Optional
 from django.utils import timezone
@@ -11,6 +12,9 @@ from ..models import (
     CatchupSession, CatchupSchedule
 )
 
+# bulk_create 한 번에 넣을 행 수 (DB 파라미터 수 제한 대비)
+CATCHUP_BULK_BATCH_SIZE = 500
+
 
 def get_overdue_schedules(subscription: PlanSubscription) -> QuerySet[DailyBibleSchedule]:
     """
@@ -53,6 +57,15 @@ def get_overdue_schedules_in_range(
     ).exclude(id__in=completed_schedule_ids).order_by('date')
 
 
+def _scaled_limit(limit: Optional[int], multiplier: float) -> Optional[int]:
+    """주말 배수를 적용한 제한 (제한이 있으면 최소 1)"""
+    if not limit:
+        return None
+    if not multiplier:
+        return limit
+    return max(1, int(limit * multiplier))
+
+
 def calculate_catchup_schedule(
     overdue_schedules: List[DailyBibleSchedule],
     start_date: date,
@@ -64,6 +77,9 @@ def calculate_catchup_schedule(
     """
     밀린 스케줄을 새 날짜에 분배
 
+    각 스케줄을 한 번씩만 꺼내므로 스케줄 수에 선형 (deque).
+    한 스케줄의 장 수가 하루 장 수 제한보다 크면 그 스케줄만 하루에 배정한다.
+
     Args:
         overdue_schedules: 밀린 스케줄 목록
         start_date: 따라잡기 시작일
@@ -76,20 +92,25 @@ def calculate_catchup_schedule(
         (분배된 스케줄 목록, 남은 스케줄 목록)
     """
     result = []
-    remaining = list(overdue_schedules)
+    remaining = deque(overdue_schedules)
     current_date = start_date
 
     # 목표일이 없으면 1년 후로 설정 (사실상 무제한)
     end_date = target_date or (start_date + timedelta(days=365))
 
+    # 평일/주말 제한은 날짜마다 다시 계산하지 않음
+    limits = {
+        False: (max_daily_readings or None, max_daily_chapters or None),
+        True: (
+            _scaled_limit(max_daily_readings, weekend_multiplier),
+            _scaled_limit(max_daily_chapters, weekend_multiplier),
+        ),
+    }
+
     while remaining and current_date <= end_date:
         # 주말 여부 확인 (토요일=5, 일요일=6)
         is_weekend = current_date.weekday() >= 5
-
-        # 오늘의 읽기량 제한
-        daily_limit = max_daily_readings
-        if is_weekend and daily_limit and weekend_multiplier:
-            daily_limit = int(daily_limit * weekend_multiplier)
+        daily_limit, chapter_limit = limits[is_weekend]
 
         today_items = []
         today_chapters = 0
@@ -102,17 +123,12 @@ def calculate_catchup_schedule(
             if daily_limit and len(today_items) >= daily_limit:
                 break
 
-            # 장 수 제한 확인
-            if max_daily_chapters:
-                chapter_limit = max_daily_chapters
-                if is_weekend and weekend_multiplier:
-                    chapter_limit = int(chapter_limit * weekend_multiplier)
-                if today_chapters + chapters > chapter_limit:
-                    break
+            # 장 수 제한 확인 (빈 날에는 한 스케줄은 항상 배정해 진행 보장)
+            if chapter_limit and today_items and today_chapters + chapters > chapter_limit:
+                break
 
-            today_items.append(schedule)
+            today_items.append(remaining.popleft())
             today_chapters += chapters
-            remaining.pop(0)
 
         if today_items:
             result.append({
@@ -124,7 +140,26 @@ def calculate_catchup_schedule(
 
         current_date += timedelta(days=1)
 
-    return result, remaining
+    return result, list(remaining)
+
+
+def create_catchup_schedules(session: CatchupSession, distributed: List[dict]) -> List[CatchupSchedule]:
+    """
+    분배 결과로 CatchupSchedule을 한 번에 생성 (bulk_create)
+
+    호출하는 쪽에서 세션 생성과 같은 트랜잭션으로 묶는다.
+    """
+    schedules = [
+        CatchupSchedule(
+            session=session,
+            original_schedule=original_schedule,
+            scheduled_date=day_data['date']
+        )
+        for day_data in distributed
+        for original_schedule in day_data['items']
+    ]
+
+    return CatchupSchedule.objects.bulk_create(schedules, batch_size=CATCHUP_BULK_BATCH_SIZE)
 
 
 def calculate_suggested_settings(overdue_count: int, overdue_chapters: int) -> dict:
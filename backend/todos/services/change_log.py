@@ -0,0 +1,46 @@
+"""
+오프라인 동기화 변경 로그 기록
+- 북마크/하이라이트/묵상노트/개인 읽기 기록은 시그널로, 플랜 진도는 일괄 저장 서비스에서 직접 기록
+- 원본 변경과 같은 트랜잭션에서 기록하므로 롤백되면 로그도 남지 않음
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Max
+from django.utils import timezone
+
+from ..models import SyncChange
+
+
+def record_changes(user_id, entity, object_ids, op=SyncChange.OP_UPSERT):
+    """변경 로그 일괄 기록 (쿼리 1개)"""
+    SyncChange.objects.bulk_create([
+        SyncChange(user_id=user_id, entity=entity, object_id=object_id, op=op)
+        for object_id in object_ids
+    ])
+
+
+def record_change(user_id, entity, object_id, op=SyncChange.OP_UPSERT):
+    SyncChange.objects.create(user_id=user_id, entity=entity, object_id=object_id, op=op)
+
+
+def get_retention_days():
+    return getattr(settings, 'SYNC_CHANGE_RETENTION_DAYS', 30)
+
+
+def prune_change_log(now=None):
+    """
+    보관 기간이 지난 변경 로그 삭제
+
+    가장 최근 행은 남겨 두어, 보관 기간보다 오래된 cursor를 구분할 수 있게 한다 (sync.py).
+    """
+    now = now or timezone.now()
+    latest_id = SyncChange.objects.aggregate(latest=Max('id'))['latest']
+    if latest_id is None:
+        return 0
+    deleted, _ = SyncChange.objects.filter(
+        created_at__lt=now - timedelta(days=get_retention_days()),
+        id__lt=latest_id
+    ).delete()
+    return deleted
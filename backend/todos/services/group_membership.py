@@ -0,0 +1,74 @@
+"""
+그룹 멤버십 변경 + 활성 멤버 수(ReadingGroup.member_count) 관리
+- 정원 확인과 카운터 증가를 조건부 UPDATE 한 번으로 처리하므로 동시 가입에도 정원을 넘지 않음
+- 탈퇴는 멤버십 행을 잠근 뒤 활성 상태일 때만 감소 (중복 요청으로 두 번 빠지지 않음)
+- 활성 멤버십 행 삭제(회원 탈퇴 등)는 signals.py에서 감소
+"""
+
+from django.db import transaction
+from django.db.models import F
+
+from ..models import GroupMembership, ReadingGroup
+
+
+class GroupFullError(Exception):
+    """그룹 정원 초과"""
+
+
+def _increment(group_id, check_capacity=True):
+    queryset = ReadingGroup.objects.filter(id=group_id)
+    if check_capacity:
+        queryset = queryset.filter(member_count__lt=F('max_members'))
+    return queryset.update(member_count=F('member_count') + 1)
+
+
+def decrement_member_count(group_id):
+    ReadingGroup.objects.filter(id=group_id, member_count__gt=0).update(
+        member_count=F('member_count') - 1
+    )
+
+
+def add_member(group, user, role='member', check_capacity=True):
+    """
+    활성 멤버로 추가 (비활성 멤버십이 있으면 재활성화)
+
+    Raises:
+        GroupFullError: 정원이 가득 참 (아무것도 바꾸지 않음)
+    """
+    with transaction.atomic():
+        membership = GroupMembership.objects.select_for_update().filter(
+            group=group,
+            user=user
+        ).first()
+        if membership is not None and membership.is_active:
+            return membership
+
+        if not _increment(group.id, check_capacity):
+            raise GroupFullError('그룹이 가득 찼습니다.')
+
+        if membership is None:
+            membership = GroupMembership.objects.create(
+                group=group,
+                user=user,
+                role=role,
+                is_active=True
+            )
+        else:
+            membership.is_active = True
+            membership.save(update_fields=['is_active'])
+
+    group.refresh_from_db(fields=['member_count'])
+    return membership
+
+
+def remove_member(membership):
+    """멤버십 비활성화 (이미 비활성이면 아무것도 하지 않음)"""
+    with transaction.atomic():
+        locked = GroupMembership.objects.select_for_update().get(id=membership.id)
+        if not locked.is_active:
+            return False
+        locked.is_active = False
+        locked.save(update_fields=['is_active'])
+        decrement_member_count(locked.group_id)
+    membership.is_active = False
+    return True
@@ -0,0 +1,201 @@
+"""
+리더보드 materialized view (Redis Sorted Set)
+- 범위(scope: 'global' 또는 플랜 ID)별로 사용자 점수를 ZSET에 유지
+  - all: UserProfile.total_completed_days
+  - 일별 버킷: 해당 날짜에 완료한 스케줄 수 (week/month는 최근 7/30일 버킷의 합집합)
+- 진도가 바뀐 사용자만 통계 재계산 태스크에서 갱신
+- 공개 프로필의 활성 사용자만 포함
+- 캐시 백엔드가 Redis가 아니거나 아직 빌드되지 않았으면 사용하지 않음 (뷰에서 DB 집계로 대체)
+"""
+
+import logging
+from datetime import timedelta
+
+from django.core.cache import caches
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from ..models import PlanSubscription, UserBibleProgress
+
+logger = logging.getLogger(__name__)
+
+PERIOD_DAYS = {'week': 7, 'month': 30}
+MAX_PERIOD_DAYS = max(PERIOD_DAYS.values())
+
+LEADERBOARD_ALL_KEY = 'leaderboard:all:{scope}'
+LEADERBOARD_DAY_KEY = 'leaderboard:day:{scope}:{day}'
+LEADERBOARD_PERIOD_KEY = 'leaderboard:{period}:{scope}:{day}'
+LEADERBOARD_BUILT_KEY = 'leaderboard:built'
+
+# 일별 버킷은 가장 긴 기간보다 조금 더 보관
+DAY_BUCKET_TTL = 60 * 60 * 24 * (MAX_PERIOD_DAYS + 2)
+# week/month 합집합 결과 재사용 시간
+PERIOD_UNION_TTL = 60
+
+
+def _backend():
+    return caches['default']
+
+
+def get_client():
+    """Redis 클라이언트 (Redis 캐시 백엔드가 아니면 None)"""
+    from django.core.cache.backends.redis import RedisCache
+
+    backend = _backend()
+    if not isinstance(backend, RedisCache):
+        return None
+    return backend._cache.get_client(write=True)
+
+
+def _key(template, **kwargs):
+    return _backend().make_key(template.format(**kwargs))
+
+
+def _scope(plan_id):
+    return str(plan_id) if plan_id else 'global'
+
+
+def is_available():
+    """materialized 리더보드 사용 가능 여부"""
+    client = get_client()
+    if client is None:
+        return False
+    try:
+        return bool(client.exists(_key(LEADERBOARD_BUILT_KEY)))
+    except Exception as e:
+        logger.error(f"Error in leaderboard availability check: {str(e)}", exc_info=True)
+        return False
+
+
+def refresh_user_leaderboards(user, pipeline=None):
+    """
+    사용자 한 명의 모든 리더보드 점수 갱신
+
+    일별 버킷은 최근 MAX_PERIOD_DAYS일만 다시 집계한다 (쿼리 2개).
+    """
+    client = pipeline or get_client()
+    if client is None:
+        return False
+
+    profile = getattr(user, 'profile', None)
+    listed = bool(user.is_active and profile and profile.is_public)
+
+    plan_states = {}
+    for plan_id, is_active in PlanSubscription.objects.filter(user=user).values_list('plan_id', 'is_active'):
+        plan_states[plan_id] = plan_states.get(plan_id, False) or is_active
+    active_plans = [plan_id for plan_id, active in plan_states.items() if active]
+    inactive_plans = [plan_id for plan_id, active in plan_states.items() if not active]
+
+    today = timezone.now().date()
+    window = [today - timedelta(days=i) for i in range(MAX_PERIOD_DAYS)]
+    day_counts = {}
+    if listed:
+        rows = UserBibleProgress.objects.filter(
+            subscription__user=user,
+            is_completed=True,
+            completed_at__date__gte=window[-1]
+        ).annotate(
+            day=TruncDate('completed_at')
+        ).values('subscription__plan_id', 'day').annotate(cnt=Count('id'))
+        for row in rows:
+            for scope in ('global', _scope(row['subscription__plan_id'])):
+                key = (scope, row['day'])
+                day_counts[key] = day_counts.get(key, 0) + row['cnt']
+
+    member = str(user.id)
+    pipe = client if pipeline else client.pipeline(transaction=False)
+
+    for scope in ['global'] + [_scope(p) for p in active_plans]:
+        all_key = _key(LEADERBOARD_ALL_KEY, scope=scope)
+        if listed:
+            pipe.zadd(all_key, {member: profile.total_completed_days})
+        else:
+            pipe.zrem(all_key, member)
+
+        for day in window:
+            day_key = _key(LEADERBOARD_DAY_KEY, scope=scope, day=day.isoformat())
+            count = day_counts.get((scope, day), 0)
+            if count:
+                pipe.zadd(day_key, {member: count})
+                pipe.expire(day_key, DAY_BUCKET_TTL)
+            else:
+                pipe.zrem(day_key, member)
+
+    for scope in [_scope(p) for p in inactive_plans]:
+        pipe.zrem(_key(LEADERBOARD_ALL_KEY, scope=scope), member)
+        for day in window:
+            pipe.zrem(_key(LEADERBOARD_DAY_KEY, scope=scope, day=day.isoformat()), member)
+
+    if not pipeline:
+        pipe.execute()
+    return True
+
+
+def rebuild_leaderboards(users):
+    """
+    전체 리더보드 재구성 (백필/정합성 복구용)
+
+    기존 키를 지우고 다시 채운 뒤 빌드 마커를 설정한다.
+    재구성 중에는 빌드 마커가 없으므로 뷰는 DB 집계를 사용한다.
+    """
+    client = get_client()
+    if client is None:
+        return 0
+
+    client.delete(_key(LEADERBOARD_BUILT_KEY))
+    for key in client.scan_iter(match=_key('leaderboard:*')):
+        client.delete(key)
+
+    count = 0
+    pipe = client.pipeline(transaction=False)
+    for user in users:
+        refresh_user_leaderboards(user, pipeline=pipe)
+        count += 1
+        if count % 500 == 0:
+            pipe.execute()
+    pipe.execute()
+
+    client.set(_key(LEADERBOARD_BUILT_KEY), timezone.now().isoformat())
+    return count
+
+
+def _period_key(client, period, plan_id):
+    """기간별 ZSET 키 (week/month는 일별 버킷 합집합을 잠시 캐시)"""
+    scope = _scope(plan_id)
+    if period not in PERIOD_DAYS:
+        return _key(LEADERBOARD_ALL_KEY, scope=scope)
+
+    today = timezone.now().date()
+    union_key = _key(LEADERBOARD_PERIOD_KEY, period=period, scope=scope, day=today.isoformat())
+    if not client.exists(union_key):
+        day_keys = [
+            _key(LEADERBOARD_DAY_KEY, scope=scope, day=(today - timedelta(days=i)).isoformat())
+            for i in range(PERIOD_DAYS[period])
+        ]
+        client.zunionstore(union_key, day_keys)
+        client.expire(union_key, PERIOD_UNION_TTL)
+    return union_key
+
+
+def get_top_scores(period, plan_id=None, limit=100):
+    """상위 N명 [(user_id, score)] (점수 내림차순)"""
+    client = get_client()
+    key = _period_key(client, period, plan_id)
+    return [
+        (int(member), int(score))
+        for member, score in client.zrevrange(key, 0, limit - 1, withscores=True)
+    ]
+
+
+def get_user_score(period, user_id, plan_id=None):
+    """사용자 점수 (리더보드에 없으면 None)"""
+    client = get_client()
+    score = client.zscore(_period_key(client, period, plan_id), str(user_id))
+    return int(score) if score is not None else None
+
+
+def count_users_ahead(period, score, plan_id=None):
+    """score보다 점수가 높은 사용자 수 (O(log n))"""
+    client = get_client()
+    return client.zcount(_period_key(client, period, plan_id), f'({score}', '+inf')
@@ -0,0 +1,132 @@
+"""
+플랜 스케줄 메타데이터 캐시
+- 플랜별 정렬된 스케줄 ID/날짜 배열, 스케줄/장 수 누적합, 책별 합계를 한 번에 계산해 캐시
+- "D일까지의 스케줄 수" 같은 질의를 COUNT 쿼리 대신 이진 탐색으로 처리
+- 해당 플랜의 DailyBibleSchedule이 바뀔 때만 무효화 (signals.py)
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+from django.core.cache import cache
+
+from ..models import DailyBibleSchedule
+
+PLAN_METADATA_KEY = 'plan_metadata:v2:{plan_id}'
+# 무효화는 시그널로 처리하므로 만료는 안전장치 용도
+PLAN_METADATA_TIMEOUT = 60 * 60 * 24
+
+
+class PlanMetadata:
+    """플랜 스케줄 메타데이터 (날짜는 ordinal 정수로 보관)"""
+
+    def __init__(self, plan_id, schedule_ids, ordinals, chapter_prefix, book_totals):
+        self.plan_id = plan_id
+        # schedule_ids[i]와 ordinals[i]는 (date, id) 순서의 i번째 스케줄
+        self.schedule_ids = schedule_ids
+        self.ordinals = ordinals
+        # chapter_prefix[i] = 앞에서부터 i개 스케줄의 장 수 합계
+        self.chapter_prefix = chapter_prefix
+        self.book_totals = book_totals
+        self._index = None
+
+    @property
+    def total_schedules(self):
+        return len(self.ordinals)
+
+    @property
+    def total_chapters(self):
+        return self.chapter_prefix[-1]
+
+    @property
+    def signature(self):
+        """스케줄 구성이 바뀌면 달라지는 값 (인덱스 기반 캐시의 유효성 확인용)"""
+        return hash(tuple(self.schedule_ids))
+
+    @property
+    def first_date(self):
+        return date.fromordinal(self.ordinals[0]) if self.ordinals else None
+
+    @property
+    def last_date(self):
+        return date.fromordinal(self.ordinals[-1]) if self.ordinals else None
+
+    def schedules_until(self, day):
+        """day(포함)까지의 스케줄 수"""
+        return bisect_right(self.ordinals, day.toordinal())
+
+    def schedules_before(self, day):
+        """day(미포함) 이전의 스케줄 수"""
+        return bisect_left(self.ordinals, day.toordinal())
+
+    def schedules_between(self, start, end):
+        """start ~ end(모두 포함) 사이의 스케줄 수"""
+        if end < start:
+            return 0
+        return self.schedules_until(end) - self.schedules_before(start)
+
+    def schedules_on(self, day):
+        return self.schedules_between(day, day)
+
+    def chapters_until(self, day):
+        """day(포함)까지의 장 수 합계"""
+        return self.chapter_prefix[self.schedules_until(day)]
+
+    def chapters_at(self, index):
+        """index번째 스케줄의 장 수"""
+        return self.chapter_prefix[index + 1] - self.chapter_prefix[index]
+
+    def date_at(self, index):
+        return date.fromordinal(self.ordinals[index])
+
+    def index_of(self, schedule_id):
+        """스케줄 ID의 인덱스 (플랜에 없으면 None)"""
+        if self._index is None:
+            self._index = {sid: i for i, sid in enumerate(self.schedule_ids)}
+        return self._index.get(schedule_id)
+
+    def to_cache(self):
+        return {
+            'schedule_ids': self.schedule_ids,
+            'ordinals': self.ordinals,
+            'chapter_prefix': self.chapter_prefix,
+            'book_totals': self.book_totals,
+        }
+
+
+def build_plan_metadata(plan_id):
+    """스케줄 한 번 조회로 메타데이터 생성"""
+    rows = DailyBibleSchedule.objects.filter(
+        plan_id=plan_id
+    ).order_by('date', 'id').values_list('id', 'date', 'book', 'start_chapter', 'end_chapter')
+
+    schedule_ids = []
+    ordinals = []
+    chapter_prefix = [0]
+    book_totals = {}
+    for schedule_id, schedule_date, book, start_chapter, end_chapter in rows:
+        chapters = max(0, end_chapter - start_chapter + 1)
+        schedule_ids.append(schedule_id)
+        ordinals.append(schedule_date.toordinal())
+        chapter_prefix.append(chapter_prefix[-1] + chapters)
+        totals = book_totals.setdefault(book, {'schedules': 0, 'chapters': 0})
+        totals['schedules'] += 1
+        totals['chapters'] += chapters
+
+    return PlanMetadata(plan_id, schedule_ids, ordinals, chapter_prefix, book_totals)
+
+
+def get_plan_metadata(plan_id):
+    """캐시된 플랜 메타데이터 조회 (없으면 생성 후 캐시)"""
+    cache_key = PLAN_METADATA_KEY.format(plan_id=plan_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return PlanMetadata(plan_id, **cached)
+
+    metadata = build_plan_metadata(plan_id)
+    cache.set(cache_key, metadata.to_cache(), timeout=PLAN_METADATA_TIMEOUT)
+    return metadata
+
+
+def invalidate_plan_metadata(plan_id):
+    cache.delete(PLAN_METADATA_KEY.format(plan_id=plan_id))
@@ -0,0 +1,208 @@
+"""
+구독별 진도 스냅샷 (완료 비트맵 읽기 모델)
+- 플랜 스케줄 순서(plan_metadata)의 인덱스를 비트로 사용하는 완료 비트맵을 SubscriptionProgressBitmap에 보관
+- 완료 여부/완료 수(popcount)/첫 미완료(find-first-zero)/밀린 스케줄을 메모리 비트 연산으로 계산
+- update_bible_progress는 같은 트랜잭션에서 비트를 직접 갱신하고, 그 외 진도 저장은 무효화 (signals.py)
+- 플랜 스케줄이 바뀌면 signature가 달라져 다시 생성
+- 구독 조회 시 select_related('progress_bitmap')을 붙이면 진도 조회 쿼리가 없음
+"""
+
+from functools import cached_property
+
+from django.db.models import F
+from django.utils import timezone
+
+from ..models import DailyBibleSchedule, SubscriptionProgressBitmap, UserBibleProgress
+from .plan_metadata import get_plan_metadata
+
+
+def encode_bits(bits, length):
+    return bits.to_bytes((length + 7) // 8, 'little')
+
+
+def decode_bits(data):
+    return int.from_bytes(bytes(data), 'little')
+
+
+def build_completion_bits(subscription_id, metadata):
+    """완료한 스케줄의 인덱스 비트를 켠 정수 (쿼리 1개)"""
+    completed = set(UserBibleProgress.objects.filter(
+        subscription_id=subscription_id,
+        is_completed=True
+    ).values_list('schedule_id', flat=True))
+
+    bits = 0
+    for index, schedule_id in enumerate(metadata.schedule_ids):
+        if schedule_id in completed:
+            bits |= 1 << index
+    return bits
+
+
+def _loaded_bitmap(subscription):
+    """구독에 연결된 비트맵 행 (select_related로 이미 불러왔으면 쿼리 없음)"""
+    try:
+        return subscription.progress_bitmap
+    except SubscriptionProgressBitmap.DoesNotExist:
+        return None
+
+
+def rebuild_completion_bits(subscription, metadata, bitmap=None):
+    """
+    UserBibleProgress에서 비트맵을 다시 만들어 저장
+
+    계산하는 동안 진도가 바뀌었으면(version 증가) 저장하지 않고 계산 결과만 반환한다.
+    """
+    version = bitmap.version if bitmap else 0
+    bits = build_completion_bits(subscription.id, metadata)
+    data = encode_bits(bits, metadata.total_schedules)
+
+    if bitmap is None:
+        bitmap, created = SubscriptionProgressBitmap.objects.get_or_create(
+            subscription_id=subscription.id,
+            defaults={'bits': data, 'signature': metadata.signature}
+        )
+        if created:
+            subscription.progress_bitmap = bitmap
+            return bits
+        if bitmap.bits is not None and bitmap.signature == metadata.signature:
+            # 동시에 다른 요청이 먼저 만든 경우
+            subscription.progress_bitmap = bitmap
+            return decode_bits(bitmap.bits)
+        version = bitmap.version
+
+    updated = SubscriptionProgressBitmap.objects.filter(
+        subscription_id=subscription.id,
+        version=version
+    ).update(bits=data, signature=metadata.signature, updated_at=timezone.now())
+    if updated:
+        bitmap.bits = data
+        bitmap.signature = metadata.signature
+        subscription.progress_bitmap = bitmap
+    return bits
+
+
+def get_completion_bits(subscription, metadata):
+    """구독의 완료 비트맵 (없거나 무효화되었거나 플랜 구성이 바뀌었으면 재계산)"""
+    bitmap = _loaded_bitmap(subscription)
+    if bitmap is not None and bitmap.bits is not None and bitmap.signature == metadata.signature:
+        return decode_bits(bitmap.bits)
+    return rebuild_completion_bits(subscription, metadata, bitmap)
+
+
+def apply_progress_changes(subscription, schedule_ids, is_completed):
+    """
+    진도 일괄 변경을 비트맵에 반영 (update_bible_progress의 트랜잭션 안에서 진도 저장 후 호출)
+
+    비트맵 행을 잠근 뒤 해당 비트만 바꾼다. 비트맵이 유효하지 않으면 저장된 진도로 다시 만든다.
+    """
+    metadata = get_plan_metadata(subscription.plan_id)
+    bitmap = SubscriptionProgressBitmap.objects.select_for_update().filter(
+        subscription_id=subscription.id
+    ).first()
+
+    if bitmap is None or bitmap.bits is None or bitmap.signature != metadata.signature:
+        bits = build_completion_bits(subscription.id, metadata)
+    else:
+        bits = decode_bits(bitmap.bits)
+        for schedule_id in schedule_ids:
+            index = metadata.index_of(schedule_id)
+            if index is None:
+                continue
+            if is_completed:
+                bits |= 1 << index
+            else:
+                bits &= ~(1 << index)
+
+    values = {
+        'bits': encode_bits(bits, metadata.total_schedules),
+        'signature': metadata.signature,
+    }
+    if bitmap is None:
+        SubscriptionProgressBitmap.objects.create(subscription_id=subscription.id, **values)
+    else:
+        SubscriptionProgressBitmap.objects.filter(subscription_id=subscription.id).update(
+            version=F('version') + 1, updated_at=timezone.now(), **values
+        )
+    return bits
+
+
+def invalidate_progress_snapshot(*subscription_ids):
+    """비트맵 무효화 (다음 조회 시 재계산)"""
+    SubscriptionProgressBitmap.objects.filter(subscription_id__in=subscription_ids).update(
+        bits=None, version=F('version') + 1, updated_at=timezone.now()
+    )
+
+
+class ProgressSnapshot:
+    """구독 한 개의 진도 스냅샷 (인덱스는 플랜 스케줄 순서 기준)"""
+
+    def __init__(self, subscription, metadata, bits, today):
+        self.subscription = subscription
+        self.metadata = metadata
+        self.bits = bits
+        self.today = today
+
+    def is_completed(self, index):
+        return bool(self.bits >> index & 1)
+
+    def is_schedule_completed(self, schedule_id):
+        index = self.metadata.index_of(schedule_id)
+        return index is not None and self.is_completed(index)
+
+    @property
+    def completed_count(self):
+        return self.bits.bit_count()
+
+    def first_incomplete(self):
+        """가장 앞의 미완료 인덱스 (모두 완료했으면 None)"""
+        index = (~self.bits & (self.bits + 1)).bit_length() - 1
+        return index if index < self.metadata.total_schedules else None
+
+    def incomplete_between(self, start_index, end_index):
+        """[start_index, end_index) 구간의 미완료 인덱스 (오름차순)"""
+        return [i for i in range(start_index, end_index) if not self.bits >> i & 1]
+
+    def incomplete_in_range(self, range_start, range_end):
+        """range_start ~ range_end(모두 포함) 날짜의 미완료 인덱스"""
+        if range_end < range_start:
+            return []
+        return self.incomplete_between(
+            self.metadata.schedules_before(range_start),
+            self.metadata.schedules_until(range_end)
+        )
+
+    @cached_property
+    def overdue_indices(self):
+        """구독 시작일 ~ 어제의 미완료 인덱스"""
+        return self.incomplete_between(
+            self.metadata.schedules_before(self.subscription.start_date),
+            self.metadata.schedules_before(self.today)
+        )
+
+    def last_incomplete_until(self, day):
+        """day(포함)까지 중 가장 최근 미완료 인덱스 (없으면 None)"""
+        for index in range(self.metadata.schedules_until(day) - 1, -1, -1):
+            if not self.bits >> index & 1:
+                return index
+        return None
+
+    def chapters(self, indices):
+        return sum(self.metadata.chapters_at(i) for i in indices)
+
+    def schedule_ids(self, indices):
+        return [self.metadata.schedule_ids[i] for i in indices]
+
+    def load_schedules(self, indices):
+        """인덱스 순서대로 DailyBibleSchedule 조회 (비어 있으면 쿼리 없음)"""
+        if not indices:
+            return []
+        ids = self.schedule_ids(indices)
+        schedules = DailyBibleSchedule.objects.in_bulk(ids)
+        return [schedules[schedule_id] for schedule_id in ids if schedule_id in schedules]
+
+
+def get_progress_snapshot(subscription, today=None):
+    """구독의 진도 스냅샷 (플랜 메타데이터가 캐시되어 있고 비트맵을 함께 불러왔으면 쿼리 없음)"""
+    metadata = get_plan_metadata(subscription.plan_id)
+    bits = get_completion_bits(subscription, metadata)
+    return ProgressSnapshot(subscription, metadata, bits, today or timezone.now().date())
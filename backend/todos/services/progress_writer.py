@@ -0,0 +1,187 @@
+"""
+성경 진도 일괄 저장 서비스
+- 여러 플랜의 완료/취소 변경을 한 번에 검증하고 (구독, 스케줄) 기준 upsert 한 번으로 저장
+  (MySQL: INSERT ... ON DUPLICATE KEY UPDATE, unique_progress_subscription_schedule 제약 기준)
+- 이미 같은 상태인 진도는 건드리지 않으므로 같은 요청을 다시 보내도 결과가 같음 (completed_at 유지)
+- 행별 post_save 대신 요청당 progress_changed 이벤트를 한 번 발생 (통계/캘린더 무효화는 signals.py)
+- 바뀐 스케줄은 동기화 변경 로그에 함께 기록 (sync.py)
+"""
+
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+from ..models import DailyBibleSchedule, PlanSubscription, UserBibleProgress
+from .change_log import record_changes
+from .progress_snapshot import apply_progress_changes
+from utils.db import upsert_options
+
+# 진도가 실제로 바뀐 요청마다 한 번 발생 (user_id, subscription_ids, books, completed, completed_books)
+progress_changed = Signal()
+
+PROGRESS_ACTIONS = {'complete': True, 'cancel': False}
+
+
+class ProgressUpdateError(Exception):
+    """진도 변경 요청 검증 실패"""
+
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class ProgressChange:
+    """플랜 하나의 진도 변경 요청"""
+    plan_id: int
+    schedule_ids: list
+    is_completed: bool
+
+
+@dataclass
+class ProgressUpdateResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    subscription_ids: list = field(default_factory=list)
+
+
+def parse_progress_change(data):
+    """요청 항목({plan_id, schedule_ids, action}) → ProgressChange"""
+    plan_id = data.get('plan_id')
+    schedule_ids = data.get('schedule_ids') or []
+    action = data.get('action')
+
+    if not all([plan_id, schedule_ids, action]):
+        raise ProgressUpdateError('필수 파라미터(plan_id, schedule_ids, action)가 누락되었습니다.')
+    if action not in PROGRESS_ACTIONS:
+        raise ProgressUpdateError('action은 complete 또는 cancel이어야 합니다.')
+    try:
+        return ProgressChange(
+            plan_id=int(plan_id),
+            schedule_ids=list(dict.fromkeys(int(schedule_id) for schedule_id in schedule_ids)),
+            is_completed=PROGRESS_ACTIONS[action]
+        )
+    except (TypeError, ValueError):
+        raise ProgressUpdateError('plan_id와 schedule_ids는 숫자여야 합니다.')
+
+
+def _resolve_targets(user, changes):
+    """
+    스케줄/구독 검증 후 {schedule_id: (subscription, is_completed, book)} 반환 (쿼리 2개)
+
+    같은 스케줄이 여러 번 나오면 마지막 변경을 따른다.
+    """
+    schedule_ids = {schedule_id for change in changes for schedule_id in change.schedule_ids}
+    schedules = {
+        schedule_id: (plan_id, book)
+        for schedule_id, plan_id, book in DailyBibleSchedule.objects.filter(
+            id__in=schedule_ids
+        ).values_list('id', 'plan_id', 'book')
+    }
+    if not schedules:
+        raise ProgressUpdateError('존재하지 않는 스케줄입니다.', status_code=404)
+
+    for change in changes:
+        if any(schedules.get(schedule_id, (None,))[0] != change.plan_id
+               for schedule_id in change.schedule_ids):
+            raise ProgressUpdateError('스케줄 ID와 플랜 ID가 일치하지 않습니다.')
+
+    plan_ids = {change.plan_id for change in changes}
+    subscriptions = {
+        subscription.plan_id: subscription
+        for subscription in PlanSubscription.objects.filter(
+            user=user,
+            plan_id__in=plan_ids,
+            is_active=True
+        )
+    }
+    if len(subscriptions) != len(plan_ids):
+        raise ProgressUpdateError('구독 중인 플랜이 아닙니다.', status_code=404)
+
+    targets = {}
+    for change in changes:
+        subscription = subscriptions[change.plan_id]
+        for schedule_id in change.schedule_ids:
+            targets[schedule_id] = (subscription, change.is_completed, schedules[schedule_id][1])
+    return targets
+
+
+def apply_progress_batch(user, changes):
+    """
+    여러 플랜의 진도 변경을 한 트랜잭션으로 저장
+
+    Raises:
+        ProgressUpdateError: 스케줄/플랜/구독 검증 실패 (아무것도 저장하지 않음)
+    """
+    targets = _resolve_targets(user, changes)
+    result = ProgressUpdateResult()
+    now = timezone.now()
+
+    with transaction.atomic():
+        existing = {
+            (subscription_id, schedule_id): is_completed
+            for subscription_id, schedule_id, is_completed in UserBibleProgress.objects.filter(
+                subscription_id__in={subscription.id for subscription, _, _ in targets.values()},
+                schedule_id__in=targets.keys()
+            ).values_list('subscription_id', 'schedule_id', 'is_completed')
+        }
+
+        rows = []
+        changed = {}
+        books = set()
+        for schedule_id, (subscription, is_completed, book) in targets.items():
+            current = existing.get((subscription.id, schedule_id))
+            if current is None:
+                # 기록이 없는 스케줄의 취소도 미완료 행을 만듦 (기존 동작 유지)
+                result.created += 1
+            elif current != is_completed:
+                result.updated += 1
+            else:
+                result.unchanged += 1
+                continue
+
+            rows.append(UserBibleProgress(
+                subscription=subscription,
+                schedule_id=schedule_id,
+                is_completed=is_completed,
+                completed_at=now if is_completed else None
+            ))
+            changed.setdefault(subscription, []).append(schedule_id)
+            books.add(book)
+
+        if rows:
+            UserBibleProgress.objects.bulk_create(
+                rows,
+                **upsert_options(['subscription', 'schedule'], ['is_completed', 'completed_at', 'updated_at'])
+            )
+            record_changes(user.id, 'progress', [row.schedule_id for row in rows])
+
+        # 완료 비트맵은 같은 트랜잭션에서 갱신 (구독별 변경 방향이 섞일 수 있어 나눠서 반영)
+        for subscription, schedule_ids in changed.items():
+            completed = [sid for sid in schedule_ids if targets[sid][1]]
+            cancelled = [sid for sid in schedule_ids if not targets[sid][1]]
+            if completed:
+                apply_progress_changes(subscription, completed, True)
+            if cancelled:
+                apply_progress_changes(subscription, cancelled, False)
+
+        result.subscription_ids = [subscription.id for subscription in changed]
+        if changed:
+            user_id = user.id
+            subscription_ids = result.subscription_ids
+            books = sorted(books)
+            completed_books = sorted({targets[row.schedule_id][2] for row in rows if row.is_completed})
+            completed = sum(1 for row in rows if row.is_completed)
+            transaction.on_commit(lambda: progress_changed.send(
+                sender=UserBibleProgress,
+                user_id=user_id,
+                subscription_ids=subscription_ids,
+                books=books,
+                completed=completed,
+                completed_books=completed_books
+            ))
+
+    return result
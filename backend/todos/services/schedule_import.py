@@ -0,0 +1,361 @@
+"""
+엑셀 일정 가져오기
+- 업로드 요청은 헤더만 확인하고 파일을 ScheduleImportJob에 저장, 처리는 Celery 태스크에서 (요청 워커를 붙잡지 않음)
+- openpyxl read_only로 행을 CHUNK_ROWS개씩 읽고, 묶음마다 pandas 열 연산으로 날짜/성경/장 번호/링크를 검증
+  (행별 오류는 작업에 기록, 나머지 행은 저장)
+- 같은 (날짜, 성경) 중복은 파일 안과 기존 일정(쿼리 1개)을 메모리에서 비교
+  (모델 save()의 full_clean()이 행마다 실행하던 exists() 쿼리를 대신함)
+- 저장은 한 트랜잭션에서 bulk_create / bulk_update, 처리한 행 수는 묶음마다 작업에 기록 (상태 조회 API)
+- bulk 저장은 post_save가 없으므로 플랜 메타데이터/캘린더 캐시는 커밋 후 한 번만 무효화
+- 시작(대기 중이면 생성) 후 SCHEDULE_IMPORT_TIMEOUT_MINUTES분이 지나도 끝나지 않은 작업은
+  상태 조회 시 실패로 표시 (워커 중단, 태스크 유실)
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from io import BytesIO
+from itertools import islice
+
+import pandas as pd
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import transaction
+from django.utils import timezone
+from openpyxl import load_workbook
+
+from ..models import BibleReadingPlan, DailyBibleSchedule, ScheduleImportJob
+from .calendar_projection import bump_calendar_schedules
+from .plan_metadata import invalidate_plan_metadata
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = ['날짜', '성경', '시작장', '끝장']
+# 선택 컬럼 → 모델 필드
+LINK_COLUMNS = {'오디오': 'audio_link', '가이드': 'guide_link'}
+IMPORT_MODES = ('add', 'update', 'replace')
+CHUNK_ROWS = 1000
+# 작업에 저장할 최대 행별 오류 수 (error_count는 전체 수)
+MAX_REPORTED_ERRORS = 100
+
+
+def get_job_timeout():
+    return timedelta(minutes=getattr(settings, 'SCHEDULE_IMPORT_TIMEOUT_MINUTES', 15))
+
+
+class ScheduleImportError(Exception):
+    """파일 자체를 처리할 수 없음 (작업 전체 실패)"""
+
+
+@dataclass
+class ScheduleRow:
+    row: int
+    date: object
+    book: str
+    start_chapter: int
+    end_chapter: int
+    audio_link: str = ''
+    guide_link: str = ''
+
+
+def _open_sheet(source):
+    """첫 번째 시트를 read_only로 열어 (workbook, 컬럼 위치 {이름: 인덱스}, 데이터 행 iterator, 데이터 행 수)"""
+    try:
+        workbook = load_workbook(BytesIO(source), read_only=True, data_only=True)
+    except Exception:
+        raise ScheduleImportError('엑셀 파일(.xlsx)을 읽을 수 없습니다.')
+
+    sheet = workbook.worksheets[0]
+    rows = sheet.iter_rows(values_only=True)
+    header = [str(value).strip() if value is not None else '' for value in next(rows, ())]
+    missing = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing:
+        workbook.close()
+        raise ScheduleImportError(f"필수 컬럼이 누락되었습니다: {', '.join(missing)}")
+
+    columns = {
+        name: header.index(name)
+        for name in REQUIRED_COLUMNS + list(LINK_COLUMNS)
+        if name in header
+    }
+    total = sheet.max_row - 1 if sheet.max_row else None
+    return workbook, columns, rows, total
+
+
+def check_header(source):
+    """필수 컬럼 확인 (업로드 요청에서 바로 오류를 돌려주기 위함)"""
+    workbook, _, _, _ = _open_sheet(source)
+    workbook.close()
+
+
+def _normalize_links(values):
+    """링크 열 정리: 빈 값은 '', 스키마가 없으면 https:// 추가"""
+    text = values.where(values.notna(), '').astype(str).str.strip()
+    needs_scheme = text.ne('') & ~text.str.startswith(('http://', 'https://'))
+    return text.mask(needs_scheme, 'https://' + text)
+
+
+def _invalid_links(links):
+    """URLField 검증에 실패하는 링크 (서로 다른 값만 검사)"""
+    validate = URLValidator()
+    invalid = set()
+    for link in links[links.ne('')].unique():
+        try:
+            validate(link)
+        except ValidationError:
+            invalid.add(link)
+    return links.isin(invalid)
+
+
+def _validate_chunk(frame):
+    """
+    묶음 검증 (열 단위 연산)
+
+    Returns:
+        (유효한 ScheduleRow 목록, [(행 번호, 오류)])
+    """
+    # 엑셀 날짜 셀(datetime), 'YYYY-MM-DD', 'YYYY.MM.DD' 모두 'YYYY-MM-DD' 문자열로 맞춘 뒤 한 번에 변환
+    date_text = frame['날짜'].astype(str).str.strip().str.split(' ').str[0].str.replace('.', '-', regex=False)
+    dates = pd.to_datetime(date_text, format='%Y-%m-%d', errors='coerce')
+    books = frame['성경'].where(frame['성경'].notna(), '').astype(str).str.strip()
+    starts = pd.to_numeric(frame['시작장'], errors='coerce')
+    ends = pd.to_numeric(frame['끝장'], errors='coerce')
+    links = {field: _normalize_links(frame[column]) for column, field in LINK_COLUMNS.items() if column in frame}
+
+    checks = [
+        (dates.isna(), '날짜 형식이 올바르지 않습니다 (YYYY-MM-DD).'),
+        (books.eq(''), '성경이 비어 있습니다.'),
+        (books.str.len() > DailyBibleSchedule._meta.get_field('book').max_length, '성경 이름이 너무 깁니다.'),
+        (starts.isna() | ends.isna() | (starts % 1 != 0) | (ends % 1 != 0), '시작장과 끝장은 정수여야 합니다.'),
+        ((starts < 1) | (ends < starts), '장 범위가 올바르지 않습니다.'),
+    ]
+    for column, field in LINK_COLUMNS.items():
+        if field in links:
+            checks.append((_invalid_links(links[field]), f'{column} 링크가 올바른 URL이 아닙니다.'))
+
+    # 행마다 첫 번째로 실패한 검사의 메시지
+    errors = pd.Series(None, index=frame.index, dtype=object)
+    for mask, message in checks:
+        errors = errors.mask(errors.isna() & mask.fillna(False), message)
+
+    valid = errors.isna()
+    rows = [
+        ScheduleRow(row, date.date(), book, int(start), int(end), audio, guide)
+        for row, date, book, start, end, audio, guide in zip(
+            frame.index[valid],
+            dates[valid],
+            books[valid],
+            starts[valid],
+            ends[valid],
+            links['audio_link'][valid] if 'audio_link' in links else [''] * int(valid.sum()),
+            links['guide_link'][valid] if 'guide_link' in links else [''] * int(valid.sum()),
+        )
+    ]
+    return rows, list(errors.dropna().items())
+
+
+class _ImportErrors:
+    def __init__(self):
+        self.count = 0
+        self.items = []
+
+    def add(self, row, error):
+        self.count += 1
+        if len(self.items) < MAX_REPORTED_ERRORS:
+            self.items.append({'row': row, 'error': error})
+
+
+def _read_rows(job, errors):
+    """파일을 묶음 단위로 읽고 검증, {(날짜, 성경): ScheduleRow} 반환"""
+    workbook, columns, rows, total = _open_sheet(bytes(job.source))
+    job.total_rows = total
+    job.save(update_fields=['total_rows'])
+
+    records = {}
+    next_row = 2  # 엑셀 행 번호 (헤더 다음)
+    try:
+        while True:
+            chunk = list(islice(rows, CHUNK_ROWS))
+            if not chunk:
+                break
+            frame = pd.DataFrame(
+                [[row[index] if index < len(row) else None for index in columns.values()] for row in chunk],
+                columns=list(columns),
+                index=range(next_row, next_row + len(chunk))
+            )
+            next_row += len(chunk)
+            # 완전히 빈 행(서식만 남은 행)은 건너뜀
+            frame = frame.replace('', None).dropna(how='all')
+
+            valid, chunk_errors = _validate_chunk(frame)
+            for row, error in chunk_errors:
+                errors.add(row, error)
+            for record in valid:
+                key = (record.date, record.book)
+                if key in records:
+                    errors.add(record.row, f'{records[key].row}행과 날짜/성경이 중복됩니다.')
+                else:
+                    records[key] = record
+
+            ScheduleImportJob.objects.filter(id=job.id).update(processed_rows=next_row - 2)
+    finally:
+        workbook.close()
+    return records
+
+
+def _save_rows(job, records, errors):
+    """한 트랜잭션에서 일정 저장, (생성 수, 갱신 수) 반환"""
+    fields = ['start_chapter', 'end_chapter', 'audio_link', 'guide_link']
+    with transaction.atomic():
+        # 같은 플랜의 가져오기가 동시에 실행되지 않도록 플랜 행 잠금
+        plan = BibleReadingPlan.objects.select_for_update().get(id=job.plan_id)
+        if job.update_mode == 'replace':
+            DailyBibleSchedule.objects.filter(plan=plan).delete()
+            existing = {}
+        else:
+            existing = {
+                (date, book): schedule_id
+                for schedule_id, date, book in DailyBibleSchedule.objects.filter(
+                    plan=plan
+                ).values_list('id', 'date', 'book')
+            }
+
+        to_create = []
+        to_update = []
+        for key, record in sorted(records.items(), key=lambda item: item[1].row):
+            values = {field: getattr(record, field) for field in fields}
+            schedule_id = existing.get(key)
+            if schedule_id is None:
+                to_create.append(DailyBibleSchedule(plan=plan, date=record.date, book=record.book, **values))
+            elif job.update_mode == 'add':
+                errors.add(record.row, '같은 날짜/성경의 일정이 이미 있습니다.')
+            else:
+                to_update.append(DailyBibleSchedule(id=schedule_id, **values))
+
+        DailyBibleSchedule.objects.bulk_create(to_create, batch_size=CHUNK_ROWS)
+        DailyBibleSchedule.objects.bulk_update(to_update, fields, batch_size=CHUNK_ROWS)
+
+        plan_id = plan.id
+        transaction.on_commit(lambda: invalidate_plan_metadata(plan_id))
+        transaction.on_commit(bump_calendar_schedules)
+    return len(to_create), len(to_update)
+
+
+def _finish(job_id, status, message, **fields):
+    ScheduleImportJob.objects.filter(id=job_id).update(
+        status=status,
+        message=message[:255],
+        source=None,
+        finished_at=timezone.now(),
+        **fields
+    )
+
+
+def run_import(job_id):
+    """가져오기 작업 실행 (Celery 태스크), 대기 상태가 아니면 아무것도 하지 않음"""
+    claimed = ScheduleImportJob.objects.filter(
+        id=job_id,
+        status=ScheduleImportJob.STATUS_PENDING
+    ).update(status=ScheduleImportJob.STATUS_RUNNING, started_at=timezone.now())
+    if not claimed:
+        return None
+
+    job = ScheduleImportJob.objects.get(id=job_id)
+    errors = _ImportErrors()
+    try:
+        records = _read_rows(job, errors)
+        created, updated = _save_rows(job, records, errors)
+    except ScheduleImportError as e:
+        _finish(job_id, ScheduleImportJob.STATUS_FAILED, str(e))
+    except Exception as e:
+        logger.error(f"Error in schedule import job {job_id}: {str(e)}", exc_info=True)
+        _finish(job_id, ScheduleImportJob.STATUS_FAILED, '일정 가져오기 중 오류가 발생했습니다.')
+    else:
+        errors.items.sort(key=lambda item: item['row'])
+        _finish(
+            job_id, ScheduleImportJob.STATUS_COMPLETED,
+            f'{created + updated}개의 일정이 처리되었습니다. 오류: {errors.count}개',
+            created_count=created,
+            updated_count=updated,
+            error_count=errors.count,
+            errors=errors.items
+        )
+    return ScheduleImportJob.objects.get(id=job_id)
+
+
+def fail_stale_job(job):
+    """제한 시간이 지나도 끝나지 않은 작업을 실패로 표시 (늦게라도 끝나면 결과로 덮어씀)"""
+    if job.status not in (ScheduleImportJob.STATUS_PENDING, ScheduleImportJob.STATUS_RUNNING):
+        return job
+    if (job.started_at or job.created_at) > timezone.now() - get_job_timeout():
+        return job
+
+    ScheduleImportJob.objects.filter(id=job.id, status=job.status).update(
+        status=ScheduleImportJob.STATUS_FAILED,
+        message='처리 시간이 초과되었습니다. 다시 업로드해주세요.',
+        source=None,
+        finished_at=timezone.now()
+    )
+    job.refresh_from_db()
+    return job
+
+
+def _enqueue(job_id):
+    from todos.tasks import import_schedules_task
+
+    try:
+        import_schedules_task.delay(job_id)
+    except Exception as e:
+        logger.error(f"Error in enqueue schedule import: {str(e)}", exc_info=True)
+        _finish(job_id, ScheduleImportJob.STATUS_FAILED, '가져오기 작업을 예약하지 못했습니다.')
+
+
+def start_import(plan, user, uploaded_file, update_mode='add'):
+    """
+    가져오기 작업 생성 (커밋되면 태스크 예약)
+
+    Raises:
+        ScheduleImportError: 잘못된 모드, 읽을 수 없는 파일, 필수 컬럼 누락
+    """
+    if update_mode not in IMPORT_MODES:
+        raise ScheduleImportError('update_mode는 add, update, replace 중 하나여야 합니다.')
+    source = uploaded_file.read()
+    check_header(source)
+
+    job = ScheduleImportJob.objects.create(
+        plan=plan,
+        created_by=user,
+        update_mode=update_mode,
+        file_name=uploaded_file.name[:255],
+        source=source
+    )
+    transaction.on_commit(lambda: _enqueue(job.id))
+    return job
+
+
+def serialize_job(job):
+    """상태 조회 응답"""
+    progress = None
+    if job.status == ScheduleImportJob.STATUS_COMPLETED:
+        progress = 100
+    elif job.total_rows:
+        progress = min(round(job.processed_rows * 100 / job.total_rows), 99)
+    return {
+        'id': job.id,
+        'plan_id': job.plan_id,
+        'status': job.status,
+        'update_mode': job.update_mode,
+        'file_name': job.file_name,
+        'total_rows': job.total_rows,
+        'processed_rows': job.processed_rows,
+        'progress': progress,
+        'created_count': job.created_count,
+        'updated_count': job.updated_count,
+        'error_count': job.error_count,
+        'errors': job.errors,
+        'message': job.message,
+        'created_at': job.created_at,
+        'started_at': job.started_at,
+        'finished_at': job.finished_at,
+    }
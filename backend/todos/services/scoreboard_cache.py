@@ -0,0 +1,40 @@
+"""
+스코어보드 캐시 네임스페이스
+- 플랜/그룹/사용자별 세대 카운터로 스코어보드 캐시 키 버전 관리
+- 진도 재계산, 그룹 멤버십, 팔로우 변경 시 관련 네임스페이스 bump
+"""
+
+from utils.cache import bump_generation
+
+from ..models import PlanSubscription, GroupMembership
+
+
+def plan_namespace(plan_id=None):
+    return f'scoreboard:plan:{plan_id or "all"}'
+
+
+def group_namespace(group_id):
+    return f'scoreboard:group:{group_id}'
+
+
+def user_namespace(user_id):
+    return f'scoreboard:user:{user_id}'
+
+
+def bump_for_user_progress(user_id):
+    """사용자 진도/통계 변경 시 영향을 받는 스코어보드 캐시 무효화"""
+    plan_ids = PlanSubscription.objects.filter(
+        user_id=user_id,
+        is_active=True
+    ).values_list('plan_id', flat=True)
+    group_ids = GroupMembership.objects.filter(
+        user_id=user_id,
+        is_active=True
+    ).values_list('group_id', flat=True)
+
+    bump_generation(
+        user_namespace(user_id),
+        plan_namespace(),
+        *[plan_namespace(plan_id) for plan_id in plan_ids],
+        *[group_namespace(group_id) for group_id in group_ids],
+    )
@@ -0,0 +1,149 @@
+"""
+프로필 통계/업적 재계산 예약 서비스
+- 진도 저장 시 사용자별 dirty 마커만 남기고 즉시 반환
+- Celery 태스크가 짧은 시간 내 연속 저장을 모아 사용자당 한 번만 재계산
+- 최대 지연(staleness) 시간을 넘기지 않도록 보장
+- 큐 지연(queue lag) 지표를 캐시에 기록
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+STATS_DIRTY_KEY = 'stats_recompute:dirty:{user_id}'
+STATS_SCHEDULED_KEY = 'stats_recompute:scheduled:{user_id}'
+STATS_QUEUE_LAG_KEY = 'stats_recompute:queue_lag'
+
+
+def get_debounce_seconds():
+    return getattr(settings, 'STATS_RECOMPUTE_DEBOUNCE_SECONDS', 10)
+
+
+def get_max_staleness_seconds():
+    return getattr(settings, 'STATS_RECOMPUTE_MAX_STALENESS_SECONDS', 60)
+
+
+def _marker_timeout():
+    # 워커가 죽어도 마커가 영구히 남지 않도록 최대 지연 시간의 몇 배로 만료
+    return get_max_staleness_seconds() * 5
+
+
+def _is_eager():
+    # 테스트 등 즉시 실행 모드에서는 재예약이 곧바로 재귀 호출되므로 지연하지 않음
+    from config.celery import app
+    return bool(app.conf.task_always_eager)
+
+
+def mark_user_stats_dirty(user_id, books=None):
+    """
+    사용자 통계를 dirty로 표시하고 필요하면 재계산 태스크를 예약
+
+    books: 진도가 바뀐 책 이름 목록 (완독 현황을 다시 집계할 대상)
+    이미 예약된 태스크가 있으면 마커의 마지막 변경 시각과 책 목록만 갱신한다.
+    """
+    now = time.time()
+    dirty_key = STATS_DIRTY_KEY.format(user_id=user_id)
+    state = cache.get(dirty_key) or {'first': now, 'books': []}
+    state['last'] = now
+    if books:
+        state['books'] = sorted(set(state.get('books', [])) | set(books))
+    cache.set(dirty_key, state, timeout=_marker_timeout())
+
+    scheduled_key = STATS_SCHEDULED_KEY.format(user_id=user_id)
+    if not cache.add(scheduled_key, now, timeout=_marker_timeout()):
+        return False
+
+    return _enqueue(user_id, get_debounce_seconds())
+
+
+def _enqueue(user_id, countdown):
+    from todos.tasks import recompute_user_stats_task
+
+    try:
+        recompute_user_stats_task.apply_async(
+            args=[user_id, time.time() + countdown],
+            countdown=countdown,
+        )
+        return True
+    except Exception as e:
+        # 브로커 장애 시 다음 저장에서 다시 예약할 수 있도록 예약 마커 해제
+        cache.delete(STATS_SCHEDULED_KEY.format(user_id=user_id))
+        logger.error(f"Error in enqueue stats recompute: {str(e)}", exc_info=True)
+        return False
+
+
+def record_queue_lag(due_at):
+    """예정 실행 시각 대비 실제 실행 지연(초) 기록"""
+    lag = max(0.0, time.time() - due_at)
+    stats = cache.get(STATS_QUEUE_LAG_KEY) or {'count': 0, 'max': 0.0}
+    stats['last'] = round(lag, 3)
+    stats['max'] = round(max(stats['max'], lag), 3)
+    stats['count'] += 1
+    stats['updated_at'] = time.time()
+    cache.set(STATS_QUEUE_LAG_KEY, stats, timeout=None)
+
+    if lag > get_max_staleness_seconds():
+        logger.warning(f"Stats recompute queue lag {lag:.1f}s exceeds staleness window")
+    return lag
+
+
+def get_queue_lag_stats():
+    """큐 지연 지표 조회 (모니터링용)"""
+    return cache.get(STATS_QUEUE_LAG_KEY) or {'count': 0, 'max': 0.0, 'last': None}
+
+
+def process_dirty_user(user_id):
+    """
+    dirty 상태인 사용자의 통계/업적 재계산
+
+    마지막 저장 후 디바운스 시간이 지나지 않았고 최대 지연 시간도 남아 있으면
+    남은 시간만큼 재예약한다.
+    Returns: 'skipped' | 'deferred' | 'recomputed'
+    """
+    from django.contrib.auth import get_user_model
+    from accounts.services import AchievementService, BookCompletionService
+    from .leaderboard import refresh_user_leaderboards
+    from .scoreboard_cache import bump_for_user_progress
+
+    dirty_key = STATS_DIRTY_KEY.format(user_id=user_id)
+    scheduled_key = STATS_SCHEDULED_KEY.format(user_id=user_id)
+    state = cache.get(dirty_key)
+    if not state:
+        cache.delete(scheduled_key)
+        return 'skipped'
+
+    now = time.time()
+    quiet_for = now - state['last']
+    dirty_for = now - state['first']
+    debounce = get_debounce_seconds()
+    max_staleness = get_max_staleness_seconds()
+    if quiet_for < debounce and dirty_for < max_staleness and not _is_eager():
+        countdown = min(debounce - quiet_for, max_staleness - dirty_for)
+        if _enqueue(user_id, countdown):
+            return 'deferred'
+
+    # 재계산 도중 들어온 저장은 새 마커와 새 태스크로 처리되도록 먼저 해제
+    cache.delete(dirty_key)
+    cache.delete(scheduled_key)
+
+    user = get_user_model().objects.filter(id=user_id).first()
+    if user is None:
+        return 'skipped'
+
+    try:
+        if state.get('books'):
+            BookCompletionService.refresh_books(user, state['books'])
+        AchievementService.update_user_stats(user)
+        AchievementService.check_and_grant_achievements(user)
+        refresh_user_leaderboards(user)
+        bump_for_user_progress(user.id)
+    except Exception:
+        # 실패 시 마커를 복구해 태스크 재시도에서 다시 처리
+        cache.add(dirty_key, state, timeout=_marker_timeout())
+        cache.add(scheduled_key, now, timeout=_marker_timeout())
+        raise
+    return 'recomputed'
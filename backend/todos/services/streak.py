@@ -0,0 +1,76 @@
+"""
+연속 일수(streak) 계산 서비스
+- 완료 날짜 목록을 한 번만 받아 총 일수, 현재 연속, 최장 연속을 한 번에 계산
+- 쉬는 날 달력을 교체해 규칙을 바꿀 수 있음 (예: 하세나는 일요일 제외)
+"""
+
+from collections import namedtuple
+from datetime import timedelta
+
+from django.utils import timezone
+
+StreakStats = namedtuple('StreakStats', ['total_days', 'current_streak', 'longest_streak'])
+
+
+class RestDayCalendar:
+    """쉬는 날 달력 (기본: 쉬는 날 없음)"""
+
+    def is_rest_day(self, day):
+        return False
+
+
+class WeeklyRestCalendar(RestDayCalendar):
+    """매주 특정 요일을 쉬는 날로 보는 달력 (weekday: 월=0 ~ 일=6)"""
+
+    def __init__(self, weekdays):
+        self.weekdays = frozenset(weekdays)
+
+    def is_rest_day(self, day):
+        return day.weekday() in self.weekdays
+
+
+DAILY_CALENDAR = RestDayCalendar()
+SUNDAY_REST_CALENDAR = WeeklyRestCalendar([6])
+
+
+def _is_connected(earlier, later, calendar):
+    """두 날짜 사이(양 끝 제외)가 모두 쉬는 날이면 연속으로 간주"""
+    day = earlier + timedelta(days=1)
+    while day < later:
+        if not calendar.is_rest_day(day):
+            return False
+        day += timedelta(days=1)
+    return True
+
+
+def calculate_streaks(dates, today=None, calendar=DAILY_CALENDAR):
+    """
+    완료 날짜 목록으로 연속 일수 통계 계산
+
+    - total_days: 고유 완료 날짜 수 (쉬는 날 완료 포함)
+    - current_streak: 오늘(미완료면 직전 날)부터 거슬러 올라간 연속 일수
+    - longest_streak: 전체 기간 중 최장 연속 일수
+    쉬는 날은 연속을 끊지 않으며 연속 일수에도 포함하지 않는다.
+    """
+    today = today or timezone.now().date()
+    unique_dates = {d for d in dates if d}
+    streak_dates = sorted(d for d in unique_dates if not calendar.is_rest_day(d))
+
+    longest = 0
+    run = 0
+    current_run = 0
+    last_past = None
+    prev = None
+    for day in streak_dates:
+        run = run + 1 if prev and _is_connected(prev, day, calendar) else 1
+        longest = max(longest, run)
+        if day <= today:
+            current_run = run
+            last_past = day
+        prev = day
+
+    current = 0
+    if last_past and (last_past == today or _is_connected(last_past, today, calendar)):
+        current = current_run
+
+    return StreakStats(len(unique_dates), current, longest)
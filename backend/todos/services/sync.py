@@ -0,0 +1,247 @@
+"""
+오프라인 동기화 (delta sync)
+- 클라이언트가 보낸 cursor(SyncChange.id) 이후의 변경만 반환, 삭제는 tombstone(id 목록)으로 전달
+- cursor가 없거나 보관 기간보다 오래되었으면 전체 스냅샷을 반환 (reset=True)
+- 클라이언트 변경 묶음(mutations)을 받아 한 번에 적용 (항목별 savepoint, 진도는 upsert 한 번)
+- 동시에 커밋된 트랜잭션의 id 순서가 뒤바뀔 수 있으므로 최근 몇 초 안의 변경은 cursor를 넘기지 않음
+  (같은 변경을 다시 받을 수 있지만 upsert/tombstone은 멱등)
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from ..models import (
+    BibleBookmark, BibleHighlight, PersonalReadingRecord, ReflectionNote, SyncChange, UserBibleProgress
+)
+from ..serializers import (
+    BibleBookmarkSerializer, BibleHighlightSerializer, PersonalReadingRecordSerializer,
+    ReflectionNoteSerializer
+)
+from .progress_writer import ProgressUpdateError, apply_progress_batch, parse_progress_change
+
+
+@dataclass(frozen=True)
+class SyncEntity:
+    model: type
+    serializer_class: type
+    # 같은 값이면 새로 만들지 않고 기존 행을 수정 (모델의 유일 제약과 같은 기준)
+    natural_key: tuple = ()
+
+
+SYNC_ENTITIES = {
+    'bookmark': SyncEntity(BibleBookmark, BibleBookmarkSerializer),
+    'highlight': SyncEntity(BibleHighlight, BibleHighlightSerializer),
+    'note': SyncEntity(ReflectionNote, ReflectionNoteSerializer),
+    'reading_record': SyncEntity(
+        PersonalReadingRecord, PersonalReadingRecordSerializer, natural_key=('book', 'chapter')
+    ),
+}
+# 원본 모델이 없는 항목 (진도는 schedule_id, 구독은 plan_id 기준)
+PROGRESS_ENTITY = 'progress'
+SUBSCRIPTION_ENTITY = 'subscription'
+
+
+def get_page_size():
+    return getattr(settings, 'SYNC_PAGE_SIZE', 500)
+
+
+def get_settle_seconds():
+    return getattr(settings, 'SYNC_SETTLE_SECONDS', 5)
+
+
+def _empty_changes():
+    changes = {entity: {'upserts': [], 'deletes': []} for entity in SYNC_ENTITIES}
+    changes[PROGRESS_ENTITY] = {'upserts': [], 'deletes': []}
+    changes[SUBSCRIPTION_ENTITY] = {'deletes': []}
+    return changes
+
+
+def _serialize_progress(user, schedule_ids=None):
+    queryset = UserBibleProgress.objects.filter(subscription__user=user)
+    if schedule_ids is not None:
+        queryset = queryset.filter(schedule_id__in=schedule_ids)
+    return [
+        {
+            'schedule_id': row['schedule_id'],
+            'plan_id': row['subscription__plan_id'],
+            'is_completed': row['is_completed'],
+            'completed_at': row['completed_at'],
+        }
+        for row in queryset.values('schedule_id', 'subscription__plan_id', 'is_completed', 'completed_at')
+    ]
+
+
+def _settled_cursor(rows, fallback):
+    """
+    반환할 다음 cursor
+
+    settle 구간(최근 몇 초) 안에 기록된 첫 변경 직전까지만 전진한다.
+    """
+    settle_from = timezone.now() - timedelta(seconds=get_settle_seconds())
+    for row in rows:
+        if row.created_at > settle_from:
+            return row.id - 1
+    return fallback
+
+
+def _is_expired(cursor):
+    """cursor 이후의 로그 일부가 이미 삭제되었는지 (가장 오래 남은 로그보다 앞서면 만료)"""
+    oldest = SyncChange.objects.aggregate(oldest=Min('id'))['oldest']
+    return oldest is not None and cursor < oldest - 1
+
+
+def build_snapshot(user):
+    """전체 스냅샷 (reset=True)"""
+    settle_from = timezone.now() - timedelta(seconds=get_settle_seconds())
+    cursor = SyncChange.objects.filter(
+        created_at__lte=settle_from
+    ).aggregate(latest=Max('id'))['latest'] or 0
+
+    changes = _empty_changes()
+    for name, entity in SYNC_ENTITIES.items():
+        changes[name]['upserts'] = entity.serializer_class(
+            entity.model.objects.filter(user=user), many=True
+        ).data
+    changes[PROGRESS_ENTITY]['upserts'] = _serialize_progress(user)
+
+    return {'cursor': cursor, 'has_more': False, 'reset': True, 'changes': changes}
+
+
+def get_changes(user, cursor):
+    """
+    cursor 이후의 변경
+
+    Returns:
+        {'cursor', 'has_more', 'reset', 'changes': {entity: {'upserts': [...], 'deletes': [id, ...]}}}
+    """
+    if not cursor or _is_expired(cursor):
+        return build_snapshot(user)
+
+    page_size = get_page_size()
+    rows = list(SyncChange.objects.filter(
+        user=user,
+        id__gt=cursor
+    ).order_by('id')[:page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    # 같은 대상의 변경은 마지막 것만 의미가 있음
+    latest = {}
+    for row in rows:
+        latest[(row.entity, row.object_id)] = row.op
+
+    upsert_ids = {}
+    changes = _empty_changes()
+    for (entity, object_id), op in latest.items():
+        if op == SyncChange.OP_DELETE:
+            changes[entity]['deletes'].append(object_id)
+        else:
+            upsert_ids.setdefault(entity, set()).add(object_id)
+
+    for name, ids in upsert_ids.items():
+        if name == PROGRESS_ENTITY:
+            upserts = _serialize_progress(user, ids)
+            found = {item['schedule_id'] for item in upserts}
+        else:
+            entity = SYNC_ENTITIES[name]
+            objects = list(entity.model.objects.filter(user=user, id__in=ids))
+            upserts = entity.serializer_class(objects, many=True).data
+            found = {obj.id for obj in objects}
+        changes[name]['upserts'] = upserts
+        # 수정 이후 삭제되었지만 삭제 로그가 다음 페이지에 있는 경우
+        changes[name]['deletes'].extend(sorted(ids - found))
+
+    next_cursor = rows[-1].id if rows else cursor
+    settled = _settled_cursor(rows, next_cursor)
+    return {
+        'cursor': settled,
+        # settle 구간에서 멈췄으면 바로 다시 요청하지 않도록 has_more를 내림
+        'has_more': has_more and settled == next_cursor,
+        'reset': False,
+        'changes': changes,
+    }
+
+
+def _apply_entity_mutation(user, mutation):
+    entity = SYNC_ENTITIES[mutation['entity']]
+    op = mutation.get('op', SyncChange.OP_UPSERT)
+    object_id = mutation.get('id')
+    data = mutation.get('data') or {}
+    queryset = entity.model.objects.filter(user=user)
+
+    if op == SyncChange.OP_DELETE:
+        if object_id is None:
+            return {'status': 'error', 'error': 'id가 필요합니다.'}
+        # 이미 삭제된 항목도 성공으로 처리 (재전송 대비)
+        for obj in queryset.filter(id=object_id):
+            obj.delete()
+        return {'status': 'ok', 'id': object_id}
+
+    instance = None
+    if object_id is not None:
+        instance = queryset.filter(id=object_id).first()
+        if instance is None:
+            return {'status': 'error', 'error': '존재하지 않는 항목입니다.', 'id': object_id}
+    elif entity.natural_key and all(key in data for key in entity.natural_key):
+        instance = queryset.filter(**{key: data[key] for key in entity.natural_key}).first()
+
+    serializer = entity.serializer_class(instance, data=data, partial=instance is not None)
+    if not serializer.is_valid():
+        return {'status': 'error', 'error': serializer.errors}
+    obj = serializer.save(user=user)
+    return {'status': 'ok', 'id': obj.id}
+
+
+@transaction.atomic
+def apply_mutations(user, mutations):
+    """
+    클라이언트 변경 묶음 적용
+
+    mutations: [{'client_id', 'entity', 'op': 'upsert'|'delete', 'id', 'data'}, ...]
+    진도 항목의 data는 update_bible_progress와 같은 {plan_id, schedule_ids, action}이며 모아서 한 번에 저장한다.
+    예상하지 못한 오류가 나면 묶음 전체를 되돌린다 (재전송 시 노트/ID 없는 upsert 중복 방지).
+
+    Returns:
+        항목별 결과 목록 (요청 순서)
+    """
+    results = [None] * len(mutations)
+    progress_changes = []
+
+    for index, mutation in enumerate(mutations):
+        name = mutation.get('entity')
+        result = {'client_id': mutation.get('client_id'), 'entity': name}
+
+        if name == PROGRESS_ENTITY:
+            try:
+                progress_changes.append((index, parse_progress_change(mutation.get('data') or {})))
+                results[index] = result
+            except ProgressUpdateError as e:
+                results[index] = {**result, 'status': 'error', 'error': str(e)}
+            continue
+
+        if name not in SYNC_ENTITIES:
+            results[index] = {**result, 'status': 'error', 'error': '지원하지 않는 항목입니다.'}
+            continue
+
+        try:
+            with transaction.atomic():
+                result.update(_apply_entity_mutation(user, mutation))
+        except IntegrityError:
+            result.update({'status': 'error', 'error': '이미 존재하는 항목입니다.'})
+        results[index] = result
+
+    if progress_changes:
+        try:
+            apply_progress_batch(user, [change for _, change in progress_changes])
+            status, error = 'ok', None
+        except ProgressUpdateError as e:
+            status, error = 'error', str(e)
+        for index, _ in progress_changes:
+            results[index].update({'status': status} if error is None else {'status': status, 'error': error})
+
+    return results
@@ -1,9 +1,24 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
-from .models import PlanSubscription, UserPlanDisplaySettings, UserBibleProgress
+from .models import (
+    PlanSubscription, UserPlanDisplaySettings, UserBibleProgress, DailyBibleSchedule, GroupMembership,
+    BibleBookmark, BibleHighlight, ReflectionNote, PersonalReadingRecord, SyncChange, FriendActivity
+)
 from .constants import PLAN_COLORS
-from accounts.services.achievement_service import AchievementService
+from .services.stats_recompute import mark_user_stats_dirty
+from .services.plan_metadata import invalidate_plan_metadata
+from .services.progress_snapshot import invalidate_progress_snapshot
+from .services.calendar_projection import bump_calendar, bump_calendar_schedules
+from .services.progress_writer import progress_changed
+from .services.change_log import record_change
+from .services.scoreboard_cache import group_namespace, user_namespace
+from .services.group_membership import decrement_member_count
+from .services.activity_feed import invalidate_timeline, record_activity, record_reading
+from accounts.achievement_config import ALL_BIBLE_BOOKS
+from accounts.models import Follow, UserAchievement
+from utils.cache import bump_generation
 
 
 @receiver(post_save, sender=PlanSubscription)
@@ -26,13 +41,158 @@ def create_display_settings(sender, instance, created, **kwargs):
 @receiver(post_save, sender=UserBibleProgress)
 def update_stats_and_achievements(sender, instance, **kwargs):
     """
-    성경 읽기 완료 시 프로필 통계 및 업적 업데이트
+    성경 읽기 진도 변경 시 프로필 통계, 책 완독 현황 및 업적 업데이트 예약
+    - 요청 경로에서는 dirty 마커만 남기고, 재계산은 Celery 태스크에서 병합 처리
+    - 완독 현황은 진도가 바뀐 책만 다시 집계
     """
-    if instance.is_completed:
-        user = instance.subscription.user
+    user_id = instance.subscription.user_id
+    book = instance.schedule.book
+    transaction.on_commit(lambda: mark_user_stats_dirty(user_id, books=[book]))
 
-        # 프로필 통계 업데이트
-        AchievementService.update_user_stats(user)
 
-        # 업적 확인 및 부여
-        AchievementService.check_and_grant_achievements(user)
+@receiver(post_save, sender=UserBibleProgress)
+def invalidate_progress_snapshot_on_progress(sender, instance, **kwargs):
+    """
+    update_bible_progress 외의 경로로 진도가 저장되면 완료 비트맵 무효화 (같은 트랜잭션에서 처리)
+    - 진도 삭제는 구독 취소(비트맵도 CASCADE 삭제)와 스케줄 삭제(플랜 signature 변경)로만 발생하므로
+      post_delete는 연결하지 않음 (연결하면 일괄 삭제 시 행을 모두 조회하게 됨)
+    """
+    invalidate_progress_snapshot(instance.subscription_id)
+    user_id = instance.subscription.user_id
+    record_change(user_id, 'progress', instance.schedule_id)
+    transaction.on_commit(lambda: bump_calendar(user_id))
+
+
+@receiver(progress_changed)
+def handle_progress_batch(sender, user_id, subscription_ids, books, **kwargs):
+    """
+    일괄 진도 저장(요청당 한 번, 커밋 후 발생) 시 통계 재계산 예약 및 캘린더 캐시 무효화
+    - 완료 비트맵은 저장과 같은 트랜잭션에서 이미 갱신됨
+    """
+    mark_user_stats_dirty(user_id, books=books)
+    bump_calendar(user_id)
+
+
+@receiver(progress_changed)
+def record_reading_activity(sender, user_id, completed=0, completed_books=(), **kwargs):
+    """완료한 진도가 있으면 오늘의 친구 활동(읽기)에 합산"""
+    if completed:
+        record_reading(user_id, completed, completed_books)
+
+
+@receiver(post_save, sender=PlanSubscription)
+@receiver(post_delete, sender=PlanSubscription)
+def refresh_book_completions_on_subscription(sender, instance, update_fields=None, **kwargs):
+    """구독 생성/활성 상태 변경/삭제 시 책별 전체 스케줄 수가 달라지므로 완독 현황 재집계 예약"""
+    if update_fields is not None and 'is_active' not in update_fields:
+        return
+    user_id = instance.user_id
+    transaction.on_commit(lambda: mark_user_stats_dirty(user_id, books=ALL_BIBLE_BOOKS))
+
+
+@receiver(post_save, sender=DailyBibleSchedule)
+@receiver(post_delete, sender=DailyBibleSchedule)
+def invalidate_plan_metadata_on_schedule_change(sender, instance, **kwargs):
+    """스케줄 추가/수정/삭제 시 플랜 메타데이터 및 캘린더 캐시 무효화"""
+    plan_id = instance.plan_id
+    transaction.on_commit(lambda: invalidate_plan_metadata(plan_id))
+    transaction.on_commit(bump_calendar_schedules)
+
+
+@receiver(post_save, sender=PlanSubscription)
+@receiver(post_delete, sender=PlanSubscription)
+@receiver(post_save, sender=UserPlanDisplaySettings)
+@receiver(post_delete, sender=UserPlanDisplaySettings)
+def invalidate_calendar_on_subscription_change(sender, instance, **kwargs):
+    """구독/표시 설정(색상, 순서, 표시 여부) 변경 시 해당 사용자의 캘린더 캐시 무효화"""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: bump_calendar(user_id))
+
+
+@receiver(post_save, sender=GroupMembership)
+@receiver(post_delete, sender=GroupMembership)
+def invalidate_group_scoreboard(sender, instance, **kwargs):
+    """그룹 가입/탈퇴 시 그룹 스코어보드 캐시 무효화"""
+    namespaces = (group_namespace(instance.group_id), user_namespace(instance.user_id))
+    transaction.on_commit(lambda: bump_generation(*namespaces))
+
+
+@receiver(post_delete, sender=GroupMembership)
+def decrement_group_member_count(sender, instance, **kwargs):
+    """활성 멤버십 행 삭제(회원 탈퇴 등) 시 그룹 활성 멤버 수 감소 (가입/탈퇴는 services.group_membership)"""
+    if instance.is_active:
+        decrement_member_count(instance.group_id)
+
+
+@receiver(post_save, sender=Follow)
+@receiver(post_delete, sender=Follow)
+def invalidate_friends_scoreboard(sender, instance, **kwargs):
+    """팔로우/언팔로우 시 양쪽 사용자의 친구 스코어보드 캐시 무효화 (상호 팔로우 목록도 바뀜)"""
+    namespaces = (user_namespace(instance.follower_id), user_namespace(instance.following_id))
+    transaction.on_commit(lambda: bump_generation(*namespaces))
+
+
+@receiver(post_save, sender=Follow)
+@receiver(post_delete, sender=Follow)
+def invalidate_feed_timeline(sender, instance, **kwargs):
+    """팔로우/언팔로우 시 팔로우한 사용자의 피드 타임라인을 다시 구성하도록 삭제"""
+    follower_id = instance.follower_id
+    transaction.on_commit(lambda: invalidate_timeline(follower_id))
+
+
+@receiver(post_save, sender=UserAchievement)
+def record_achievement_activity(sender, instance, created, **kwargs):
+    """업적 부여 시 친구 활동 기록"""
+    if created:
+        record_activity(instance.user_id, FriendActivity.VERB_ACHIEVEMENT, instance.id, {
+            'achievement_type': instance.achievement_type,
+            'title': instance.get_achievement_type_display(),
+            'milestone_value': instance.milestone_value,
+        })
+
+
+@receiver(post_save, sender=GroupMembership)
+def record_group_join_activity(sender, instance, created, update_fields=None, **kwargs):
+    """공개 그룹 가입(재가입 포함) 시 친구 활동 기록"""
+    joined = created or (update_fields is not None and 'is_active' in update_fields)
+    if not (joined and instance.is_active and instance.group.is_public):
+        return
+    record_activity(instance.user_id, FriendActivity.VERB_GROUP_JOIN, instance.group_id, {
+        'group_name': instance.group.name,
+        'role': instance.role,
+    })
+
+
+SYNC_ENTITY_MODELS = {
+    BibleBookmark: 'bookmark',
+    BibleHighlight: 'highlight',
+    ReflectionNote: 'note',
+    PersonalReadingRecord: 'reading_record',
+}
+
+
+@receiver(post_save, sender=BibleBookmark)
+@receiver(post_save, sender=BibleHighlight)
+@receiver(post_save, sender=ReflectionNote)
+@receiver(post_save, sender=PersonalReadingRecord)
+def record_sync_upsert(sender, instance, **kwargs):
+    """동기화 변경 로그 기록 (저장과 같은 트랜잭션)"""
+    record_change(instance.user_id, SYNC_ENTITY_MODELS[sender], instance.id)
+
+
+@receiver(post_delete, sender=BibleBookmark)
+@receiver(post_delete, sender=BibleHighlight)
+@receiver(post_delete, sender=ReflectionNote)
+@receiver(post_delete, sender=PersonalReadingRecord)
+def record_sync_delete(sender, instance, **kwargs):
+    """삭제는 tombstone으로 전달되도록 기록"""
+    record_change(instance.user_id, SYNC_ENTITY_MODELS[sender], instance.id, SyncChange.OP_DELETE)
+
+
+@receiver(post_delete, sender=PlanSubscription)
+def record_sync_unsubscribe(sender, instance, **kwargs):
+    """
+    구독 삭제 시 진도는 행별 삭제 시그널 없이 지워지므로 플랜 단위 tombstone 하나로 전달
+    (클라이언트는 해당 plan_id의 진도를 모두 제거)
+    """
+    record_change(instance.user_id, 'subscription', instance.plan_id, SyncChange.OP_DELETE)
@@ -0,0 +1,68 @@
+"""
+오프라인 동기화 API 뷰
+"""
+from django.conf import settings
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .services.sync import apply_mutations, get_changes
+
+
+def _parse_cursor(value):
+    if value in (None, ''):
+        return 0
+    cursor = int(value)
+    if cursor < 0:
+        raise ValueError(cursor)
+    return cursor
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def sync(request):
+    """
+    북마크/하이라이트/묵상노트/개인 읽기 기록/플랜 진도 동기화
+    GET  /api/v1/todos/sync/?cursor=123
+    POST /api/v1/todos/sync/  Body: {"cursor": 123, "mutations": [...]}
+
+    - cursor 이후의 변경만 반환 (cursor가 없거나 만료되었으면 전체, reset=true)
+    - 삭제는 changes.{entity}.deletes에 ID로 전달 (subscription.deletes는 진도를 지울 plan_id)
+    - has_more가 true면 받은 cursor로 바로 다시 요청
+    - POST는 mutations를 먼저 적용하고 항목별 결과(results)와 함께 변경을 반환
+
+    mutations 예시:
+        {"client_id": "a1", "entity": "bookmark", "op": "upsert", "data": {"book": "gen", ...}}
+        {"client_id": "a2", "entity": "highlight", "op": "delete", "id": 12}
+        {"client_id": "a3", "entity": "progress", "data": {"plan_id": 1, "schedule_ids": [42], "action": "complete"}}
+    """
+    source = request.query_params if request.method == 'GET' else request.data
+    try:
+        cursor = _parse_cursor(source.get('cursor'))
+    except (TypeError, ValueError):
+        return Response({
+            'success': False,
+            'error': 'cursor는 0 이상의 숫자여야 합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    results = None
+    if request.method == 'POST':
+        mutations = request.data.get('mutations') or []
+        max_mutations = getattr(settings, 'SYNC_MAX_MUTATIONS', 500)
+        if not isinstance(mutations, list) or not all(isinstance(m, dict) for m in mutations):
+            return Response({
+                'success': False,
+                'error': 'mutations는 객체 목록이어야 합니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if len(mutations) > max_mutations:
+            return Response({
+                'success': False,
+                'error': f'한 번에 최대 {max_mutations}개의 변경만 보낼 수 있습니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        results = apply_mutations(request.user, mutations)
+
+    data = {'success': True, **get_changes(request.user, cursor)}
+    if results is not None:
+        data['results'] = results
+    return Response(data)
@@ -57,3 +57,77 @@ def generate_hasena_summary_task(self):
     except Exception as e:
         logger.error(f"Error in generate_hasena_summary_task: {str(e)}", exc_info=True)
         return {'status': 'error', 'reason': str(e)}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def recompute_user_stats_task(self, user_id, due_at=None):
+    """사용자 프로필 통계 및 업적 재계산 (연속 저장은 하나로 병합)"""
+    from .services.stats_recompute import process_dirty_user, record_queue_lag
+
+    if due_at is not None:
+        record_queue_lag(due_at)
+
+    try:
+        result = process_dirty_user(user_id)
+        return {'status': result, 'user_id': user_id}
+    except Exception as e:
+        logger.error(f"Error in recompute_user_stats_task: {str(e)}", exc_info=True)
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e, args=[user_id, None])
+        return {'status': 'error', 'reason': str(e), 'user_id': user_id}
+
+
+@shared_task(bind=True, max_retries=0)
+def rebuild_leaderboards_task(self):
+    """Redis 리더보드 전체 재구성 (탈퇴/비활성 사용자 정리 등 정합성 복구)"""
+    from django.contrib.auth import get_user_model
+    from .services.leaderboard import rebuild_leaderboards
+
+    try:
+        users = get_user_model().objects.filter(is_active=True).select_related('profile').iterator()
+        count = rebuild_leaderboards(users)
+        logger.info(f"Rebuilt leaderboards for {count} users")
+        return {'status': 'success', 'users': count}
+    except Exception as e:
+        logger.error(f"Error in rebuild_leaderboards_task: {str(e)}", exc_info=True)
+        return {'status': 'error', 'reason': str(e)}
+
+
+@shared_task(bind=True, max_retries=0)
+def prune_sync_changes_task(self):
+    """보관 기간이 지난 동기화 변경 로그 삭제"""
+    from .services.change_log import prune_change_log
+
+    try:
+        deleted = prune_change_log()
+        logger.info(f"Pruned {deleted} sync changes")
+        return {'status': 'success', 'deleted': deleted}
+    except Exception as e:
+        logger.error(f"Error in prune_sync_changes_task: {str(e)}", exc_info=True)
+        return {'status': 'error', 'reason': str(e)}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=10)
+def fan_out_activity_task(self, activity_id):
+    """친구 활동을 팔로워 타임라인에 전달"""
+    from .services.activity_feed import fan_out
+
+    try:
+        count = fan_out(activity_id)
+        return {'status': 'success', 'activity_id': activity_id, 'followers': count}
+    except Exception as e:
+        logger.error(f"Error in fan_out_activity_task: {str(e)}", exc_info=True)
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e)
+        return {'status': 'error', 'reason': str(e), 'activity_id': activity_id}
+
+
+@shared_task
+def import_schedules_task(job_id):
+    """엑셀 일정 가져오기 작업 실행 (오류는 작업 상태에 기록)"""
+    from .services.schedule_import import run_import
+
+    job = run_import(job_id)
+    if job is None:
+        return {'status': 'skipped', 'job_id': job_id}
+    return {'status': job.status, 'job_id': job_id, 'errors': job.error_count}
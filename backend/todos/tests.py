@@ -1,3 +1,1156 @@
-from django.test import TestCase
+"""
+todos 앱 테스트
+"""
 
-# Create your tests here.
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+from fnmatch import fnmatch
+from io import BytesIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from django.db import connection
+from django.db.models.constants import OnConflict
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import Follow, User, UserAchievement, UserProfile
+from accounts.services.achievement_service import AchievementService
+from todos.models import (
+    BibleBookmark, BibleHighlight, BibleReadingPlan, CatchupSchedule, DailyBibleSchedule, GroupMembership,
+    PlanSubscription, ReadingGroup, ReflectionNote, ScheduleImportJob, SubscriptionProgressBitmap, SyncChange,
+    UserBibleProgress
+)
+from todos.services import leaderboard as leaderboard_store
+from todos.services.calendar_projection import bump_calendar
+from todos.services.catchup import calculate_catchup_schedule
+from todos.services.group_membership import add_member
+from todos.services.progress_snapshot import get_progress_snapshot
+from todos.services.progress_writer import progress_changed
+from todos.services.streak import calculate_streaks, SUNDAY_REST_CALENDAR
+from todos.services.plan_metadata import get_plan_metadata
+from todos.scoreboard_views import calculate_progress_rates
+from utils.cache import bump_generation, get_or_rebuild, versioned_key
+from utils.db import upsert_options
+from todos.services.stats_recompute import (
+    mark_user_stats_dirty,
+    process_dirty_user,
+    STATS_DIRTY_KEY,
+)
+
+
+@contextmanager
+def mysql_style_upsert():
+    """
+    MySQL처럼 upsert 충돌 대상을 지정할 수 없는 백엔드 흉내
+
+    대상 없는 ON CONFLICT DO UPDATE(SQLite 3.35+)는 ON DUPLICATE KEY UPDATE처럼 유니크 인덱스로 충돌을 판단한다.
+    """
+    quote = connection.ops.quote_name
+    original = connection.ops.on_conflict_suffix_sql
+
+    def on_conflict_suffix_sql(fields, on_conflict, update_fields, unique_fields):
+        if on_conflict != OnConflict.UPDATE:
+            return original(fields, on_conflict, update_fields, unique_fields)
+        return 'ON CONFLICT DO UPDATE SET ' + ', '.join(
+            f'{quote(field)} = EXCLUDED.{quote(field)}' for field in update_fields
+        )
+
+    with patch.object(connection.features, 'supports_update_conflicts_with_target', False), \
+            patch.object(connection.ops, 'on_conflict_suffix_sql', on_conflict_suffix_sql):
+        yield
+
+
+class StatsRecomputeTest(TestCase):
+    """통계 재계산 디바운스 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='reader', password='pw', nickname='reader')
+
+    @patch('todos.tasks.recompute_user_stats_task.apply_async')
+    def test_burst_enqueues_single_task(self, mock_apply):
+        """연속 저장은 태스크 하나로 병합"""
+        for _ in range(5):
+            mark_user_stats_dirty(self.user.id)
+
+        self.assertEqual(mock_apply.call_count, 1)
+        self.assertIsNotNone(cache.get(STATS_DIRTY_KEY.format(user_id=self.user.id)))
+
+    @patch('todos.services.stats_recompute.get_debounce_seconds', return_value=0)
+    @patch('todos.tasks.recompute_user_stats_task.apply_async')
+    @patch('accounts.services.achievement_service.AchievementService.check_and_grant_achievements')
+    @patch('accounts.services.achievement_service.AchievementService.update_user_stats')
+    def test_process_recomputes_once(self, mock_update, mock_check, mock_apply, _):
+        """dirty 사용자는 한 번만 재계산되고 마커가 해제됨"""
+        mark_user_stats_dirty(self.user.id)
+
+        self.assertEqual(process_dirty_user(self.user.id), 'recomputed')
+        self.assertEqual(process_dirty_user(self.user.id), 'skipped')
+        mock_update.assert_called_once_with(self.user)
+        mock_check.assert_called_once_with(self.user)
+
+
+class StreakEngineTest(TestCase):
+    """연속 일수 계산 테스트"""
+
+    def test_streaks(self):
+        """오늘 미완료면 어제부터, 끊긴 구간은 최장 연속으로만 반영"""
+        today = date(2025, 3, 20)
+        dates = [today - timedelta(days=i) for i in range(1, 4)]
+        dates += [date(2025, 1, 1) + timedelta(days=i) for i in range(10)]
+
+        stats = calculate_streaks(dates, today=today)
+
+        self.assertEqual(stats, (13, 3, 10))
+
+    def test_broken_current_streak(self):
+        """어제도 미완료면 현재 연속은 0"""
+        today = date(2025, 3, 20)
+        stats = calculate_streaks([today - timedelta(days=2)], today=today)
+        self.assertEqual(stats.current_streak, 0)
+
+    def test_sunday_rest_calendar(self):
+        """일요일은 연속을 끊지 않음"""
+        # 2025-03-15 토요일, 2025-03-17 월요일(오늘)
+        stats = calculate_streaks(
+            [date(2025, 3, 14), date(2025, 3, 15)],
+            today=date(2025, 3, 17),
+            calendar=SUNDAY_REST_CALENDAR,
+        )
+        self.assertEqual(stats.current_streak, 2)
+
+
+class StreakQueryBenchmarkTest(TestCase):
+    """3년치 기록 사용자의 통계 갱신 쿼리 수 벤치마크"""
+
+    def test_update_user_stats_query_count(self):
+        user = User.objects.create_user(username='veteran', password='pw', nickname='veteran')
+        plan = BibleReadingPlan.objects.create(name='3년 플랜', created_by=user)
+        subscription = PlanSubscription.objects.create(user=user, plan=plan, start_date=date(2022, 1, 1))
+        today = date.today()
+        schedules = DailyBibleSchedule.objects.bulk_create([
+            DailyBibleSchedule(plan=plan, date=today - timedelta(days=i), book='창세기',
+                               start_chapter=1, end_chapter=1)
+            for i in range(365 * 3)
+        ])
+        UserBibleProgress.objects.bulk_create([
+            UserBibleProgress(subscription=subscription, schedule=schedule, is_completed=True)
+            for schedule in schedules
+        ])
+
+        # 프로필 조회 + 완료 날짜 조회 + 저장
+        with self.assertNumQueries(3):
+            profile = AchievementService.update_user_stats(user)
+
+        self.assertEqual(profile.total_completed_days, 365 * 3)
+        self.assertEqual(profile.current_streak, 365 * 3)
+        self.assertEqual(profile.longest_streak, 365 * 3)
+
+
+class PlanMetadataTest(TestCase):
+    """플랜 스케줄 메타데이터 캐시 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(username='admin', password='pw', nickname='admin')
+        self.plan = BibleReadingPlan.objects.create(name='플랜', created_by=user)
+        DailyBibleSchedule.objects.bulk_create([
+            DailyBibleSchedule(plan=self.plan, date=date(2025, 1, 1), book='창세기', start_chapter=1, end_chapter=3),
+            DailyBibleSchedule(plan=self.plan, date=date(2025, 1, 2), book='창세기', start_chapter=4, end_chapter=5),
+            DailyBibleSchedule(plan=self.plan, date=date(2025, 1, 2), book='마태복음', start_chapter=1, end_chapter=1),
+        ])
+
+    def test_prefix_queries(self):
+        """날짜 기준 누적 스케줄/장 수를 조회 없이 계산"""
+        get_plan_metadata(self.plan.id)
+
+        with self.assertNumQueries(0):
+            metadata = get_plan_metadata(self.plan.id)
+            self.assertEqual(metadata.total_schedules, 3)
+            self.assertEqual(metadata.schedules_until(date(2025, 1, 1)), 1)
+            self.assertEqual(metadata.schedules_on(date(2025, 1, 2)), 2)
+            self.assertEqual(metadata.schedules_before(date(2025, 1, 1)), 0)
+            self.assertEqual(metadata.chapters_until(date(2025, 1, 2)), 6)
+            self.assertEqual(metadata.book_totals['창세기'], {'schedules': 2, 'chapters': 5})
+
+    def test_invalidated_on_schedule_change(self):
+        """스케줄 추가 시 캐시 무효화"""
+        self.assertEqual(get_plan_metadata(self.plan.id).total_schedules, 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            DailyBibleSchedule.objects.create(
+                plan=self.plan, date=date(2025, 1, 3), book='창세기', start_chapter=6, end_chapter=7
+            )
+
+        self.assertEqual(get_plan_metadata(self.plan.id).total_schedules, 4)
+
+
+class ProgressRatesTest(TestCase):
+    """리더보드 진행률 일괄 계산 테스트"""
+
+    def test_constant_queries(self):
+        """사용자 수와 관계없이 쿼리 수가 일정"""
+        cache.clear()
+        today = date.today()
+        users = [
+            User.objects.create_user(username=f'user{i}', password='pw', nickname=f'user{i}')
+            for i in range(5)
+        ]
+        plan = BibleReadingPlan.objects.create(name='플랜', created_by=users[0])
+        schedules = DailyBibleSchedule.objects.bulk_create([
+            DailyBibleSchedule(plan=plan, date=today - timedelta(days=i), book='창세기',
+                               start_chapter=1, end_chapter=1)
+            for i in range(4)
+        ])
+        for i, user in enumerate(users):
+            subscription = PlanSubscription.objects.create(user=user, plan=plan, start_date=today)
+            UserBibleProgress.objects.bulk_create([
+                UserBibleProgress(subscription=subscription, schedule=schedule, is_completed=True)
+                for schedule in schedules[:i]
+            ])
+        get_plan_metadata(plan.id)
+
+        with self.assertNumQueries(2):
+            rates = calculate_progress_rates([user.id for user in users], plan.id)
+
+        self.assertEqual([rates[user.id] for user in users], [0, 25.0, 50.0, 75.0, 100.0])
+
+
+class VersionedCacheTest(TestCase):
+    """세대 기반 스코어보드 캐시 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def _build(self):
+        self.calls += 1
+        return {'value': self.calls}
+
+    def test_bump_invalidates(self):
+        """세대가 올라가기 전까지는 재계산하지 않음"""
+        for _ in range(3):
+            get_or_rebuild('board', self._build, namespaces=('plan:1',))
+        self.assertEqual(self.calls, 1)
+
+        bump_generation('plan:1')
+
+        self.assertEqual(get_or_rebuild('board', self._build, namespaces=('plan:1',)), {'value': 2})
+
+    def test_serves_stale_while_rebuilding(self):
+        """다른 워커가 재계산 중이면 이전 값을 제공"""
+        get_or_rebuild('board', self._build, namespaces=('plan:1',))
+        bump_generation('plan:1')
+        cache.add(versioned_key('board', 'plan:1') + ':lock', 1)
+
+        self.assertEqual(get_or_rebuild('board', self._build, namespaces=('plan:1',)), {'value': 1})
+        self.assertEqual(self.calls, 1)
+
+
+class CatchupDistributionTest(TestCase):
+    """따라잡기 분배 엔진 테스트"""
+
+    def _schedules(self, chapters):
+        return [
+            DailyBibleSchedule(id=i + 1, date=date(2025, 1, 1) + timedelta(days=i), book='창세기',
+                               start_chapter=1, end_chapter=count)
+            for i, count in enumerate(chapters)
+        ]
+
+    def test_daily_and_weekend_limits(self):
+        # 2025-01-03은 금요일, 01-04/05는 주말
+        distributed, remaining = calculate_catchup_schedule(
+            self._schedules([1] * 8),
+            start_date=date(2025, 1, 3),
+            max_daily_readings=2,
+            weekend_multiplier=1.5
+        )
+
+        self.assertEqual([len(day['items']) for day in distributed], [2, 3, 3])
+        self.assertEqual(remaining, [])
+
+    def test_chapter_limit_and_oversized_schedule(self):
+        """장 수 제한을 넘는 스케줄도 하루에 하나씩은 배정"""
+        distributed, _ = calculate_catchup_schedule(
+            self._schedules([2, 2, 5, 1]),
+            start_date=date(2025, 1, 6),
+            max_daily_chapters=4
+        )
+
+        self.assertEqual([day['total_chapters'] for day in distributed], [4, 5, 1])
+
+    def test_target_date_leaves_remaining(self):
+        distributed, remaining = calculate_catchup_schedule(
+            self._schedules([1] * 5),
+            start_date=date(2025, 1, 6),
+            target_date=date(2025, 1, 7),
+            max_daily_readings=2
+        )
+
+        self.assertEqual(len(distributed), 2)
+        self.assertEqual([s.id for s in remaining], [5])
+
+
+class CatchupCreateBenchmarkTest(TestCase):
+    """365일 밀린 플랜 3개의 따라잡기 세션 생성 쿼리 수 벤치마크"""
+
+    def setUp(self):
+        # 다른 테스트에서 같은 plan_id로 캐시된 메타데이터 제거
+        cache.clear()
+
+    def _create_subscriptions(self, user, overdue_days):
+        today = date.today()
+        subscriptions = []
+        for index in range(3):
+            plan = BibleReadingPlan.objects.create(name=f'플랜{index}', created_by=user)
+            DailyBibleSchedule.objects.bulk_create([
+                DailyBibleSchedule(plan=plan, date=today - timedelta(days=overdue_days - i),
+                                   book='창세기', start_chapter=1, end_chapter=1)
+                for i in range(overdue_days)
+            ])
+            subscriptions.append(PlanSubscription.objects.create(
+                user=user, plan=plan, start_date=today - timedelta(days=overdue_days)
+            ))
+        return subscriptions
+
+    def _create_sessions(self, user, subscriptions):
+        client = APIClient()
+        client.force_authenticate(user)
+        today = date.today()
+        for subscription in subscriptions:
+            response = client.post(
+                f'/api/v1/todos/subscriptions/{subscription.id}/catchup/',
+                {
+                    'name': '따라잡기',
+                    'range_start': (today - timedelta(days=400)).isoformat(),
+                    'range_end': today.isoformat(),
+                    'max_daily_readings': 3,
+                },
+                format='json'
+            )
+            self.assertEqual(response.status_code, 201)
+
+    def test_query_count_independent_of_overdue_days(self):
+        small_user = User.objects.create_user(username='small', password='pw', nickname='small')
+        small = self._create_subscriptions(small_user, overdue_days=10)
+        with CaptureQueriesContext(connection) as small_queries:
+            self._create_sessions(small_user, small)
+
+        user = User.objects.create_user(username='behind', password='pw', nickname='behind')
+        subscriptions = self._create_subscriptions(user, overdue_days=365)
+        with CaptureQueriesContext(connection) as queries:
+            self._create_sessions(user, subscriptions)
+
+        # INSERT 배치 수(DB별 파라미터 제한에 따라 다름)를 제외하면 쿼리 수가 같음
+        table = CatchupSchedule._meta.db_table
+
+        def split(captured):
+            inserts = [q for q in captured if q['sql'].startswith(f'INSERT INTO "{table}"')]
+            return len(captured) - len(inserts), len(inserts)
+
+        fields = [f for f in CatchupSchedule._meta.concrete_fields if not f.primary_key]
+        batch_size = min(500, connection.ops.bulk_batch_size(fields, [None] * 365) or 500)
+        other, inserts = split(queries)
+
+        self.assertEqual(other, split(small_queries)[0])
+        self.assertEqual(inserts, 3 * -(-365 // batch_size))
+        self.assertEqual(CatchupSchedule.objects.filter(session__subscription__user=user).count(), 365 * 3)
+
+
+class ProgressSnapshotTest(TestCase):
+    """구독 진도 스냅샷(완료 비트맵) 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.today = date.today()
+        self.user = User.objects.create_user(username='reader', password='pw', nickname='reader')
+        self.plan = BibleReadingPlan.objects.create(name='플랜', created_by=self.user)
+        self.schedules = DailyBibleSchedule.objects.bulk_create([
+            DailyBibleSchedule(plan=self.plan, date=self.today - timedelta(days=4 - i), book='창세기',
+                               start_chapter=i + 1, end_chapter=i + 2)
+            for i in range(5)
+        ])
+        self.subscription = PlanSubscription.objects.create(
+            user=self.user, plan=self.plan, start_date=self.today - timedelta(days=4)
+        )
+        UserBibleProgress.objects.create(
+            subscription=self.subscription, schedule=self.schedules[1], is_completed=True
+        )
+
+    def test_overdue_from_bitmap(self):
+        snapshot = get_progress_snapshot(self.subscription)
+
+        # 오늘(인덱스 4) 스케줄은 밀린 것이 아님
+        self.assertEqual(snapshot.overdue_indices, [0, 2, 3])
+        self.assertEqual(snapshot.chapters(snapshot.overdue_indices), 6)
+        self.assertEqual(snapshot.last_incomplete_until(self.today), 4)
+
+        with self.assertNumQueries(0):
+            get_progress_snapshot(self.subscription)
+
+    def test_invalidated_on_progress_update(self):
+        get_progress_snapshot(self.subscription)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.post('/api/v1/todos/reading/update/', {
+                'plan_id': self.plan.id,
+                'schedule_ids': [self.schedules[0].id],
+                'action': 'complete',
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        # 비트맵은 요청 안에서 직접 갱신되므로 재계산 없이 반영됨
+        subscription = PlanSubscription.objects.select_related('progress_bitmap').get(pk=self.subscription.pk)
+        with self.assertNumQueries(0):
+            snapshot = get_progress_snapshot(subscription)
+        self.assertEqual(snapshot.overdue_indices, [2, 3])
+
+    def test_bitmap_rebuilt_after_invalidation(self):
+        get_progress_snapshot(self.subscription)
+        # 시그널 경로(개별 저장)는 비트맵을 무효화
+        UserBibleProgress.objects.create(
+            subscription=self.subscription, schedule=self.schedules[0], is_completed=True
+        )
+        bitmap = SubscriptionProgressBitmap.objects.get(pk=self.subscription.pk)
+        self.assertIsNone(bitmap.bits)
+
+        subscription = PlanSubscription.objects.select_related('progress_bitmap').get(pk=self.subscription.pk)
+        snapshot = get_progress_snapshot(subscription)
+        self.assertEqual(snapshot.completed_count, 2)
+        self.assertEqual(snapshot.first_incomplete(), 2)
+        self.assertTrue(snapshot.is_schedule_completed(self.schedules[1].id))
+        self.assertIsNotNone(SubscriptionProgressBitmap.objects.get(pk=self.subscription.pk).bits)
+
+    def test_next_reading_position(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.get('/api/v1/todos/next-position/', {'plan_id': self.plan.id})
+        self.assertEqual(response.data['status'], 'next_incomplete')
+        self.assertEqual(response.data['schedule_id'], self.schedules[0].id)
+
+        client.post('/api/v1/todos/reading/update/', {
+            'plan_id': self.plan.id,
+            'schedule_ids': [s.id for s in self.schedules],
+            'action': 'complete',
+        }, format='json')
+        response = client.get('/api/v1/todos/next-position/', {'plan_id': self.plan.id})
+        self.assertEqual(response.data['status'], 'all_completed')
+        self.assertEqual(response.data['schedule_id'], self.schedules[-1].id)
+
+    def test_catchup_status(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.get(f'/api/v1/todos/subscriptions/{self.subscription.id}/catchup-status/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['overdue_count'], 3)
+        self.assertEqual(response.data['overdue_chapters'], 6)
+
+
+class CalendarGridTest(TestCase):
+    """멀티 플랜 캘린더 구성 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='cal', password='pw', nickname='cal')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _subscribe(self, name, order, days=28):
+        plan = BibleReadingPlan.objects.create(name=name, created_by=self.user)
+        schedules = DailyBibleSchedule.objects.bulk_create([
+            DailyBibleSchedule(plan=plan, date=date(2025, 1, 1) + timedelta(days=i * 13), book='창세기',
+                               start_chapter=i + 1, end_chapter=i + 1)
+            for i in range(days)
+        ])
+        subscription = PlanSubscription.objects.create(user=self.user, plan=plan, start_date=date(2025, 1, 1))
+        subscription.display_settings.display_order = order
+        subscription.display_settings.save()
+        UserBibleProgress.objects.create(subscription=subscription, schedule=schedules[0], is_completed=True)
+        return plan
+
+    def _month_queries(self):
+        # 플랜 메타데이터/완료 비트맵 준비 후 캘린더 캐시만 무효화
+        # (TestCase에서는 on_commit 무효화가 실행되지 않으므로 직접 bump)
+        bump_calendar(self.user.id)
+        self.client.get('/api/v1/todos/calendar/month/', {'year': 2025, 'month': 1})
+        bump_calendar(self.user.id)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/todos/calendar/month/', {'year': 2025, 'month': 1})
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_constant_queries_and_display_order(self):
+        first = self._subscribe('첫째', order=1)
+        single_count, _ = self._month_queries()
+
+        second = self._subscribe('둘째', order=0)
+        self._subscribe('셋째', order=2)
+        count, response = self._month_queries()
+
+        self.assertEqual(count, single_count)
+        items = response.data['calendar']['2025-01-01']
+        self.assertEqual([item['plan_name'] for item in items], ['둘째', '첫째', '셋째'])
+        self.assertTrue(all(item['is_completed'] for item in items))
+        self.assertEqual(
+            [s['plan_id'] for s in response.data['settings']][:2], [second.id, first.id]
+        )
+
+    def test_year_view(self):
+        self._subscribe('첫째', order=0)
+        month_count, _ = self._month_queries()
+
+        bump_calendar(self.user.id)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/todos/calendar/year/', {'year': 2025})
+
+        self.assertEqual(len(ctx.captured_queries), month_count)
+        months = response.data['calendar']
+        self.assertEqual(len(months), 12)
+        self.assertEqual(sum(len(days) for days in months.values()), 28)
+        self.assertIn('2025-02-09', months[2])
+
+    def test_year_view_rejects_out_of_range_year(self):
+        for year in (0, 10000, 'abc'):
+            response = self.client.get('/api/v1/todos/calendar/year/', {'year': year})
+            self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/todos/calendar/year/', {'year': 9999}).status_code, 200)
+
+    def test_profile_calendar_cached_until_progress_write(self):
+        plan = self._subscribe('첫째', order=0)
+        viewer = APIClient()
+        url = f'/api/v1/accounts/profile/{self.user.id}/calendar/'
+        params = {'year': 2025, 'month': 1}
+
+        response = viewer.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        entries = response.data['data']['calendar']
+        self.assertEqual(entries[0]['schedule_text'], '창 1')
+        self.assertEqual([e['is_completed'] for e in entries], [True, False, False])
+
+        # 두 번째 조회는 캘린더 쿼리 없이 캐시에서 응답 (프로필 확인 쿼리만)
+        with CaptureQueriesContext(connection) as ctx:
+            viewer.get(url, params)
+        self.assertFalse(any('todos_dailybibleschedule' in q['sql'].lower() for q in ctx.captured_queries))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/v1/todos/reading/update/', {
+                'plan_id': plan.id,
+                'schedule_ids': [entries[1]['schedule_id']],
+                'action': 'complete',
+            }, format='json')
+
+        response = viewer.get(url, params)
+        self.assertEqual([e['is_completed'] for e in response.data['data']['calendar']], [True, True, False])
+
+
+class BulkProgressTest(TestCase):
+    """진도 일괄 저장(upsert) 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='bulk', password='pw', nickname='bulk')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.plans = []
+        self.schedules = []
+        for index in range(2):
+            plan = BibleReadingPlan.objects.create(name=f'플랜{index}', created_by=self.user)
+            self.schedules.append(DailyBibleSchedule.objects.bulk_create([
+                DailyBibleSchedule(plan=plan, date=date(2025, 1, 1) + timedelta(days=i), book='창세기',
+                                   start_chapter=i + 1, end_chapter=i + 1)
+                for i in range(3)
+            ]))
+            PlanSubscription.objects.create(user=self.user, plan=plan, start_date=date(2025, 1, 1))
+            self.plans.append(plan)
+
+    def _post(self, changes):
+        events = []
+
+        def receiver(sender, **kwargs):
+            events.append(kwargs)
+
+        progress_changed.connect(receiver)
+        try:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post('/api/v1/todos/reading/bulk/', {'changes': changes}, format='json')
+        finally:
+            progress_changed.disconnect(receiver)
+        return response, events
+
+    def test_multi_plan_batch_is_idempotent(self):
+        changes = [
+            {'plan_id': self.plans[0].id, 'schedule_ids': [s.id for s in self.schedules[0]], 'action': 'complete'},
+            {'plan_id': self.plans[1].id, 'schedule_ids': [self.schedules[1][0].id], 'action': 'complete'},
+        ]
+        response, events = self._post(changes)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['created'], response.data['updated'], response.data['unchanged']), (4, 0, 0))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['books'], ['창세기'])
+
+        completed_at = UserBibleProgress.objects.get(schedule=self.schedules[0][0]).completed_at
+        self.assertIsNotNone(completed_at)
+
+        response, events = self._post(changes)
+        self.assertEqual((response.data['created'], response.data['updated'], response.data['unchanged']), (0, 0, 4))
+        self.assertEqual(events, [])
+        self.assertEqual(UserBibleProgress.objects.get(schedule=self.schedules[0][0]).completed_at, completed_at)
+
+        response, _ = self._post([
+            {'plan_id': self.plans[0].id, 'schedule_ids': [self.schedules[0][1].id], 'action': 'cancel'},
+        ])
+        self.assertEqual(response.data['updated'], 1)
+        progress = UserBibleProgress.objects.get(schedule=self.schedules[0][1])
+        self.assertFalse(progress.is_completed)
+        self.assertIsNone(progress.completed_at)
+        self.assertEqual(UserBibleProgress.objects.count(), 4)
+
+        subscription = PlanSubscription.objects.get(user=self.user, plan=self.plans[0])
+        snapshot = get_progress_snapshot(subscription)
+        self.assertEqual(snapshot.completed_count, 2)
+        self.assertEqual(snapshot.first_incomplete(), 1)
+
+    def test_upsert_without_conflict_target(self):
+        schedule_ids = [s.id for s in self.schedules[0]]
+        self._post([{'plan_id': self.plans[0].id, 'schedule_ids': schedule_ids[:2], 'action': 'complete'}])
+
+        # MySQL: unique_fields 없이 유니크 제약으로 갱신/생성
+        with mysql_style_upsert():
+            self.assertNotIn('unique_fields', upsert_options(['subscription', 'schedule'], ['is_completed']))
+            response, _ = self._post([
+                {'plan_id': self.plans[0].id, 'schedule_ids': schedule_ids[1:], 'action': 'cancel'},
+            ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['created'], response.data['updated']), (1, 1))
+        self.assertEqual(UserBibleProgress.objects.count(), 3)
+        self.assertEqual(
+            list(UserBibleProgress.objects.order_by('schedule_id').values_list('is_completed', flat=True)),
+            [True, False, False]
+        )
+
+    def test_invalid_batch_saves_nothing(self):
+        response, events = self._post([
+            {'plan_id': self.plans[0].id, 'schedule_ids': [self.schedules[0][0].id], 'action': 'complete'},
+            {'plan_id': self.plans[0].id, 'schedule_ids': [self.schedules[1][0].id], 'action': 'complete'},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(events, [])
+        self.assertFalse(UserBibleProgress.objects.exists())
+
+
+@override_settings(SYNC_SETTLE_SECONDS=0)
+class SyncTest(TestCase):
+    """오프라인 동기화(delta sync) 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='sync', password='pw', nickname='sync')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.bookmark = BibleBookmark.objects.create(user=self.user, bookmark_type='chapter', book='gen', chapter=1)
+        self.note = ReflectionNote.objects.create(user=self.user, book='gen', chapter=1, content='묵상')
+
+    def _sync(self, cursor=None, mutations=None):
+        if mutations is None:
+            response = self.client.get('/api/v1/todos/sync/', {'cursor': cursor or ''})
+        else:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    '/api/v1/todos/sync/', {'cursor': cursor, 'mutations': mutations}, format='json'
+                )
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_snapshot_then_delta_with_tombstones(self):
+        data = self._sync()
+        self.assertTrue(data['reset'])
+        self.assertEqual([b['id'] for b in data['changes']['bookmark']['upserts']], [self.bookmark.id])
+        cursor = data['cursor']
+
+        self.assertEqual(self._sync(cursor)['changes']['bookmark']['upserts'], [])
+
+        note_id = self.note.id
+        self.bookmark.title = '창조'
+        self.bookmark.save()
+        self.note.delete()
+        highlight = BibleHighlight.objects.create(user=self.user, book='gen', chapter=1, start_verse=1, end_verse=2)
+
+        data = self._sync(cursor)
+        self.assertFalse(data['reset'])
+        changes = data['changes']
+        self.assertEqual([b['title'] for b in changes['bookmark']['upserts']], ['창조'])
+        self.assertEqual(changes['note']['deletes'], [note_id])
+        self.assertEqual([h['id'] for h in changes['highlight']['upserts']], [highlight.id])
+        self.assertGreater(data['cursor'], cursor)
+
+    def test_mutations_batch(self):
+        plan = BibleReadingPlan.objects.create(name='플랜', created_by=self.user)
+        schedule = DailyBibleSchedule.objects.create(
+            plan=plan, date=date(2025, 1, 1), book='창세기', start_chapter=1, end_chapter=1
+        )
+        PlanSubscription.objects.create(user=self.user, plan=plan, start_date=date(2025, 1, 1))
+        cursor = self._sync()['cursor']
+
+        data = self._sync(cursor, [
+            {'client_id': 'a', 'entity': 'highlight', 'op': 'upsert',
+             'data': {'book': 'exo', 'chapter': 3, 'start_verse': 1, 'end_verse': 4}},
+            {'client_id': 'b', 'entity': 'note', 'op': 'delete', 'id': self.note.id},
+            {'client_id': 'c', 'entity': 'progress',
+             'data': {'plan_id': plan.id, 'schedule_ids': [schedule.id], 'action': 'complete'}},
+            {'client_id': 'd', 'entity': 'unknown'},
+        ])
+
+        self.assertEqual([r['status'] for r in data['results']], ['ok', 'ok', 'ok', 'error'])
+        changes = data['changes']
+        self.assertEqual(changes['highlight']['upserts'][0]['id'], data['results'][0]['id'])
+        self.assertEqual(changes['note']['deletes'], [self.note.id])
+        self.assertEqual(changes['progress']['upserts'][0]['schedule_id'], schedule.id)
+        self.assertTrue(changes['progress']['upserts'][0]['is_completed'])
+
+        # 재전송해도 같은 결과 (진도는 변경 없음)
+        self._sync(data['cursor'], [
+            {'client_id': 'c', 'entity': 'progress',
+             'data': {'plan_id': plan.id, 'schedule_ids': [schedule.id], 'action': 'complete'}},
+        ])
+        self.assertEqual(UserBibleProgress.objects.count(), 1)
+
+    def test_unexpected_error_rolls_back_batch(self):
+        plan = BibleReadingPlan.objects.create(name='플랜', created_by=self.user)
+        schedule = DailyBibleSchedule.objects.create(
+            plan=plan, date=date(2025, 1, 1), book='창세기', start_chapter=1, end_chapter=1
+        )
+        PlanSubscription.objects.create(user=self.user, plan=plan, start_date=date(2025, 1, 1))
+
+        with patch('todos.services.sync.apply_progress_batch', side_effect=RuntimeError('boom')), \
+                self.assertRaises(RuntimeError):
+            self.client.post('/api/v1/todos/sync/', {'mutations': [
+                {'client_id': 'a', 'entity': 'note', 'op': 'upsert',
+                 'data': {'book': 'exo', 'chapter': 1, 'content': '새 묵상'}},
+                {'client_id': 'b', 'entity': 'bookmark', 'op': 'delete', 'id': self.bookmark.id},
+                {'client_id': 'c', 'entity': 'progress',
+                 'data': {'plan_id': plan.id, 'schedule_ids': [schedule.id], 'action': 'complete'}},
+            ]}, format='json')
+
+        # 재전송해도 중복되지 않도록 앞선 항목까지 모두 되돌림
+        self.assertEqual(ReflectionNote.objects.filter(user=self.user).count(), 1)
+        self.assertTrue(BibleBookmark.objects.filter(id=self.bookmark.id).exists())
+
+    def test_expired_cursor_resets(self):
+        cursor = self._sync()['cursor']
+        BibleBookmark.objects.create(user=self.user, bookmark_type='chapter', book='exo', chapter=1)
+        BibleBookmark.objects.create(user=self.user, bookmark_type='chapter', book='lev', chapter=1)
+        # 보관 기간이 지나 cursor 이후 로그 일부가 삭제된 상황
+        SyncChange.objects.filter(id__lte=SyncChange.objects.order_by('-id')[1].id).delete()
+
+        data = self._sync(cursor)
+        self.assertTrue(data['reset'])
+        self.assertEqual(len(data['changes']['bookmark']['upserts']), 3)
+
+
+class GroupListTest(TestCase):
+    """그룹 멤버 수 카운터와 목록 조회 테스트"""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pw', nickname='owner')
+        self.plan = BibleReadingPlan.objects.create(name='그룹 플랜', created_by=self.owner)
+        self.client = APIClient()
+
+    def _create_group(self, name, max_members=50):
+        self.client.force_authenticate(self.owner)
+        response = self.client.post('/api/v1/todos/groups/create/', {
+            'name': name, 'plan_ids': [self.plan.id], 'is_public': True, 'max_members': max_members
+        }, format='json')
+        return ReadingGroup.objects.get(id=response.data['group']['id'])
+
+    def test_member_count_on_join_leave_and_capacity(self):
+        group = self._create_group('정원 2', max_members=2)
+        self.assertEqual(group.member_count, 1)
+
+        member = User.objects.create_user(username='m1', password='pw', nickname='m1')
+        other = User.objects.create_user(username='m2', password='pw', nickname='m2')
+        self.client.force_authenticate(member)
+        self.assertEqual(self.client.post(f'/api/v1/todos/groups/{group.id}/join/').status_code, 201)
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.post(f'/api/v1/todos/groups/{group.id}/join/').status_code, 400)
+
+        # 탈퇴는 한 번만 반영, 재가입 시 다시 증가
+        self.client.force_authenticate(member)
+        self.client.post(f'/api/v1/todos/groups/{group.id}/leave/')
+        self.client.post(f'/api/v1/todos/groups/{group.id}/leave/')
+        group.refresh_from_db()
+        self.assertEqual(group.member_count, 1)
+        self.client.post(f'/api/v1/todos/groups/{group.id}/join/')
+        group.refresh_from_db()
+        self.assertEqual(group.member_count, 2)
+
+        # 활성 멤버십 행 삭제(회원 탈퇴)도 반영
+        member.delete()
+        group.refresh_from_db()
+        self.assertEqual(group.member_count, 1)
+        self.assertEqual(group.member_count, GroupMembership.objects.filter(group=group, is_active=True).count())
+
+    def test_list_query_count_and_cursor(self):
+        for index in range(5):
+            self._create_group(f'그룹{index}')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/todos/groups/?limit=3')
+        # 그룹 + 플랜 + 내 멤버십 (그룹 수와 무관)
+        self.assertLessEqual(len(ctx.captured_queries), 4)
+        self.assertEqual(len(response.data['groups']), 3)
+        self.assertTrue(response.data['has_more'])
+        self.assertTrue(all(group['is_member'] for group in response.data['groups']))
+        self.assertEqual(response.data['groups'][0]['member_count'], 1)
+
+        response = self.client.get(f"/api/v1/todos/groups/?limit=3&cursor={response.data['next_cursor']}")
+        self.assertEqual([group['name'] for group in response.data['groups']], ['그룹1', '그룹0'])
+        self.assertFalse(response.data['has_more'])
+        self.assertIsNone(response.data['next_cursor'])
+
+
+class FriendFeedTest(TestCase):
+    """친구 활동 피드 테스트 (Redis가 아닌 캐시 백엔드에서는 DB에서 모음)"""
+
+    def setUp(self):
+        cache.clear()
+        self.me = User.objects.create_user(username='me', password='pw', nickname='me')
+        self.friend = User.objects.create_user(username='friend', password='pw', nickname='friend')
+        self.stranger = User.objects.create_user(username='stranger', password='pw', nickname='stranger')
+        Follow.objects.create(follower=self.me, following=self.friend)
+
+        self.plan = BibleReadingPlan.objects.create(name='피드 플랜', created_by=self.friend)
+        self.schedules = DailyBibleSchedule.objects.bulk_create([
+            DailyBibleSchedule(plan=self.plan, date=date(2025, 1, 1) + timedelta(days=i), book=book,
+                               start_chapter=1, end_chapter=1)
+            for i, book in enumerate(['룻기', '룻기', '요나'])
+        ])
+        PlanSubscription.objects.create(user=self.friend, plan=self.plan, start_date=date(2025, 1, 1))
+        self.client = APIClient()
+
+    def _complete(self, schedules):
+        self.client.force_authenticate(self.friend)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/api/v1/todos/reading/bulk/', {'changes': [
+                {'plan_id': self.plan.id, 'schedule_ids': [s.id for s in schedules], 'action': 'complete'}
+            ]}, format='json')
+
+    def test_feed_collects_followee_activities(self):
+        # 같은 날의 읽기는 한 항목에 합산
+        self._complete(self.schedules[:2])
+        self._complete(self.schedules[2:])
+        UserAchievement.objects.create(user=self.friend, achievement_type='streak_7', milestone_value=7)
+        public = ReadingGroup.objects.create(name='공개 그룹', creator=self.stranger, is_public=True)
+        private = ReadingGroup.objects.create(name='비공개 그룹', creator=self.stranger, is_public=False)
+        add_member(public, self.friend)
+        add_member(private, self.friend)
+        UserAchievement.objects.create(user=self.stranger, achievement_type='streak_7', milestone_value=7)
+
+        self.client.force_authenticate(self.me)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/v1/todos/feed/')
+        # 팔로잉 중 조회 시점 대상 + 활동 ID + 활동/사용자 (항목 수와 무관)
+        self.assertLessEqual(len(ctx.captured_queries), 4)
+
+        # 읽기 완료로 통계 재계산에서 부여된 업적(첫 완독 등)도 포함
+        activities = response.data['activities']
+        self.assertEqual([a['type'] for a in activities[:2]], ['group_join', 'achievement'])
+        self.assertEqual(activities[0]['data']['group_name'], '공개 그룹')
+        self.assertEqual(activities[1]['data']['title'], '7일 연속')
+        readings = [a for a in activities if a['type'] == 'reading']
+        self.assertEqual([a['data'] for a in readings], [{'count': 3, 'books': ['룻기', '요나']}])
+        self.assertTrue(all(a['user']['id'] == self.friend.id for a in activities))
+
+        seen = []
+        cursor = None
+        while True:
+            params = {'limit': 2, **({'cursor': cursor} if cursor else {})}
+            response = self.client.get('/api/v1/todos/feed/', params)
+            seen += [a['id'] for a in response.data['activities']]
+            cursor = response.data['next_cursor']
+            if not response.data['has_more']:
+                break
+        self.assertEqual(seen, [a['id'] for a in activities])
+
+    def test_private_profile_and_unfollow_hide_activities(self):
+        UserAchievement.objects.create(user=self.friend, achievement_type='streak_7', milestone_value=7)
+        self.client.force_authenticate(self.me)
+        self.assertEqual(len(self.client.get('/api/v1/todos/feed/').data['activities']), 1)
+
+        UserProfile.objects.filter(user=self.friend).update(is_public=False)
+        self.assertEqual(self.client.get('/api/v1/todos/feed/').data['activities'], [])
+
+        UserProfile.objects.filter(user=self.friend).update(is_public=True)
+        Follow.objects.filter(follower=self.me).delete()
+        self.assertEqual(self.client.get('/api/v1/todos/feed/').data['activities'], [])
+
+
+class InMemoryRedis:
+    """리더보드 테스트용 Redis 대역 (사용하는 Sorted Set 명령만, 파이프라인은 즉시 실행)"""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    def scan_iter(self, match):
+        return [key for key in list(self.data) if fnmatch(key, match)]
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update({member: float(score) for member, score in mapping.items()})
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.data.get(key, {}).pop(member, None)
+
+    def zscore(self, key, member):
+        return self.data.get(key, {}).get(member)
+
+    def zunionstore(self, dest, keys):
+        union = {}
+        for key in keys:
+            for member, score in self.data.get(key, {}).items():
+                union[member] = union.get(member, 0) + score
+        self.data[dest] = union
+
+    def zrevrange(self, key, start, end, withscores=False):
+        items = sorted(self.data.get(key, {}).items(), key=lambda item: (-item[1], item[0]))
+        items = items[start:end + 1 if end >= 0 else None]
+        return [(member.encode(), score) for member, score in items]
+
+    def zcount(self, key, low, high):
+        exclusive = str(low).startswith('(')
+        low = float(str(low).lstrip('('))
+        return sum(
+            1 for score in self.data.get(key, {}).values()
+            if score > low or (not exclusive and score == low)
+        )
+
+
+class LeaderboardStoreTest(TestCase):
+    """materialized 리더보드(ZSET) 점수와 내 순위 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.redis = InMemoryRedis()
+        patcher = patch('todos.services.leaderboard.get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.plan = BibleReadingPlan.objects.create(
+            name='리더보드 플랜', created_by=User.objects.create_user(username='owner', password='pw', nickname='owner')
+        )
+        self.schedules = DailyBibleSchedule.objects.bulk_create([
+            DailyBibleSchedule(plan=self.plan, date=date(2025, 1, 1) + timedelta(days=i), book='창세기',
+                               start_chapter=i + 1, end_chapter=i + 1)
+            for i in range(10)
+        ])
+        self.alice = self._user('alice')
+        self.bob = self._user('bob')
+
+        today = timezone.now().date()
+        # alice: 오늘 3개, 10일 전 1개 / bob: 오늘 2개, 20일 전 5개
+        self._complete(self.alice, [datetime.combine(today, time(0, 0))] * 3 +
+                       [datetime.combine(today - timedelta(days=10), time(12, 0))])
+        self._complete(self.bob, [datetime.combine(today, time(0, 0))] * 2 +
+                       [datetime.combine(today - timedelta(days=20), time(12, 0))] * 5)
+        UserProfile.objects.filter(user=self.alice).update(total_completed_days=40)
+        UserProfile.objects.filter(user=self.bob).update(total_completed_days=30)
+
+    def _user(self, name):
+        user = User.objects.create_user(username=name, password='pw', nickname=name)
+        PlanSubscription.objects.create(user=user, plan=self.plan, start_date=date(2025, 1, 1))
+        return user
+
+    def _complete(self, user, completed_ats):
+        subscription = PlanSubscription.objects.get(user=user, plan=self.plan)
+        done = UserBibleProgress.objects.filter(subscription=subscription).count()
+        # 신호 없이 저장 (점수는 refresh/rebuild로만 반영)
+        UserBibleProgress.objects.bulk_create([
+            UserBibleProgress(subscription=subscription, schedule=schedule, is_completed=True,
+                              completed_at=completed_at)
+            for schedule, completed_at in zip(self.schedules[done:], completed_ats)
+        ])
+
+    def _rebuild(self):
+        return leaderboard_store.rebuild_leaderboards(User.objects.select_related('profile'))
+
+    def test_rebuild_builds_period_scores(self):
+        self.assertEqual(self._rebuild(), 3)
+        self.assertTrue(leaderboard_store.is_available())
+
+        alice, bob = self.alice.id, self.bob.id
+        self.assertEqual(leaderboard_store.get_top_scores('all', limit=2), [(alice, 40), (bob, 30)])
+        self.assertEqual(leaderboard_store.get_top_scores('week'), [(alice, 3), (bob, 2)])
+        self.assertEqual(leaderboard_store.get_top_scores('month', self.plan.id), [(bob, 7), (alice, 4)])
+        self.assertEqual(leaderboard_store.get_top_scores('month', limit=1), [(bob, 7)])
+        self.assertEqual(leaderboard_store.get_user_score('month', alice), 4)
+        self.assertEqual(leaderboard_store.count_users_ahead('month', 4), 1)
+        self.assertEqual(leaderboard_store.count_users_ahead('week', 3, self.plan.id), 0)
+
+    def test_refresh_updates_and_removes_user(self):
+        self._rebuild()
+        self._complete(self.alice, [timezone.now()] * 2)
+        leaderboard_store.refresh_user_leaderboards(User.objects.get(id=self.alice.id))
+        # 합집합 캐시를 비우고 다시 계산
+        self.redis.delete(*leaderboard_store.get_client().scan_iter('*leaderboard:week:*'))
+        self.assertEqual(leaderboard_store.get_user_score('week', self.alice.id), 5)
+
+        UserProfile.objects.filter(user=self.bob).update(is_public=False)
+        leaderboard_store.refresh_user_leaderboards(User.objects.get(id=self.bob.id))
+        self.assertIsNone(leaderboard_store.get_user_score('all', self.bob.id))
+
+    def test_my_ranking_uses_leaderboard_score(self):
+        # 최근 30일(시각 기준)에는 들어가지만 30일 날짜 버킷에는 없는 완료
+        self._complete(self.alice, [datetime.combine(timezone.now().date() - timedelta(days=30), time(23, 59, 59))])
+        self._rebuild()
+
+        client = APIClient()
+        client.force_authenticate(self.alice)
+        ranking = client.get('/api/v1/todos/scoreboard/my-ranking/', {'period': 'month'}).data['ranking']
+        self.assertEqual((ranking['completed_days'], ranking['rank']), (4, 2))
+
+        ranking = client.get('/api/v1/todos/scoreboard/my-ranking/', {'period': 'week'}).data['ranking']
+        self.assertEqual((ranking['completed_days'], ranking['rank']), (3, 1))
+
+
+class ScheduleImportTest(TestCase):
+    """엑셀 일정 가져오기 작업 테스트 (Celery eager 모드에서 커밋 시 바로 실행)"""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(username='admin', password='pw', nickname='admin', is_staff=True)
+        self.plan = BibleReadingPlan.objects.create(name='가져오기 플랜', created_by=self.admin)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _xlsx(self, rows, header=('날짜', '성경', '시작장', '끝장', '오디오')):
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(header)
+        for row in rows:
+            sheet.append(row)
+        buffer = BytesIO()
+        workbook.save(buffer)
+        return SimpleUploadedFile('schedules.xlsx', buffer.getvalue())
+
+    def _upload(self, rows, update_mode='add', **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/v1/todos/schedules/upload-excel/', {
+                'plan_id': self.plan.id, 'file': self._xlsx(rows, **kwargs), 'update_mode': update_mode
+            }, format='multipart')
+        self.assertEqual(response.status_code, 202)
+        response = self.client.get(f"/api/v1/todos/schedules/import-jobs/{response.data['job']['id']}/")
+        return response.data['job']
+
+    def test_import_validates_rows_and_reports_errors(self):
+        job = self._upload([
+            (datetime(2025, 1, 1), '창세기', 1, 3, 'youtu.be/abc'),
+            ('2025.01.02', '창세기', 4, 6, None),
+            ('2025-01-03', '출애굽기', 1, 2, None),
+            ('2025-13-01', '출애굽기', 3, 4, None),
+            ('2025-01-04', '', 1, 2, None),
+            ('2025-01-05', '레위기', 5, 2, None),
+            ('2025-01-06', '레위기', '일', 2, None),
+            (None, None, None, None, None),
+            ('2025-01-03', '출애굽기', 9, 9, None),
+        ])
+
+        self.assertEqual(job['status'], ScheduleImportJob.STATUS_COMPLETED)
+        self.assertEqual((job['created_count'], job['updated_count'], job['error_count']), (3, 0, 5))
+        self.assertEqual([error['row'] for error in job['errors']], [5, 6, 7, 8, 10])
+        self.assertEqual(job['processed_rows'], job['total_rows'])
+        self.assertEqual(job['progress'], 100)
+        self.assertIsNone(ScheduleImportJob.objects.get(id=job['id']).source)
+
+        first = DailyBibleSchedule.objects.get(plan=self.plan, date=date(2025, 1, 1))
+        self.assertEqual((first.book, first.start_chapter, first.end_chapter), ('창세기', 1, 3))
+        self.assertEqual(first.audio_link, 'https://youtu.be/abc')
+        self.assertEqual(DailyBibleSchedule.objects.get(date=date(2025, 1, 3)).end_chapter, 2)
+
+    def test_update_and_replace_modes(self):
+        self._upload([('2025-01-01', '창세기', 1, 3, None), ('2025-01-02', '창세기', 4, 6, None)])
+
+        # add 모드에서는 같은 날짜/성경이 오류, update 모드에서는 갱신
+        job = self._upload([('2025-01-01', '창세기', 1, 2, None)])
+        self.assertEqual((job['created_count'], job['error_count']), (0, 1))
+        job = self._upload([('2025-01-01', '창세기', 1, 2, None), ('2025-01-01', '마태복음', 1, 1, None)], 'update')
+        self.assertEqual((job['created_count'], job['updated_count']), (1, 1))
+        self.assertEqual(DailyBibleSchedule.objects.get(date=date(2025, 1, 1), book='창세기').end_chapter, 2)
+
+        job = self._upload([('2025-02-01', '요한복음', 1, 1, None)], 'replace')
+        self.assertEqual(job['created_count'], 1)
+        self.assertEqual(list(DailyBibleSchedule.objects.filter(plan=self.plan).values_list('book', flat=True)),
+                         ['요한복음'])
+
+    def test_import_query_count_is_independent_of_rows(self):
+        def run(count):
+            self.plan = BibleReadingPlan.objects.create(name=f'플랜 {count}', created_by=self.admin)
+            rows = [(date(2025, 1, 1) + timedelta(days=i), '시편', 1, 1, None) for i in range(count)]
+            with CaptureQueriesContext(connection) as ctx:
+                job = self._upload(rows)
+            self.assertEqual(job['created_count'], count)
+            return len(ctx.captured_queries)
+
+        # sqlite는 한 INSERT의 변수 수 제한으로 묶음이 더 잘게 나뉘므로 한 묶음 안의 크기로 비교
+        self.assertEqual(run(10), run(100))
+
+    def test_stale_job_is_failed_on_status_check(self):
+        stale = timezone.now() - timedelta(minutes=16)
+        running = ScheduleImportJob.objects.create(
+            plan=self.plan, created_by=self.admin, status=ScheduleImportJob.STATUS_RUNNING, started_at=stale
+        )
+        fresh = ScheduleImportJob.objects.create(
+            plan=self.plan, created_by=self.admin, status=ScheduleImportJob.STATUS_RUNNING,
+            started_at=timezone.now()
+        )
+
+        job = self.client.get(f'/api/v1/todos/schedules/import-jobs/{running.id}/').data['job']
+        self.assertEqual(job['status'], ScheduleImportJob.STATUS_FAILED)
+        self.assertIsNotNone(job['finished_at'])
+        job = self.client.get(f'/api/v1/todos/schedules/import-jobs/{fresh.id}/').data['job']
+        self.assertEqual(job['status'], ScheduleImportJob.STATUS_RUNNING)
+
+    def test_rejects_bad_uploads_without_job(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/v1/todos/schedules/upload-excel/', {
+                'plan_id': self.plan.id, 'file': self._xlsx([], header=('날짜', '성경'))
+            }, format='multipart')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('시작장', response.data['detail'])
+
+        response = self.client.post('/api/v1/todos/schedules/upload-excel/', {
+            'plan_id': self.plan.id, 'file': SimpleUploadedFile('schedules.xlsx', b'not a workbook')
+        }, format='multipart')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ScheduleImportJob.objects.exists())
+
+        self.client.force_authenticate(User.objects.create_user(username='member', password='pw', nickname='member'))
+        self.assertEqual(self.client.get('/api/v1/todos/schedules/import-jobs/1/').status_code, 403)
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views, scoreboard_views, group_views, calendar_views, catchup_views
+from . import views, scoreboard_views, group_views, calendar_views, catchup_views, sync_views, feed_views
 
 router = DefaultRouter()
 router.register(r'bible-plans', views.BibleReadingPlanViewSet)
@@ -17,9 +17,11 @@ urlpatterns = [
     path('schedules/month/', views.get_schedules_for_month, name='schedules-month'),
     path('schedules/today/', views.get_today_schedules, name='schedules-today'),
     path('schedules/upload-excel/', views.upload_schedules_excel, name='upload-schedules-excel'),
+    path('schedules/import-jobs/<int:job_id>/', views.get_schedule_import_job, name='schedule-import-job'),
     
     path('reading/', views.update_bible_progress, name='update_bible_progress'),
     path('reading/update/', views.update_bible_progress, name='update_bible_progress'),
+    path('reading/bulk/', views.bulk_update_bible_progress, name='bulk_update_bible_progress'),
     path('reading/history/', views.get_reading_history, name='progress-history'),
 
     path('plans/', views.get_available_plans, name='available-plans'),
@@ -64,6 +66,9 @@ urlpatterns = [
     path('scoreboard/friends/', scoreboard_views.get_friends_scoreboard, name='friends-scoreboard'),
     path('scoreboard/group/<int:group_id>/', scoreboard_views.get_group_scoreboard, name='group-scoreboard'),
     path('scoreboard/my-ranking/', scoreboard_views.get_my_ranking, name='my-ranking'),
+
+    # 친구 활동 피드
+    path('feed/', feed_views.get_friend_feed, name='friend-feed'),
     
     # 그룹 관련 URL
     path('groups/', group_views.get_groups, name='groups-list'),
@@ -83,8 +88,12 @@ urlpatterns = [
     path('calendar/settings/<int:pk>/', calendar_views.update_calendar_setting, name='calendar-setting-detail'),
     path('calendar/settings/reorder/', calendar_views.reorder_calendar_settings, name='calendar-settings-reorder'),
     path('calendar/month/', calendar_views.get_calendar_month_data, name='calendar-month'),
+    path('calendar/year/', calendar_views.get_calendar_year_data, name='calendar-year'),
     path('calendar/last-incomplete/', calendar_views.get_last_incomplete_positions, name='calendar-last-incomplete'),
 
+    # 오프라인 동기화
+    path('sync/', sync_views.sync, name='sync'),
+
     # 따라잡기(Catchup) 관련 URL
     path('subscriptions/<int:subscription_id>/catchup-status/', catchup_views.catchup_status, name='catchup-status'),
     path('subscriptions/<int:subscription_id>/catchup/preview/', catchup_views.catchup_preview, name='catchup-preview'),
@@ -3,7 +3,7 @@ from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 import pandas as pd
 from datetime import datetime
-from .models import DailyBibleSchedule, UserBibleProgress, BibleReadingPlan, PlanSubscription, VideoBibleIntro, HasenaRecord, UserVideoIntroProgress, VisitorCount
+from .models import DailyBibleSchedule, UserBibleProgress, BibleReadingPlan, PlanSubscription, VideoBibleIntro, HasenaRecord, UserVideoIntroProgress, VisitorCount, ScheduleImportJob
 from .serializers import DailyBibleScheduleSerializer, UserBibleProgressSerializer, BibleProgressResponse, BibleReadingPlanSerializer, PlanSubscriptionSerializer, VideoBibleIntroSerializer
 import logging
 from django.utils import timezone
@@ -17,6 +17,12 @@ from django.utils.dateparse import parse_date
 import re
 from io import BytesIO
 from django.utils.timezone import localtime
+from .services.streak import calculate_streaks, SUNDAY_REST_CALENDAR
+from .services.plan_metadata import get_plan_metadata
+from django.conf import settings
+from .services.progress_snapshot import get_progress_snapshot
+from .services.progress_writer import ProgressUpdateError, apply_progress_batch, parse_progress_change
+from .services.schedule_import import ScheduleImportError, fail_stale_job, serialize_job, start_import
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -113,98 +119,84 @@ def update_bible_progress(request):
     }
     """
     try:
-        plan_id = request.data.get('plan_id')
-        schedule_ids = request.data.get('schedule_ids', [])
-        action = request.data.get('action')
+        change = parse_progress_change(request.data)
+        result = apply_progress_batch(request.user, [change])
 
-        # 필수 파라미터 검증
-        if not all([plan_id, schedule_ids, action]):
-            return Response({
-                'success': False,
-                'error': '필수 파라미터(plan_id, schedule_ids, action)가 누락되었습니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-            
-        if action not in ['complete', 'cancel']:
-            return Response({
-                'success': False,
-                'error': 'action은 complete 또는 cancel이어야 합니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            'success': True,
+            'plan_id': str(change.plan_id),
+            'schedule_ids': [str(id) for id in change.schedule_ids],
+            'is_completed': change.is_completed,
+            'created': result.created,
+            'updated': result.updated,
+            'unchanged': result.unchanged
+        }, status=status.HTTP_200_OK)
 
-        # 1. 스케줄 조회 및 검증
-        try:
-            daily_schedules = DailyBibleSchedule.objects.filter(id__in=schedule_ids)
-            if not daily_schedules.exists():
-                return Response({
-                    'success': False,
-                    'error': '존재하지 않는 스케줄입니다.'
-                }, status=status.HTTP_404_NOT_FOUND)
-        except Exception as e:
-            logger.error(f"Error in update_bible_progress schedule lookup: {str(e)}", exc_info=True)
-            return Response({
-                'success': False,
-                'error': '요청 처리 중 오류가 발생했습니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-            
-        # 2. 스케줄의 plan_id와 요청의 plan_id 일치 여부 검증
-        if daily_schedules.filter(plan_id=plan_id).count() != len(schedule_ids):
-            return Response({
-                'success': False,
-                'error': '스케줄 ID와 플랜 ID가 일치하지 않습니다.'
-            }, status=status.HTTP_400_BAD_REQUEST)
+    except ProgressUpdateError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=e.status_code)
+    except Exception as e:
+        logger.error(f"Error in update_bible_progress: {str(e)}", exc_info=True)
+        return Response({
+            'success': False,
+            'error': '요청 처리 중 오류가 발생했습니다.'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        # 3. 사용자의 플랜 구독 확인
-        try:
-            subscription = PlanSubscription.objects.get(
-                user=request.user,
-                plan_id=plan_id,
-                is_active=True
-            )
-        except PlanSubscription.DoesNotExist:
-            return Response({
-                'success': False,
-                'error': '구독 중인 플랜이 아닙니다.'
-            }, status=status.HTTP_404_NOT_FOUND)
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def bulk_update_bible_progress(request):
+    """
+    여러 플랜의 진도를 한 번에 저장 (오프라인 체크 동기화용)
 
-        # 4. 진도 업데이트 또는 생성 (bulk 연산으로 최적화)
-        is_completed = action == 'complete'
-        with transaction.atomic():
-            # 기존 진도 레코드 조회 (1 쿼리)
-            existing_progress = UserBibleProgress.objects.filter(
-                subscription=subscription,
-                schedule__in=daily_schedules
-            ).select_related('schedule')
+    하나라도 검증에 실패하면 아무것도 저장하지 않습니다.
+    이미 같은 상태인 스케줄은 unchanged로 집계되므로 같은 요청을 다시 보내도 안전합니다.
 
-            existing_schedule_ids = set(p.schedule_id for p in existing_progress)
+    [요청 예시]
+    {
+        "changes": [
+            {"plan_id": 1, "schedule_ids": [42, 43], "action": "complete"},
+            {"plan_id": 2, "schedule_ids": [7], "action": "cancel"}
+        ]
+    }
 
-            # 기존 레코드 bulk update (1 쿼리)
-            if existing_progress.exists():
-                UserBibleProgress.objects.filter(
-                    subscription=subscription,
-                    schedule__in=daily_schedules
-                ).update(is_completed=is_completed)
+    [응답 예시]
+    {
+        "success": true,
+        "created": 2,
+        "updated": 1,
+        "unchanged": 0
+    }
+    """
+    items = request.data.get('changes')
+    if not isinstance(items, list) or not items:
+        return Response({
+            'success': False,
+            'error': 'changes 목록이 필요합니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
 
-            # 새 레코드 bulk create (1 쿼리)
-            new_progress = [
-                UserBibleProgress(
-                    subscription=subscription,
-                    schedule=schedule,
-                    is_completed=is_completed
-                )
-                for schedule in daily_schedules
-                if schedule.id not in existing_schedule_ids
-            ]
-            if new_progress:
-                UserBibleProgress.objects.bulk_create(new_progress)
+    max_items = getattr(settings, 'PROGRESS_BULK_MAX_SCHEDULES', 2000)
+    try:
+        changes = [parse_progress_change(item) for item in items]
+        if sum(len(change.schedule_ids) for change in changes) > max_items:
+            raise ProgressUpdateError(f'한 번에 최대 {max_items}개의 스케줄만 저장할 수 있습니다.')
+        result = apply_progress_batch(request.user, changes)
 
         return Response({
             'success': True,
-            'plan_id': str(plan_id),
-            'schedule_ids': [str(id) for id in schedule_ids],
-            'is_completed': is_completed
-        }, status=status.HTTP_200_OK)
+            'created': result.created,
+            'updated': result.updated,
+            'unchanged': result.unchanged
+        })
 
+    except ProgressUpdateError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=e.status_code)
     except Exception as e:
-        logger.error(f"Error in update_bible_progress: {str(e)}", exc_info=True)
+        logger.error(f"Error in bulk_update_bible_progress: {str(e)}", exc_info=True)
         return Response({
             'success': False,
             'error': '요청 처리 중 오류가 발생했습니다.'
@@ -287,25 +279,16 @@ def get_schedules_for_month(request):
             user=user,
             plan=plan,
             is_active=True
-        ).first()
+        ).select_related('progress_bitmap').first()
         
         if subscription:
-            # schedule을 기준으로 progress 조회
-            progress_records = UserBibleProgress.objects.filter(
-                subscription=subscription,
-                schedule__in=schedules
-            ).select_related('schedule')
-            
-            # schedule_id를 키로 하는 progress 딕셔너리 생성
-            progress_dict = {
-                record.schedule_id: record.is_completed 
-                for record in progress_records
-            }
+            # 완료 여부는 구독 완료 비트맵에서 확인
+            snapshot = get_progress_snapshot(subscription)
             
             schedule_data = []
             for schedule in schedules:
                 schedule_dict = DailyBibleScheduleSerializer(schedule).data
-                schedule_dict['is_completed'] = progress_dict.get(schedule.id, False)
+                schedule_dict['is_completed'] = snapshot.is_schedule_completed(schedule.id)
                 schedule_data.append(schedule_dict)
             
             return Response(schedule_data)
@@ -346,156 +329,8 @@ class DailyBibleScheduleViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['post'])
     def upload_excel(self, request):
-        """엑셀 파일로 세부 일정 대량 업로드"""
-        plan_id = request.data.get('plan_id')
-        file = request.FILES.get('file')
-        update_mode = request.data.get('update_mode', 'add')  # 'add', 'update', 'replace'
-        
-        if not plan_id or not file:
-            return Response(
-                {"detail": "플랜 ID와 파일은 필수 항목입니다."}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        try:
-            # 플랜 존재 여부 확인
-            plan = BibleReadingPlan.objects.get(id=plan_id)
-            
-            # 엑셀 파일 읽기
-            df = pd.read_excel(file)
-            
-            # 필수 열 확인
-            required_columns = ['날짜', '성경', '시작장', '끝장']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                return Response(
-                    {"detail": f"필수 컬럼이 누락되었습니다: {', '.join(missing_columns)}"}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # 기존 일정 관리
-            if update_mode == 'replace':
-                # 기존 일정 모두 삭제
-                DailyBibleSchedule.objects.filter(plan=plan).delete()
-            
-            # 데이터 변환 및 저장
-            success_count = 0
-            error_count = 0
-            errors = []
-            
-            for index, row in df.iterrows():
-                try:
-                    # 날짜 변환
-                    date_str = row['날짜']
-                    if isinstance(date_str, str):
-                        # YYYY-MM-DD 형식이 아닌 경우 변환
-                        if re.match(r'\d{4}\.\d{1,2}\.\d{1,2}', date_str):
-                            date_str = date_str.replace('.', '-')
-                        date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-                    else:
-                        # pandas가 자동으로 datetime으로 변환한 경우
-                        date_obj = date_str.date() if hasattr(date_str, 'date') else date_str
-                    
-                    # 필드 값 추출
-                    book = row['성경']
-                    start_chapter = int(row['시작장'])
-                    end_chapter = int(row['끝장'])
-                    
-                    # URL 필드 처리 개선
-                    audio_link = row.get('오디오', '')
-                    guide_link = row.get('가이드', '')
-
-                    # 데이터 타입 확인 및 변환 
-                    # float 타입이 들어온 경우 처리
-                    if isinstance(audio_link, float) or isinstance(guide_link, float):
-                        logger.info(f"행 {index+2}: float 타입 URL 필드 발견, 변환 시도")
-
-                    # 유효한 URL로 변환
-                    audio_link = self._validate_url(audio_link)
-                    guide_link = self._validate_url(guide_link)
-                    
-                    # 업데이트 모드 처리
-                    if update_mode in ['add', 'replace']:
-                        # 신규 추가
-                        DailyBibleSchedule.objects.create(
-                            plan=plan,
-                            date=date_obj,
-                            book=book,
-                            start_chapter=start_chapter,
-                            end_chapter=end_chapter,
-                            audio_link=audio_link,
-                            guide_link=guide_link
-                        )
-                    else:  # update 모드
-                        # 기존 레코드 업데이트 또는 생성
-                        obj, created = DailyBibleSchedule.objects.update_or_create(
-                            plan=plan,
-                            date=date_obj,
-                            defaults={
-                                'book': book,
-                                'start_chapter': start_chapter,
-                                'end_chapter': end_chapter,
-                                'audio_link': audio_link,
-                                'guide_link': guide_link
-                            }
-                        )
-                    
-                    success_count += 1
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"Error in upload_excel row {index + 2}: {str(e)}", exc_info=True)
-                    errors.append(f"행 {index + 2}: 처리 중 오류가 발생했습니다.")
-            
-            return Response({
-                "detail": f"{success_count}개의 일정이 처리되었습니다. 오류: {error_count}개",
-                "errors": errors if errors else None
-            })
-            
-        except BibleReadingPlan.DoesNotExist:
-            return Response(
-                {"detail": "해당 ID의 플랜을 찾을 수 없습니다."}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-        except Exception as e:
-            logger.error(f"Error in upload_excel: {str(e)}", exc_info=True)
-            return Response(
-                {"detail": "요청 처리 중 오류가 발생했습니다."}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-    def _validate_url(self, url):
-        """URL을 검증하고 필요하면 수정합니다"""
-        # None 값 처리
-        if url is None:
-            return ''
-        
-        # float 타입이면 문자열로 변환
-        if isinstance(url, float):
-            # NaN 체크
-            if pd.isna(url):
-                return ''
-            # 소수점 없는 정수형 숫자로 보이면 정수로 변환 (예: 12.0 -> '12')
-            if url.is_integer():
-                url = str(int(url))
-            else:
-                url = str(url)
-        
-        # 문자열 타입이 아니면 문자열로 변환
-        if not isinstance(url, str):
-            url = str(url)
-        
-        # 공백 제거
-        url = url.strip()
-        
-        # 빈 문자열 처리
-        if url == '':
-            return ''
-        
-        # URL에 스키마가 없으면 https:// 추가
-        if not url.startswith(('http://', 'https://')):
-            return 'https://' + url
-        
-        return url
+        """엑셀 파일로 세부 일정 대량 업로드 (백그라운드 작업)"""
+        return _start_schedule_import(request)
 
     # 추가 디버깅 액션
     @action(detail=False, methods=['get'])
@@ -931,7 +766,7 @@ def get_today_schedules(request):
         
         # 사용자 인증 여부 확인
         user = request.user
-        progress_dict = {}
+        snapshot = None
         
         if user.is_authenticated:
             # 사용자의 구독 확인
@@ -939,20 +774,11 @@ def get_today_schedules(request):
                 user=user,
                 plan_id=plan_id,
                 is_active=True
-            ).first()
+            ).select_related('progress_bitmap').first()
             
             if subscription:
-                # 오늘 일정에 대한 진행 상태 조회
-                progress_records = UserBibleProgress.objects.filter(
-                    subscription=subscription,
-                    schedule__in=schedules
-                )
-                
-                # schedule_id를 키로 하는 progress 딕셔너리 생성
-                progress_dict = {
-                    record.schedule_id: record.is_completed 
-                    for record in progress_records
-                }
+                # 완료 여부는 구독 완료 비트맵에서 확인
+                snapshot = get_progress_snapshot(subscription, today)
         
         # 응답 데이터 구성
         schedule_data = []
@@ -965,7 +791,7 @@ def get_today_schedules(request):
                 'end_chapter': schedule.end_chapter,
                 'audio_link': schedule.audio_link,
                 'guide_link': schedule.guide_link,
-                'is_completed': progress_dict.get(schedule.id, False)
+                'is_completed': bool(snapshot and snapshot.is_schedule_completed(schedule.id))
             }
             schedule_data.append(data)
         
@@ -1136,7 +962,7 @@ def get_next_reading_position(request):
             user=user,
             plan_id=plan_id,
             is_active=True
-        ).first()
+        ).select_related('progress_bitmap').first()
         
         if not subscription:
             # 구독 없으면 비로그인과 동일하게 처리
@@ -1187,40 +1013,31 @@ def get_next_reading_position(request):
                 'message': '플랜에 등록된 일정이 없습니다.'
             })
         
-        # 구독 있는 로그인 사용자: 미완료 스케줄 찾기
-        completed_schedule_ids = UserBibleProgress.objects.filter(
-            subscription=subscription,
-            is_completed=True
-        ).values_list('schedule_id', flat=True)
+        # 구독 있는 로그인 사용자: 완료 비트맵에서 첫 미완료 스케줄 찾기
+        snapshot = get_progress_snapshot(subscription, today)
+        metadata = snapshot.metadata
+        next_index = snapshot.first_incomplete()
         
-        next_schedule = DailyBibleSchedule.objects.filter(
-            plan_id=plan_id
-        ).exclude(
-            id__in=completed_schedule_ids
-        ).order_by('date').first()
-        
-        if next_schedule:
+        if next_index is not None:
+            next_date = metadata.date_at(next_index)
             return Response({
                 'success': True,
                 'status': 'next_incomplete',
-                'month': next_schedule.date.month,
-                'schedule_id': next_schedule.id,
-                'date': next_schedule.date.isoformat()
+                'month': next_date.month,
+                'schedule_id': metadata.schedule_ids[next_index],
+                'date': next_date.isoformat()
             })
         
         # 모든 스케줄 완료
         # 마지막 스케줄 날짜 반환 (UI에서 스크롤 위치용)
-        last_schedule = DailyBibleSchedule.objects.filter(
-            plan_id=plan_id
-        ).order_by('-date').first()
-        
-        if last_schedule:
+        if metadata.total_schedules:
+            last_date = metadata.last_date
             return Response({
                 'success': True,
                 'status': 'all_completed',
-                'month': last_schedule.date.month,
-                'schedule_id': last_schedule.id,
-                'date': last_schedule.date.isoformat(),
+                'month': last_date.month,
+                'schedule_id': metadata.schedule_ids[-1],
+                'date': last_date.isoformat(),
                 'message': '모든 일정을 완료했습니다!'
             })
         
@@ -1911,149 +1728,70 @@ def schedule_detail(request, pk):
 @permission_classes([permissions.IsAuthenticated, permissions.IsAdminUser])
 @parser_classes([MultiPartParser, FormParser])
 def upload_schedules_excel(request):
-    """엑셀 파일로 세부 일정 대량 업로드"""
+    """엑셀 파일로 세부 일정 대량 업로드 (백그라운드 작업)"""
+    return _start_schedule_import(request)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated, permissions.IsAdminUser])
+def get_schedule_import_job(request, job_id):
+    """엑셀 일정 가져오기 작업 상태 조회"""
+    job = fail_stale_job(get_object_or_404(ScheduleImportJob, id=job_id))
+    return Response({'job': serialize_job(job)})
+
+
+def _start_schedule_import(request):
+    """업로드 파일을 확인하고 가져오기 작업 생성 (202, 처리는 Celery 태스크)"""
+    plan_id = request.data.get('plan_id')
+    file = request.FILES.get('file')
+    update_mode = request.data.get('update_mode', 'add')  # 'add', 'update', 'replace'
+
+    if not plan_id or not file:
+        return Response(
+            {"detail": "플랜 ID와 파일은 필수 항목입니다."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    # 파일 확장자 확인 (스트리밍 읽기는 .xlsx만 지원)
+    if not file.name.lower().endswith('.xlsx'):
+        return Response(
+            {"detail": "Excel 파일(.xlsx)만 업로드 가능합니다."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    # 파일 크기 제한 (5MB)
+    if file.size > 5 * 1024 * 1024:
+        return Response(
+            {"detail": "파일 크기는 5MB를 초과할 수 없습니다."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    plan = BibleReadingPlan.objects.filter(id=plan_id).first()
+    if plan is None:
+        return Response(
+            {"detail": "해당 ID의 플랜을 찾을 수 없습니다."},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
     try:
-        plan_id = request.data.get('plan_id')
-        file = request.FILES.get('file')
-        update_mode = request.data.get('update_mode', 'add')  # 'add', 'update', 'replace'
-        
-        if not plan_id or not file:
-            return Response(
-                {"detail": "플랜 ID와 파일은 필수 항목입니다."}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # 파일 확장자 확인
-        file_name = file.name.lower()
-        if not (file_name.endswith('.xlsx') or file_name.endswith('.xls')):
-            return Response(
-                {"detail": "Excel 파일(.xlsx, .xls)만 업로드 가능합니다."}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-            
-        # 파일 크기 제한 (5MB)
-        if file.size > 5 * 1024 * 1024:
-            return Response(
-                {"detail": "파일 크기는 5MB를 초과할 수 없습니다."}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        try:
-            # 플랜 존재 여부 확인
-            plan = BibleReadingPlan.objects.get(id=plan_id)
-            
-            # 엑셀 파일 읽기
-            import pandas as pd
-            import re
-            from datetime import datetime
-            
-            # 날짜 컬럼을 자동으로 datetime 객체로 변환
-            df = pd.read_excel(file)
-            
-            # 필수 열 확인
-            required_columns = ['날짜', '성경', '시작장', '끝장']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                return Response(
-                    {"detail": f"필수 컬럼이 누락되었습니다: {', '.join(missing_columns)}"}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # 기존 일정 관리
-            if update_mode == 'replace':
-                # 기존 일정 모두 삭제
-                DailyBibleSchedule.objects.filter(plan=plan).delete()
-            
-            # 데이터 변환 및 저장
-            success_count = 0
-            error_count = 0
-            errors = []
-            
-            for index, row in df.iterrows():
-                try:
-                    # 날짜 변환
-                    date_str = row['날짜']
-                    if isinstance(date_str, str):
-                        # YYYY-MM-DD 형식이 아닌 경우 변환
-                        if re.match(r'\d{4}\.\d{1,2}\.\d{1,2}', date_str):
-                            date_str = date_str.replace('.', '-')
-                        date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-                    else:
-                        # pandas가 자동으로 datetime으로 변환한 경우
-                        date_obj = date_str.date() if hasattr(date_str, 'date') else date_str
-                    
-                    # 필드 값 추출
-                    book = row['성경']
-                    start_chapter = int(row['시작장'])
-                    end_chapter = int(row['끝장'])
-                    
-                    # URL 필드 처리 개선
-                    audio_link = row.get('오디오', '')
-                    guide_link = row.get('가이드', '')
-
-                    # 데이터 타입 확인 및 변환 
-                    # float 타입이 들어온 경우 처리
-                    if isinstance(audio_link, float) or isinstance(guide_link, float):
-                        if pd.isna(audio_link):
-                            audio_link = ''
-                        if pd.isna(guide_link):
-                            guide_link = ''
-                    
-                    # 업데이트 모드 처리
-                    if update_mode in ['add', 'replace']:
-                        # 신규 추가
-                        DailyBibleSchedule.objects.create(
-                            plan=plan,
-                            date=date_obj,
-                            book=book,
-                            start_chapter=start_chapter,
-                            end_chapter=end_chapter,
-                            audio_link=audio_link,
-                            guide_link=guide_link
-                        )
-                    else:  # update 모드
-                        # 기존 레코드 업데이트 또는 생성
-                        obj, created = DailyBibleSchedule.objects.update_or_create(
-                            plan=plan,
-                            date=date_obj,
-                            defaults={
-                                'book': book,
-                                'start_chapter': start_chapter,
-                                'end_chapter': end_chapter,
-                                'audio_link': audio_link,
-                                'guide_link': guide_link
-                            }
-                        )
-                    
-                    success_count += 1
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"Error in upload_schedules_excel row {index + 2}: {str(e)}", exc_info=True)
-                    errors.append(f"행 {index + 2}: 처리 중 오류가 발생했습니다.")
-            
-            return Response({
-                "detail": f"{success_count}개의 일정이 처리되었습니다. 오류: {error_count}개",
-                "errors": errors if errors else None
-            })
-            
-        except BibleReadingPlan.DoesNotExist:
-            return Response(
-                {"detail": "해당 ID의 플랜을 찾을 수 없습니다."}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-        except Exception as e:
-            logger.error(f"Error in upload_schedules_excel: {str(e)}", exc_info=True)
-            return Response(
-                {"detail": "요청 처리 중 오류가 발생했습니다."}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        with transaction.atomic():
+            job = start_import(plan, request.user, file, update_mode)
+    except ScheduleImportError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
-        logger.error(f"Error in upload_schedules_excel request: {str(e)}", exc_info=True)
+        logger.error(f"Error in upload_schedules_excel: {str(e)}", exc_info=True)
         return Response(
-            {"detail": "요청 처리 중 오류가 발생했습니다."}, 
+            {"detail": "요청 처리 중 오류가 발생했습니다."},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+    # 태스크가 바로 실행된 경우(eager) 결과가 반영되어 있음
+    job.refresh_from_db()
+    return Response(
+        {"detail": job.message or "일정 가져오기를 시작했습니다.", "job": serialize_job(job)},
+        status=status.HTTP_202_ACCEPTED
+    )
+
 @api_view(['GET'])
 @permission_classes([AllowAny])  # IsAuthenticated에서 AllowAny로 변경
 def get_total_users(request):
@@ -2104,28 +1842,21 @@ def get_plan_stats(request):
             is_active=True
         ).count()
 
-        # 오늘의 일정
-        today_schedules = DailyBibleSchedule.objects.filter(
-            plan=plan,
-            date=today
-        )
-
-        # 오늘 일정을 완료한 사용자 수
-        completed_users = set()
-        for schedule in today_schedules:
-            completed_users.update(
-                UserBibleProgress.objects.filter(
-                    schedule=schedule,
-                    is_completed=True,
-                    subscription__plan=plan,
-                    subscription__is_active=True
-                ).values_list('subscription__user_id', flat=True)
-            )
+        # 오늘 일정을 완료한 사용자 수 (오늘 일정이 없으면 조회 생략)
+        today_completed_users = 0
+        if get_plan_metadata(plan.id).schedules_on(today):
+            today_completed_users = UserBibleProgress.objects.filter(
+                schedule__plan=plan,
+                schedule__date=today,
+                is_completed=True,
+                subscription__plan=plan,
+                subscription__is_active=True
+            ).values('subscription__user_id').distinct().count()
 
         return Response({
             'success': True,
             'plan_name': plan.name,
-            'today_completed_users': len(completed_users)
+            'today_completed_users': today_completed_users
         })
     except Exception as e:
         logger.error(f"Error in get_plan_stats: {str(e)}", exc_info=True)
@@ -2177,8 +1908,9 @@ def get_progress_stats(request):
         # 오늘 날짜 가져오기
         today = timezone.now().date()
         
-        # 1. 전체 일정 개수 계산
-        total_schedules = DailyBibleSchedule.objects.filter(plan=plan).count()
+        # 1. 전체 일정 개수 (플랜 메타데이터 캐시)
+        metadata = get_plan_metadata(plan.id)
+        total_schedules = metadata.total_schedules
         
         if total_schedules == 0:
             return Response({
@@ -2187,10 +1919,7 @@ def get_progress_stats(request):
             }, status=status.HTTP_400_BAD_REQUEST)
         
         # 2. 오늘까지의 일정 개수 계산
-        today_schedules = DailyBibleSchedule.objects.filter(
-            plan=plan,
-            date__lte=today
-        ).count()
+        today_schedules = metadata.schedules_until(today)
         
         # 3. 이론적 진행률 계산 (오늘까지 완료했을 때)
         theoretical_progress = (today_schedules / total_schedules) * 100
@@ -2517,59 +2246,18 @@ def update_hasena_summary(request, video_id):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_hasena_stats(request):
-    from datetime import timedelta
-    
     try:
-        today = timezone.now().date()
         records = HasenaRecord.objects.filter(
             user=request.user,
             is_completed=True
-        ).order_by('-date').values_list('date', flat=True)
-        
-        records_set = set(records)
-        total_completed = len(records_set)
-        
-        current_streak = 0
-        check_date = today
-        
-        while True:
-            if check_date.weekday() == 6:
-                check_date -= timedelta(days=1)
-                continue
-            
-            if check_date in records_set:
-                current_streak += 1
-                check_date -= timedelta(days=1)
-            elif check_date == today:
-                check_date -= timedelta(days=1)
-            else:
-                break
-        
-        longest_streak = current_streak
-        temp_streak = 0
-        sorted_dates = sorted(records_set, reverse=True)
-        
-        for i, date in enumerate(sorted_dates):
-            if i == 0:
-                temp_streak = 1
-            else:
-                prev_date = sorted_dates[i - 1]
-                diff = (prev_date - date).days
-                
-                weekdays_between = 0
-                check = date + timedelta(days=1)
-                while check <= prev_date:
-                    if check.weekday() != 6:
-                        weekdays_between += 1
-                    check += timedelta(days=1)
-                
-                if weekdays_between <= 1:
-                    temp_streak += 1
-                else:
-                    temp_streak = 1
-            
-            longest_streak = max(longest_streak, temp_streak)
-        
+        ).values_list('date', flat=True)
+
+        # 일요일은 쉬는 날로 보고 연속을 끊지 않음
+        stats = calculate_streaks(records, calendar=SUNDAY_REST_CALENDAR)
+        total_completed = stats.total_days
+        current_streak = stats.current_streak
+        longest_streak = stats.longest_streak
+
         return Response({
             'success': True,
             'data': {
@@ -2899,12 +2587,13 @@ class PersonalReadingRecordViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """읽기 통계 조회"""
-        records = self.get_queryset()
+        # 책/날짜를 한 번에 조회해 모든 통계를 메모리에서 계산
+        rows = list(self.get_queryset().values_list('book', 'read_date'))
 
         # 책별 읽은 장 수 계산
         books_progress = defaultdict(lambda: {'read': 0, 'total': 0})
-        for record in records:
-            books_progress[record.book]['read'] += 1
+        for book, _ in rows:
+            books_progress[book]['read'] += 1
 
         # 각 책의 총 장 수 추가
         for book in books_progress:
@@ -2917,31 +2606,13 @@ class PersonalReadingRecordViewSet(viewsets.ModelViewSet):
         )
 
         # 연속 읽기 일수 (streak) 계산
-        from datetime import date, timedelta
-        dates = records.values_list('read_date', flat=True).distinct().order_by('-read_date')
-        dates_list = list(dates)
-
-        current_streak = 0
-        if dates_list:
-            today = date.today()
-            expected_date = today
-
-            for read_date in dates_list:
-                if read_date == expected_date:
-                    current_streak += 1
-                    expected_date -= timedelta(days=1)
-                elif read_date == expected_date + timedelta(days=1):
-                    # 오늘 안 읽었지만 어제 읽었으면 어제부터 카운트
-                    current_streak += 1
-                    expected_date = read_date - timedelta(days=1)
-                else:
-                    break
+        streak = calculate_streaks(read_date for _, read_date in rows)
 
         stats = {
-            'total_chapters_read': records.count(),
-            'books_read': records.values('book').distinct().count(),
+            'total_chapters_read': len(rows),
+            'books_read': len(books_progress),
             'books_completed': books_completed,
-            'current_streak': current_streak,
+            'current_streak': streak.current_streak,
             'books_progress': dict(books_progress)
         }
 
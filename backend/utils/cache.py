@@ -0,0 +1,82 @@
+"""
+캐시 유틸리티
+- 네임스페이스별 세대(generation) 카운터로 캐시 키 버전 관리 (이벤트 발생 시 bump → 이전 키 자동 무효화)
+- 단일 재계산(single-flight) + 만료/무효화된 값 임시 제공(stale-while-revalidate)
+"""
+
+import logging
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = 'cachegen:{namespace}'
+LOCK_SUFFIX = ':lock'
+STALE_SUFFIX = ':stale'
+
+
+def get_generations(*namespaces):
+    """네임스페이스들의 현재 세대 조회 (한 번의 get_many)"""
+    keys = {GENERATION_KEY.format(namespace=ns): ns for ns in namespaces}
+    found = cache.get_many(list(keys))
+    return {ns: found.get(key, 0) for key, ns in keys.items()}
+
+
+def bump_generation(*namespaces):
+    """네임스페이스 세대 증가 → 해당 네임스페이스에 묶인 캐시 키가 모두 새 키로 바뀜"""
+    for ns in namespaces:
+        key = GENERATION_KEY.format(namespace=ns)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 키가 없으면 생성 (동시에 생성된 경우 다시 증가)
+            if not cache.add(key, 1, timeout=None):
+                cache.incr(key)
+
+
+def versioned_key(base_key, *namespaces):
+    """base_key에 네임스페이스 세대를 붙인 캐시 키"""
+    generations = get_generations(*namespaces)
+    suffix = '.'.join(f'{ns}={generations[ns]}' for ns in namespaces)
+    return f'{base_key}:{suffix}'
+
+
+def get_or_rebuild(base_key, builder, namespaces=(), timeout=300, stale_timeout=86400,
+                   lock_timeout=30, wait_timeout=2.0):
+    """
+    버전 키로 캐시 조회, 없으면 한 워커만 재계산
+
+    - 재계산 중인 다른 요청은 마지막으로 만든 값(stale)을 즉시 받음
+    - stale 값도 없으면 잠시 기다렸다가 결과를 받고, 그래도 없으면 직접 계산
+    """
+    key = versioned_key(base_key, *namespaces) if namespaces else base_key
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    stale_key = base_key + STALE_SUFFIX
+    lock_key = key + LOCK_SUFFIX
+
+    if cache.add(lock_key, 1, timeout=lock_timeout):
+        try:
+            value = builder()
+            cache.set(key, value, timeout=timeout)
+            cache.set(stale_key, value, timeout=stale_timeout)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    stale = cache.get(stale_key)
+    if stale is not None:
+        return stale
+
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+    logger.warning(f"Cache rebuild wait timed out: {base_key}")
+    return builder()
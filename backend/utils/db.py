@@ -0,0 +1,18 @@
+"""
+DB 유틸리티
+"""
+
+from django.db import connections
+
+
+def upsert_options(unique_fields, update_fields, using='default'):
+    """
+    bulk_create upsert 옵션
+
+    PostgreSQL/SQLite는 충돌 대상(unique_fields)을 지정해야 하고(ON CONFLICT (...) DO UPDATE),
+    MySQL은 지정할 수 없으므로(NotSupportedError) 유니크 인덱스가 ON DUPLICATE KEY UPDATE를 결정한다.
+    """
+    options = {'update_conflicts': True, 'update_fields': update_fields}
+    if connections[using].features.supports_update_conflicts_with_target:
+        options['unique_fields'] = unique_fields
+    return options
@@ -17,7 +17,9 @@ export function useProfilePageData(userId: Ref<number>) {
     achievements: false,
     groups: false,
     followers: false,
-    following: false
+    following: false,
+    moreFollowers: false,
+    moreFollowing: false
   })
 
   // 로드된 탭 추적 (지연 로딩용)
@@ -96,8 +98,8 @@ export function useProfilePageData(userId: Ref<number>) {
         loadingStates.groups = true
         try {
           if (profileStore.isOwnProfile) {
-            // 본인 프로필: 내 그룹 전체 조회
-            await groupsStore.fetchGroups({ only_mine: true })
+            // 본인 프로필: 내 그룹 전체 조회 (마지막 페이지까지)
+            await groupsStore.fetchGroups({ only_mine: true }, { all: true })
           } else {
             // 타인 프로필: 해당 사용자의 프로필에 공개된 그룹만 조회
             await groupsStore.fetchUserPublicGroups(userId.value)
@@ -141,6 +143,32 @@ export function useProfilePageData(userId: Ref<number>) {
     }
   }
 
+  // 팔로워 다음 페이지 (모달 더 보기)
+  async function loadMoreFollowers() {
+    if (!socialStore.followersPage.hasMore || loadingStates.moreFollowers) return
+    loadingStates.moreFollowers = true
+    try {
+      await socialStore.fetchMoreFollowers(userId.value)
+    } catch (e) {
+      toast.error('팔로워를 불러오지 못했습니다')
+    } finally {
+      loadingStates.moreFollowers = false
+    }
+  }
+
+  // 팔로잉 다음 페이지 (모달 더 보기)
+  async function loadMoreFollowing() {
+    if (!socialStore.followingPage.hasMore || loadingStates.moreFollowing) return
+    loadingStates.moreFollowing = true
+    try {
+      await socialStore.fetchMoreFollowing(userId.value)
+    } catch (e) {
+      toast.error('팔로잉을 불러오지 못했습니다')
+    } finally {
+      loadingStates.moreFollowing = false
+    }
+  }
+
   // 달력 월 변경
   async function handleMonthChange(year: number, month: number) {
     loadingStates.calendar = true
@@ -258,6 +286,8 @@ export function useProfilePageData(userId: Ref<number>) {
     groups: computed(() => profileStore.isOwnProfile ? groupsStore.myGroups : groupsStore.groups),
     followers: computed(() => socialStore.followers),
     following: computed(() => socialStore.following),
+    followersHasMore: computed(() => socialStore.followersPage.hasMore),
+    followingHasMore: computed(() => socialStore.followingPage.hasMore),
     isOwnProfile: computed(() => profileStore.isOwnProfile),
     completionRate: computed(() => profileStore.completionRate),
 
@@ -266,6 +296,8 @@ export function useProfilePageData(userId: Ref<number>) {
     loadTabData,
     loadFollowers,
     loadFollowing,
+    loadMoreFollowers,
+    loadMoreFollowing,
     handleMonthChange,
     toggleFollow,
     handleToggleFollowInModal,
@@ -30,6 +30,11 @@ interface ReadingGroup {
   updated_at: string
 }
 
+interface GroupPage {
+  hasMore: boolean
+  nextCursor: number | null
+}
+
 interface GroupMember {
   user: {
     id: number
@@ -69,11 +74,15 @@ export const useGroupsStore = defineStore('groups', {
   state: () => ({
     groups: [] as ReadingGroup[],
     myGroups: [] as ReadingGroup[],
+    // 목록 다음 페이지 위치 (서버 cursor 페이지네이션)
+    groupsPage: { hasMore: false, nextCursor: null } as GroupPage,
+    myGroupsPage: { hasMore: false, nextCursor: null } as GroupPage,
     currentGroup: null as ReadingGroup | null,
     currentGroupMembers: [] as GroupMember[],
     currentPlanSchedules: [] as DailySchedule[],
     invitations: [] as GroupInvitation[],
     isLoading: false,
+    isLoadingMore: false,
     error: null as string | null
   }),
 
@@ -90,36 +99,60 @@ export const useGroupsStore = defineStore('groups', {
       plan_id?: number
       only_public?: boolean
       only_mine?: boolean
+    } = {}, options: {
+      append?: boolean // 다음 페이지를 이어 붙임
+      all?: boolean // 마지막 페이지까지 모두 조회
     } = {}) {
-      this.isLoading = true
+      const pageKey = filters.only_mine ? 'myGroupsPage' : 'groupsPage'
+      const listKey = filters.only_mine ? 'myGroups' : 'groups'
+      if (options.append) {
+        this.isLoadingMore = true
+      } else {
+        this.isLoading = true
+      }
       this.error = null
 
       try {
-        const { data } = await useApi().get('/api/v1/todos/groups/', {
-          params: filters
-        })
+        // 중복 제거를 위해 Map 사용
+        const uniqueGroups = new Map()
+        if (options.append) {
+          this[listKey].forEach((group: ReadingGroup) => uniqueGroups.set(group.id, group))
+        }
+
+        let cursor = options.append ? this[pageKey].nextCursor : null
+        do {
+          const { data } = await useApi().get('/api/v1/todos/groups/', {
+            params: cursor ? { ...filters, cursor } : filters
+          })
+          if (!data?.success) break
 
-        if (data?.success) {
-          // 중복 제거를 위해 Map 사용
-          const uniqueGroups = new Map()
           data.groups.forEach((group: ReadingGroup) => {
             uniqueGroups.set(group.id, group)
           })
-          const deduplicatedGroups = Array.from(uniqueGroups.values())
+          cursor = data.has_more ? data.next_cursor : null
+          this[pageKey] = { hasMore: !!data.has_more, nextCursor: data.next_cursor ?? null }
+        } while (options.all && cursor)
 
-          if (filters.only_mine) {
-            this.myGroups = deduplicatedGroups
-          } else {
-            this.groups = deduplicatedGroups
-          }
-        }
+        this[listKey] = Array.from(uniqueGroups.values())
       } catch (error: any) {
         this.error = error.message || '그룹 목록을 불러올 수 없습니다.'
       } finally {
         this.isLoading = false
+        this.isLoadingMore = false
       }
     },
 
+    async fetchMoreGroups(filters: {
+      search?: string
+      plan_id?: number
+      only_public?: boolean
+      only_mine?: boolean
+    } = {}) {
+      const page = filters.only_mine ? this.myGroupsPage : this.groupsPage
+      if (!page.hasMore || this.isLoadingMore) return
+      await this.fetchGroups(filters, { append: true })
+    },
+
     async fetchGroupDetail(groupId: number) {
       this.isLoading = true
 
@@ -330,6 +363,8 @@ export const useGroupsStore = defineStore('groups', {
     clearGroupData() {
       this.groups = []
       this.myGroups = []
+      this.groupsPage = { hasMore: false, nextCursor: null }
+      this.myGroupsPage = { hasMore: false, nextCursor: null }
       this.currentGroup = null
       this.currentGroupMembers = []
       this.currentPlanSchedules = []
@@ -14,10 +14,21 @@ interface Friend extends User {
   is_mutual: boolean
 }
 
+interface FollowPage {
+  total: number | null
+  hasMore: boolean
+  nextCursor: string | null
+}
+
+const emptyPage = (): FollowPage => ({ total: null, hasMore: false, nextCursor: null })
+
 export const useSocialStore = defineStore('social', {
   state: () => ({
     followers: [] as User[],
     following: [] as User[],
+    // 팔로워/팔로잉 목록 다음 페이지 위치와 전체 수 (서버 cursor 페이지네이션)
+    followersPage: emptyPage(),
+    followingPage: emptyPage(),
     friends: [] as Friend[],
     searchResults: [] as User[],
     isLoading: false,
@@ -25,12 +36,15 @@ export const useSocialStore = defineStore('social', {
   }),
 
   getters: {
-    followersCount: (state) => state.followers.length,
-    followingCount: (state) => state.following.length,
+    followersCount: (state) => state.followersPage.total ?? state.followers.length,
+    followingCount: (state) => state.followingPage.total ?? state.following.length,
     friendsCount: (state) => state.friends.length,
-    
+
+    // 목록은 일부 페이지만 있으므로 서버가 행마다 내려준 is_following 사용
     isFollowing: (state) => (userId: number) => {
-      return state.following.some(user => user.id === userId)
+      const user = [...state.followers, ...state.following, ...state.searchResults, ...state.friends]
+        .find(u => u.id === userId && u.is_following !== undefined)
+      return user?.is_following ?? false
     },
     
     isFriend: (state) => (userId: number) => {
@@ -39,42 +53,55 @@ export const useSocialStore = defineStore('social', {
   },
 
   actions: {
-    async fetchFollowers(userId: number) {
+    async fetchFollowList(userId: number, key: 'followers' | 'following', append: boolean) {
+      const pageKey = key === 'followers' ? 'followersPage' : 'followingPage'
+      const label = key === 'followers' ? '팔로워를' : '팔로잉 목록을'
+      const cursor = append ? this[pageKey].nextCursor : null
+      if (append && !cursor) return
+
       this.isLoading = true
       this.error = null
       try {
-        const response = await useApi().get(`/api/v1/accounts/followers/${userId}/`)
+        const response = await useApi().get(`/api/v1/accounts/${key}/${userId}/`, {
+          params: cursor ? { cursor } : {}
+        })
         if (response.data?.success) {
-          // 하위 호환: response.data.data?.followers 또는 response.data.followers
-          this.followers = response.data.data?.followers ?? response.data.followers ?? []
+          // 하위 호환: response.data.data 또는 response.data
+          const data = response.data.data ?? response.data
+          const users: User[] = data[key] ?? []
+          this[key] = append
+            ? [...this[key], ...users.filter(u => !this[key].some(existing => existing.id === u.id))]
+            : users
+          this[pageKey] = {
+            total: data.total ?? null,
+            hasMore: !!data.has_more,
+            nextCursor: data.next_cursor ?? null
+          }
         } else {
-          this.error = response.data?.error || '팔로워를 불러올 수 없습니다.'
+          this.error = response.data?.error || `${label} 불러올 수 없습니다.`
         }
       } catch (error: any) {
-        console.error('팔로워 조회 실패:', error)
-        this.error = error.message || '팔로워를 불러올 수 없습니다.'
+        console.error(`${key} 조회 실패:`, error)
+        this.error = error.message || `${label} 불러올 수 없습니다.`
       } finally {
         this.isLoading = false
       }
     },
 
+    async fetchFollowers(userId: number) {
+      await this.fetchFollowList(userId, 'followers', false)
+    },
+
+    async fetchMoreFollowers(userId: number) {
+      await this.fetchFollowList(userId, 'followers', true)
+    },
+
     async fetchFollowing(userId: number) {
-      this.isLoading = true
-      this.error = null
-      try {
-        const response = await useApi().get(`/api/v1/accounts/following/${userId}/`)
-        if (response.data?.success) {
-          // 하위 호환: response.data.data?.following 또는 response.data.following
-          this.following = response.data.data?.following ?? response.data.following ?? []
-        } else {
-          this.error = response.data?.error || '팔로잉 목록을 불러올 수 없습니다.'
-        }
-      } catch (error: any) {
-        console.error('팔로잉 조회 실패:', error)
-        this.error = error.message || '팔로잉 목록을 불러올 수 없습니다.'
-      } finally {
-        this.isLoading = false
-      }
+      await this.fetchFollowList(userId, 'following', false)
+    },
+
+    async fetchMoreFollowing(userId: number) {
+      await this.fetchFollowList(userId, 'following', true)
     },
 
     async fetchFriends() {
@@ -120,7 +147,7 @@ export const useSocialStore = defineStore('social', {
         if (response?.success || response?.data?.success) {
           // 낙관적 업데이트: 팔로잉 목록에 추가
           if (userInfo && !this.following.some(u => u.id === userId)) {
-            this.following.push({
+            this.following.unshift({
               id: userId,
               username: userInfo.username || '',
               nickname: userInfo.nickname || '',
@@ -128,6 +155,7 @@ export const useSocialStore = defineStore('social', {
               is_following: true,
               total_completed_days: userInfo.total_completed_days
             })
+            if (this.followingPage.total !== null) this.followingPage.total++
           }
           // 모든 목록에서 is_following 상태 업데이트
           this.updateUserFollowStatus(userId, true)
@@ -146,6 +174,9 @@ export const useSocialStore = defineStore('social', {
 
         if (response?.success || response?.data?.success) {
           // 팔로잉 목록에서 제거
+          if (this.following.some(user => user.id === userId) && this.followingPage.total) {
+            this.followingPage.total--
+          }
           this.following = this.following.filter(user => user.id !== userId)
           // 친구 목록에서도 제거 (상호 팔로우가 깨짐)
           this.friends = this.friends.filter(friend => friend.id !== userId)
@@ -194,6 +225,8 @@ export const useSocialStore = defineStore('social', {
     clearSocialData() {
       this.followers = []
       this.following = []
+      this.followersPage = emptyPage()
+      this.followingPage = emptyPage()
       this.friends = []
       this.searchResults = []
       this.error = null